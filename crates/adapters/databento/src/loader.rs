@@ -231,7 +231,7 @@ impl DatabentoDataLoader {
         instrument_id: Option<InstrumentId>,
         price_precision: Option<u8>,
         include_trades: bool,
-    ) -> anyhow::Result<impl Iterator<Item = anyhow::Result<(Option<Data>, Option<Data>)>> + '_>
+    ) -> anyhow::Result<impl Iterator<Item = anyhow::Result<(Option<Data>, Option<Data>)>> + 'static>
     where
         T: dbn::Record + dbn::HasRType + 'static,
     {
@@ -242,6 +242,10 @@ impl DatabentoDataLoader {
 
         let price_precision = price_precision.unwrap_or(Currency::USD().precision);
 
+        // Owned by the iterator so it can outlive the loader (e.g. when streaming in chunks)
+        let publisher_venue_map = self.publisher_venue_map.clone();
+        let symbol_venue_map = self.symbol_venue_map.clone();
+
         Ok(std::iter::from_fn(move || {
             if let Err(e) = dbn_stream.advance() {
                 return Some(Err(e.into()));
@@ -254,8 +258,8 @@ impl DatabentoDataLoader {
                         None => decode_nautilus_instrument_id(
                             &record,
                             &mut metadata_cache,
-                            &self.publisher_venue_map,
-                            &self.symbol_venue_map,
+                            &publisher_venue_map,
+                            &symbol_venue_map,
                         )
                         .expect("Failed to decode record"),
                     };
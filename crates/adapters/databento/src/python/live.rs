@@ -19,17 +19,23 @@ use std::{
     path::PathBuf,
     str::FromStr,
     sync::{Arc, RwLock},
+    time::Duration,
 };
 
 use databento::{dbn, live::Subscription};
 use indexmap::IndexMap;
 use nautilus_core::python::{IntoPyObjectNautilusExt, to_pyruntime_err, to_pyvalue_err};
 use nautilus_model::{
+    data::Data,
     identifiers::{InstrumentId, Symbol, Venue},
-    python::{data::data_to_pycapsule, instruments::instrument_any_to_pyobject},
+    python::{
+        data::{data_to_pycapsule, data_vec_to_pycapsule},
+        instruments::instrument_any_to_pyobject,
+    },
 };
 use pyo3::prelude::*;
 use time::OffsetDateTime;
+use tokio::sync::mpsc::error::TryRecvError;
 
 use crate::{
     live::{DatabentoFeedHandler, LiveCommand, LiveMessage},
@@ -37,6 +43,15 @@ use crate::{
     types::DatabentoPublisher,
 };
 
+/// Configuration for delivering `Data` records to Python in micro-batches.
+#[derive(Clone, Copy, Debug)]
+struct BatchConfig {
+    /// The maximum number of records per batch.
+    max_size: usize,
+    /// The maximum time to wait for a batch to fill after its first record.
+    max_latency: Duration,
+}
+
 #[cfg_attr(
     feature = "python",
     pyo3::pyclass(module = "nautilus_trader.core.nautilus_pyo3.databento")
@@ -66,11 +81,33 @@ impl DatabentoLiveClient {
         mut msg_rx: tokio::sync::mpsc::Receiver<LiveMessage>,
         callback: PyObject,
         callback_pyo3: PyObject,
+        callback_batch: Option<(PyObject, BatchConfig)>,
     ) -> PyResult<()> {
         tracing::debug!("Processing messages...");
         // Continue to process messages until channel is hung up
         while let Some(msg) = msg_rx.recv().await {
             tracing::trace!("Received message: {msg:?}");
+
+            let msg = match (msg, &callback_batch) {
+                (LiveMessage::Data(data), Some((callback_batch, batch))) => {
+                    let mut buffer = Vec::with_capacity(batch.max_size);
+                    buffer.push(data);
+                    let next = Self::fill_batch(&mut msg_rx, &mut buffer, *batch).await;
+
+                    Python::with_gil(|py| match data_vec_to_pycapsule(py, buffer) {
+                        Ok(py_obj) => call_python(py, callback_batch, py_obj),
+                        Err(e) => tracing::error!("Error creating batch `PyCapsule`: {e}"),
+                    });
+
+                    // A non-data message ends the batch, and is handled after it to preserve order
+                    match next {
+                        Some(msg) => msg,
+                        None => continue,
+                    }
+                }
+                (msg, _) => msg,
+            };
+
             match msg {
                 LiveMessage::Data(data) => Python::with_gil(|py| {
                     let py_obj = data_to_pycapsule(py, data);
@@ -110,6 +147,36 @@ impl DatabentoLiveClient {
         Ok(())
     }
 
+    /// Fills the `buffer` with `Data` records until it reaches the maximum batch size,
+    /// the latency bound elapses, or a non-data message is received (which is returned).
+    async fn fill_batch(
+        msg_rx: &mut tokio::sync::mpsc::Receiver<LiveMessage>,
+        buffer: &mut Vec<Data>,
+        batch: BatchConfig,
+    ) -> Option<LiveMessage> {
+        let deadline = tokio::time::Instant::now() + batch.max_latency;
+
+        while buffer.len() < batch.max_size {
+            let msg = match msg_rx.try_recv() {
+                Ok(msg) => msg,
+                Err(TryRecvError::Empty) if !batch.max_latency.is_zero() => {
+                    match tokio::time::timeout_at(deadline, msg_rx.recv()).await {
+                        Ok(Some(msg)) => msg,
+                        Ok(None) | Err(_) => return None, // Hung up or latency bound elapsed
+                    }
+                }
+                Err(_) => return None,
+            };
+
+            match msg {
+                LiveMessage::Data(data) => buffer.push(data),
+                msg => return Some(msg),
+            }
+        }
+
+        None
+    }
+
     fn send_command(&self, cmd: LiveCommand) -> PyResult<()> {
         self.cmd_tx.send(cmd).map_err(to_pyruntime_err)
     }
@@ -197,11 +264,15 @@ impl DatabentoLiveClient {
     }
 
     #[pyo3(name = "start")]
+    #[pyo3(signature = (callback, callback_pyo3, callback_batch=None, max_batch_size=1024, max_batch_latency_us=0))]
     fn py_start<'py>(
         &mut self,
         py: Python<'py>,
         callback: PyObject,
         callback_pyo3: PyObject,
+        callback_batch: Option<PyObject>,
+        max_batch_size: usize,
+        max_batch_latency_us: u64,
     ) -> PyResult<Bound<'py, PyAny>> {
         if self.is_closed {
             return Err(to_pyruntime_err("Client already closed"));
@@ -209,6 +280,17 @@ impl DatabentoLiveClient {
         if self.is_running {
             return Err(to_pyruntime_err("Client already running"));
         }
+        if max_batch_size == 0 {
+            return Err(to_pyvalue_err("`max_batch_size` must be positive"));
+        }
+
+        let callback_batch = callback_batch.map(|callback_batch| {
+            let batch = BatchConfig {
+                max_size: max_batch_size,
+                max_latency: Duration::from_micros(max_batch_latency_us),
+            };
+            (callback_batch, batch)
+        });
 
         tracing::debug!("Starting client");
 
@@ -234,7 +316,7 @@ impl DatabentoLiveClient {
 
         pyo3_async_runtimes::tokio::future_into_py(py, async move {
             let (proc_handle, feed_handle) = tokio::join!(
-                Self::process_messages(msg_rx, callback, callback_pyo3),
+                Self::process_messages(msg_rx, callback, callback_pyo3, callback_batch),
                 feed_handler.run(),
             );
 
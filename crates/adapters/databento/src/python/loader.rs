@@ -23,7 +23,7 @@ use nautilus_core::{
 use nautilus_model::{
     data::{Bar, Data, InstrumentStatus, OrderBookDelta, OrderBookDepth10, QuoteTick, TradeTick},
     identifiers::{InstrumentId, Venue},
-    python::instruments::instrument_any_to_pyobject,
+    python::{data::data_vec_to_pycapsule, instruments::instrument_any_to_pyobject},
 };
 use pyo3::{
     prelude::*,
@@ -375,6 +375,123 @@ impl DatabentoDataLoader {
 
         Ok(data)
     }
+
+    #[pyo3(name = "stream_data")]
+    #[pyo3(signature = (filepath, chunk_size=100_000, instrument_id=None, price_precision=None, include_trades=None))]
+    fn py_stream_data(
+        &self,
+        filepath: PathBuf,
+        chunk_size: usize,
+        instrument_id: Option<InstrumentId>,
+        price_precision: Option<u8>,
+        include_trades: Option<bool>,
+    ) -> PyResult<DatabentoDataChunkIterator> {
+        if chunk_size == 0 {
+            return Err(to_pyvalue_err("`chunk_size` must be positive"));
+        }
+
+        let include_trades = include_trades.unwrap_or(false);
+        let schema = self
+            .schema_from_file(&filepath)
+            .map_err(to_pyvalue_err)?
+            .ok_or_else(|| to_pyvalue_err("Streaming files with mixed schemas not supported"))?;
+
+        let records: DataRecordIterator = match schema.as_str() {
+            "mbo" => Box::new(
+                self.read_records::<dbn::MboMsg>(
+                    &filepath,
+                    instrument_id,
+                    price_precision,
+                    include_trades,
+                )
+                .map_err(to_pyvalue_err)?,
+            ),
+            "mbp-1" | "tbbo" => Box::new(
+                self.read_records::<dbn::Mbp1Msg>(
+                    &filepath,
+                    instrument_id,
+                    price_precision,
+                    include_trades,
+                )
+                .map_err(to_pyvalue_err)?,
+            ),
+            "bbo-1s" | "bbo-1m" => Box::new(
+                self.read_records::<dbn::BboMsg>(&filepath, instrument_id, price_precision, false)
+                    .map_err(to_pyvalue_err)?,
+            ),
+            "mbp-10" => Box::new(
+                self.read_records::<dbn::Mbp10Msg>(&filepath, instrument_id, price_precision, false)
+                    .map_err(to_pyvalue_err)?,
+            ),
+            "trades" => Box::new(
+                self.read_records::<dbn::TradeMsg>(&filepath, instrument_id, price_precision, false)
+                    .map_err(to_pyvalue_err)?,
+            ),
+            "ohlcv-1s" | "ohlcv-1m" | "ohlcv-1h" | "ohlcv-1d" | "ohlcv-eod" => Box::new(
+                self.read_records::<dbn::OhlcvMsg>(&filepath, instrument_id, price_precision, false)
+                    .map_err(to_pyvalue_err)?,
+            ),
+            _ => {
+                return Err(to_pyvalue_err(format!(
+                    "Streaming schema {schema} not currently supported"
+                )));
+            }
+        };
+
+        Ok(DatabentoDataChunkIterator {
+            records,
+            chunk_size,
+            pending: None,
+        })
+    }
+}
+
+type DataRecordIterator = Box<dyn Iterator<Item = anyhow::Result<(Option<Data>, Option<Data>)>>>;
+
+/// Provides an iterator over chunks of data decoded from a DBN file, where each chunk is
+/// a `PyCapsule` containing a `CVec` of at most `chunk_size` `Data` records.
+///
+/// Each capsule owns its records and drops them when it is garbage collected.
+#[pyclass(unsendable, module = "nautilus_trader.core.nautilus_pyo3.databento")]
+pub struct DatabentoDataChunkIterator {
+    records: DataRecordIterator,
+    chunk_size: usize,
+    pending: Option<Data>,
+}
+
+#[pymethods]
+impl DatabentoDataChunkIterator {
+    const fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__(&mut self, py: Python<'_>) -> PyResult<Option<PyObject>> {
+        let mut data = Vec::with_capacity(self.chunk_size);
+        data.extend(self.pending.take());
+
+        while data.len() < self.chunk_size {
+            match self.records.next() {
+                Some(Ok((item1, item2))) => {
+                    data.extend(item1);
+                    if let Some(item2) = item2 {
+                        if data.len() < self.chunk_size {
+                            data.push(item2);
+                        } else {
+                            self.pending = Some(item2);
+                        }
+                    }
+                }
+                Some(Err(e)) => return Err(to_pyvalue_err(e)),
+                None => break,
+            }
+        }
+
+        if data.is_empty() {
+            return Ok(None);
+        }
+
+        data_vec_to_pycapsule(py, data).map(Some)
+    }
 }
 
 fn exhaust_data_iter_to_pycapsule(
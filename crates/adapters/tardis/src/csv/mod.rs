@@ -20,6 +20,7 @@ use std::{
     ffi::OsStr,
     fs::File,
     io::{BufReader, Read, Seek, SeekFrom},
+    marker::PhantomData,
     path::Path,
     time::Duration,
 };
@@ -154,56 +155,101 @@ fn create_csv_reader<P: AsRef<Path>>(
         .from_reader(Box::new(decoder)))
 }
 
-/// Loads [`OrderBookDelta`]s from a Tardis format CSV at the given `filepath`,
-/// automatically applying `GZip` decompression for files ending in ".gz".
-pub fn load_deltas<P: AsRef<Path>>(
+fn infer_book_update_precisions<P: AsRef<Path>>(
     filepath: P,
     price_precision: Option<u8>,
     size_precision: Option<u8>,
-    instrument_id: Option<InstrumentId>,
     limit: Option<usize>,
-) -> Result<Vec<OrderBookDelta>, Box<dyn Error>> {
-    // Infer precisions if not provided
-    let (price_precision, size_precision) = match (price_precision, size_precision) {
-        (Some(p), Some(s)) => (p, s),
-        (price_precision, size_precision) => {
-            let mut reader = create_csv_reader(&filepath)?;
-            let mut record = StringRecord::new();
+) -> Result<(u8, u8), Box<dyn Error>> {
+    if let (Some(p), Some(s)) = (price_precision, size_precision) {
+        return Ok((p, s));
+    }
 
-            let mut max_price_precision = 0u8;
-            let mut max_size_precision = 0u8;
-            let mut count = 0;
+    let mut reader = create_csv_reader(filepath)?;
+    let mut record = StringRecord::new();
 
-            while reader.read_record(&mut record)? {
-                let parsed: TardisBookUpdateRecord = record.deserialize(None)?;
+    let mut max_price_precision = 0u8;
+    let mut max_size_precision = 0u8;
+    let mut count = 0;
 
-                if price_precision.is_none() {
-                    max_price_precision = infer_precision(parsed.price).max(max_price_precision);
-                }
+    while reader.read_record(&mut record)? {
+        let parsed: TardisBookUpdateRecord = record.deserialize(None)?;
 
-                if size_precision.is_none() {
-                    max_size_precision = infer_precision(parsed.amount).max(max_size_precision);
-                }
+        if price_precision.is_none() {
+            max_price_precision = infer_precision(parsed.price).max(max_price_precision);
+        }
 
-                if let Some(limit) = limit {
-                    if count >= limit {
-                        break;
-                    }
-                    count += 1;
-                }
+        if size_precision.is_none() {
+            max_size_precision = infer_precision(parsed.amount).max(max_size_precision);
+        }
+
+        if let Some(limit) = limit {
+            if count >= limit {
+                break;
             }
+            count += 1;
+        }
+    }
 
-            drop(reader);
+    max_price_precision = max_price_precision.min(FIXED_PRECISION);
+    max_size_precision = max_size_precision.min(FIXED_PRECISION);
 
-            max_price_precision = max_price_precision.min(FIXED_PRECISION);
-            max_size_precision = max_size_precision.min(FIXED_PRECISION);
+    Ok((
+        price_precision.unwrap_or(max_price_precision),
+        size_precision.unwrap_or(max_size_precision),
+    ))
+}
 
-            (
-                price_precision.unwrap_or(max_price_precision),
-                size_precision.unwrap_or(max_size_precision),
-            )
-        }
+fn parse_delta_record(
+    record: &TardisBookUpdateRecord,
+    price_precision: u8,
+    size_precision: u8,
+    instrument_id: Option<InstrumentId>,
+) -> OrderBookDelta {
+    let instrument_id = match &instrument_id {
+        Some(id) => *id,
+        None => parse_instrument_id(&record.exchange, record.symbol),
     };
+    let side = parse_order_side(&record.side);
+    let price = parse_price(record.price, price_precision);
+    let size = Quantity::new(record.amount, size_precision);
+    let order_id = 0; // Not applicable for L2 data
+    let order = BookOrder::new(side, price, size, order_id);
+
+    let action = parse_book_action(record.is_snapshot, size.as_f64());
+    let flags = 0; // Flags always zero until timestamp changes
+    let sequence = 0; // Sequence not available
+    let ts_event = parse_timestamp(record.timestamp);
+    let ts_init = parse_timestamp(record.local_timestamp);
+
+    assert!(
+        !(action != BookAction::Delete && size.is_zero()),
+        "Invalid delta: action {action} when size zero, check size_precision ({size_precision}) vs data; {record:?}"
+    );
+
+    OrderBookDelta::new(
+        instrument_id,
+        action,
+        order,
+        flags,
+        sequence,
+        ts_event,
+        ts_init,
+    )
+}
+
+/// Loads [`OrderBookDelta`]s from a Tardis format CSV at the given `filepath`,
+/// automatically applying `GZip` decompression for files ending in ".gz".
+pub fn load_deltas<P: AsRef<Path>>(
+    filepath: P,
+    price_precision: Option<u8>,
+    size_precision: Option<u8>,
+    instrument_id: Option<InstrumentId>,
+    limit: Option<usize>,
+) -> Result<Vec<OrderBookDelta>, Box<dyn Error>> {
+    // Infer precisions if not provided
+    let (price_precision, size_precision) =
+        infer_book_update_precisions(&filepath, price_precision, size_precision, limit)?;
 
     let mut deltas: Vec<OrderBookDelta> = Vec::new();
     let mut last_ts_event = UnixNanos::default();
@@ -213,47 +259,17 @@ pub fn load_deltas<P: AsRef<Path>>(
 
     while reader.read_record(&mut record)? {
         let record: TardisBookUpdateRecord = record.deserialize(None)?;
-
-        let instrument_id = match &instrument_id {
-            Some(id) => *id,
-            None => parse_instrument_id(&record.exchange, record.symbol),
-        };
-        let side = parse_order_side(&record.side);
-        let price = parse_price(record.price, price_precision);
-        let size = Quantity::new(record.amount, size_precision);
-        let order_id = 0; // Not applicable for L2 data
-        let order = BookOrder::new(side, price, size, order_id);
-
-        let action = parse_book_action(record.is_snapshot, size.as_f64());
-        let flags = 0; // Flags always zero until timestamp changes
-        let sequence = 0; // Sequence not available
-        let ts_event = parse_timestamp(record.timestamp);
-        let ts_init = parse_timestamp(record.local_timestamp);
+        let delta = parse_delta_record(&record, price_precision, size_precision, instrument_id);
 
         // Check if timestamp is different from last timestamp
-        if last_ts_event != ts_event {
+        if last_ts_event != delta.ts_event {
             if let Some(last_delta) = deltas.last_mut() {
                 // Set previous delta flags as F_LAST
                 last_delta.flags = RecordFlag::F_LAST.value();
             }
         }
 
-        assert!(
-            !(action != BookAction::Delete && size.is_zero()),
-            "Invalid delta: action {action} when size zero, check size_precision ({size_precision}) vs data; {record:?}"
-        );
-
-        last_ts_event = ts_event;
-
-        let delta = OrderBookDelta::new(
-            instrument_id,
-            action,
-            order,
-            flags,
-            sequence,
-            ts_event,
-            ts_init,
-        );
+        last_ts_event = delta.ts_event;
 
         deltas.push(delta);
 
@@ -619,60 +635,95 @@ pub fn load_depth10_from_snapshot25<P: AsRef<Path>>(
     Ok(depths)
 }
 
-/// Loads [`QuoteTick`]s from a Tardis format CSV at the given `filepath`,
-/// automatically applying `GZip` decompression for files ending in ".gz".
-pub fn load_quote_ticks<P: AsRef<Path>>(
+fn infer_quote_precisions<P: AsRef<Path>>(
     filepath: P,
     price_precision: Option<u8>,
     size_precision: Option<u8>,
-    instrument_id: Option<InstrumentId>,
     limit: Option<usize>,
-) -> Result<Vec<QuoteTick>, Box<dyn Error>> {
-    // Infer precisions if not provided
-    let (price_precision, size_precision) = match (price_precision, size_precision) {
-        (Some(p), Some(s)) => (p, s),
-        (price_precision, size_precision) => {
-            let mut reader = create_csv_reader(&filepath)?;
-            let mut record = StringRecord::new();
+) -> Result<(u8, u8), Box<dyn Error>> {
+    if let (Some(p), Some(s)) = (price_precision, size_precision) {
+        return Ok((p, s));
+    }
 
-            let mut max_price_precision = 0u8;
-            let mut max_size_precision = 0u8;
-            let mut count = 0;
+    let mut reader = create_csv_reader(filepath)?;
+    let mut record = StringRecord::new();
 
-            while reader.read_record(&mut record)? {
-                let parsed: TardisQuoteRecord = record.deserialize(None)?;
+    let mut max_price_precision = 0u8;
+    let mut max_size_precision = 0u8;
+    let mut count = 0;
 
-                if price_precision.is_none() {
-                    if let Some(bid_price) = parsed.bid_price {
-                        max_price_precision = infer_precision(bid_price).max(max_price_precision);
-                    }
-                }
+    while reader.read_record(&mut record)? {
+        let parsed: TardisQuoteRecord = record.deserialize(None)?;
 
-                if size_precision.is_none() {
-                    if let Some(bid_amount) = parsed.bid_amount {
-                        max_size_precision = infer_precision(bid_amount).max(max_size_precision);
-                    }
-                }
+        if price_precision.is_none() {
+            if let Some(bid_price) = parsed.bid_price {
+                max_price_precision = infer_precision(bid_price).max(max_price_precision);
+            }
+        }
 
-                if let Some(limit) = limit {
-                    if count >= limit {
-                        break;
-                    }
-                    count += 1;
-                }
+        if size_precision.is_none() {
+            if let Some(bid_amount) = parsed.bid_amount {
+                max_size_precision = infer_precision(bid_amount).max(max_size_precision);
             }
+        }
 
-            drop(reader);
+        if let Some(limit) = limit {
+            if count >= limit {
+                break;
+            }
+            count += 1;
+        }
+    }
 
-            max_price_precision = max_price_precision.min(FIXED_PRECISION);
-            max_size_precision = max_size_precision.min(FIXED_PRECISION);
+    max_price_precision = max_price_precision.min(FIXED_PRECISION);
+    max_size_precision = max_size_precision.min(FIXED_PRECISION);
 
-            (
-                price_precision.unwrap_or(max_price_precision),
-                size_precision.unwrap_or(max_size_precision),
-            )
-        }
+    Ok((
+        price_precision.unwrap_or(max_price_precision),
+        size_precision.unwrap_or(max_size_precision),
+    ))
+}
+
+fn parse_quote_record(
+    record: &TardisQuoteRecord,
+    price_precision: u8,
+    size_precision: u8,
+    instrument_id: Option<InstrumentId>,
+) -> QuoteTick {
+    let instrument_id = match &instrument_id {
+        Some(id) => *id,
+        None => parse_instrument_id(&record.exchange, record.symbol),
     };
+    let bid_price = parse_price(record.bid_price.unwrap_or(0.0), price_precision);
+    let bid_size = Quantity::new(record.bid_amount.unwrap_or(0.0), size_precision);
+    let ask_price = parse_price(record.ask_price.unwrap_or(0.0), price_precision);
+    let ask_size = Quantity::new(record.ask_amount.unwrap_or(0.0), size_precision);
+    let ts_event = parse_timestamp(record.timestamp);
+    let ts_init = parse_timestamp(record.local_timestamp);
+
+    QuoteTick::new(
+        instrument_id,
+        bid_price,
+        ask_price,
+        bid_size,
+        ask_size,
+        ts_event,
+        ts_init,
+    )
+}
+
+/// Loads [`QuoteTick`]s from a Tardis format CSV at the given `filepath`,
+/// automatically applying `GZip` decompression for files ending in ".gz".
+pub fn load_quote_ticks<P: AsRef<Path>>(
+    filepath: P,
+    price_precision: Option<u8>,
+    size_precision: Option<u8>,
+    instrument_id: Option<InstrumentId>,
+    limit: Option<usize>,
+) -> Result<Vec<QuoteTick>, Box<dyn Error>> {
+    // Infer precisions if not provided
+    let (price_precision, size_precision) =
+        infer_quote_precisions(&filepath, price_precision, size_precision, limit)?;
 
     let mut quotes = Vec::new();
     let mut reader = create_csv_reader(filepath)?;
@@ -680,27 +731,7 @@ pub fn load_quote_ticks<P: AsRef<Path>>(
 
     while reader.read_record(&mut record)? {
         let record: TardisQuoteRecord = record.deserialize(None)?;
-
-        let instrument_id = match &instrument_id {
-            Some(id) => *id,
-            None => parse_instrument_id(&record.exchange, record.symbol),
-        };
-        let bid_price = parse_price(record.bid_price.unwrap_or(0.0), price_precision);
-        let bid_size = Quantity::new(record.bid_amount.unwrap_or(0.0), size_precision);
-        let ask_price = parse_price(record.ask_price.unwrap_or(0.0), price_precision);
-        let ask_size = Quantity::new(record.ask_amount.unwrap_or(0.0), size_precision);
-        let ts_event = parse_timestamp(record.timestamp);
-        let ts_init = parse_timestamp(record.local_timestamp);
-
-        let quote = QuoteTick::new(
-            instrument_id,
-            bid_price,
-            ask_price,
-            bid_size,
-            ask_size,
-            ts_event,
-            ts_init,
-        );
+        let quote = parse_quote_record(&record, price_precision, size_precision, instrument_id);
 
         quotes.push(quote);
 
@@ -714,56 +745,91 @@ pub fn load_quote_ticks<P: AsRef<Path>>(
     Ok(quotes)
 }
 
-/// Loads [`TradeTick`]s from a Tardis format CSV at the given `filepath`,
-/// automatically applying `GZip` decompression for files ending in ".gz".
-pub fn load_trade_ticks<P: AsRef<Path>>(
+fn infer_trade_precisions<P: AsRef<Path>>(
     filepath: P,
     price_precision: Option<u8>,
     size_precision: Option<u8>,
-    instrument_id: Option<InstrumentId>,
     limit: Option<usize>,
-) -> Result<Vec<TradeTick>, Box<dyn Error>> {
-    // Infer precisions if not provided
-    let (price_precision, size_precision) = match (price_precision, size_precision) {
-        (Some(p), Some(s)) => (p, s),
-        (price_precision, size_precision) => {
-            let mut reader = create_csv_reader(&filepath)?;
-            let mut record = StringRecord::new();
+) -> Result<(u8, u8), Box<dyn Error>> {
+    if let (Some(p), Some(s)) = (price_precision, size_precision) {
+        return Ok((p, s));
+    }
 
-            let mut max_price_precision = 0u8;
-            let mut max_size_precision = 0u8;
-            let mut count = 0;
+    let mut reader = create_csv_reader(filepath)?;
+    let mut record = StringRecord::new();
 
-            while reader.read_record(&mut record)? {
-                let parsed: TardisTradeRecord = record.deserialize(None)?;
+    let mut max_price_precision = 0u8;
+    let mut max_size_precision = 0u8;
+    let mut count = 0;
 
-                if price_precision.is_none() {
-                    max_price_precision = infer_precision(parsed.price).max(max_price_precision);
-                }
+    while reader.read_record(&mut record)? {
+        let parsed: TardisTradeRecord = record.deserialize(None)?;
 
-                if size_precision.is_none() {
-                    max_size_precision = infer_precision(parsed.amount).max(max_size_precision);
-                }
+        if price_precision.is_none() {
+            max_price_precision = infer_precision(parsed.price).max(max_price_precision);
+        }
 
-                if let Some(limit) = limit {
-                    if count >= limit {
-                        break;
-                    }
-                    count += 1;
-                }
+        if size_precision.is_none() {
+            max_size_precision = infer_precision(parsed.amount).max(max_size_precision);
+        }
+
+        if let Some(limit) = limit {
+            if count >= limit {
+                break;
             }
+            count += 1;
+        }
+    }
 
-            drop(reader);
+    max_price_precision = max_price_precision.min(FIXED_PRECISION);
+    max_size_precision = max_size_precision.min(FIXED_PRECISION);
 
-            max_price_precision = max_price_precision.min(FIXED_PRECISION);
-            max_size_precision = max_size_precision.min(FIXED_PRECISION);
+    Ok((
+        price_precision.unwrap_or(max_price_precision),
+        size_precision.unwrap_or(max_size_precision),
+    ))
+}
 
-            (
-                price_precision.unwrap_or(max_price_precision),
-                size_precision.unwrap_or(max_size_precision),
-            )
-        }
+fn parse_trade_record(
+    record: &TardisTradeRecord,
+    price_precision: u8,
+    size_precision: u8,
+    instrument_id: Option<InstrumentId>,
+) -> TradeTick {
+    let instrument_id = match &instrument_id {
+        Some(id) => *id,
+        None => parse_instrument_id(&record.exchange, record.symbol),
     };
+    let price = parse_price(record.price, price_precision);
+    let size = Quantity::new(record.amount, size_precision);
+    let aggressor_side = parse_aggressor_side(&record.side);
+    let trade_id = TradeId::new(&record.id);
+    let ts_event = parse_timestamp(record.timestamp);
+    let ts_init = parse_timestamp(record.local_timestamp);
+
+    TradeTick::new(
+        instrument_id,
+        price,
+        size,
+        aggressor_side,
+        trade_id,
+        ts_event,
+        ts_init,
+    )
+}
+
+/// Loads [`TradeTick`]s from a Tardis format CSV at the given `filepath`,
+/// automatically applying `GZip` decompression for files ending in ".gz".
+pub fn load_trade_ticks<P: AsRef<Path>>(
+    filepath: P,
+    price_precision: Option<u8>,
+    size_precision: Option<u8>,
+    instrument_id: Option<InstrumentId>,
+    limit: Option<usize>,
+) -> Result<Vec<TradeTick>, Box<dyn Error>> {
+    // Infer precisions if not provided
+    let (price_precision, size_precision) =
+        infer_trade_precisions(&filepath, price_precision, size_precision, limit)?;
 
     let mut trades = Vec::new();
     let mut reader = create_csv_reader(filepath)?;
@@ -771,27 +837,7 @@ pub fn load_trade_ticks<P: AsRef<Path>>(
 
     while reader.read_record(&mut record)? {
         let record: TardisTradeRecord = record.deserialize(None)?;
-
-        let instrument_id = match &instrument_id {
-            Some(id) => *id,
-            None => parse_instrument_id(&record.exchange, record.symbol),
-        };
-        let price = parse_price(record.price, price_precision);
-        let size = Quantity::new(record.amount, size_precision);
-        let aggressor_side = parse_aggressor_side(&record.side);
-        let trade_id = TradeId::new(&record.id);
-        let ts_event = parse_timestamp(record.timestamp);
-        let ts_init = parse_timestamp(record.local_timestamp);
-
-        let trade = TradeTick::new(
-            instrument_id,
-            price,
-            size,
-            aggressor_side,
-            trade_id,
-            ts_event,
-            ts_init,
-        );
+        let trade = parse_trade_record(&record, price_precision, size_precision, instrument_id);
 
         trades.push(trade);
 
@@ -805,6 +851,232 @@ pub fn load_trade_ticks<P: AsRef<Path>>(
     Ok(trades)
 }
 
+/// The result of reading a single chunk from a Tardis format CSV.
+pub type ChunkResult<T> = Result<Vec<T>, Box<dyn Error>>;
+
+/// An iterator which reads a Tardis format CSV in chunks of at most `chunk_size` records,
+/// so that only a single chunk is held in memory at a time.
+struct CsvChunks<T, F> {
+    reader: Reader<Box<dyn Read>>,
+    record: StringRecord,
+    chunk_size: usize,
+    remaining: Option<usize>,
+    parse: F,
+    _marker: PhantomData<T>,
+}
+
+impl<T, F> CsvChunks<T, F>
+where
+    F: FnMut(&StringRecord) -> Result<T, Box<dyn Error>>,
+{
+    fn new(
+        reader: Reader<Box<dyn Read>>,
+        chunk_size: usize,
+        limit: Option<usize>,
+        parse: F,
+    ) -> Self {
+        assert!(chunk_size > 0, "`chunk_size` must be positive");
+        Self {
+            reader,
+            record: StringRecord::new(),
+            chunk_size,
+            remaining: limit,
+            parse,
+            _marker: PhantomData,
+        }
+    }
+}
+
+impl<T, F> Iterator for CsvChunks<T, F>
+where
+    F: FnMut(&StringRecord) -> Result<T, Box<dyn Error>>,
+{
+    type Item = ChunkResult<T>;
+
+    fn next(&mut self) -> Option<Self::Item> {
+        let capacity = self
+            .remaining
+            .map_or(self.chunk_size, |remaining| remaining.min(self.chunk_size));
+        let mut chunk = Vec::with_capacity(capacity);
+
+        while chunk.len() < capacity {
+            match self.reader.read_record(&mut self.record) {
+                Ok(true) => {}
+                Ok(false) => break,
+                Err(e) => return Some(Err(Box::new(e))),
+            }
+
+            match (self.parse)(&self.record) {
+                Ok(item) => chunk.push(item),
+                Err(e) => return Some(Err(e)),
+            }
+        }
+
+        if let Some(remaining) = self.remaining.as_mut() {
+            *remaining -= chunk.len();
+        }
+
+        if chunk.is_empty() {
+            None
+        } else {
+            Some(Ok(chunk))
+        }
+    }
+}
+
+/// Streams [`OrderBookDelta`]s from a Tardis format CSV at the given `filepath` in chunks
+/// of at most `chunk_size`, automatically applying `GZip` decompression for files ending in ".gz".
+///
+/// The `F_LAST` flag is applied across chunk boundaries exactly as for [`load_deltas`].
+///
+/// # Errors
+///
+/// Returns an error if the file cannot be opened or precisions cannot be inferred.
+///
+/// # Panics
+///
+/// Panics if `chunk_size` is zero.
+pub fn stream_deltas<P: AsRef<Path>>(
+    filepath: P,
+    chunk_size: usize,
+    price_precision: Option<u8>,
+    size_precision: Option<u8>,
+    instrument_id: Option<InstrumentId>,
+    limit: Option<usize>,
+) -> Result<impl Iterator<Item = ChunkResult<OrderBookDelta>>, Box<dyn Error>> {
+    let (price_precision, size_precision) =
+        infer_book_update_precisions(&filepath, price_precision, size_precision, limit)?;
+
+    let mut chunks = CsvChunks::new(
+        create_csv_reader(filepath)?,
+        chunk_size,
+        limit,
+        move |record: &StringRecord| {
+            let record: TardisBookUpdateRecord = record.deserialize(None)?;
+            Ok(parse_delta_record(
+                &record,
+                price_precision,
+                size_precision,
+                instrument_id,
+            ))
+        },
+    );
+
+    // The last delta of each chunk is held back until the next timestamp is known
+    let mut pending: Option<OrderBookDelta> = None;
+    let mut is_exhausted = false;
+
+    Ok(std::iter::from_fn(move || {
+        while !is_exhausted {
+            let mut deltas: Vec<OrderBookDelta> = pending.take().into_iter().collect();
+
+            match chunks.next() {
+                Some(Ok(chunk)) => deltas.extend(chunk),
+                Some(Err(e)) => {
+                    is_exhausted = true;
+                    return Some(Err(e));
+                }
+                None => is_exhausted = true,
+            }
+
+            for i in 1..deltas.len() {
+                if deltas[i - 1].ts_event != deltas[i].ts_event {
+                    deltas[i - 1].flags = RecordFlag::F_LAST.value();
+                }
+            }
+
+            if is_exhausted {
+                // Set F_LAST flag for final delta
+                if let Some(last_delta) = deltas.last_mut() {
+                    last_delta.flags = RecordFlag::F_LAST.value();
+                }
+            } else {
+                pending = deltas.pop();
+            }
+
+            if !deltas.is_empty() {
+                return Some(Ok(deltas));
+            }
+        }
+
+        None
+    }))
+}
+
+/// Streams [`QuoteTick`]s from a Tardis format CSV at the given `filepath` in chunks
+/// of at most `chunk_size`, automatically applying `GZip` decompression for files ending in ".gz".
+///
+/// # Errors
+///
+/// Returns an error if the file cannot be opened or precisions cannot be inferred.
+///
+/// # Panics
+///
+/// Panics if `chunk_size` is zero.
+pub fn stream_quote_ticks<P: AsRef<Path>>(
+    filepath: P,
+    chunk_size: usize,
+    price_precision: Option<u8>,
+    size_precision: Option<u8>,
+    instrument_id: Option<InstrumentId>,
+    limit: Option<usize>,
+) -> Result<impl Iterator<Item = ChunkResult<QuoteTick>>, Box<dyn Error>> {
+    let (price_precision, size_precision) =
+        infer_quote_precisions(&filepath, price_precision, size_precision, limit)?;
+
+    Ok(CsvChunks::new(
+        create_csv_reader(filepath)?,
+        chunk_size,
+        limit,
+        move |record: &StringRecord| {
+            let record: TardisQuoteRecord = record.deserialize(None)?;
+            Ok(parse_quote_record(
+                &record,
+                price_precision,
+                size_precision,
+                instrument_id,
+            ))
+        },
+    ))
+}
+
+/// Streams [`TradeTick`]s from a Tardis format CSV at the given `filepath` in chunks
+/// of at most `chunk_size`, automatically applying `GZip` decompression for files ending in ".gz".
+///
+/// # Errors
+///
+/// Returns an error if the file cannot be opened or precisions cannot be inferred.
+///
+/// # Panics
+///
+/// Panics if `chunk_size` is zero.
+pub fn stream_trade_ticks<P: AsRef<Path>>(
+    filepath: P,
+    chunk_size: usize,
+    price_precision: Option<u8>,
+    size_precision: Option<u8>,
+    instrument_id: Option<InstrumentId>,
+    limit: Option<usize>,
+) -> Result<impl Iterator<Item = ChunkResult<TradeTick>>, Box<dyn Error>> {
+    let (price_precision, size_precision) =
+        infer_trade_precisions(&filepath, price_precision, size_precision, limit)?;
+
+    Ok(CsvChunks::new(
+        create_csv_reader(filepath)?,
+        chunk_size,
+        limit,
+        move |record: &StringRecord| {
+            let record: TardisTradeRecord = record.deserialize(None)?;
+            Ok(parse_trade_record(
+                &record,
+                price_precision,
+                size_precision,
+                instrument_id,
+            ))
+        },
+    ))
+}
+
 ////////////////////////////////////////////////////////////////////////////////
 // Tests
 ////////////////////////////////////////////////////////////////////////////////
@@ -992,4 +1264,54 @@ mod tests {
         assert_eq!(trades[0].ts_event, 1583020803145000000);
         assert_eq!(trades[0].ts_init, 1583020803307160000);
     }
+
+    #[rstest]
+    #[case(1)]
+    #[case(999)]
+    #[case(100_000)]
+    pub fn test_stream_deltas_matches_load_deltas(#[case] chunk_size: usize) {
+        let filepath = ensure_data_exists_tardis_deribit_book_l2();
+        let deltas = load_deltas(&filepath, None, None, None, Some(10_000)).unwrap();
+
+        let chunks: Vec<Vec<OrderBookDelta>> =
+            stream_deltas(&filepath, chunk_size, None, None, None, Some(10_000))
+                .unwrap()
+                .collect::<Result<_, _>>()
+                .unwrap();
+
+        assert!(chunks.iter().all(|chunk| chunk.len() <= chunk_size));
+        assert_eq!(chunks.concat(), deltas);
+    }
+
+    #[rstest]
+    pub fn test_stream_quotes_matches_load_quotes() {
+        let filepath = ensure_data_exists_tardis_huobi_quotes();
+        let quotes = load_quote_ticks(&filepath, None, None, None, Some(10_000)).unwrap();
+
+        let chunks: Vec<Vec<QuoteTick>> =
+            stream_quote_ticks(&filepath, 3_000, None, None, None, Some(10_000))
+                .unwrap()
+                .collect::<Result<_, _>>()
+                .unwrap();
+
+        assert_eq!(
+            chunks.iter().map(Vec::len).collect::<Vec<_>>(),
+            vec![3_000, 3_000, 3_000, 1_000]
+        );
+        assert_eq!(chunks.concat(), quotes);
+    }
+
+    #[rstest]
+    pub fn test_stream_trades_matches_load_trades() {
+        let filepath = ensure_data_exists_tardis_bitmex_trades();
+        let trades = load_trade_ticks(&filepath, None, None, None, Some(10_000)).unwrap();
+
+        let chunks: Vec<Vec<TradeTick>> =
+            stream_trade_ticks(&filepath, 4_096, None, None, None, Some(10_000))
+                .unwrap()
+                .collect::<Result<_, _>>()
+                .unwrap();
+
+        assert_eq!(chunks.concat(), trades);
+    }
 }
@@ -20,13 +20,60 @@ use nautilus_model::{
     data::{OrderBookDelta, OrderBookDepth10, QuoteTick, TradeTick},
     identifiers::InstrumentId,
 };
-use pyo3::prelude::*;
+use pyo3::{IntoPyObject, IntoPyObjectExt, prelude::*};
 
 use crate::csv::{
-    load_deltas, load_depth10_from_snapshot5, load_depth10_from_snapshot25, load_quote_ticks,
-    load_trade_ticks,
+    ChunkResult, load_deltas, load_depth10_from_snapshot5, load_depth10_from_snapshot25,
+    load_quote_ticks, load_trade_ticks, stream_deltas, stream_quote_ticks, stream_trade_ticks,
 };
 
+enum TardisCsvChunks {
+    Deltas(Box<dyn Iterator<Item = ChunkResult<OrderBookDelta>>>),
+    Quotes(Box<dyn Iterator<Item = ChunkResult<QuoteTick>>>),
+    Trades(Box<dyn Iterator<Item = ChunkResult<TradeTick>>>),
+}
+
+/// Provides an iterator over chunks of data read from a Tardis format CSV file,
+/// where each chunk is a list of at most `chunk_size` objects.
+#[pyclass(unsendable, module = "nautilus_trader.core.nautilus_pyo3.tardis")]
+pub struct TardisCsvChunkIterator {
+    chunks: TardisCsvChunks,
+}
+
+#[pymethods]
+impl TardisCsvChunkIterator {
+    const fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__(&mut self, py: Python<'_>) -> PyResult<Option<PyObject>> {
+        match &mut self.chunks {
+            TardisCsvChunks::Deltas(iter) => next_chunk(py, iter.as_mut()),
+            TardisCsvChunks::Quotes(iter) => next_chunk(py, iter.as_mut()),
+            TardisCsvChunks::Trades(iter) => next_chunk(py, iter.as_mut()),
+        }
+    }
+}
+
+fn next_chunk<'py, T, I>(py: Python<'py>, iter: &mut I) -> PyResult<Option<PyObject>>
+where
+    I: Iterator<Item = ChunkResult<T>> + ?Sized,
+    Vec<T>: IntoPyObject<'py>,
+{
+    match iter.next() {
+        Some(Ok(chunk)) => Ok(Some(chunk.into_py_any(py)?)),
+        Some(Err(e)) => Err(to_pyvalue_err(e)),
+        None => Ok(None),
+    }
+}
+
+fn check_chunk_size(chunk_size: usize) -> PyResult<()> {
+    if chunk_size == 0 {
+        return Err(to_pyvalue_err("`chunk_size` must be positive"));
+    }
+    Ok(())
+}
+
 #[pyfunction(name = "load_tardis_deltas")]
 #[pyo3(signature = (filepath, price_precision=None, size_precision=None, instrument_id=None, limit=None))]
 pub fn py_load_tardis_deltas(
@@ -121,3 +168,81 @@ pub fn py_load_tardis_trades(
     )
     .map_err(to_pyvalue_err)
 }
+
+#[pyfunction(name = "stream_tardis_deltas")]
+#[pyo3(signature = (filepath, chunk_size=100_000, price_precision=None, size_precision=None, instrument_id=None, limit=None))]
+pub fn py_stream_tardis_deltas(
+    filepath: PathBuf,
+    chunk_size: usize,
+    price_precision: Option<u8>,
+    size_precision: Option<u8>,
+    instrument_id: Option<InstrumentId>,
+    limit: Option<usize>,
+) -> PyResult<TardisCsvChunkIterator> {
+    check_chunk_size(chunk_size)?;
+    let iter = stream_deltas(
+        filepath,
+        chunk_size,
+        price_precision,
+        size_precision,
+        instrument_id,
+        limit,
+    )
+    .map_err(to_pyvalue_err)?;
+
+    Ok(TardisCsvChunkIterator {
+        chunks: TardisCsvChunks::Deltas(Box::new(iter)),
+    })
+}
+
+#[pyfunction(name = "stream_tardis_quotes")]
+#[pyo3(signature = (filepath, chunk_size=100_000, price_precision=None, size_precision=None, instrument_id=None, limit=None))]
+pub fn py_stream_tardis_quotes(
+    filepath: PathBuf,
+    chunk_size: usize,
+    price_precision: Option<u8>,
+    size_precision: Option<u8>,
+    instrument_id: Option<InstrumentId>,
+    limit: Option<usize>,
+) -> PyResult<TardisCsvChunkIterator> {
+    check_chunk_size(chunk_size)?;
+    let iter = stream_quote_ticks(
+        filepath,
+        chunk_size,
+        price_precision,
+        size_precision,
+        instrument_id,
+        limit,
+    )
+    .map_err(to_pyvalue_err)?;
+
+    Ok(TardisCsvChunkIterator {
+        chunks: TardisCsvChunks::Quotes(Box::new(iter)),
+    })
+}
+
+#[pyfunction(name = "stream_tardis_trades")]
+#[pyo3(signature = (filepath, chunk_size=100_000, price_precision=None, size_precision=None, instrument_id=None, limit=None))]
+pub fn py_stream_tardis_trades(
+    filepath: PathBuf,
+    chunk_size: usize,
+    price_precision: Option<u8>,
+    size_precision: Option<u8>,
+    instrument_id: Option<InstrumentId>,
+    limit: Option<usize>,
+) -> PyResult<TardisCsvChunkIterator> {
+    check_chunk_size(chunk_size)?;
+    let iter = stream_trade_ticks(
+        filepath,
+        chunk_size,
+        price_precision,
+        size_precision,
+        instrument_id,
+        limit,
+    )
+    .map_err(to_pyvalue_err)?;
+
+    Ok(TardisCsvChunkIterator {
+        chunks: TardisCsvChunks::Trades(Box::new(iter)),
+    })
+}
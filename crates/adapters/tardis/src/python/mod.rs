@@ -35,6 +35,7 @@ pub fn tardis(_: Python<'_>, m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<super::machine::types::StreamNormalizedRequestOptions>()?;
     m.add_class::<super::machine::TardisMachineClient>()?;
     m.add_class::<super::http::client::TardisHttpClient>()?;
+    m.add_class::<csv::TardisCsvChunkIterator>()?;
     m.add_function(wrap_pyfunction!(
         enums::py_tardis_exchange_from_venue_str,
         m
@@ -55,6 +56,9 @@ pub fn tardis(_: Python<'_>, m: &Bound<'_, PyModule>) -> PyResult<()> {
     )?)?;
     m.add_function(wrap_pyfunction!(csv::py_load_tardis_quotes, m)?)?;
     m.add_function(wrap_pyfunction!(csv::py_load_tardis_trades, m)?)?;
+    m.add_function(wrap_pyfunction!(csv::py_stream_tardis_deltas, m)?)?;
+    m.add_function(wrap_pyfunction!(csv::py_stream_tardis_quotes, m)?)?;
+    m.add_function(wrap_pyfunction!(csv::py_stream_tardis_trades, m)?)?;
 
     Ok(())
 }
@@ -125,6 +125,17 @@ pub extern "C" fn test_clock_timer_count(clock: &mut TestClock_API) -> usize {
     clock.timer_count()
 }
 
+/// Returns the earliest next time across all active timers (0 if there are no timers).
+#[unsafe(no_mangle)]
+pub extern "C" fn test_clock_next_event_time(clock: &TestClock_API) -> u64 {
+    clock
+        .get_timers()
+        .values()
+        .map(|timer| timer.next_time_ns().as_u64())
+        .min()
+        .unwrap_or(0)
+}
+
 /// # Safety
 ///
 /// - Assumes `name_ptr` is a valid C string pointer.
@@ -26,6 +26,18 @@ pub extern "C" fn uuid4_new() -> UUID4 {
     UUID4::new()
 }
 
+/// Switches [`UUID4`] generation on the calling thread to a deterministic sequence from `seed`.
+#[unsafe(no_mangle)]
+pub extern "C" fn uuid4_set_seed(seed: u64) {
+    UUID4::set_seed(seed);
+}
+
+/// Restores random [`UUID4`] generation on the calling thread.
+#[unsafe(no_mangle)]
+pub extern "C" fn uuid4_clear_seed() {
+    UUID4::clear_seed();
+}
+
 /// Returns a [`UUID4`] from C string pointer.
 ///
 /// # Safety
@@ -16,10 +16,10 @@
 //! A `UUID4` Universally Unique Identifier (UUID) version 4 (RFC 4122).
 
 use std::{
+    cell::Cell,
     ffi::CStr,
     fmt::{Debug, Display, Formatter},
     hash::Hash,
-    io::{Cursor, Write},
     str::FromStr,
 };
 
@@ -30,6 +30,21 @@ use uuid::Uuid;
 /// The maximum length of ASCII characters for a `UUID4` string value (includes null terminator).
 pub(crate) const UUID4_LEN: usize = 37;
 
+const HEX_DIGITS: &[u8; 16] = b"0123456789abcdef";
+
+thread_local! {
+    /// The deterministic generator state (mixed seed, counter) for the current thread, if seeded.
+    static SEEDED_STATE: Cell<Option<(u64, u64)>> = const { Cell::new(None) };
+}
+
+/// Returns the SplitMix64 output for the given state.
+const fn splitmix64(state: u64) -> u64 {
+    let mut z = state.wrapping_add(0x9E37_79B9_7F4A_7C15);
+    z = (z ^ (z >> 30)).wrapping_mul(0xBF58_476D_1CE4_E5B9);
+    z = (z ^ (z >> 27)).wrapping_mul(0x94D0_49BB_1331_11EB);
+    z ^ (z >> 31)
+}
+
 /// Represents a Universally Unique Identifier (UUID)
 /// version 4 based on a 128-bit label as specified in RFC 4122.
 #[repr(C)]
@@ -49,30 +64,61 @@ impl UUID4 {
     /// The UUID value is stored as a fixed-length C string byte array.
     #[must_use]
     pub fn new() -> Self {
-        let mut rng = rand::rng();
         let mut bytes = [0u8; 16];
-        rng.fill_bytes(&mut bytes);
 
+        match SEEDED_STATE.get() {
+            Some((key, counter)) => {
+                // Counter-based generation, each half mixes the seed key with a distinct
+                // counter value (so sequences from nearby seeds do not overlap)
+                let state = counter.wrapping_mul(2);
+                bytes[..8].copy_from_slice(&splitmix64(key ^ splitmix64(state)).to_be_bytes());
+                bytes[8..].copy_from_slice(
+                    &splitmix64(key ^ splitmix64(state.wrapping_add(1))).to_be_bytes(),
+                );
+                SEEDED_STATE.set(Some((key, counter.wrapping_add(1))));
+            }
+            None => rand::rng().fill_bytes(&mut bytes),
+        }
+
+        Self::from_random_bytes(bytes)
+    }
+
+    /// Switches [`UUID4`] generation on the current thread to a deterministic
+    /// sequence derived from the given `seed`.
+    ///
+    /// Values are still valid version 4 RFC 4122 UUIDs, though they are no longer random.
+    /// Calling this again with the same `seed` restarts the same sequence.
+    pub fn set_seed(seed: u64) {
+        SEEDED_STATE.set(Some((splitmix64(seed), 0)));
+    }
+
+    /// Restores random [`UUID4`] generation on the current thread.
+    pub fn clear_seed() {
+        SEEDED_STATE.set(None);
+    }
+
+    /// Returns whether [`UUID4`] generation on the current thread is seeded (deterministic).
+    #[must_use]
+    pub fn is_seeded() -> bool {
+        SEEDED_STATE.get().is_some()
+    }
+
+    fn from_random_bytes(mut bytes: [u8; 16]) -> Self {
         bytes[6] = (bytes[6] & 0x0F) | 0x40; // Set the version to 4
         bytes[8] = (bytes[8] & 0x3F) | 0x80; // Set the variant to RFC 4122
 
+        // Hex encode as 8-4-4-4-12, the final byte remains the null terminator
         let mut value = [0u8; UUID4_LEN];
-        let mut cursor = Cursor::new(&mut value[..36]);
-
-        write!(
-            cursor,
-            "{:08x}-{:04x}-{:04x}-{:04x}-{:012x}",
-            u32::from_be_bytes([bytes[0], bytes[1], bytes[2], bytes[3]]),
-            u16::from_be_bytes([bytes[4], bytes[5]]),
-            u16::from_be_bytes([bytes[6], bytes[7]]),
-            u16::from_be_bytes([bytes[8], bytes[9]]),
-            u64::from_be_bytes([
-                bytes[10], bytes[11], bytes[12], bytes[13], bytes[14], bytes[15], 0, 0
-            ]) >> 16
-        )
-        .expect("Error writing UUID string to buffer");
-
-        value[36] = 0; // Add the null terminator
+        let mut pos = 0;
+        for (i, byte) in bytes.iter().enumerate() {
+            if matches!(i, 4 | 6 | 8 | 10) {
+                value[pos] = b'-';
+                pos += 1;
+            }
+            value[pos] = HEX_DIGITS[(byte >> 4) as usize];
+            value[pos + 1] = HEX_DIGITS[(byte & 0x0F) as usize];
+            pos += 2;
+        }
 
         Self { value }
     }
@@ -236,6 +282,46 @@ mod tests {
         assert!(matches!(variant_char, "8" | "9" | "a" | "b" | "A" | "B"));
     }
 
+    #[rstest]
+    fn test_new_when_seeded_is_deterministic() {
+        UUID4::set_seed(42);
+        let first: Vec<UUID4> = (0..3).map(|_| UUID4::new()).collect();
+        UUID4::set_seed(42);
+        let second: Vec<UUID4> = (0..3).map(|_| UUID4::new()).collect();
+        UUID4::clear_seed();
+
+        assert_eq!(first, second);
+        assert_ne!(first[0], first[1]);
+        assert!(!UUID4::is_seeded());
+        for uuid in first {
+            let uuid_parsed = Uuid::parse_str(&uuid.to_string()).unwrap();
+            assert_eq!(uuid_parsed.get_version().unwrap(), uuid::Version::Random);
+            assert_eq!(uuid_parsed.get_variant(), uuid::Variant::RFC4122);
+        }
+    }
+
+    #[rstest]
+    fn test_new_with_different_seeds_differs() {
+        UUID4::set_seed(1);
+        let uuid1 = UUID4::new();
+        UUID4::set_seed(2);
+        let uuid2 = UUID4::new();
+        UUID4::clear_seed();
+
+        assert_ne!(uuid1, uuid2);
+    }
+
+    #[rstest]
+    fn test_new_with_adjacent_seeds_do_not_overlap() {
+        UUID4::set_seed(0);
+        let first: Vec<UUID4> = (0..16).map(|_| UUID4::new()).collect();
+        UUID4::set_seed(2);
+        let second: Vec<UUID4> = (0..16).map(|_| UUID4::new()).collect();
+        UUID4::clear_seed();
+
+        assert!(first.iter().all(|uuid| !second.contains(uuid)));
+    }
+
     #[rstest]
     fn test_uuid_format() {
         let uuid = UUID4::new();
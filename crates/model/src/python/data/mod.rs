@@ -30,7 +30,11 @@ pub mod trade;
 use indexmap::IndexMap;
 #[cfg(feature = "ffi")]
 use nautilus_core::ffi::cvec::CVec;
-use pyo3::{exceptions::PyValueError, prelude::*, types::PyCapsule};
+use pyo3::{
+    exceptions::{PyTypeError, PyValueError},
+    prelude::*,
+    types::PyCapsule,
+};
 
 use crate::data::{
     Bar, Data, DataType, OrderBookDelta, QuoteTick, TradeTick, is_monotonically_increasing_by_init,
@@ -124,6 +128,81 @@ pub fn drop_cvec_pycapsule(_capsule: &Bound<'_, PyAny>) {
     panic!("`ffi` feature is not enabled");
 }
 
+/// Creates a Python `PyCapsule` object containing a `CVec` of the given `Data` records.
+///
+/// The capsule owns the records and drops them when it is garbage collected, so
+/// the receiver only needs to convert them (e.g. with `capsule_to_list`).
+///
+/// # Errors
+///
+/// Returns an error if creating the `PyCapsule` fails.
+#[cfg(feature = "ffi")]
+pub fn data_vec_to_pycapsule(py: Python, data: Vec<Data>) -> PyResult<PyObject> {
+    let cvec: CVec = data.into();
+    let capsule = PyCapsule::new_with_destructor(py, cvec, None, |cvec, _| {
+        if !cvec.ptr.is_null() {
+            // SAFETY: The `CVec` was created from a `Vec<Data>` above and is only dropped once
+            let data: Vec<Data> =
+                unsafe { Vec::from_raw_parts(cvec.ptr.cast::<Data>(), cvec.len, cvec.cap) };
+            drop(data);
+        }
+    })?;
+
+    Ok(capsule.into_any().unbind())
+}
+
+/// Creates a Python `PyCapsule` object containing a `CVec` of `Data` converted from
+/// the given pyo3 data objects.
+///
+/// Each object is copied directly from its Rust representation, so the whole list is
+/// handed across in a single contiguous buffer rather than one `PyCapsule` per object.
+/// The capsule owns the buffer and drops it when the capsule is garbage collected.
+///
+/// # Errors
+///
+/// Returns an error if any object is not a pyo3 `OrderBookDelta`, `QuoteTick`,
+/// `TradeTick` or `Bar`.
+#[pyfunction]
+#[cfg(feature = "ffi")]
+pub fn pyobjects_to_data_pycapsule(
+    py: Python<'_>,
+    data: Vec<Bound<'_, PyAny>>,
+) -> PyResult<PyObject> {
+    let data: Vec<Data> = data
+        .iter()
+        .map(pyobject_to_data)
+        .collect::<PyResult<Vec<Data>>>()?;
+
+    data_vec_to_pycapsule(py, data)
+}
+
+#[pyfunction]
+#[cfg(not(feature = "ffi"))]
+pub fn pyobjects_to_data_pycapsule(
+    _py: Python<'_>,
+    _data: Vec<Bound<'_, PyAny>>,
+) -> PyResult<PyObject> {
+    panic!("`ffi` feature is not enabled");
+}
+
+#[cfg(feature = "ffi")]
+fn pyobject_to_data(obj: &Bound<'_, PyAny>) -> PyResult<Data> {
+    if let Ok(quote) = obj.downcast::<QuoteTick>() {
+        Ok(Data::Quote(*quote.borrow()))
+    } else if let Ok(trade) = obj.downcast::<TradeTick>() {
+        Ok(Data::Trade(*trade.borrow()))
+    } else if let Ok(delta) = obj.downcast::<OrderBookDelta>() {
+        Ok(Data::Delta(*delta.borrow()))
+    } else if let Ok(bar) = obj.downcast::<Bar>() {
+        Ok(Data::Bar(*bar.borrow()))
+    } else {
+        Err(PyTypeError::new_err(format!(
+            "Cannot convert `{}` to `Data`",
+            obj.get_type().name()?
+        )))
+    }
+}
+
 /// Transforms the given `data` Python objects into a vector of [`OrderBookDelta`] objects.
 pub fn pyobjects_to_order_book_deltas(
     data: Vec<Bound<'_, PyAny>>,
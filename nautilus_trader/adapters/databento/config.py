@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from nautilus_trader.common.config import NonNegativeInt
+from nautilus_trader.common.config import PositiveInt
 from nautilus_trader.config import LiveDataClientConfig
 from nautilus_trader.model.identifiers import InstrumentId
 
@@ -44,6 +46,12 @@ class DatabentoDataClientConfig(LiveDataClientConfig, frozen=True):
         e.g. {'GLBX.MDP3', ['ES.FUT', 'ES.OPT']} (for all E-mini S&P 500 futures and options products).
     instrument_ids : list[InstrumentId], optional
         The instrument IDs to request instrument definitions for on start.
+    max_batch_size : PositiveInt, optional
+        The maximum number of live data records to deliver from the feed in a single batch.
+        If ``None`` then records are delivered individually.
+    max_batch_latency_us : NonNegativeInt, default 0
+        The maximum time (microseconds) to wait for a batch to fill after its first record.
+        If zero then a batch only contains the records immediately available.
 
     """
 
@@ -55,3 +63,5 @@ class DatabentoDataClientConfig(LiveDataClientConfig, frozen=True):
     mbo_subscriptions_delay: float | None = 3.0  # Need to have received all definitions
     instrument_ids: list[InstrumentId] | None = None
     parent_symbols: dict[str, set[str]] | None = None
+    max_batch_size: PositiveInt | None = None
+    max_batch_latency_us: NonNegativeInt = 0
@@ -15,6 +15,7 @@
 
 import asyncio
 from collections import defaultdict
+from collections.abc import Awaitable
 from collections.abc import Coroutine
 
 import pandas as pd
@@ -67,6 +68,7 @@ from nautilus_trader.model.data import InstrumentStatus
 from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.data import TradeTick
 from nautilus_trader.model.data import capsule_to_data
+from nautilus_trader.model.data import capsule_to_list
 from nautilus_trader.model.enums import BookType
 from nautilus_trader.model.enums import bar_aggregation_to_str
 from nautilus_trader.model.identifiers import ClientId
@@ -137,12 +139,16 @@ class DatabentoDataClient(LiveMarketDataClient):
         self._use_exchange_as_venue: bool = config.use_exchange_as_venue
         self._timeout_initial_load: float | None = config.timeout_initial_load
         self._mbo_subscriptions_delay: float | None = config.mbo_subscriptions_delay
+        self._max_batch_size: int | None = config.max_batch_size
+        self._max_batch_latency_us: int = config.max_batch_latency_us
         self._parent_symbols: dict[Dataset, set[str]] = defaultdict(set)
         self._instrument_ids: dict[Dataset, set[InstrumentId]] = defaultdict(set)
 
         self._log.info(f"{config.use_exchange_as_venue=}", LogColor.BLUE)
         self._log.info(f"{config.timeout_initial_load=}", LogColor.BLUE)
         self._log.info(f"{config.mbo_subscriptions_delay=}", LogColor.BLUE)
+        self._log.info(f"{config.max_batch_size=}", LogColor.BLUE)
+        self._log.info(f"{config.max_batch_latency_us=}", LogColor.BLUE)
 
         # Clients
         self._http_client = http_client
@@ -309,15 +315,30 @@ class DatabentoDataClient(LiveMarketDataClient):
         if not self._has_subscribed.get(dataset):
             self._log.debug(f"Starting {dataset} live client", LogColor.MAGENTA)
             future = asyncio.ensure_future(
-                live_client.start(
-                    callback=self._handle_msg,
-                    callback_pyo3=self._handle_msg_pyo3,  # Imbalance and Statistics messages
-                ),
+                self._start_live_client(live_client),
             )
             self._live_client_futures.add(future)
             self._has_subscribed[dataset] = True
             self._log.info(f"Started {dataset} live feed", LogColor.BLUE)
 
+    def _start_live_client(
+        self,
+        live_client: nautilus_pyo3.DatabentoLiveClient,
+    ) -> Awaitable[None]:
+        if self._max_batch_size is None:
+            return live_client.start(
+                callback=self._handle_msg,
+                callback_pyo3=self._handle_msg_pyo3,  # Imbalance and Statistics messages
+            )
+
+        return live_client.start(
+            callback=self._handle_msg,
+            callback_pyo3=self._handle_msg_pyo3,  # Imbalance and Statistics messages
+            callback_batch=self._handle_msg_batch,
+            max_batch_size=self._max_batch_size,
+            max_batch_latency_us=self._max_batch_latency_us,
+        )
+
     def _send_all_instruments_to_data_engine(self) -> None:
         for instrument in self._instrument_provider.get_all().values():
             self._handle_data(instrument)
@@ -567,10 +588,7 @@ class DatabentoDataClient(LiveMarketDataClient):
                 self._trade_tick_subscriptions.add(instrument_id)
 
             future = asyncio.ensure_future(
-                live_client.start(
-                    callback=self._handle_msg,
-                    callback_pyo3=self._handle_msg_pyo3,  # Imbalance and Statistics messages
-                ),
+                self._start_live_client(live_client),
             )
             self._live_client_futures.add(future)
         except asyncio.CancelledError:
@@ -1048,3 +1066,12 @@ class DatabentoDataClient(LiveMarketDataClient):
         # to `Data` is still owned and managed by Rust.
         data = capsule_to_data(pycapsule)
         self._handle_data(data)
+
+    def _handle_msg_batch(
+        self,
+        pycapsule: object,
+    ) -> None:
+        # The capsule owns the batch of `Data` records, which are dropped
+        # by Rust once the capsule is garbage collected.
+        data = capsule_to_list(pycapsule)
+        self._handle_data_batch(data)
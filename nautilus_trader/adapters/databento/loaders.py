@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from collections.abc import Generator
 from os import PathLike
 from pathlib import Path
 
@@ -324,3 +325,64 @@ class DatabentoDataLoader:
                 )
             case _:
                 raise RuntimeError(f"Loading schema {schema} not currently supported")
+
+    def stream_dbn_file(
+        self,
+        path: PathLike[str] | str,
+        chunk_size: int = 100_000,
+        instrument_id: InstrumentId | None = None,
+        price_precision: int | None = None,
+        include_trades: bool = False,
+    ) -> Generator[list[Data], None, None]:
+        """
+        Stream data objects decoded from the DBN file at the given `path` in chunks.
+
+        Only a single chunk of records is held in memory at a time, so this can be used
+        to load files which are too large to decode in full with `from_dbn_file`.
+        The data is always converted to 'legacy Cython' objects.
+
+        Parameters
+        ----------
+        path : PathLike[str] | str
+            The path for the DBN data file.
+        chunk_size : int, default 100_000
+            The maximum number of data objects per chunk.
+        instrument_id : InstrumentId, optional
+            The Nautilus instrument ID for the data (see `from_dbn_file`).
+        price_precision : int, optional
+            The price precision, if different to the default of 2 for USD.
+        include_trades : bool, default False
+            If separate `TradeTick` elements will be included in the data for MBO and MBP-1 schemas
+            when applicable.
+
+        Yields
+        ------
+        list[Data]
+
+        Raises
+        ------
+        ValueError
+            If the file schema is mixed or does not decode to market data
+            (e.g. `definition`, `status`, `imbalance` or `statistics`).
+
+        """
+        if isinstance(path, Path):
+            path = str(path.resolve())
+
+        pyo3_instrument_id: nautilus_pyo3.InstrumentId | None = (
+            nautilus_pyo3.InstrumentId.from_str(instrument_id.value)
+            if instrument_id is not None
+            else None
+        )
+
+        chunks = self._pyo3_loader.stream_data(
+            filepath=str(path),
+            chunk_size=chunk_size,
+            instrument_id=pyo3_instrument_id,
+            price_precision=price_precision,
+            include_trades=include_trades,
+        )
+
+        for capsule in chunks:
+            # Each capsule owns its `CVec`, which is dropped when the capsule is collected
+            yield capsule_to_list(capsule)
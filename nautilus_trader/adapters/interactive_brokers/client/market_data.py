@@ -434,7 +434,8 @@ class InteractiveBrokersClientMarketDataMixin(BaseMixin):
         if isinstance(end_date_time, pd.Timestamp):
             end_date_time = end_date_time.strftime("%Y%m%d %H:%M:%S %Z")
 
-        name = (str(ib_contract_to_instrument_id(contract)), tick_type)
+        # Include the start so concurrent requests for separate segments do not collide
+        name = (str(ib_contract_to_instrument_id(contract)), tick_type, start_date_time)
         if not (request := self._requests.get(name=name)):
             req_id = self._next_req_id()
             request = self._requests.add(
@@ -15,10 +15,16 @@
 
 # fmt: off
 from nautilus_trader.adapters.interactive_brokers.historical.client import HistoricInteractiveBrokersClient
+from nautilus_trader.adapters.interactive_brokers.historical.scheduler import HistoricalPacingLimiter
+from nautilus_trader.adapters.interactive_brokers.historical.scheduler import HistoricalSegmentCache
+from nautilus_trader.adapters.interactive_brokers.historical.scheduler import HistoricDownloadScheduler
 
 
 # fmt: on
 
 __all__ = [
+    "HistoricDownloadScheduler",
     "HistoricInteractiveBrokersClient",
+    "HistoricalPacingLimiter",
+    "HistoricalSegmentCache",
 ]
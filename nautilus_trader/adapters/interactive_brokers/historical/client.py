@@ -24,6 +24,8 @@ from ibapi.common import MarketDataTypeEnum
 # fmt: off
 from nautilus_trader.adapters.interactive_brokers.client import InteractiveBrokersClient
 from nautilus_trader.adapters.interactive_brokers.common import IBContract
+from nautilus_trader.adapters.interactive_brokers.historical.scheduler import HistoricDownloadScheduler
+from nautilus_trader.adapters.interactive_brokers.historical.scheduler import next_tick_request_start
 from nautilus_trader.adapters.interactive_brokers.parsing.instruments import ib_contract_to_instrument_id
 from nautilus_trader.adapters.interactive_brokers.parsing.instruments import instrument_id_to_ib_contract
 from nautilus_trader.adapters.interactive_brokers.providers import InteractiveBrokersInstrumentProvider
@@ -37,7 +39,6 @@ from nautilus_trader.common.component import MessageBus
 from nautilus_trader.common.component import init_logging
 from nautilus_trader.common.component import log_level_from_str
 from nautilus_trader.core.datetime import dt_to_unix_nanos
-from nautilus_trader.core.datetime import unix_nanos_to_dt
 from nautilus_trader.model.data import Bar
 from nautilus_trader.model.data import BarSpecification
 from nautilus_trader.model.data import BarType
@@ -196,6 +197,7 @@ class HistoricInteractiveBrokersClient:
         instrument_ids: list[str] | None = None,
         use_rth: bool = True,
         timeout: int = 120,
+        scheduler: HistoricDownloadScheduler | None = None,
     ) -> list[Bar]:
         """
         Return Bars for one or more bar specifications for a list of IBContracts and/or
@@ -224,6 +226,10 @@ class HistoricInteractiveBrokersClient:
             Whether to use regular trading hours.
         timeout : int, default 120
             The timeout (seconds) for each request.
+        scheduler : HistoricDownloadScheduler, optional
+            The scheduler to download segments concurrently within the IB pacing limits
+            (and to resume from its cache). Requires `start_date_time`, and the end
+            date time is then exclusive.
 
         Returns
         -------
@@ -244,6 +250,30 @@ class HistoricInteractiveBrokersClient:
         # Ensure instruments are fetched and cached
         await self._fetch_instruments_if_not_cached(contracts)
 
+        if scheduler is not None:
+            if start_date_time is None:
+                raise ValueError("start_date_time must be provided when using a scheduler")
+            results = await asyncio.gather(
+                *[
+                    scheduler.download_bars(
+                        self._client,
+                        contract,
+                        BarType(
+                            ib_contract_to_instrument_id(contract),
+                            BarSpecification.from_str(bar_spec),
+                            AggregationSource.EXTERNAL,
+                        ),
+                        start_date_time,
+                        end_date_time,
+                        use_rth=use_rth,
+                        timeout=timeout,
+                    )
+                    for contract in contracts
+                    for bar_spec in bar_specifications
+                ],
+            )
+            return sorted((bar for bars in results for bar in bars), key=lambda x: x.ts_init)
+
         data: list[Bar] = []
 
         for contract in contracts:
@@ -294,6 +324,7 @@ class HistoricInteractiveBrokersClient:
         instrument_ids: list[str] | None = None,
         use_rth: bool = True,
         timeout: int = 60,
+        scheduler: HistoricDownloadScheduler | None = None,
     ) -> list[TradeTick | QuoteTick]:
         """
         Return TradeTicks or QuoteTicks for one or more bar specifications for a list of
@@ -317,6 +348,9 @@ class HistoricInteractiveBrokersClient:
             Whether to use regular trading hours.
         timeout : int, default 60
             The timeout (seconds) for each request.
+        scheduler : HistoricDownloadScheduler, optional
+            The scheduler to download segments concurrently within the IB pacing limits
+            (and to resume from its cache). The end date time is then exclusive.
 
         Returns
         -------
@@ -355,6 +389,23 @@ class HistoricInteractiveBrokersClient:
         # Ensure instruments are fetched and cached
         await self._fetch_instruments_if_not_cached(contracts)
 
+        if scheduler is not None:
+            results = await asyncio.gather(
+                *[
+                    scheduler.download_ticks(
+                        self._client,
+                        contract,
+                        tick_type,
+                        start_date_time,
+                        end_date_time,
+                        use_rth=use_rth,
+                        timeout=timeout,
+                    )
+                    for contract in contracts
+                ],
+            )
+            return sorted((tick for ticks in results for tick in ticks), key=lambda x: x.ts_init)
+
         data: list[TradeTick | QuoteTick] = []
         for contract in contracts:
             instrument_id = ib_contract_to_instrument_id(contract)
@@ -420,21 +471,7 @@ class HistoricInteractiveBrokersClient:
         tuple[pd.Timestamp | None, bool]
 
         """
-        if not ticks:
-            return None, False
-
-        timestamps = [unix_nanos_to_dt(tick.ts_event) for tick in ticks]
-        min_timestamp = min(timestamps)
-        max_timestamp = max(timestamps)
-
-        if min_timestamp.floor("S") == max_timestamp.floor("S"):
-            max_timestamp = max_timestamp.floor("S") + pd.Timedelta(seconds=1)
-        if len(ticks) <= 50:
-            max_timestamp = max_timestamp.floor("S") + pd.Timedelta(minutes=1)
-        if max_timestamp >= end_date_time:
-            return None, False
-
-        return max_timestamp, True
+        return next_tick_request_start(ticks, end_date_time)
 
     async def _fetch_instruments_if_not_cached(self, contracts: list[IBContract]) -> None:
         """
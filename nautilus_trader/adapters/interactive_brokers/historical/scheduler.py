@@ -0,0 +1,690 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+import math
+import os
+import re
+import time
+from collections import deque
+from collections.abc import Awaitable
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from typing import Literal
+from typing import Protocol
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from nautilus_trader.adapters.interactive_brokers.common import IBContract
+from nautilus_trader.adapters.interactive_brokers.parsing.instruments import ib_contract_to_instrument_id
+from nautilus_trader.common.component import Logger
+from nautilus_trader.core.datetime import unix_nanos_to_dt
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.data import BarAggregation
+from nautilus_trader.model.data import BarType
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.data import TradeTick
+from nautilus_trader.serialization.arrow.serializer import ArrowSerializer
+
+
+# The longest segment requested per bar aggregation, within the IB duration limits for
+# the smallest step of each aggregation
+DEFAULT_BAR_SEGMENT_LENGTHS: dict[BarAggregation, pd.Timedelta] = {
+    BarAggregation.SECOND: pd.Timedelta(minutes=30),
+    BarAggregation.MINUTE: pd.Timedelta(days=1),
+    BarAggregation.HOUR: pd.Timedelta(days=30),
+    BarAggregation.DAY: pd.Timedelta(days=365),
+    BarAggregation.WEEK: pd.Timedelta(days=365),
+    BarAggregation.MONTH: pd.Timedelta(days=365),
+}
+
+DEFAULT_TICK_SEGMENT_LENGTH = pd.Timedelta(hours=1)
+
+
+class HistoricalDataClient(Protocol):
+    """
+    The subset of the `InteractiveBrokersClient` API used to request historical data.
+    """
+
+    async def get_historical_bars(
+        self,
+        bar_type: BarType,
+        contract: IBContract,
+        use_rth: bool,
+        end_date_time: pd.Timestamp,
+        duration: str,
+        timeout: int = 60,
+    ) -> list[Bar]: ...
+
+    async def get_historical_ticks(
+        self,
+        contract: IBContract,
+        tick_type: str,
+        start_date_time: pd.Timestamp | str = "",
+        end_date_time: pd.Timestamp | str = "",
+        use_rth: bool = True,
+        timeout: int = 60,
+    ) -> list[QuoteTick | TradeTick] | None: ...
+
+
+@dataclass(frozen=True)
+class HistoricalSegment:
+    """
+    Represents the half-open time range [start, end) of one historical data request.
+
+    Parameters
+    ----------
+    data_type : str
+        The bar type, or the instrument ID and tick type, of the data requested.
+    start : pd.Timestamp
+        The UTC start of the segment (inclusive).
+    end : pd.Timestamp
+        The UTC end of the segment (exclusive).
+    use_rth : bool, default True
+        Whether the data is for regular trading hours only.
+
+    """
+
+    data_type: str
+    start: pd.Timestamp
+    end: pd.Timestamp
+    use_rth: bool = True
+
+    @property
+    def key(self) -> str:
+        """
+        Return the unique key for the segment (safe to use as a file name).
+
+        Returns
+        -------
+        str
+
+        """
+        data_type = re.sub(r"[^\w.\-]", "_", self.data_type)
+        hours = "RTH" if self.use_rth else "ALL"
+        return f"{data_type}-{hours}-{self.start.value}-{self.end.value}"
+
+    def contains(self, ts_event: int) -> bool:
+        """
+        Return whether the given UNIX timestamp (nanoseconds) is within the segment.
+
+        Parameters
+        ----------
+        ts_event : int
+            The timestamp to check.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self.start.value <= ts_event < self.end.value
+
+    @property
+    def duration(self) -> str:
+        """
+        Return the IB duration string covering the segment.
+
+        Returns
+        -------
+        str
+
+        """
+        seconds = math.ceil((self.end - self.start).total_seconds())
+        if seconds < 86_400:
+            return f"{seconds} S"
+        return f"{math.ceil(seconds / 86_400)} D"
+
+
+def calculate_segments(
+    data_type: str,
+    start: pd.Timestamp,
+    end: pd.Timestamp,
+    length: pd.Timedelta,
+    use_rth: bool = True,
+) -> list[HistoricalSegment]:
+    """
+    Return the segments of a fixed UTC grid which cover the half-open range [start, end).
+
+    Aligning to the grid (rather than to `start`) means overlapping ranges share the
+    same segments, so each segment is only downloaded once across runs.
+
+    Parameters
+    ----------
+    data_type : str
+        The data type for the segments.
+    start : pd.Timestamp
+        The UTC start of the range.
+    end : pd.Timestamp
+        The UTC end of the range (exclusive).
+    length : pd.Timedelta
+        The length of each grid segment.
+    use_rth : bool, default True
+        Whether the data is for regular trading hours only.
+
+    Returns
+    -------
+    list[HistoricalSegment]
+
+    """
+    if length <= pd.Timedelta(0):
+        raise ValueError(f"`length` must be positive, was {length}")
+
+    start_ns = start.value
+    end_ns = end.value
+    step = length.value
+
+    segments: list[HistoricalSegment] = []
+    grid_ns = (start_ns // step) * step
+    while grid_ns < end_ns:
+        segments.append(
+            HistoricalSegment(
+                data_type=data_type,
+                start=pd.Timestamp(grid_ns, tz="UTC"),
+                end=pd.Timestamp(grid_ns + step, tz="UTC"),
+                use_rth=use_rth,
+            ),
+        )
+        grid_ns += step
+
+    return segments
+
+
+def next_tick_request_start(
+    ticks: list[TradeTick | QuoteTick],
+    end_date_time: pd.Timestamp,
+) -> tuple[pd.Timestamp | None, bool]:
+    """
+    Return the max timestamp from the given ticks and whether to continue iterating.
+    If all timestamps occur in the same second, the max timestamp will be
+    incremented by 1 second.
+
+    Parameters
+    ----------
+    ticks : list[TradeTick | QuoteTick]
+        The ticks from the last request.
+    end_date_time : pd.Timestamp
+        The end date for the ticks.
+
+    Returns
+    -------
+    tuple[pd.Timestamp | None, bool]
+
+    """
+    if not ticks:
+        return None, False
+
+    timestamps = [unix_nanos_to_dt(tick.ts_event) for tick in ticks]
+    min_timestamp = min(timestamps)
+    max_timestamp = max(timestamps)
+
+    if min_timestamp.floor("S") == max_timestamp.floor("S"):
+        max_timestamp = max_timestamp.floor("S") + pd.Timedelta(seconds=1)
+    if len(ticks) <= 50:
+        max_timestamp = max_timestamp.floor("S") + pd.Timedelta(minutes=1)
+    if max_timestamp >= end_date_time:
+        return None, False
+
+    return max_timestamp, True
+
+
+class HistoricalPacingLimiter:
+    """
+    Provides pacing of historical data requests within the IB limits.
+
+    IB rejects historical requests with a pacing violation when more than 60 are
+    made within any ten minute period, or when six or more are made for the same
+    contract within two seconds. The number of open requests is also limited.
+
+    Parameters
+    ----------
+    max_requests : int, default 60
+        The maximum number of requests within any `period_secs`.
+    period_secs : float, default 600.0
+        The rolling period (seconds) for `max_requests`.
+    max_requests_per_contract : int, default 5
+        The maximum number of requests for the same contract within any `contract_period_secs`.
+    contract_period_secs : float, default 2.0
+        The rolling period (seconds) for `max_requests_per_contract`.
+    max_concurrent : int, default 50
+        The maximum number of requests open at the same time.
+
+    """
+
+    def __init__(
+        self,
+        max_requests: int = 60,
+        period_secs: float = 600.0,
+        max_requests_per_contract: int = 5,
+        contract_period_secs: float = 2.0,
+        max_concurrent: int = 50,
+    ) -> None:
+        if max_requests <= 0 or max_requests_per_contract <= 0 or max_concurrent <= 0:
+            raise ValueError("Request limits must be positive")
+
+        self.max_requests = max_requests
+        self.period_secs = period_secs
+        self.max_requests_per_contract = max_requests_per_contract
+        self.contract_period_secs = contract_period_secs
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._requests: deque[float] = deque()
+        self._contract_requests: dict[str, deque[float]] = {}
+
+    async def acquire(self, contract_key: str) -> None:
+        """
+        Wait until a request for the given contract is allowed, then record it.
+
+        Each call must be followed by a call to `release` once the request completes.
+
+        Parameters
+        ----------
+        contract_key : str
+            The key of the contract being requested.
+
+        """
+        await self._semaphore.acquire()
+        try:
+            contract_requests = self._contract_requests.setdefault(contract_key, deque())
+            while True:
+                now = time.monotonic()
+                wait = max(
+                    _window_wait(self._requests, self.max_requests, self.period_secs, now),
+                    _window_wait(
+                        contract_requests,
+                        self.max_requests_per_contract,
+                        self.contract_period_secs,
+                        now,
+                    ),
+                )
+                if wait <= 0:
+                    self._requests.append(now)
+                    contract_requests.append(now)
+                    return
+                await asyncio.sleep(wait)
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    def release(self) -> None:
+        """
+        Release the slot of a completed request.
+        """
+        self._semaphore.release()
+
+
+def _window_wait(requests: deque[float], limit: int, period: float, now: float) -> float:
+    while requests and requests[0] <= now - period:
+        requests.popleft()
+    if len(requests) < limit:
+        return 0.0
+    return requests[0] + period - now
+
+
+class HistoricalSegmentCache:
+    """
+    Provides an on-disk cache of completed historical data segments.
+
+    Each segment is written to its own Parquet file (atomically, via a rename), so an
+    interrupted download resumes from the segments already completed. Completed segments
+    without any data (such as weekends, holidays or halts) are recorded with an empty
+    marker file, so they are not requested again.
+
+    Parameters
+    ----------
+    path : Path | str
+        The directory for the cache (created if it does not exist).
+
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def _file(self, segment: HistoricalSegment) -> Path:
+        return self.path / f"{segment.key}.parquet"
+
+    def _empty_file(self, segment: HistoricalSegment) -> Path:
+        return self.path / f"{segment.key}.empty"
+
+    def contains(self, segment: HistoricalSegment) -> bool:
+        """
+        Return whether the given segment has been cached.
+
+        Parameters
+        ----------
+        segment : HistoricalSegment
+            The segment to check.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self._file(segment).exists() or self._empty_file(segment).exists()
+
+    def load(
+        self,
+        segment: HistoricalSegment,
+        data_cls: type[Bar | QuoteTick | TradeTick],
+    ) -> list[Any] | None:
+        """
+        Return the cached data for the given segment (if found).
+
+        Parameters
+        ----------
+        segment : HistoricalSegment
+            The segment to load.
+        data_cls : type[Bar | QuoteTick | TradeTick]
+            The data type of the segment.
+
+        Returns
+        -------
+        list[Bar | QuoteTick | TradeTick] or ``None``
+
+        """
+        file = self._file(segment)
+        if not file.exists():
+            return [] if self._empty_file(segment).exists() else None
+
+        return ArrowSerializer.deserialize(data_cls, pq.read_table(file))
+
+    def store(
+        self,
+        segment: HistoricalSegment,
+        data: list[Any],
+        data_cls: type[Bar | QuoteTick | TradeTick],
+    ) -> None:
+        """
+        Store the data for the given segment.
+
+        Parameters
+        ----------
+        segment : HistoricalSegment
+            The segment to store.
+        data : list[Bar | QuoteTick | TradeTick]
+            The data for the segment (if empty then the segment is marked as empty).
+        data_cls : type[Bar | QuoteTick | TradeTick]
+            The data type of the segment.
+
+        """
+        if not data:
+            self._empty_file(segment).touch()
+            return
+
+        batch = ArrowSerializer.serialize_batch(data, data_cls)
+        table = batch if isinstance(batch, pa.Table) else pa.Table.from_batches([batch])
+
+        file = self._file(segment)
+        tmp_file = file.with_suffix(".tmp")
+        pq.write_table(table, tmp_file)
+        os.replace(tmp_file, file)
+
+
+class HistoricDownloadScheduler:
+    """
+    Provides concurrent, paced and resumable downloads of IB historical data.
+
+    A requested range is split into segments on a fixed UTC grid. Segments are
+    requested concurrently within the pacing limits, and each completed segment is
+    written to the cache (if provided) so that later or interrupted runs only request
+    the segments not already downloaded.
+
+    Parameters
+    ----------
+    cache : HistoricalSegmentCache, optional
+        The cache for completed segments.
+    pacing : HistoricalPacingLimiter, optional
+        The pacing limiter for requests. If ``None`` then the IB defaults are used.
+    bar_segment_lengths : dict[BarAggregation, pd.Timedelta], optional
+        The segment length per bar aggregation, overriding `DEFAULT_BAR_SEGMENT_LENGTHS`.
+    tick_segment_length : pd.Timedelta, default 1 hour
+        The segment length for ticks.
+
+    Notes
+    -----
+    Whole segments are always requested (and then trimmed to the requested range).
+    Segments which returned no data (or whose requests failed) are not cached,
+    as the client reports failed bar requests as empty results.
+
+    """
+
+    def __init__(
+        self,
+        cache: HistoricalSegmentCache | None = None,
+        pacing: HistoricalPacingLimiter | None = None,
+        bar_segment_lengths: dict[BarAggregation, pd.Timedelta] | None = None,
+        tick_segment_length: pd.Timedelta = DEFAULT_TICK_SEGMENT_LENGTH,
+    ) -> None:
+        self.cache = cache
+        self.pacing = pacing or HistoricalPacingLimiter()
+        self.bar_segment_lengths = {**DEFAULT_BAR_SEGMENT_LENGTHS, **(bar_segment_lengths or {})}
+        self.tick_segment_length = tick_segment_length
+        self._log = Logger(type(self).__name__)
+        self._in_flight: dict[str, asyncio.Future] = {}
+
+    async def download_bars(
+        self,
+        client: HistoricalDataClient,
+        contract: IBContract,
+        bar_type: BarType,
+        start_date_time: pd.Timestamp,
+        end_date_time: pd.Timestamp,
+        use_rth: bool = True,
+        timeout: int = 120,
+    ) -> list[Bar]:
+        """
+        Return the bars for the given contract from the UTC start up to (excluding) the end.
+
+        Parameters
+        ----------
+        client : HistoricalDataClient
+            The client to request data with.
+        contract : IBContract
+            The contract to request bars for.
+        bar_type : BarType
+            The bar type to request.
+        start_date_time : pd.Timestamp
+            The UTC start date time.
+        end_date_time : pd.Timestamp
+            The UTC end date time (exclusive).
+        use_rth : bool, default True
+            Whether to use regular trading hours.
+        timeout : int, default 120
+            The timeout (seconds) for each request.
+
+        Returns
+        -------
+        list[Bar]
+
+        """
+        aggregation = bar_type.spec.aggregation
+        length = self.bar_segment_lengths.get(aggregation)
+        if length is None:
+            raise ValueError(f"No segment length for {bar_type.spec}")
+
+        contract_key = str(ib_contract_to_instrument_id(contract))
+
+        async def fetch(segment: HistoricalSegment) -> list[Bar] | None:
+            await self.pacing.acquire(contract_key)
+            try:
+                return await client.get_historical_bars(
+                    bar_type,
+                    contract,
+                    use_rth,
+                    segment.end,
+                    segment.duration,
+                    timeout=timeout,
+                )
+            finally:
+                self.pacing.release()
+
+        segments = calculate_segments(
+            str(bar_type),
+            start_date_time,
+            end_date_time,
+            length,
+            use_rth,
+        )
+        return await self._download(segments, fetch, Bar, start_date_time, end_date_time)
+
+    async def download_ticks(
+        self,
+        client: HistoricalDataClient,
+        contract: IBContract,
+        tick_type: Literal["TRADES", "BID_ASK"],
+        start_date_time: pd.Timestamp,
+        end_date_time: pd.Timestamp,
+        use_rth: bool = True,
+        timeout: int = 60,
+    ) -> list[TradeTick | QuoteTick]:
+        """
+        Return the ticks for the given contract from the UTC start up to (excluding) the end.
+
+        Each segment is walked forward from its start one request at a time (as IB
+        limits the ticks per request), while separate segments are requested concurrently.
+
+        Parameters
+        ----------
+        client : HistoricalDataClient
+            The client to request data with.
+        contract : IBContract
+            The contract to request ticks for.
+        tick_type : Literal["TRADES", "BID_ASK"]
+            The type of ticks to request.
+        start_date_time : pd.Timestamp
+            The UTC start date time.
+        end_date_time : pd.Timestamp
+            The UTC end date time (exclusive).
+        use_rth : bool, default True
+            Whether to use regular trading hours.
+        timeout : int, default 60
+            The timeout (seconds) for each request.
+
+        Returns
+        -------
+        list[TradeTick | QuoteTick]
+
+        """
+        instrument_id = ib_contract_to_instrument_id(contract)
+        contract_key = str(instrument_id)
+
+        async def fetch(segment: HistoricalSegment) -> list[TradeTick | QuoteTick] | None:
+            data: list[TradeTick | QuoteTick] = []
+            current_start_date_time: pd.Timestamp | None = segment.start
+            while current_start_date_time is not None:
+                await self.pacing.acquire(contract_key)
+                try:
+                    ticks = await client.get_historical_ticks(
+                        contract=contract,
+                        tick_type=tick_type,
+                        start_date_time=current_start_date_time,
+                        use_rth=use_rth,
+                        timeout=timeout,
+                    )
+                finally:
+                    self.pacing.release()
+
+                if ticks is None:
+                    return None  # Request failed
+
+                data.extend(ticks)
+                current_start_date_time, _ = next_tick_request_start(ticks, segment.end)
+
+            return data
+
+        segments = calculate_segments(
+            f"{instrument_id}-{tick_type}",
+            start_date_time,
+            end_date_time,
+            self.tick_segment_length,
+            use_rth,
+        )
+        data_cls = TradeTick if tick_type == "TRADES" else QuoteTick
+        return await self._download(segments, fetch, data_cls, start_date_time, end_date_time)
+
+    async def _download(
+        self,
+        segments: list[HistoricalSegment],
+        fetch: Callable[[HistoricalSegment], Awaitable[list[Any] | None]],
+        data_cls: type[Bar | QuoteTick | TradeTick],
+        start_date_time: pd.Timestamp,
+        end_date_time: pd.Timestamp,
+    ) -> list[Any]:
+        results = await asyncio.gather(
+            *[self._download_segment(segment, fetch, data_cls) for segment in segments],
+            return_exceptions=True,
+        )
+
+        start_ns = start_date_time.value
+        end_ns = end_date_time.value
+        data: list[Any] = []
+        failed = 0
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result  # Completed segments are already cached
+            if result is None:
+                failed += 1
+                continue
+            data.extend(d for d in result if start_ns <= d.ts_event < end_ns)
+
+        if failed:
+            self._log.warning(f"{failed} of {len(segments)} segments failed to download")
+
+        return sorted(data, key=lambda x: x.ts_init)
+
+    async def _download_segment(
+        self,
+        segment: HistoricalSegment,
+        fetch: Callable[[HistoricalSegment], Awaitable[list[Any] | None]],
+        data_cls: type[Bar | QuoteTick | TradeTick],
+    ) -> list[Any] | None:
+        if self.cache is not None:
+            cached = self.cache.load(segment, data_cls)
+            if cached is not None:
+                self._log.debug(f"Loaded {len(cached)} from cache for segment {segment.key}")
+                return cached
+
+        # Overlapping downloads of the same segment share a single request
+        future = self._in_flight.get(segment.key)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch_segment(segment, fetch, data_cls))
+            future.add_done_callback(lambda _: self._in_flight.pop(segment.key, None))
+            self._in_flight[segment.key] = future
+
+        return await asyncio.shield(future)
+
+    async def _fetch_segment(
+        self,
+        segment: HistoricalSegment,
+        fetch: Callable[[HistoricalSegment], Awaitable[list[Any] | None]],
+        data_cls: type[Bar | QuoteTick | TradeTick],
+    ) -> list[Any] | None:
+        self._log.info(f"Requesting segment {segment.key}")
+        result = await fetch(segment)
+        if result is None:
+            return None
+
+        data = [d for d in result if segment.contains(d.ts_event)]
+
+        # Segments extending past now are incomplete, so are downloaded again next time
+        if self.cache is not None and segment.end <= pd.Timestamp.utcnow():
+            self.cache.store(segment, data, data_cls)
+
+        return data
+
@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from collections.abc import Generator
 from os import PathLike
 from pathlib import Path
 
@@ -275,3 +276,130 @@ class TardisCSVDataLoader:
             return TradeTick.from_pyo3_list(pyo3_trades)
 
         return pyo3_trades
+
+    def stream_deltas(
+        self,
+        filepath: PathLike[str] | str,
+        chunk_size: int = 100_000,
+        as_legacy_cython: bool = True,
+        limit: int | None = None,
+    ) -> Generator[list[OrderBookDelta] | list[nautilus_pyo3.OrderBookDelta], None, None]:
+        """
+        Stream order book deltas data from the given `filepath` in chunks.
+
+        Only a single chunk is held in memory at a time. The deltas (including their
+        flags) are identical to those returned by `load_deltas`.
+
+        Parameters
+        ----------
+        filepath : PathLike[str] | str
+            The path for the CSV data file (must be Tardis incremental book L2 format).
+        chunk_size : int, default 100_000
+            The maximum number of deltas per chunk.
+        as_legacy_cython : bool, True
+            If data should be converted to 'legacy Cython' objects.
+        limit : int, optional
+            The limit for the number of records to read.
+
+        Yields
+        ------
+        list[OrderBookDelta] | list[nautilus_pyo3.OrderBookDelta]
+
+        """
+        chunks = nautilus_pyo3.stream_tardis_deltas(
+            filepath=self._resolve_filepath(filepath),
+            chunk_size=chunk_size,
+            price_precision=self._price_precision,
+            size_precision=self._size_precision,
+            instrument_id=self._instrument_id,
+            limit=limit,
+        )
+
+        for pyo3_deltas in chunks:
+            yield OrderBookDelta.from_pyo3_list(pyo3_deltas) if as_legacy_cython else pyo3_deltas
+
+    def stream_quotes(
+        self,
+        filepath: PathLike[str] | str,
+        chunk_size: int = 100_000,
+        as_legacy_cython: bool = True,
+        limit: int | None = None,
+    ) -> Generator[list[QuoteTick] | list[nautilus_pyo3.QuoteTick], None, None]:
+        """
+        Stream quote tick data from the given `filepath` in chunks.
+
+        Only a single chunk is held in memory at a time.
+
+        Parameters
+        ----------
+        filepath : PathLike[str] | str
+            The path for the CSV data file (must be Tardis quotes format).
+        chunk_size : int, default 100_000
+            The maximum number of quotes per chunk.
+        as_legacy_cython : bool, True
+            If data should be converted to 'legacy Cython' objects.
+        limit : int, optional
+            The limit for the number of records to read.
+
+        Yields
+        ------
+        list[QuoteTick] | list[nautilus_pyo3.QuoteTick]
+
+        """
+        chunks = nautilus_pyo3.stream_tardis_quotes(
+            filepath=self._resolve_filepath(filepath),
+            chunk_size=chunk_size,
+            price_precision=self._price_precision,
+            size_precision=self._size_precision,
+            instrument_id=self._instrument_id,
+            limit=limit,
+        )
+
+        for pyo3_quotes in chunks:
+            yield QuoteTick.from_pyo3_list(pyo3_quotes) if as_legacy_cython else pyo3_quotes
+
+    def stream_trades(
+        self,
+        filepath: PathLike[str] | str,
+        chunk_size: int = 100_000,
+        as_legacy_cython: bool = True,
+        limit: int | None = None,
+    ) -> Generator[list[TradeTick] | list[nautilus_pyo3.TradeTick], None, None]:
+        """
+        Stream trade tick data from the given `filepath` in chunks.
+
+        Only a single chunk is held in memory at a time.
+
+        Parameters
+        ----------
+        filepath : PathLike[str] | str
+            The path for the CSV data file (must be Tardis trades format).
+        chunk_size : int, default 100_000
+            The maximum number of trades per chunk.
+        as_legacy_cython : bool, True
+            If data should be converted to 'legacy Cython' objects.
+        limit : int, optional
+            The limit for the number of records to read.
+
+        Yields
+        ------
+        list[TradeTick] | list[nautilus_pyo3.TradeTick]
+
+        """
+        chunks = nautilus_pyo3.stream_tardis_trades(
+            filepath=self._resolve_filepath(filepath),
+            chunk_size=chunk_size,
+            price_precision=self._price_precision,
+            size_precision=self._size_precision,
+            instrument_id=self._instrument_id,
+            limit=limit,
+        )
+
+        for pyo3_trades in chunks:
+            yield TradeTick.from_pyo3_list(pyo3_trades) if as_legacy_cython else pyo3_trades
+
+    @staticmethod
+    def _resolve_filepath(filepath: PathLike[str] | str) -> str:
+        if isinstance(filepath, Path):
+            return str(filepath.resolve())
+        return str(filepath)
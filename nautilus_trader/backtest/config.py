@@ -24,6 +24,7 @@ from nautilus_trader.common import Environment
 from nautilus_trader.common.config import ActorConfig
 from nautilus_trader.common.config import ImportableActorConfig
 from nautilus_trader.common.config import NautilusConfig
+from nautilus_trader.common.config import NonNegativeInt
 from nautilus_trader.common.config import resolve_path
 from nautilus_trader.core.datetime import dt_to_unix_nanos
 from nautilus_trader.data.config import DataEngineConfig
@@ -299,6 +300,16 @@ class BacktestEngineConfig(NautilusKernelConfig, frozen=True):
         If logging should be bypassed.
     run_analysis : bool, default True
         If post backtest performance analysis should be run.
+    profiling : bool, default False
+        If hot-path profiling should be enabled, with the results available
+        on `BacktestResult.hot_paths`.
+    uuid_seed : NonNegativeInt, optional
+        The seed for deterministic `UUID4` generation. If set, then all `UUID4`
+        values generated on the engine's thread during a run (command, event, time
+        event and response IDs) come from a seeded counter rather than the random
+        number generator, so reruns with the same inputs produce identical IDs.
+        The sequence restarts at the start of each run, and random generation is
+        restored when the run ends.
 
     """
 
@@ -308,6 +319,7 @@ class BacktestEngineConfig(NautilusKernelConfig, frozen=True):
     risk_engine: RiskEngineConfig = RiskEngineConfig()
     exec_engine: ExecEngineConfig = ExecEngineConfig()
     run_analysis: bool = True
+    uuid_seed: NonNegativeInt | None = None
 
 
 class BacktestRunConfig(NautilusConfig, frozen=True):
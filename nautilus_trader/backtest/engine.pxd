@@ -19,6 +19,7 @@ from libc.stdint cimport uint64_t
 from nautilus_trader.backtest.exchange cimport SimulatedExchange
 from nautilus_trader.common.component cimport Clock
 from nautilus_trader.common.component cimport Logger
+from nautilus_trader.common.component cimport TestClock
 from nautilus_trader.core.data cimport Data
 from nautilus_trader.core.rust.backtest cimport TimeEventAccumulatorAPI
 from nautilus_trader.core.rust.core cimport CVec
@@ -49,8 +50,13 @@ cdef class BacktestEngine:
     cdef uint64_t _data_len
     cdef uint64_t _index
     cdef uint64_t _iteration
+    cdef list _timer_heap
+    cdef dict _timer_scheduled
+    cdef uint64_t _timer_seq
 
     cdef Data _next(self)
+    cdef void _build_timer_heap(self)
+    cdef void _schedule_clock(self, TestClock clock)
     cdef CVec _advance_time(self, uint64_t ts_now)
     cdef void _process_raw_time_event_handlers(
         self,
@@ -15,6 +15,8 @@
 
 import pickle
 from decimal import Decimal
+from heapq import heappop
+from heapq import heappush
 
 import pandas as pd
 
@@ -57,12 +59,16 @@ from nautilus_trader.common.component cimport TestClock
 from nautilus_trader.common.component cimport TimeEvent
 from nautilus_trader.common.component cimport TimeEventHandler
 from nautilus_trader.common.component cimport get_component_clocks
+from nautilus_trader.common.component cimport pop_component_clocks_timers_changed
 from nautilus_trader.common.component cimport log_level_from_str
 from nautilus_trader.common.component cimport log_sysinfo
 from nautilus_trader.common.component cimport set_backtest_force_stop
 from nautilus_trader.common.component cimport set_logging_clock_realtime_mode
 from nautilus_trader.common.component cimport set_logging_clock_static_mode
 from nautilus_trader.common.component cimport set_logging_clock_static_time
+from nautilus_trader.common.profiler cimport PROFILING
+from nautilus_trader.common.profiler cimport get_profiler
+from nautilus_trader.common.profiler cimport profiler_handle_time_event
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.data cimport Data
 from nautilus_trader.core.datetime cimport format_iso8601
@@ -82,6 +88,8 @@ from nautilus_trader.core.rust.model cimport AggregationSource
 from nautilus_trader.core.rust.model cimport BookType
 from nautilus_trader.core.rust.model cimport OmsType
 from nautilus_trader.core.uuid cimport UUID4
+from nautilus_trader.core.uuid cimport clear_uuid4_seed
+from nautilus_trader.core.uuid cimport set_uuid4_seed
 from nautilus_trader.execution.algorithm cimport ExecAlgorithm
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport CustomData
@@ -143,6 +151,11 @@ cdef class BacktestEngine:
         self._index: uint64_t = 0
         self._iteration: uint64_t = 0
 
+        # Timer scheduling (next event time per component clock)
+        self._timer_heap: list[tuple[uint64_t, uint64_t, TestClock]] = []
+        self._timer_scheduled: dict[TestClock, uint64_t] = {}
+        self._timer_seq: uint64_t = 0
+
         # Timing
         self._run_started: pd.Timestamp | None = None
         self._run_finished: pd.Timestamp | None = None
@@ -887,6 +900,9 @@ cdef class BacktestEngine:
         self._backtest_start = None
         self._backtest_end = None
 
+        if self._config.profiling:
+            get_profiler().reset()
+
         self._log.info("Reset")
 
     def clear_data(self) -> None:
@@ -979,7 +995,11 @@ cdef class BacktestEngine:
             If the `start` is >= the `end` datetime.
 
         """
-        self._run(start, end, run_config_id)
+        try:
+            self._run(start, end, run_config_id)
+        except BaseException:
+            self._clear_uuid_seed()
+            raise
 
         if not streaming:
             self.end()
@@ -1024,6 +1044,7 @@ cdef class BacktestEngine:
         if LOGGING_PYO3:
             nautilus_pyo3.logging_clock_set_realtime_mode()
 
+        self._clear_uuid_seed()
         self._log_post_run()
 
     def get_result(self):
@@ -1057,6 +1078,7 @@ cdef class BacktestEngine:
             total_positions=self._kernel.cache.positions_total_count(),
             stats_pnls=stats_pnls,
             stats_returns=self._kernel.portfolio.analyzer.get_performance_stats_returns(),
+            hot_paths=self._kernel.profiling_summary(),
         )
 
     def _run(
@@ -1114,6 +1136,10 @@ cdef class BacktestEngine:
 
         if self._iteration == 0:
             # Initialize run
+            if self._config.uuid_seed is not None:
+                # Scoped to the run (restarting the sequence), cleared when it ends
+                set_uuid4_seed(self._config.uuid_seed)
+
             self._run_config_id = run_config_id  # Can be None
             self._run_id = UUID4()
             self._run_started = pd.Timestamp.utcnow()
@@ -1169,6 +1195,8 @@ cdef class BacktestEngine:
                 self._index = i
                 break
 
+        self._build_timer_heap()
+
         # -- MAIN BACKTEST LOOP -----------------------------------------------#
         cdef uint64_t last_ns = 0
         cdef uint64_t raw_handlers_count = 0
@@ -1259,17 +1287,57 @@ cdef class BacktestEngine:
         if cursor < self._data_len:
             return self._data[cursor]
 
+    cdef void _build_timer_heap(self):
+        self._timer_heap.clear()
+        self._timer_scheduled.clear()
+        pop_component_clocks_timers_changed(self._instance_id)
+
+        cdef TestClock clock
+        for clock in get_component_clocks(self._instance_id):
+            self._schedule_clock(clock)
+
+    cdef void _schedule_clock(self, TestClock clock):
+        cdef uint64_t next_time_ns = clock.next_event_time_ns()
+        if next_time_ns == 0:
+            # No active timers
+            self._timer_scheduled.pop(clock, None)
+            return
+
+        if self._timer_scheduled.get(clock) == next_time_ns:
+            return  # Already scheduled
+
+        # Any previous entry for the clock is now stale and skipped when popped
+        self._timer_scheduled[clock] = next_time_ns
+        self._timer_seq += 1
+        heappush(self._timer_heap, (next_time_ns, self._timer_seq, clock))
+
     cdef CVec _advance_time(self, uint64_t ts_now):
         cdef list[TestClock] clocks = get_component_clocks(self._instance_id)
         cdef TestClock clock
 
-        for clock in clocks:
+        # Reschedule clocks which had timers set or cancelled since the last advance
+        for clock in pop_component_clocks_timers_changed(self._instance_id):
+            self._schedule_clock(clock)
+
+        # Only advance clocks with a timer due at or before `ts_now`
+        cdef uint64_t next_time_ns
+        while self._timer_heap and self._timer_heap[0][0] <= ts_now:
+            next_time_ns, _, clock = heappop(self._timer_heap)
+            if self._timer_scheduled.get(clock) != next_time_ns:
+                continue  # Stale entry
+
+            del self._timer_scheduled[clock]
+
+            if clock._timers_changed_queue is None:
+                continue  # Clock was deregistered
+
             time_event_accumulator_advance_clock(
                 &self._accumulator,
                 &clock._mem,
                 ts_now,
                 False,
             )
+            self._schedule_clock(clock)
 
         cdef CVec raw_handlers = time_event_accumulator_drain(&self._accumulator)
 
@@ -1336,7 +1404,10 @@ cdef class BacktestEngine:
             # Cast raw `PyObject *` to a `PyObject`
             raw_callback = <PyObject *>raw_handler.callback_ptr
             callback = <object>raw_callback
-            callback(event)
+            if PROFILING:
+                profiler_handle_time_event(callback, event)
+            else:
+                callback(event)
 
             if ts_event_init != ts_last_init:
                 # Process exchange messages
@@ -1345,6 +1416,10 @@ cdef class BacktestEngine:
                 for exchange in self._venues.values():
                     exchange.process(ts_event_init)
 
+    def _clear_uuid_seed(self):
+        if self._config.uuid_seed is not None:
+            clear_uuid4_seed()  # Restore random generation outside the run
+
     def _get_log_color_code(self):
         return "\033[36m" if logging_is_colored() else ""
 
@@ -32,6 +32,9 @@ from nautilus_trader.backtest.modules cimport SimulationModule
 from nautilus_trader.cache.base cimport CacheFacade
 from nautilus_trader.common.component cimport Logger
 from nautilus_trader.common.component cimport TestClock
+from nautilus_trader.common.profiler cimport PROFILING
+from nautilus_trader.common.profiler cimport profiler_now
+from nautilus_trader.common.profiler cimport profiler_record
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.rust.model cimport AccountType
 from nautilus_trader.core.rust.model cimport BookType
@@ -688,7 +691,13 @@ cdef class SimulatedExchange:
             self.add_instrument(instrument)
             matching_engine = self._matching_engines[delta.instrument_id]
 
-        matching_engine.process_order_book_delta(delta)
+        cdef uint64_t start_ns
+        if PROFILING:
+            start_ns = profiler_now()
+            matching_engine.process_order_book_delta(delta)
+            profiler_record("OrderMatchingEngine", "process_order_book_delta", start_ns)
+        else:
+            matching_engine.process_order_book_delta(delta)
 
     cpdef void process_order_book_deltas(self, OrderBookDeltas deltas):
         """
@@ -714,7 +723,13 @@ cdef class SimulatedExchange:
             self.add_instrument(instrument)
             matching_engine = self._matching_engines[deltas.instrument_id]
 
-        matching_engine.process_order_book_deltas(deltas)
+        cdef uint64_t start_ns
+        if PROFILING:
+            start_ns = profiler_now()
+            matching_engine.process_order_book_deltas(deltas)
+            profiler_record("OrderMatchingEngine", "process_order_book_deltas", start_ns)
+        else:
+            matching_engine.process_order_book_deltas(deltas)
 
     cpdef void process_quote_tick(self, QuoteTick tick):
         """
@@ -742,7 +757,13 @@ cdef class SimulatedExchange:
             self.add_instrument(instrument)
             matching_engine = self._matching_engines[tick.instrument_id]
 
-        matching_engine.process_quote_tick(tick)
+        cdef uint64_t start_ns
+        if PROFILING:
+            start_ns = profiler_now()
+            matching_engine.process_quote_tick(tick)
+            profiler_record("OrderMatchingEngine", "process_quote_tick", start_ns)
+        else:
+            matching_engine.process_quote_tick(tick)
 
     cpdef void process_trade_tick(self, TradeTick tick):
         """
@@ -770,7 +791,13 @@ cdef class SimulatedExchange:
             self.add_instrument(instrument)
             matching_engine = self._matching_engines[tick.instrument_id]
 
-        matching_engine.process_trade_tick(tick)
+        cdef uint64_t start_ns
+        if PROFILING:
+            start_ns = profiler_now()
+            matching_engine.process_trade_tick(tick)
+            profiler_record("OrderMatchingEngine", "process_trade_tick", start_ns)
+        else:
+            matching_engine.process_trade_tick(tick)
 
     cpdef void process_bar(self, Bar bar):
         """
@@ -798,7 +825,13 @@ cdef class SimulatedExchange:
             self.add_instrument(instrument)
             matching_engine = self._matching_engines[bar.bar_type.instrument_id]
 
-        matching_engine.process_bar(bar)
+        cdef uint64_t start_ns
+        if PROFILING:
+            start_ns = profiler_now()
+            matching_engine.process_bar(bar)
+            profiler_record("OrderMatchingEngine", "process_bar", start_ns)
+        else:
+            matching_engine.process_bar(bar)
 
     cpdef void process_instrument_status(self, InstrumentStatus data):
         """
@@ -918,6 +951,10 @@ cdef class SimulatedExchange:
         cdef:
             Order order
             list[Order] orders
+            uint64_t start_ns = 0
+        if PROFILING:
+            start_ns = profiler_now()
+
         if isinstance(command, SubmitOrder):
             matching_engine.process_order(command.order, self.exec_client.account_id)
         elif isinstance(command, SubmitOrderList):
@@ -932,6 +969,9 @@ cdef class SimulatedExchange:
         elif isinstance(command, BatchCancelOrders):
             matching_engine.process_batch_cancel(command, self.exec_client.account_id)
 
+        if start_ns:
+            profiler_record("OrderMatchingEngine", type(command).__name__, start_ns)
+
 # -- EVENT GENERATORS -----------------------------------------------------------------------------
 
     cdef void _generate_fresh_account_state(self):
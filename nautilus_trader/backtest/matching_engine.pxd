@@ -31,6 +31,7 @@ from nautilus_trader.core.rust.model cimport LiquiditySide
 from nautilus_trader.core.rust.model cimport MarketStatus
 from nautilus_trader.core.rust.model cimport MarketStatusAction
 from nautilus_trader.core.rust.model cimport OmsType
+from nautilus_trader.core.rust.model cimport PriceRaw
 from nautilus_trader.core.rust.model cimport TimeInForce
 from nautilus_trader.execution.matching_core cimport MatchingCore
 from nautilus_trader.execution.messages cimport BatchCancelOrders
@@ -152,13 +153,16 @@ cdef class OrderMatchingEngine:
     cpdef void process_status(self, MarketStatusAction status)
     cpdef void process_auction_book(self, OrderBook book)
     cpdef void process_instrument_close(self, InstrumentClose close)
+    cdef bint _is_bar_range_matched(self, uint64_t ts_ns, PriceRaw bid_low, PriceRaw bid_high, PriceRaw ask_low, PriceRaw ask_high)
     cdef void _process_trade_ticks_from_bar(self, Bar bar)
+    cdef void _process_trade_bar_range(self, Bar bar, TradeTick tick)
     cdef TradeTick _create_base_trade_tick(self, Bar bar, Quantity size)
     cdef void _process_trade_bar_open(self, Bar bar, TradeTick tick)
     cdef void _process_trade_bar_high(self, Bar bar, TradeTick tick)
     cdef void _process_trade_bar_low(self, Bar bar, TradeTick tick)
     cdef void _process_trade_bar_close(self, Bar bar, TradeTick tick)
     cdef void _process_quote_ticks_from_bar(self)
+    cdef void _process_quote_bar_range(self, QuoteTick tick)
     cdef QuoteTick _create_base_quote_tick(self, Quantity bid_size, Quantity ask_size)
     cdef void _process_quote_bar_open(self, QuoteTick tick)
     cdef void _process_quote_bar_high(self, QuoteTick tick)
@@ -13,8 +13,6 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-import uuid
-
 from cpython.datetime cimport timedelta
 from libc.stdint cimport uint64_t
 
@@ -45,6 +43,7 @@ from nautilus_trader.core.rust.model cimport OrderSide
 from nautilus_trader.core.rust.model cimport OrderStatus
 from nautilus_trader.core.rust.model cimport OrderType
 from nautilus_trader.core.rust.model cimport Price_t
+from nautilus_trader.core.rust.model cimport PriceRaw
 from nautilus_trader.core.rust.model cimport PriceType
 from nautilus_trader.core.rust.model cimport QuantityRaw
 from nautilus_trader.core.rust.model cimport TimeInForce
@@ -505,6 +504,10 @@ cdef class OrderMatchingEngine:
 
         Market dynamics are simulated by auctioning open orders.
 
+        When no open order could trigger or fill anywhere within the bar's
+        [low, high] range, only the close is processed rather than the full
+        open, high, low, close sequence.
+
         Parameters
         ----------
         bar : Bar
@@ -642,6 +645,24 @@ cdef class OrderMatchingEngine:
         #             LiquiditySide.NO_LIQUIDITY_SIDE,
         #         )
 
+    cdef bint _is_bar_range_matched(
+        self,
+        uint64_t ts_ns,
+        PriceRaw bid_low,
+        PriceRaw bid_high,
+        PriceRaw ask_low,
+        PriceRaw ask_high,
+    ):
+        # Return whether the bar must be processed as the full OHLC tick sequence,
+        # otherwise no order can trigger or fill anywhere within the bar range and
+        # processing the close alone leaves the market in the same state.
+        if self._instrument_close is not None:
+            return True
+        if self._instrument_has_expiration and ts_ns >= self.instrument.expiration_ns:
+            return True
+
+        return self._core.is_range_matched(bid_low, bid_high, ask_low, ask_high)
+
     cdef void _process_trade_ticks_from_bar(self, Bar bar):
         cdef double size_value = max(bar.volume.as_double() / 4.0, self.instrument.size_increment.as_double())
         cdef Quantity size = Quantity(size_value, bar._mem.volume.precision)
@@ -649,6 +670,16 @@ cdef class OrderMatchingEngine:
         # Create base tick template
         cdef TradeTick tick = self._create_base_trade_tick(bar, size)
 
+        if not self._is_bar_range_matched(
+            tick.ts_init,
+            bar._mem.low.raw,
+            bar._mem.high.raw,
+            bar._mem.low.raw,
+            bar._mem.high.raw,
+        ):
+            self._process_trade_bar_range(bar, tick)
+            return
+
         # Process each price point
         cdef bint process_high_first = (
             not self._bar_adaptive_high_low_ordering
@@ -705,6 +736,23 @@ cdef class OrderMatchingEngine:
             self.iterate(tick.ts_init)
             self._core.set_last_raw(bar._mem.low.raw)
 
+    cdef void _process_trade_bar_range(self, Bar bar, TradeTick tick):
+        if (
+            self._core.is_last_initialized
+            and bar._mem.open.raw == self._core.last_raw
+            and bar._mem.high.raw == bar._mem.low.raw
+        ):
+            return  # No price change to process
+
+        if is_logging_initialized():
+            self._log.debug(f"Updating with close {bar.close} (no orders within bar range)")
+
+        tick._mem.price = bar._mem.close
+        tick._mem.aggressor_side = AggressorSide.BUYER if bar._mem.close.raw > bar._mem.open.raw else AggressorSide.SELLER
+        self._book.update_trade_tick(tick)
+        self.iterate(tick.ts_init)
+        self._core.set_last_raw(bar._mem.close.raw)
+
     cdef void _process_trade_bar_close(self, Bar bar, TradeTick tick):
         if bar._mem.close.raw != self._core.last_raw:
             if is_logging_initialized():
@@ -732,6 +780,18 @@ cdef class OrderMatchingEngine:
         # Create base tick template
         cdef QuoteTick tick = self._create_base_quote_tick(bid_size, ask_size)
 
+        if not self._is_bar_range_matched(
+            tick.ts_init,
+            self._last_bid_bar._mem.low.raw,
+            self._last_bid_bar._mem.high.raw,
+            self._last_ask_bar._mem.low.raw,
+            self._last_ask_bar._mem.high.raw,
+        ):
+            self._process_quote_bar_range(tick)
+            self._last_bid_bar = None
+            self._last_ask_bar = None
+            return
+
         # Process each price point
         cdef bint process_high_first = (
             not self._bar_adaptive_high_low_ordering
@@ -777,6 +837,18 @@ cdef class OrderMatchingEngine:
         self._book.update_quote_tick(tick)
         self.iterate(tick.ts_init)
 
+    cdef void _process_quote_bar_range(self, QuoteTick tick):
+        if is_logging_initialized():
+            self._log.debug(
+                f"Updating with close {self._last_bid_bar.close}/{self._last_ask_bar.close} "
+                "(no orders within bar range)",
+            )
+
+        tick._mem.bid_price = self._last_bid_bar._mem.close
+        tick._mem.ask_price = self._last_ask_bar._mem.close
+        self._book.update_quote_tick(tick)
+        self.iterate(tick.ts_init)
+
     cdef void _process_quote_bar_close(self, QuoteTick tick):
         tick._mem.bid_price = self._last_bid_bar._mem.close
         tick._mem.ask_price = self._last_ask_bar._mem.close
@@ -1449,7 +1521,7 @@ cdef class OrderMatchingEngine:
                     trader_id=position.trader_id,
                     strategy_id=position.strategy_id,
                     instrument_id=position.instrument_id,
-                    client_order_id=ClientOrderId(str(uuid.uuid4())),
+                    client_order_id=ClientOrderId(UUID4().to_str()),
                     order_side=Order.closing_side_c(position.side),
                     quantity=position.quantity,
                     init_id=UUID4(),
@@ -2121,14 +2193,14 @@ cdef class OrderMatchingEngine:
 
         self._position_count += 1
         if self._use_random_ids:
-            return PositionId(str(uuid.uuid4()))
+            return PositionId(UUID4().to_str())
         else:
             return PositionId(f"{self.venue.to_str()}-{self.raw_id}-{self._position_count:03d}")
 
     cdef VenueOrderId _generate_venue_order_id(self):
         self._order_count += 1
         if self._use_random_ids:
-            return VenueOrderId(str(uuid.uuid4()))
+            return VenueOrderId(UUID4().to_str())
         else:
             return VenueOrderId(f"{self.venue.to_str()}-{self.raw_id}-{self._order_count:03d}")
 
@@ -2138,7 +2210,7 @@ cdef class OrderMatchingEngine:
 
     cdef str _generate_trade_id_str(self):
         if self._use_random_ids:
-            return str(uuid.uuid4())
+            return UUID4().to_str()
         else:
             return f"{self.venue.to_str()}-{self.raw_id}-{self._execution_count:03d}"
 
@@ -22,7 +22,9 @@ from nautilus_trader.backtest.config import BacktestRunConfig
 from nautilus_trader.backtest.config import BacktestVenueConfig
 from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.backtest.engine import BacktestEngineConfig
+from nautilus_trader.backtest.result_cache import BacktestResultCache
 from nautilus_trader.backtest.results import BacktestResult
+from nautilus_trader.backtest.shared_data import SharedBacktestData
 from nautilus_trader.common.component import Logger
 from nautilus_trader.common.component import LogGuard
 from nautilus_trader.common.component import init_logging
@@ -60,6 +62,14 @@ class BacktestNode:
     ----------
     configs : list[BacktestRunConfig]
         The backtest run configurations.
+    shared_data : SharedBacktestData, optional
+        The pre-loaded data to load from (instead of the catalog) for any data configs
+        it contains, such as when many nodes in separate processes run on the same data.
+    result_cache : BacktestResultCache, optional
+        The cache of previous results. Runs with a cached result (for an unchanged
+        config, code version and catalog data) are not executed again, so no engine
+        is created for them (`get_engine` returns ``None``, use the cached reports).
+        Runs whose component source cannot be found are always executed, and not cached.
 
     Raises
     ------
@@ -70,7 +80,12 @@ class BacktestNode:
 
     """
 
-    def __init__(self, configs: list[BacktestRunConfig]):
+    def __init__(
+        self,
+        configs: list[BacktestRunConfig],
+        shared_data: SharedBacktestData | None = None,
+        result_cache: BacktestResultCache | None = None,
+    ):
         PyCondition.not_none(configs, "configs")
         PyCondition.not_empty(configs, "configs")
         PyCondition.is_true(
@@ -81,6 +96,8 @@ class BacktestNode:
 
         self._configs: list[BacktestRunConfig] = configs
         self._engines: dict[str, BacktestEngine] = {}
+        self._shared_data: SharedBacktestData | None = shared_data
+        self._result_cache: BacktestResultCache | None = result_cache
         self._log_guard: nautilus_pyo3.LogGuard | LogGuard | None = None
 
     @property
@@ -120,6 +137,8 @@ class BacktestNode:
         Returns
         -------
         BacktestEngine or ``None``
+            ``None`` if the result of the run was returned from the result cache, as no
+            engine is created for a cached run.
 
         """
         return self._engines.get(run_config_id)
@@ -156,6 +175,14 @@ class BacktestNode:
 
         for config in self._configs:
             try:
+                cache_key: str | None = None
+                if self._result_cache is not None:
+                    cache_key = self._result_cache.key(config)
+                    cached = self._result_cache.get(cache_key) if cache_key is not None else None
+                    if cached is not None:
+                        results.append(cached)  # Unchanged since the cached run
+                        continue
+
                 result = self._run(
                     run_config_id=config.id,
                     engine_config=config.engine,
@@ -165,6 +192,7 @@ class BacktestNode:
                     dispose_on_completion=config.dispose_on_completion,
                     start=config.start,
                     end=config.end,
+                    cache_key=cache_key,
                 )
                 results.append(result)
             except Exception as e:
@@ -317,6 +345,7 @@ class BacktestNode:
         dispose_on_completion: bool,
         start: str | int | None = None,
         end: str | int | None = None,
+        cache_key: str | None = None,
     ) -> BacktestResult:
         engine: BacktestEngine = self._create_engine(
             run_config_id=run_config_id,
@@ -344,6 +373,11 @@ class BacktestNode:
                 end=end,
             )
 
+        reports: dict[str, pd.DataFrame] | None = None
+        if self._result_cache is not None and cache_key is not None:
+            # Generate reports before any state is dropped
+            reports = self._generate_reports(engine)
+
         if dispose_on_completion:
             # Drop data and all state
             engine.dispose()
@@ -351,7 +385,24 @@ class BacktestNode:
             # Drop data
             engine.clear_data()
 
-        return engine.get_result()
+        result = engine.get_result()
+
+        if self._result_cache is not None and cache_key is not None:
+            self._result_cache.store(cache_key, result, reports)
+
+        return result
+
+    def _generate_reports(self, engine: BacktestEngine) -> dict[str, pd.DataFrame]:
+        reports: dict[str, pd.DataFrame] = {
+            "orders": engine.trader.generate_orders_report(),
+            "order_fills": engine.trader.generate_order_fills_report(),
+            "fills": engine.trader.generate_fills_report(),
+            "positions": engine.trader.generate_positions_report(),
+        }
+        for venue in engine.list_venues():
+            reports[f"account_{venue}"] = engine.trader.generate_account_report(venue)
+
+        return reports
 
     def _run_streaming(
         self,
@@ -431,7 +482,10 @@ class BacktestNode:
             engine.logger.info(
                 f"Reading {config.data_type} data for instrument={config.instrument_id}.",
             )
-            result: CatalogDataResult = self.load_data_config(config, start, end)
+            if self._shared_data is not None and self._shared_data.contains(config, start, end):
+                result: CatalogDataResult = self._shared_data.load(config, start, end)
+            else:
+                result = self.load_data_config(config, start, end)
 
             if config.instrument_id and result.instrument is None:
                 engine.logger.warning(
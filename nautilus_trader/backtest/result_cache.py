@@ -0,0 +1,367 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import importlib.util
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+import nautilus_trader
+from nautilus_trader.backtest.config import BacktestDataConfig
+from nautilus_trader.backtest.config import BacktestRunConfig
+from nautilus_trader.backtest.results import BacktestResult
+from nautilus_trader.model.data import Bar
+from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+
+
+def code_fingerprint(config: BacktestRunConfig) -> str | None:
+    """
+    Return a fingerprint of the code version for the given run `config`.
+
+    The fingerprint covers the NautilusTrader version, and the source of every module
+    referenced by an importable actor, strategy, execution algorithm or controller
+    config (both the component and its config class), along with the source of the
+    modules these import (transitively) from the same top-level package.
+
+    Only static ``import`` statements are followed, modules imported dynamically
+    (e.g. with `importlib`) or from other packages are not covered, so clear the
+    cache when these change. Components defined in the ``__main__`` script are
+    covered by the source of the script.
+
+    Parameters
+    ----------
+    config : BacktestRunConfig
+        The run config.
+
+    Returns
+    -------
+    str or ``None``
+        ``None`` if the source of a referenced module cannot be found.
+
+    """
+    engine = config.engine
+    importables = [*engine.actors, *engine.strategies, *engine.exec_algorithms]
+    if engine.controller is not None:
+        importables.append(engine.controller)
+
+    module_names: set[str] = set()
+    for importable in importables:
+        for field, value in importable.dict().items():
+            if field.endswith("_path") and isinstance(value, str):
+                module_names.add(value.partition(":")[0])
+
+    if any(_module_source_file(module_name) is None for module_name in module_names):
+        return None  # Cannot fingerprint the code
+
+    hasher = hashlib.sha256(nautilus_trader.__version__.encode())
+    for module_name in sorted(_local_module_names(module_names)):
+        hasher.update(module_name.encode())
+        hasher.update(_module_source_bytes(module_name))
+
+    return hasher.hexdigest()
+
+
+def data_fingerprint(config: BacktestDataConfig) -> str:
+    """
+    Return a fingerprint of the catalog data for the given data `config`.
+
+    The fingerprint covers the path of each parquet file for the config's data type
+    (and instrument), with its row count and the `ts_init` min/max statistics of each
+    row group, read from the parquet metadata only (the data itself is not read).
+
+    Parameters
+    ----------
+    config : BacktestDataConfig
+        The data config.
+
+    Returns
+    -------
+    str
+
+    """
+    catalog = ParquetDataCatalog(
+        path=config.catalog_path,
+        fs_protocol=config.catalog_fs_protocol,
+        fs_storage_options=config.catalog_fs_storage_options,
+    )
+    identifier = str(config.instrument_id) if config.instrument_id else None
+    if config.data_type is Bar:
+        # Bars are stored per bar type rather than per instrument
+        identifier = (
+            f"{config.instrument_id}-{config.bar_spec}-EXTERNAL" if config.bar_spec else None
+        )
+
+    directory = catalog._make_path(config.data_type, identifier)
+
+    hasher = hashlib.sha256()
+    for path in sorted(catalog.fs.glob(f"{directory}/**/*.parquet")):
+        with catalog.fs.open(path, "rb") as f:
+            metadata = pq.read_metadata(f)
+
+        hasher.update(path.encode())
+        hasher.update(str(metadata.num_rows).encode())
+
+        names = metadata.schema.names
+        ts_init_index = names.index("ts_init") if "ts_init" in names else None
+        for i in range(metadata.num_row_groups):
+            row_group = metadata.row_group(i)
+            hasher.update(str(row_group.num_rows).encode())
+            if ts_init_index is None:
+                continue
+
+            stats = row_group.column(ts_init_index).statistics
+            if stats is not None and stats.has_min_max:
+                hasher.update(f"{stats.min}-{stats.max}".encode())
+
+    return hasher.hexdigest()
+
+
+class BacktestResultCache:
+    """
+    Provides an on-disk cache of backtest results and reports for `BacktestNode`.
+
+    Results are keyed on the run config ID, the code version (see `code_fingerprint`)
+    and the catalog data (see `data_fingerprint`), so a changed config, strategy
+    source or catalog dataset results in a new key, and the run executes again.
+
+    Parameters
+    ----------
+    path : Path | str
+        The directory for the cached results (created if it does not exist).
+
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def key(self, config: BacktestRunConfig) -> str | None:
+        """
+        Return the cache key for the given run `config`.
+
+        Parameters
+        ----------
+        config : BacktestRunConfig
+            The run config.
+
+        Returns
+        -------
+        str or ``None``
+            ``None`` if the run cannot be cached (the code cannot be fingerprinted).
+
+        """
+        code = code_fingerprint(config)
+        if code is None:
+            return None
+
+        hasher = hashlib.sha256(config.id.encode())
+        hasher.update(code.encode())
+        for data_config in config.data:
+            hasher.update(data_fingerprint(data_config).encode())
+
+        return hasher.hexdigest()
+
+    def contains(self, key: str) -> bool:
+        """
+        Return whether a result is cached for the given `key`.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self._path(key).exists()
+
+    def get(self, key: str) -> BacktestResult | None:
+        """
+        Return the cached result for the given `key` (if found).
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+
+        Returns
+        -------
+        BacktestResult or ``None``
+
+        """
+        entry = self._load(key)
+        return entry["result"] if entry is not None else None
+
+    def get_reports(self, key: str) -> dict[str, pd.DataFrame]:
+        """
+        Return the cached reports for the given `key`.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+
+        Returns
+        -------
+        dict[str, pd.DataFrame]
+            The reports keyed by name, empty if no result is cached for `key`.
+
+        """
+        entry = self._load(key)
+        return entry["reports"] if entry is not None else {}
+
+    def store(
+        self,
+        key: str,
+        result: BacktestResult,
+        reports: dict[str, pd.DataFrame] | None = None,
+    ) -> None:
+        """
+        Store the given `result` and `reports` for the given `key`.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+        result : BacktestResult
+            The backtest result to store.
+        reports : dict[str, pd.DataFrame], optional
+            The reports to store, keyed by name.
+
+        """
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"result": result, "reports": reports or {}}, f)
+
+        os.replace(tmp_path, path)  # Atomic, so a concurrent reader never sees a partial file
+
+    def clear(self) -> None:
+        """
+        Remove all cached results.
+        """
+        for path in self.path.glob("*.pkl"):
+            path.unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.path / f"{key}.pkl"
+
+    def _load(self, key: str) -> dict[str, Any] | None:
+        path = self._path(key)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)  # noqa: S301 (only loads files written by this cache)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            # Removed, truncated, or written by an incompatible version (treat as a miss)
+            return None
+
+
+def _module_source_bytes(module_name: str) -> bytes:
+    source_file = _module_source_file(module_name)
+    if source_file is None:
+        return b""
+
+    return Path(source_file).read_bytes()
+
+
+def _module_source_file(module_name: str) -> str | None:
+    if module_name == "__main__":
+        # A script has no module spec (and an interactive session has no file)
+        source_file = getattr(sys.modules.get("__main__"), "__file__", None)
+        return source_file if source_file and os.path.isfile(source_file) else None
+
+    # Located from the module spec, so the module itself is not imported
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except (ImportError, ValueError):  # Missing parent package, or no spec
+        return None
+
+    if spec is None or not spec.has_location:  # Built-in or namespace package
+        return None
+
+    return spec.origin
+
+
+def _local_module_names(module_names: set[str]) -> set[str]:
+    # Return the given modules and the modules they import (transitively) from the
+    # same top-level package, excluding NautilusTrader (covered by its version)
+    roots = {name.partition(".")[0] for name in module_names}
+    roots.discard(nautilus_trader.__name__)
+
+    found: set[str] = set()
+    pending = list(module_names)
+    while pending:
+        module_name = pending.pop()
+        if module_name in found:
+            continue
+
+        found.add(module_name)
+        if module_name.partition(".")[0] not in roots:
+            continue
+
+        source_file = _module_source_file(module_name)
+        if source_file is None or not source_file.endswith(".py"):
+            continue
+
+        is_package = source_file.endswith("__init__.py")
+        package = module_name if is_package else module_name.rpartition(".")[0]
+        for imported in _imported_module_names(Path(source_file).read_bytes(), package):
+            if imported.partition(".")[0] in roots and imported not in found:
+                pending.append(imported)
+
+    return found
+
+
+def _imported_module_names(source: bytes, package: str) -> set[str]:
+    names: set[str] = set()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = "." * node.level + (node.module or "")
+            try:
+                module_name = importlib.util.resolve_name(base, package) if node.level else base
+            except ImportError:  # Relative import beyond the top-level package
+                continue
+
+            names.add(module_name)
+            for alias in node.names:
+                # The imported name may itself be a submodule
+                submodule_name = f"{module_name}.{alias.name}"
+                if _is_module(submodule_name):
+                    names.add(submodule_name)
+
+    return {name for name in names if _is_module(name)}
+
+
+def _is_module(module_name: str) -> bool:
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
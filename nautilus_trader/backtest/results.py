@@ -38,6 +38,7 @@ class BacktestResult:
     total_positions: int
     stats_pnls: dict[str, dict[str, float]]
     stats_returns: dict[str, float]
+    hot_paths: dict[str, dict[str, dict[str, int]]] | None = None
 
     # account_balances: pd.DataFrame
     # fills_report: pd.DataFrame
@@ -0,0 +1,358 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+import weakref
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+
+from nautilus_trader.backtest.config import BacktestDataConfig
+from nautilus_trader.backtest.config import BacktestRunConfig
+from nautilus_trader.core.data import Data
+from nautilus_trader.core.datetime import dt_to_unix_nanos
+from nautilus_trader.model.identifiers import ClientId
+from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+from nautilus_trader.persistence.catalog.types import CatalogDataResult
+from nautilus_trader.serialization.arrow.serializer import ArrowSerializer
+
+
+_SHM_DIR = "/dev/shm"  # noqa: S108 (tmpfs backed shared memory on Linux)
+
+
+@dataclass(frozen=True)
+class SharedDataEntry:
+    """
+    Represents the loaded data for one backtest data config, as Arrow IPC files.
+    """
+
+    data_cls: type
+    paths: tuple[str, ...]
+    count: int
+    instrument_cls: type | None = None
+    instrument_path: str | None = None
+    client_id: str | None = None
+    order_path: str | None = None
+
+
+class SharedBacktestData:
+    """
+    Provides backtest data which is loaded from the catalog once, and then shared between
+    any number of `BacktestNode` runs (including runs in separate processes).
+
+    The data for each data config is written as uncompressed Arrow IPC files (by default
+    to the tmpfs backed ``/dev/shm`` where available), which each run then memory maps
+    rather than re-reading, decompressing and filtering the catalog parquet files.
+    Each run still converts the mapped Arrow tables into data objects for the engine,
+    using the `ts_init` order recorded when the files were written.
+
+    Instances are picklable (only the directory path and the index are pickled), so the
+    same instance can be passed to worker processes.
+
+    A temporary directory created by `create` is removed when the creating instance is
+    garbage collected (or at interpreter exit), unpickled copies never remove it. For any
+    other directory the caller must call `cleanup` (or use the instance as a context
+    manager) to remove the shared data files.
+
+    Parameters
+    ----------
+    path : Path | str
+        The directory of the shared data files.
+    index : dict[str, SharedDataEntry]
+        The shared data entries keyed by data config ID and time range.
+
+    See Also
+    --------
+    SharedBacktestData.create
+
+    """
+
+    def __init__(self, path: Path | str, index: dict[str, SharedDataEntry]) -> None:
+        self.path = Path(path)
+        self.index = index
+        self._finalizer: weakref.finalize | None = None
+
+    @classmethod
+    def create(
+        cls,
+        configs: list[BacktestRunConfig],
+        path: Path | str | None = None,
+    ) -> SharedBacktestData:
+        """
+        Load the data for the given run `configs` from the catalogs, writing it to shared files.
+
+        Each distinct data config and time range is loaded from its catalog only once,
+        however many run configs share it. Streaming run configs (with a `chunk_size`)
+        are skipped, as these already read their data incrementally.
+
+        Parameters
+        ----------
+        configs : list[BacktestRunConfig]
+            The run configs to load the data for.
+        path : Path | str, optional
+            The directory to write the shared data to.
+            If ``None`` then a new temporary directory is created (under ``/dev/shm`` where available),
+            which is removed when the returned instance is garbage collected.
+
+        Returns
+        -------
+        SharedBacktestData
+
+        """
+        from nautilus_trader.backtest.node import BacktestNode
+
+        owned = path is None
+        if owned:
+            parent = _SHM_DIR if os.path.isdir(_SHM_DIR) else None
+            path = tempfile.mkdtemp(prefix="nautilus-backtest-", dir=parent)
+
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+
+        shared = cls(path, {})
+        if owned:
+            # Remove the temporary directory even if `cleanup` is never called
+            shared._finalizer = weakref.finalize(
+                shared,
+                shutil.rmtree,
+                str(path),
+                ignore_errors=True,
+            )
+
+        for run_config in configs:
+            if run_config.chunk_size is not None:
+                continue
+
+            for data_config in run_config.data:
+                key = cls.key(data_config, run_config.start, run_config.end)
+                if key in shared.index:
+                    continue
+
+                result = BacktestNode.load_data_config(
+                    data_config,
+                    run_config.start,
+                    run_config.end,
+                )
+                shared.index[key] = cls._write_result(path / key, result)
+
+        return shared
+
+    @staticmethod
+    def key(
+        config: BacktestDataConfig,
+        start: str | int | None = None,
+        end: str | int | None = None,
+    ) -> str:
+        """
+        Return the shared data key for the given data `config` and time range.
+
+        Parameters
+        ----------
+        config : BacktestDataConfig
+            The data config.
+        start : str or int, optional
+            The run start time.
+        end : str or int, optional
+            The run end time.
+
+        Returns
+        -------
+        str
+
+        """
+        start_ns = dt_to_unix_nanos(start) if start is not None else 0
+        end_ns = dt_to_unix_nanos(end) if end is not None else 0
+        return f"{config.id}-{start_ns}-{end_ns}"
+
+    def contains(
+        self,
+        config: BacktestDataConfig,
+        start: str | int | None = None,
+        end: str | int | None = None,
+    ) -> bool:
+        """
+        Return whether the data for the given data `config` and time range is shared.
+
+        Parameters
+        ----------
+        config : BacktestDataConfig
+            The data config.
+        start : str or int, optional
+            The run start time.
+        end : str or int, optional
+            The run end time.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self.key(config, start, end) in self.index
+
+    def load(
+        self,
+        config: BacktestDataConfig,
+        start: str | int | None = None,
+        end: str | int | None = None,
+    ) -> CatalogDataResult:
+        """
+        Load the shared data for the given data `config` and time range.
+
+        The Arrow buffers are memory mapped from the shared files (not copied), and
+        converted into data objects on each call (in the recorded `ts_init` order, so
+        the data is not sorted again).
+
+        Parameters
+        ----------
+        config : BacktestDataConfig
+            The data config.
+        start : str or int, optional
+            The run start time.
+        end : str or int, optional
+            The run end time.
+
+        Returns
+        -------
+        CatalogDataResult
+
+        Raises
+        ------
+        KeyError
+            If the data for `config` and the time range is not shared.
+
+        """
+        entry = self.index[self.key(config, start, end)]
+
+        groups = [
+            ParquetDataCatalog._handle_table_nautilus(_read_ipc(path), entry.data_cls)
+            for path in entry.paths
+        ]
+        if entry.order_path is None:
+            data = groups[0] if groups else []
+        else:
+            # Interleave the groups by the group index of each position in the merged order
+            iterators = [iter(group) for group in groups]
+            order = _read_ipc(entry.order_path).column(0).to_numpy()
+            data = [next(iterators[i]) for i in order]
+
+        instrument = None
+        if entry.instrument_path is not None:
+            instrument = ArrowSerializer.deserialize(
+                entry.instrument_cls,
+                _read_ipc(entry.instrument_path),
+            )[0]
+
+        return CatalogDataResult(
+            data_cls=entry.data_cls,
+            data=data,
+            instrument=instrument,
+            client_id=ClientId(entry.client_id) if entry.client_id else None,
+        )
+
+    def cleanup(self) -> None:
+        """
+        Remove the shared data files.
+
+        No runs should be loading from the shared data once this is called.
+
+        """
+        if self._finalizer is not None:
+            self._finalizer()  # Removes the directory (once only)
+        else:
+            shutil.rmtree(self.path, ignore_errors=True)
+
+        self.index = {}
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"path": str(self.path), "index": self.index}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.path = Path(state["path"])
+        self.index = state["index"]
+        self._finalizer = None  # Only the creating instance owns the directory
+
+    def __enter__(self) -> SharedBacktestData:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.cleanup()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(path={self.path}, entries={len(self.index)})"
+
+    @staticmethod
+    def _write_result(path: Path, result: CatalogDataResult) -> SharedDataEntry:
+        # Rust serialized types carry a single instrument (or bar type) in the schema
+        # metadata, so the data is written as one file per group. The group index of
+        # each object (already in `ts_init` order) is recorded to interleave them on load.
+        groups: dict[str, list[Data]] = {}
+        group_indexes: dict[str, int] = {}
+        order: list[int] = []
+        for obj in result.data:
+            group_id = str(getattr(obj, "bar_type", None) or getattr(obj, "instrument_id", None))
+            index = group_indexes.get(group_id)
+            if index is None:
+                index = len(groups)
+                group_indexes[group_id] = index
+                groups[group_id] = []
+            groups[group_id].append(obj)
+            order.append(index)
+
+        paths: list[str] = []
+        for i, group in enumerate(groups.values()):
+            paths.append(f"{path}-{i}.arrow")
+            _write_ipc(paths[-1], ArrowSerializer.serialize_batch(group, result.data_cls))
+
+        order_path = None
+        if len(groups) > 1:
+            order_path = f"{path}-order.arrow"
+            _write_ipc(order_path, pa.table({"group": pa.array(order, type=pa.uint32())}))
+
+        instrument_path = None
+        if result.instrument is not None:
+            instrument_path = f"{path}-instrument.arrow"
+            _write_ipc(
+                instrument_path,
+                ArrowSerializer.serialize_batch([result.instrument], type(result.instrument)),
+            )
+
+        return SharedDataEntry(
+            data_cls=result.data_cls,
+            paths=tuple(paths),
+            count=len(result.data),
+            instrument_cls=type(result.instrument) if result.instrument is not None else None,
+            instrument_path=instrument_path,
+            client_id=result.client_id.value if result.client_id else None,
+            order_path=order_path,
+        )
+
+
+def _write_ipc(path: str, data: pa.Table | pa.RecordBatch) -> None:
+    with pa.OSFile(path, "wb") as sink:
+        with pa.ipc.new_file(sink, data.schema) as writer:
+            writer.write(data)
+
+
+def _read_ipc(path: str) -> pa.Table:
+    # The table buffers reference the mapped pages directly (zero copy), and keep the
+    # memory map alive for as long as they are in use
+    return pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+
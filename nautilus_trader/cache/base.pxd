@@ -37,6 +37,7 @@ from nautilus_trader.model.identifiers cimport VenueOrderId
 from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.instruments.synthetic cimport SyntheticInstrument
 from nautilus_trader.model.objects cimport Currency
+from nautilus_trader.model.objects cimport Money
 from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.objects cimport Quantity
 from nautilus_trader.model.orders.base cimport Order
@@ -58,6 +59,9 @@ cdef class CacheFacade:
     cpdef list mark_prices(self, InstrumentId instrument_id)
     cpdef list index_prices(self, InstrumentId instrument_id)
     cpdef list bars(self, BarType bar_type)
+    cpdef dict quote_tick_arrays(self, InstrumentId instrument_id)
+    cpdef dict trade_tick_arrays(self, InstrumentId instrument_id)
+    cpdef dict bar_arrays(self, BarType bar_type)
     cpdef Price price(self, InstrumentId instrument_id, PriceType price_type)
     cpdef dict[InstrumentId, Price] prices(self, PriceType price_type)
     cpdef OrderBook order_book(self, InstrumentId instrument_id)
@@ -185,6 +189,8 @@ cdef class CacheFacade:
     cpdef Position position_for_order(self, ClientOrderId client_order_id)
     cpdef PositionId position_id(self, ClientOrderId client_order_id)
     cpdef list position_snapshots(self, PositionId position_id=*)
+    cpdef int position_snapshot_count(self, PositionId position_id=*)
+    cpdef Money position_snapshots_realized_pnl(self, PositionId position_id)
     cpdef list positions(self, Venue venue=*, InstrumentId instrument_id=*, StrategyId strategy_id=*, PositionSide side=*)
     cpdef list positions_open(self, Venue venue=*, InstrumentId instrument_id=*, StrategyId strategy_id=*, PositionSide side=*)
     cpdef list positions_closed(self, Venue venue=*, InstrumentId instrument_id=*, StrategyId strategy_id=*)
@@ -75,6 +75,7 @@ cdef class Cache(CacheFacade):
     cdef dict _orders
     cdef dict _order_lists
     cdef dict _positions
+    cdef int _position_max_events
     cdef dict _position_snapshots
     cdef dict _greeks
     cdef dict _yield_curves
@@ -106,10 +107,15 @@ cdef class Cache(CacheFacade):
     cdef set _index_positions
     cdef set _index_positions_open
     cdef set _index_positions_closed
+    cdef dict _index_orders_open_composite
+    cdef dict _index_positions_open_composite
     cdef set _index_actors
     cdef set _index_strategies
     cdef set _index_exec_algorithms
+    cdef dict _index_orders_purged
+    cdef dict _index_positions_purged
     cdef bint _drop_instruments_on_reset
+    cdef bint _columnar_market_data
 
     cdef readonly bint has_backing
     """If the cache has a database backing.\n\n:returns: `bool`"""
@@ -126,7 +132,7 @@ cdef class Cache(CacheFacade):
     cpdef void cache_accounts(self)
     cpdef void cache_orders(self)
     cpdef void cache_order_lists(self)
-    cpdef void cache_positions(self)
+    cpdef void cache_positions(self, int position_max_events=*)
     cpdef void build_index(self)
     cpdef bint check_integrity(self)
     cpdef bint check_residuals(self)
@@ -134,6 +140,10 @@ cdef class Cache(CacheFacade):
     cpdef void reset(self)
     cpdef void dispose(self)
     cpdef void flush_db(self)
+    cpdef void purge_closed_orders(self, uint64_t ts_now, uint64_t buffer_secs=*, int keep_count=*)
+    cpdef void purge_closed_positions(self, uint64_t ts_now, uint64_t buffer_secs=*, int keep_count=*)
+    cpdef void purge_order(self, ClientOrderId client_order_id)
+    cpdef void purge_position(self, PositionId position_id)
 
     cdef tuple _build_quote_table(self, Venue venue)
     cdef void _build_index_venue_account(self)
@@ -144,7 +154,18 @@ cdef class Cache(CacheFacade):
     cdef set _build_position_query_filter_set(self, Venue venue, InstrumentId instrument_id, StrategyId strategy_id)
     cdef list _get_orders_for_ids(self, set client_order_ids, OrderSide side)
     cdef list _get_positions_for_ids(self, set position_ids, PositionSide side)
+    cdef list _order_open_composite_keys(self, Order order)
+    cdef void _index_order_open(self, Order order)
+    cdef void _unindex_order_open(self, Order order)
+    cdef list _position_open_composite_keys(self, Position position)
+    cdef void _index_position_open(self, Position position)
+    cdef void _unindex_position_open(self, Position position)
+    cdef set _get_orders_open_index(self, Venue venue, InstrumentId instrument_id, StrategyId strategy_id, OrderSide side)
+    cdef set _get_positions_open_index(self, Venue venue, InstrumentId instrument_id, StrategyId strategy_id)
     cdef void _assign_position_id_to_contingencies(self, Order order)
+    cdef object _new_quote_tick_buffer(self, InstrumentId instrument_id)
+    cdef object _new_trade_tick_buffer(self, InstrumentId instrument_id)
+    cdef object _new_bar_buffer(self, BarType bar_type)
     cpdef Money calculate_unrealized_pnl(self, Position position)
 
     cpdef Instrument load_instrument(self, InstrumentId instrument_id)
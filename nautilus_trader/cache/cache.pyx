@@ -13,12 +13,10 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-import copy
-import pickle
 import time
-import uuid
 from collections import deque
 from decimal import Decimal
+from operator import attrgetter
 
 from nautilus_trader.cache.config import CacheConfig
 from nautilus_trader.core import nautilus_pyo3
@@ -30,10 +28,15 @@ from libc.stdint cimport uint8_t
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.accounting.accounts.base cimport Account
+from nautilus_trader.cache.columnar cimport BarRingBuffer
+from nautilus_trader.cache.columnar cimport QuoteTickRingBuffer
+from nautilus_trader.cache.columnar cimport TradeTickRingBuffer
 from nautilus_trader.cache.facade cimport CacheDatabaseFacade
+from nautilus_trader.cache.snapshots cimport PositionSnapshotBuffer
 from nautilus_trader.common.component cimport LogColor
 from nautilus_trader.common.component cimport Logger
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.rust.core cimport secs_to_nanos
 from nautilus_trader.core.rust.model cimport AggregationSource
 from nautilus_trader.core.rust.model cimport ContingencyType
 from nautilus_trader.core.rust.model cimport OmsType
@@ -77,6 +80,13 @@ from nautilus_trader.model.orders.list cimport OrderList
 from nautilus_trader.trading.strategy cimport Strategy
 
 
+_TS_LAST = attrgetter("ts_last")
+_TS_CLOSED = attrgetter("ts_closed")
+
+# The maximum number of purged IDs tracked for on-demand reload (oldest evicted first)
+cdef int _PURGED_INDEX_CAPACITY = 100_000
+
+
 cdef class Cache(CacheFacade):
     """
     Provides a common object cache for market and execution related data.
@@ -111,6 +121,7 @@ cdef class Cache(CacheFacade):
         self.has_backing = database is not None
         self.tick_capacity = config.tick_capacity
         self.bar_capacity = config.bar_capacity
+        self._columnar_market_data = config.columnar_market_data
 
         # Caches
         self._general: dict[str, bytes] = {}
@@ -132,7 +143,7 @@ cdef class Cache(CacheFacade):
         self._orders: dict[ClientOrderId, Order] = {}
         self._order_lists: dict[OrderListId, OrderList] = {}
         self._positions: dict[PositionId, Position] = {}
-        self._position_snapshots: dict[PositionId, list[bytes]] = {}
+        self._position_snapshots: dict[PositionId, PositionSnapshotBuffer] = {}
         self._greeks: dict[InstrumentId, object] = {}
         self._yield_curves: dict[str, object] = {}
 
@@ -163,9 +174,13 @@ cdef class Cache(CacheFacade):
         self._index_positions: set[PositionId] = set()
         self._index_positions_open: set[PositionId] = set()
         self._index_positions_closed: set[PositionId] = set()
+        self._index_orders_open_composite: dict[tuple, set[ClientOrderId]] = {}
+        self._index_positions_open_composite: dict[tuple, set[PositionId]] = {}
         self._index_actors: set[ComponentId] = set()
         self._index_strategies: set[StrategyId] = set()
         self._index_exec_algorithms: set[ExecAlgorithmId] = set()
+        self._index_orders_purged: dict[ClientOrderId, None] = {}  # Insertion ordered
+        self._index_positions_purged: dict[PositionId, None] = {}  # Insertion ordered
 
         self._log.info("READY")
 
@@ -398,15 +413,23 @@ cdef class Cache(CacheFacade):
             color=LogColor.BLUE if self._order_lists else LogColor.NORMAL,
         )
 
-    cpdef void cache_positions(self):
+    cpdef void cache_positions(self, int position_max_events=0):
         """
         Clear the current positions cache and load positions from the cache
         database.
+
+        Parameters
+        ----------
+        position_max_events : int, default 0
+            The maximum number of events to retain for each loaded position (0 for no limit).
+
         """
         self._log.debug(f"Loading positions from database")
 
+        self._position_max_events = position_max_events
+
         if self._database is not None:
-            self._positions = self._database.load_positions()
+            self._positions = self._database.load_positions(position_max_events)
         else:
             self._positions = {}
 
@@ -789,6 +812,8 @@ cdef class Cache(CacheFacade):
         self._index_positions.clear()
         self._index_positions_open.clear()
         self._index_positions_closed.clear()
+        self._index_orders_open_composite.clear()
+        self._index_positions_open_composite.clear()
         self._index_actors.clear()
         self._index_strategies.clear()
         self._index_exec_algorithms.clear()
@@ -822,6 +847,8 @@ cdef class Cache(CacheFacade):
         self._order_lists.clear()
         self._positions.clear()
         self._position_snapshots.clear()
+        self._index_orders_purged.clear()
+        self._index_positions_purged.clear()
         self.clear_index()
 
         if self._drop_instruments_on_reset:
@@ -853,6 +880,231 @@ cdef class Cache(CacheFacade):
 
         self._log.info("Cache database flushed")
 
+    cpdef void purge_closed_orders(
+        self,
+        uint64_t ts_now,
+        uint64_t buffer_secs = 0,
+        int keep_count = 0,
+    ):
+        """
+        Purge all closed orders from the cache which were last updated at least
+        `buffer_secs` prior to `ts_now`.
+
+        Orders are removed from memory and from every cache index. Orders with an open linked
+        (contingent) order, or which belong to a position still held in the cache, are retained
+        (so purge closed positions first).
+
+        Parameters
+        ----------
+        ts_now : uint64_t
+            UNIX timestamp (nanoseconds) of the current time.
+        buffer_secs : uint64_t, default 0
+            The minimum time (seconds) since an orders last event before it can be purged.
+        keep_count : int, default 0
+            The number of most recently updated closed orders to always retain.
+
+        Warnings
+        --------
+        Without a backing database purged orders are permanently discarded. With a database
+        they remain persisted there, and are reloaded on demand by the `order` query
+        (but are no longer included in any other order queries). Only the most recent
+        100,000 purged order IDs are tracked for reload.
+
+        """
+        Condition.not_negative_int(keep_count, "keep_count")
+
+        cdef uint64_t buffer_ns = secs_to_nanos(buffer_secs)
+        cdef list closed_orders = [self._orders[c] for c in self._index_orders_closed if c in self._orders]
+        if keep_count > 0:
+            if len(closed_orders) <= keep_count:
+                return
+            closed_orders.sort(key=_TS_LAST)
+            closed_orders = closed_orders[:len(closed_orders) - keep_count]
+
+        cdef:
+            Order order
+            ClientOrderId linked_order_id
+            Order linked_order
+            PositionId position_id
+            int count = 0
+        for order in closed_orders:
+            if order.ts_last + buffer_ns > ts_now:
+                continue
+
+            position_id = self._index_order_position.get(order.client_order_id)
+            if position_id is not None and position_id in self._positions:
+                continue
+
+            if order.linked_order_ids:
+                for linked_order_id in order.linked_order_ids:
+                    linked_order = self._orders.get(linked_order_id)
+                    if linked_order is not None and linked_order.is_open_c():
+                        break
+                else:
+                    self.purge_order(order.client_order_id)
+                    count += 1
+                continue
+
+            self.purge_order(order.client_order_id)
+            count += 1
+
+        if count:
+            self._log.info(f"Purged {count} closed order{'' if count == 1 else 's'}")
+
+    cpdef void purge_closed_positions(
+        self,
+        uint64_t ts_now,
+        uint64_t buffer_secs = 0,
+        int keep_count = 0,
+    ):
+        """
+        Purge all closed positions from the cache which were closed at least
+        `buffer_secs` prior to `ts_now`.
+
+        Positions (and their snapshots) are removed from memory and from every cache index.
+
+        Parameters
+        ----------
+        ts_now : uint64_t
+            UNIX timestamp (nanoseconds) of the current time.
+        buffer_secs : uint64_t, default 0
+            The minimum time (seconds) since a position closed before it can be purged.
+        keep_count : int, default 0
+            The number of most recently closed positions to always retain.
+
+        Warnings
+        --------
+        Purged positions no longer contribute to portfolio realized PnL aggregates
+        (`Portfolio.realized_pnl` and `Portfolio.realized_pnls`), which then only cover the
+        positions remaining in the cache, so purging reduces these by the realized PnL of
+        the purged positions.
+        Without a backing database purged positions are permanently discarded. With a database
+        they remain persisted there, and are reloaded on demand by the `position` query
+        (but are no longer included in any other position queries). Only the most recent
+        100,000 purged position IDs are tracked for reload.
+
+        """
+        Condition.not_negative_int(keep_count, "keep_count")
+
+        cdef uint64_t buffer_ns = secs_to_nanos(buffer_secs)
+        cdef list closed_positions = [self._positions[p] for p in self._index_positions_closed if p in self._positions]
+        if keep_count > 0:
+            if len(closed_positions) <= keep_count:
+                return
+            closed_positions.sort(key=_TS_CLOSED)
+            closed_positions = closed_positions[:len(closed_positions) - keep_count]
+
+        cdef:
+            Position position
+            int count = 0
+        for position in closed_positions:
+            if position.ts_closed + buffer_ns > ts_now:
+                continue
+
+            self.purge_position(position.id)
+            count += 1
+
+        if count:
+            self._log.info(f"Purged {count} closed position{'' if count == 1 else 's'}")
+
+    cpdef void purge_order(self, ClientOrderId client_order_id):
+        """
+        Purge the order for the given client order ID from the cache (if found).
+
+        The order is removed from memory and from every cache index, open orders are never purged.
+
+        Parameters
+        ----------
+        client_order_id : ClientOrderId
+            The client order ID of the order to purge.
+
+        """
+        Condition.not_none(client_order_id, "client_order_id")
+
+        cdef Order order = self._orders.get(client_order_id)
+        if order is None:
+            return
+
+        if order.is_open_c():
+            self._log.warning(f"Cannot purge open {order}")
+            return
+
+        self._orders.pop(client_order_id, None)
+        self._index_orders.discard(client_order_id)
+        self._index_orders_closed.discard(client_order_id)
+        self._index_orders_open.discard(client_order_id)
+        self._index_orders_emulated.discard(client_order_id)
+        self._index_orders_inflight.discard(client_order_id)
+        self._index_orders_pending_cancel.discard(client_order_id)
+        self._index_order_strategy.pop(client_order_id, None)
+        self._index_order_client.pop(client_order_id, None)
+
+        cdef VenueOrderId venue_order_id = self._index_client_order_ids.pop(client_order_id, None)
+        if venue_order_id is not None and self._index_venue_order_ids.get(venue_order_id) == client_order_id:
+            del self._index_venue_order_ids[venue_order_id]
+
+        cdef PositionId position_id = self._index_order_position.pop(client_order_id, None)
+        if position_id is not None:
+            discard_from_index(self._index_position_orders, position_id, client_order_id)
+
+        discard_from_index(self._index_venue_orders, order.instrument_id.venue, client_order_id)
+        discard_from_index(self._index_instrument_orders, order.instrument_id, client_order_id)
+        discard_from_index(self._index_strategy_orders, order.strategy_id, client_order_id)
+        if order.exec_algorithm_id is not None:
+            discard_from_index(self._index_exec_algorithm_orders, order.exec_algorithm_id, client_order_id)
+            discard_from_index(self._index_exec_spawn_orders, order.exec_spawn_id, client_order_id)
+
+        if self._database is not None:
+            # Remains persisted in the database for on-demand reload
+            add_to_purged_index(self._index_orders_purged, client_order_id)
+
+        self._log.debug(f"Purged {order}")
+
+    cpdef void purge_position(self, PositionId position_id):
+        """
+        Purge the position for the given position ID from the cache (if found).
+
+        The position and its snapshots are removed from memory and from every cache index,
+        open positions are never purged.
+
+        Parameters
+        ----------
+        position_id : PositionId
+            The position ID of the position to purge.
+
+        """
+        Condition.not_none(position_id, "position_id")
+
+        cdef Position position = self._positions.get(position_id)
+        if position is None:
+            return
+
+        if position.is_open_c():
+            self._log.warning(f"Cannot purge open {position}")
+            return
+
+        self._positions.pop(position_id, None)
+        self._position_snapshots.pop(position_id, None)
+        self._index_positions.discard(position_id)
+        self._index_positions_closed.discard(position_id)
+        self._index_position_strategy.pop(position_id, None)
+
+        cdef set client_order_ids = self._index_position_orders.pop(position_id, None)
+        cdef ClientOrderId client_order_id
+        for client_order_id in client_order_ids or ():
+            if self._index_order_position.get(client_order_id) == position_id:
+                del self._index_order_position[client_order_id]
+
+        discard_from_index(self._index_venue_positions, position.instrument_id.venue, position_id)
+        discard_from_index(self._index_instrument_positions, position.instrument_id, position_id)
+        discard_from_index(self._index_strategy_positions, position.strategy_id, position_id)
+
+        if self._database is not None:
+            # Remains persisted in the database for on-demand reload
+            add_to_purged_index(self._index_positions_purged, position_id)
+
+        self._log.debug(f"Purged {position}")
+
     cdef void _build_index_venue_account(self):
         cdef AccountId account_id
         for account_id in self._accounts.keys():
@@ -910,6 +1162,7 @@ cdef class Cache(CacheFacade):
             # 10: Build _index_orders_open -> {ClientOrderId}
             if order.is_open_c():
                 self._index_orders_open.add(client_order_id)
+                self._index_order_open(order)
                 if self._own_order_books:
                     self._index_orders_open_pyo3.add(nautilus_pyo3.ClientOrderId(client_order_id.value))
 
@@ -969,6 +1222,7 @@ cdef class Cache(CacheFacade):
             # 7: Build _index_positions_open -> {PositionId}
             if position.is_open_c():
                 self._index_positions_open.add(position_id)
+                self._index_position_open(position)
             # 8: Build _index_positions_closed -> {PositionId}
             elif position.is_closed_c():
                 self._index_positions_closed.add(position_id)
@@ -976,6 +1230,109 @@ cdef class Cache(CacheFacade):
             # 9: Build _index_strategies -> {StrategyId}
             self._index_strategies.add(position.strategy_id)
 
+    cdef list _order_open_composite_keys(self, Order order):
+        # Composite keys are (venue, instrument_id, strategy_id, side) with ``None``
+        # (or NO_ORDER_SIDE) as a wildcard, the instrument ID implies the venue
+        cdef list keys = []
+        for venue, instrument_id in ((None, None), (order.instrument_id.venue, None), (None, order.instrument_id)):
+            for strategy_id in (None, order.strategy_id):
+                for side in (OrderSide.NO_ORDER_SIDE, order.side):
+                    keys.append((venue, instrument_id, strategy_id, side))
+
+        # The fully wildcarded key is the `_index_orders_open` set itself
+        return keys[1:]
+
+    cdef void _index_order_open(self, Order order):
+        cdef tuple key
+        cdef set client_order_ids
+        for key in self._order_open_composite_keys(order):
+            client_order_ids = self._index_orders_open_composite.get(key)
+            if client_order_ids is None:
+                self._index_orders_open_composite[key] = {order.client_order_id}
+            else:
+                client_order_ids.add(order.client_order_id)
+
+    cdef void _unindex_order_open(self, Order order):
+        cdef tuple key
+        cdef set client_order_ids
+        for key in self._order_open_composite_keys(order):
+            client_order_ids = self._index_orders_open_composite.get(key)
+            if client_order_ids is None:
+                continue
+            client_order_ids.discard(order.client_order_id)
+            if not client_order_ids:
+                del self._index_orders_open_composite[key]
+
+    cdef list _position_open_composite_keys(self, Position position):
+        # Composite keys are (venue, instrument_id, strategy_id) with ``None`` as
+        # a wildcard, the position side can flip while open so is not indexed
+        cdef list keys = [
+            (position.instrument_id.venue, None, None),
+            (None, position.instrument_id, None),
+        ]
+        if position.strategy_id is not None:
+            keys.append((None, None, position.strategy_id))
+            keys.append((position.instrument_id.venue, None, position.strategy_id))
+            keys.append((None, position.instrument_id, position.strategy_id))
+
+        return keys
+
+    cdef void _index_position_open(self, Position position):
+        cdef tuple key
+        cdef set position_ids
+        for key in self._position_open_composite_keys(position):
+            position_ids = self._index_positions_open_composite.get(key)
+            if position_ids is None:
+                self._index_positions_open_composite[key] = {position.id}
+            else:
+                position_ids.add(position.id)
+
+    cdef void _unindex_position_open(self, Position position):
+        cdef tuple key
+        cdef set position_ids
+        for key in self._position_open_composite_keys(position):
+            position_ids = self._index_positions_open_composite.get(key)
+            if position_ids is None:
+                continue
+            position_ids.discard(position.id)
+            if not position_ids:
+                del self._index_positions_open_composite[key]
+
+    cdef set _get_orders_open_index(
+        self,
+        Venue venue,
+        InstrumentId instrument_id,
+        StrategyId strategy_id,
+        OrderSide side,
+    ):
+        # Returns the indexed set directly (callers must not mutate)
+        if instrument_id is not None and venue is not None:
+            if venue != instrument_id.venue:
+                return set()
+            venue = None  # Implied by the instrument ID
+
+        if venue is None and instrument_id is None and strategy_id is None and side == OrderSide.NO_ORDER_SIDE:
+            return self._index_orders_open
+
+        return self._index_orders_open_composite.get((venue, instrument_id, strategy_id, side), set())
+
+    cdef set _get_positions_open_index(
+        self,
+        Venue venue,
+        InstrumentId instrument_id,
+        StrategyId strategy_id,
+    ):
+        # Returns the indexed set directly (callers must not mutate)
+        if instrument_id is not None and venue is not None:
+            if venue != instrument_id.venue:
+                return set()
+            venue = None  # Implied by the instrument ID
+
+        if venue is None and instrument_id is None and strategy_id is None:
+            return self._index_positions_open
+
+        return self._index_positions_open_composite.get((venue, instrument_id, strategy_id), set())
+
     cdef void _assign_position_id_to_contingencies(self, Order order):
         cdef:
             ClientOrderId client_order_id
@@ -1242,7 +1599,7 @@ cdef class Cache(CacheFacade):
 
         if not ticks:
             # The instrument_id was not registered
-            ticks = deque(maxlen=self.tick_capacity)
+            ticks = self._new_quote_tick_buffer(instrument_id)
             self._quote_ticks[instrument_id] = ticks
 
         ticks.appendleft(tick)
@@ -1264,11 +1621,29 @@ cdef class Cache(CacheFacade):
 
         if not ticks:
             # The instrument_id was not registered
-            ticks = deque(maxlen=self.tick_capacity)
+            ticks = self._new_trade_tick_buffer(instrument_id)
             self._trade_ticks[instrument_id] = ticks
 
         ticks.appendleft(tick)
 
+    cdef object _new_quote_tick_buffer(self, InstrumentId instrument_id):
+        if self._columnar_market_data:
+            return QuoteTickRingBuffer(instrument_id, self.tick_capacity)
+
+        return deque(maxlen=self.tick_capacity)
+
+    cdef object _new_trade_tick_buffer(self, InstrumentId instrument_id):
+        if self._columnar_market_data:
+            return TradeTickRingBuffer(instrument_id, self.tick_capacity)
+
+        return deque(maxlen=self.tick_capacity)
+
+    cdef object _new_bar_buffer(self, BarType bar_type):
+        if self._columnar_market_data:
+            return BarRingBuffer(bar_type, self.bar_capacity)
+
+        return deque(maxlen=self.bar_capacity)
+
     cpdef void add_mark_price(self, MarkPriceUpdate mark_price):
         """
         Add the given mark price update to the cache.
@@ -1327,7 +1702,7 @@ cdef class Cache(CacheFacade):
 
         if not bars:
             # The bar type was not registered
-            bars = deque(maxlen=self.bar_capacity)
+            bars = self._new_bar_buffer(bar.bar_type)
             self._bars[bar.bar_type] = bars
 
         bars.appendleft(bar)
@@ -1363,7 +1738,7 @@ cdef class Cache(CacheFacade):
 
         if not cached_ticks:
             # The instrument_id was not registered
-            cached_ticks = deque(maxlen=self.tick_capacity)
+            cached_ticks = self._new_quote_tick_buffer(instrument_id)
             self._quote_ticks[instrument_id] = cached_ticks
 
         cdef QuoteTick tick
@@ -1397,7 +1772,7 @@ cdef class Cache(CacheFacade):
         cached_ticks = self._trade_ticks.get(instrument_id)
 
         if not cached_ticks:
-            cached_ticks = deque(maxlen=self.tick_capacity)
+            cached_ticks = self._new_trade_tick_buffer(instrument_id)
             self._trade_ticks[instrument_id] = cached_ticks
 
         cdef TradeTick tick
@@ -1431,7 +1806,7 @@ cdef class Cache(CacheFacade):
         cached_bars = self._bars.get(bar_type)
 
         if not cached_bars:
-            cached_bars = deque(maxlen=self.bar_capacity)
+            cached_bars = self._new_bar_buffer(bar_type)
             self._bars[bar_type] = cached_bars
 
         cdef Bar bar
@@ -1621,6 +1996,7 @@ cdef class Cache(CacheFacade):
             Condition.not_in(order.client_order_id, self._index_order_strategy, "order.client_order_id", "_index_order_strategy")
 
         self._orders[order.client_order_id] = order
+        self._index_orders_purged.pop(order.client_order_id, None)
         self._index_orders.add(order.client_order_id)
         self._index_order_strategy[order.client_order_id] = order.strategy_id
         self._index_strategies.add(order.strategy_id)
@@ -1796,8 +2172,10 @@ cdef class Cache(CacheFacade):
             Condition.not_in(position.id, self._index_positions_open, "position.id", "_index_positions_open")
 
         self._positions[position.id] = position
+        self._index_positions_purged.pop(position.id, None)
         self._index_positions.add(position.id)
         self._index_positions_open.add(position.id)
+        self._index_position_open(position)
 
         self.add_position_id(
             position.id,
@@ -1892,7 +2270,8 @@ cdef class Cache(CacheFacade):
         """
         Snapshot the given position in its current state.
 
-        The position ID will be appended with a UUID v4 string.
+        The snapshot is stored as a compact record, the position ID of the snapshot
+        position (when rebuilt) will be appended with a UUID v4 string.
 
         Parameters
         ----------
@@ -1900,20 +2279,16 @@ cdef class Cache(CacheFacade):
             The position to snapshot.
 
         """
-        cdef PositionId position_id = position.id
-        cdef list snapshots = self._position_snapshots.get(position_id)
+        Condition.not_none(position, "position")
 
-        # Reassign position ID
-        cdef Position copied_position = copy.deepcopy(position)
-        copied_position.id = PositionId(f"{position.id.to_str()}-{uuid.uuid4()}")
-        cdef bytes position_pickled = pickle.dumps(copied_position)
+        cdef PositionSnapshotBuffer snapshots = self._position_snapshots.get(position.id)
+        if snapshots is None:
+            snapshots = PositionSnapshotBuffer(position)
+            self._position_snapshots[position.id] = snapshots
 
-        if snapshots is not None:
-            snapshots.append(position_pickled)
-        else:
-            self._position_snapshots[position_id] = [position_pickled]
+        snapshots.append(position)
 
-        self._log.debug(f"Snapshot {repr(copied_position)}")
+        self._log.debug(f"Snapshot {position!r}")
 
     cpdef void snapshot_position_state(
         self,
@@ -2025,11 +2400,15 @@ cdef class Cache(CacheFacade):
         # Update open/closed state
         if order.is_open_c():
             self._index_orders_closed.discard(order.client_order_id)
-            self._index_orders_open.add(order.client_order_id)
+            if order.client_order_id not in self._index_orders_open:
+                self._index_orders_open.add(order.client_order_id)
+                self._index_order_open(order)
             if self._own_order_books:
                 self._index_orders_open_pyo3.add(nautilus_pyo3.ClientOrderId(order.client_order_id.value))
         elif order.is_closed_c():
-            self._index_orders_open.discard(order.client_order_id)
+            if order.client_order_id in self._index_orders_open:
+                self._index_orders_open.discard(order.client_order_id)
+                self._unindex_order_open(order)
             self._index_orders_pending_cancel.discard(order.client_order_id)
             self._index_orders_closed.add(order.client_order_id)
             if self._own_order_books:
@@ -2106,11 +2485,15 @@ cdef class Cache(CacheFacade):
         Condition.not_none(position, "position")
 
         if position.is_open_c():
-            self._index_positions_open.add(position.id)
+            if position.id not in self._index_positions_open:
+                self._index_positions_open.add(position.id)
+                self._index_position_open(position)
             self._index_positions_closed.discard(position.id)
         elif position.is_closed_c():
             self._index_positions_closed.add(position.id)
-            self._index_positions_open.discard(position.id)
+            if position.id in self._index_positions_open:
+                self._index_positions_open.discard(position.id)
+                self._unindex_position_open(position)
 
         if self._database is None:
             return
@@ -2321,6 +2704,120 @@ cdef class Cache(CacheFacade):
 
         return list(self._bars.get(bar_type, []))
 
+    cpdef dict quote_tick_arrays(self, InstrumentId instrument_id):
+        """
+        Return the quotes for the given instrument ID as NumPy arrays keyed by field.
+
+        The keys are 'bid_price', 'ask_price', 'bid_size', 'ask_size',
+        'price_precision', 'size_precision', 'ts_event' and 'ts_init'.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument ID for the ticks to get.
+
+        Returns
+        -------
+        dict[str, np.ndarray] or ``None``
+            If no ticks then returns ``None``.
+
+        Notes
+        -----
+        Arrays are in chronological order (oldest tick at index 0) and read-only.
+        Prices and sizes are fixed-point integers at the precision of each row.
+        With `columnar_market_data` enabled these are views of the cached columns,
+        otherwise they are built from the cached objects.
+
+        """
+        Condition.not_none(instrument_id, "instrument_id")
+
+        ticks = self._quote_ticks.get(instrument_id)
+        if not ticks:
+            return None
+
+        if isinstance(ticks, QuoteTickRingBuffer):
+            return ticks.to_arrays()
+
+        cdef QuoteTickRingBuffer buffer = QuoteTickRingBuffer(instrument_id, len(ticks))
+        buffer.extend(reversed(ticks))
+        return buffer.to_arrays()
+
+    cpdef dict trade_tick_arrays(self, InstrumentId instrument_id):
+        """
+        Return the trades for the given instrument ID as NumPy arrays keyed by field.
+
+        The keys are 'price', 'size', 'aggressor_side', 'trade_id',
+        'price_precision', 'size_precision', 'ts_event' and 'ts_init'.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument ID for the ticks to get.
+
+        Returns
+        -------
+        dict[str, np.ndarray] or ``None``
+            If no ticks then returns ``None``.
+
+        Notes
+        -----
+        Arrays are in chronological order (oldest tick at index 0) and read-only.
+        Prices and sizes are fixed-point integers at the precision of each row.
+        With `columnar_market_data` enabled these are views of the cached columns,
+        otherwise they are built from the cached objects.
+
+        """
+        Condition.not_none(instrument_id, "instrument_id")
+
+        ticks = self._trade_ticks.get(instrument_id)
+        if not ticks:
+            return None
+
+        if isinstance(ticks, TradeTickRingBuffer):
+            return ticks.to_arrays()
+
+        cdef TradeTickRingBuffer buffer = TradeTickRingBuffer(instrument_id, len(ticks))
+        buffer.extend(reversed(ticks))
+        return buffer.to_arrays()
+
+    cpdef dict bar_arrays(self, BarType bar_type):
+        """
+        Return the bars for the given bar type as NumPy arrays keyed by field.
+
+        The keys are 'open', 'high', 'low', 'close', 'volume', 'is_revision',
+        'price_precision', 'size_precision', 'ts_event' and 'ts_init'.
+
+        Parameters
+        ----------
+        bar_type : BarType
+            The bar type for bars to get.
+
+        Returns
+        -------
+        dict[str, np.ndarray] or ``None``
+            If no bars then returns ``None``.
+
+        Notes
+        -----
+        Arrays are in chronological order (oldest bar at index 0) and read-only.
+        Prices and volumes are fixed-point integers at the precision of each row.
+        With `columnar_market_data` enabled these are views of the cached columns,
+        otherwise they are built from the cached objects.
+
+        """
+        Condition.not_none(bar_type, "bar_type")
+
+        bars = self._bars.get(bar_type)
+        if not bars:
+            return None
+
+        if isinstance(bars, BarRingBuffer):
+            return bars.to_arrays()
+
+        cdef BarRingBuffer buffer = BarRingBuffer(bar_type, len(bars))
+        buffer.extend(reversed(bars))
+        return buffer.to_arrays()
+
     cpdef Price price(self, InstrumentId instrument_id, PriceType price_type):
         """
         Return the price for the given instrument ID and price type.
@@ -3445,12 +3942,12 @@ cdef class Cache(CacheFacade):
         set[ClientOrderId]
 
         """
-        cdef set query = self._build_order_query_filter_set(venue, instrument_id, strategy_id)
+        cdef set query = self._get_orders_open_index(venue, instrument_id, strategy_id, OrderSide.NO_ORDER_SIDE)
 
-        if query is None:
+        if query is self._index_orders_open:
             return self._index_orders_open
         else:
-            return self._index_orders_open.intersection(query)
+            return query.copy()
 
     cpdef set client_order_ids_closed(
         self,
@@ -3614,12 +4111,12 @@ cdef class Cache(CacheFacade):
         set[PositionId]
 
         """
-        cdef set query = self._build_position_query_filter_set(venue, instrument_id, strategy_id)
+        cdef set query = self._get_positions_open_index(venue, instrument_id, strategy_id)
 
-        if query is None:
+        if query is self._index_positions_open:
             return self._index_positions_open
         else:
-            return self._index_positions_open.intersection(query)
+            return query.copy()
 
     cpdef set position_closed_ids(
         self,
@@ -3697,7 +4194,11 @@ cdef class Cache(CacheFacade):
         """
         Condition.not_none(client_order_id, "client_order_id")
 
-        return self._orders.get(client_order_id)
+        cdef Order order = self._orders.get(client_order_id)
+        if order is None and client_order_id in self._index_orders_purged:
+            return self._database.load_order(client_order_id)
+
+        return order
 
     cpdef ClientOrderId client_order_id(self, VenueOrderId venue_order_id):
         """
@@ -3802,8 +4303,8 @@ cdef class Cache(CacheFacade):
         list[Order]
 
         """
-        cdef set client_order_ids = self.client_order_ids_open(venue, instrument_id, strategy_id)
-        return self._get_orders_for_ids(client_order_ids, side)
+        cdef set client_order_ids = self._get_orders_open_index(venue, instrument_id, strategy_id, side)
+        return self._get_orders_for_ids(client_order_ids, OrderSide.NO_ORDER_SIDE)
 
     cpdef list orders_closed(
         self,
@@ -4054,7 +4555,7 @@ cdef class Cache(CacheFacade):
         int
 
         """
-        return len(self.orders_open(venue, instrument_id, strategy_id, side))
+        return len(self._get_orders_open_index(venue, instrument_id, strategy_id, side))
 
     cpdef int orders_closed_count(
         self,
@@ -4431,7 +4932,11 @@ cdef class Cache(CacheFacade):
         """
         Condition.not_none(position_id, "position_id")
 
-        return self._positions.get(position_id)
+        cdef Position position = self._positions.get(position_id)
+        if position is None and position_id in self._index_positions_purged:
+            return self._database.load_position(position_id, self._position_max_events)
+
+        return position
 
     cpdef Position position_for_order(self, ClientOrderId client_order_id):
         """
@@ -4486,18 +4991,68 @@ cdef class Cache(CacheFacade):
         -------
         list[Position]
 
+        Notes
+        -----
+        Snapshot positions are rebuilt from compact records on each call.
+
         """
-        cdef list snapshot_list
-        cdef list snapshots
+        cdef PositionSnapshotBuffer snapshots
         if position_id is not None:
-            snapshots = self._position_snapshots.get(position_id, [])
-        else:
-            snapshots = []
-            for snapshot_list in self._position_snapshots.values():
-                snapshots += snapshot_list
+            snapshots = self._position_snapshots.get(position_id)
+            return snapshots.to_list() if snapshots is not None else []
+
+        cdef list positions = []
+        for snapshots in self._position_snapshots.values():
+            positions += snapshots.to_list()
+
+        return positions
+
+    cpdef int position_snapshot_count(self, PositionId position_id = None):
+        """
+        Return the count of position snapshots with the given optional identifier filter.
+
+        Parameters
+        ----------
+        position_id : PositionId, optional
+            The position ID query filter.
+
+        Returns
+        -------
+        int
+
+        """
+        cdef PositionSnapshotBuffer snapshots
+        if position_id is not None:
+            snapshots = self._position_snapshots.get(position_id)
+            return len(snapshots) if snapshots is not None else 0
+
+        return sum([len(snapshots) for snapshots in self._position_snapshots.values()])
+
+    cpdef Money position_snapshots_realized_pnl(self, PositionId position_id):
+        """
+        Return the total realized PnL of all snapshots for the given position ID.
 
-        cdef bytes s
-        return [pickle.loads(s) for s in snapshots]
+        The total is maintained incrementally as snapshots are taken, so no snapshot
+        positions are rebuilt.
+
+        Parameters
+        ----------
+        position_id : PositionId
+            The position ID for the snapshots.
+
+        Returns
+        -------
+        Money or ``None``
+            ``None`` if no snapshots with a realized PnL exist for the position.
+
+        """
+        Condition.not_none(position_id, "position_id")
+
+        cdef PositionSnapshotBuffer snapshots = self._position_snapshots.get(position_id)
+        if snapshots is None:
+            return None
+
+        return snapshots.realized_pnl()
 
     cpdef list positions(
         self,
@@ -4558,7 +5113,7 @@ cdef class Cache(CacheFacade):
         list[Position]
 
         """
-        cdef set position_ids = self.position_open_ids(venue, instrument_id, strategy_id)
+        cdef set position_ids = self._get_positions_open_index(venue, instrument_id, strategy_id)
         return self._get_positions_for_ids(position_ids, side)
 
     cpdef list positions_closed(
@@ -4671,6 +5226,9 @@ cdef class Cache(CacheFacade):
         int
 
         """
+        if side == PositionSide.NO_POSITION_SIDE:
+            return len(self._get_positions_open_index(venue, instrument_id, strategy_id))
+
         return len(self.positions_open(venue, instrument_id, strategy_id, side))
 
     cpdef int positions_closed_count(
@@ -4824,3 +5382,19 @@ cdef inline dict[Decimal, list[Order]] process_own_order_map(
         order_map[level_price] = orders
 
     return order_map
+
+
+cdef inline void discard_from_index(dict index, object key, object value):
+    cdef set values = index.get(key)
+    if values is None:
+        return
+
+    values.discard(value)
+    if not values:
+        del index[key]
+
+
+cdef inline void add_to_purged_index(dict index, object key):
+    index[key] = None
+    if len(index) > _PURGED_INDEX_CAPACITY:
+        del index[next(iter(index))]  # Evict the oldest
@@ -0,0 +1,91 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.model.data cimport Bar
+from nautilus_trader.model.data cimport BarType
+from nautilus_trader.model.data cimport QuoteTick
+from nautilus_trader.model.data cimport TradeTick
+from nautilus_trader.model.identifiers cimport InstrumentId
+
+
+cdef class MarketDataRingBuffer:
+    cdef int _size
+    cdef int _count
+    cdef int _head
+    cdef dict _columns
+    cdef object _latest
+    cdef int _latest_slot
+    cdef uint8_t[::1] _price_precision
+    cdef uint8_t[::1] _size_precision
+    cdef uint64_t[::1] _ts_event
+    cdef uint64_t[::1] _ts_init
+
+    cdef readonly int capacity
+    """The maximum number of rows held by the buffer.\n\n:returns: `int`"""
+
+    cdef int _next_slot(self) except -1
+    cdef int _slot(self, int index) except -1
+    cdef object _object(self, int slot)
+    cdef object _row(self, int slot)
+    cdef void _grow(self)
+    cdef void _bind(self)
+
+    cpdef void extend(self, objects)
+    cpdef list to_list(self)
+    cpdef dict to_arrays(self)
+    cpdef void clear(self)
+
+
+cdef class QuoteTickRingBuffer(MarketDataRingBuffer):
+    cdef int64_t[::1] _bid_price
+    cdef int64_t[::1] _ask_price
+    cdef uint64_t[::1] _bid_size
+    cdef uint64_t[::1] _ask_size
+
+    cdef readonly InstrumentId instrument_id
+    """The instrument ID for the buffer.\n\n:returns: `InstrumentId`"""
+
+    cpdef void append(self, QuoteTick tick)
+
+
+cdef class TradeTickRingBuffer(MarketDataRingBuffer):
+    cdef int64_t[::1] _price
+    cdef uint64_t[::1] _trade_size
+    cdef uint8_t[::1] _aggressor_side
+    cdef uint8_t[:, ::1] _trade_id
+
+    cdef readonly InstrumentId instrument_id
+    """The instrument ID for the buffer.\n\n:returns: `InstrumentId`"""
+
+    cpdef void append(self, TradeTick tick)
+    cpdef dict to_arrays(self)
+
+
+cdef class BarRingBuffer(MarketDataRingBuffer):
+    cdef int64_t[::1] _open
+    cdef int64_t[::1] _high
+    cdef int64_t[::1] _low
+    cdef int64_t[::1] _close
+    cdef uint64_t[::1] _volume
+    cdef uint8_t[::1] _is_revision
+
+    cdef readonly BarType bar_type
+    """The bar type for the buffer.\n\n:returns: `BarType`"""
+
+    cpdef void append(self, Bar bar)
@@ -0,0 +1,546 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import numpy as np
+
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
+from libc.stdint cimport uint64_t
+from libc.string cimport memcpy
+
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.rust.model cimport FIXED_PRECISION
+from nautilus_trader.core.rust.model cimport TRADE_ID_LEN
+from nautilus_trader.core.rust.model cimport AggressorSide
+from nautilus_trader.core.rust.model cimport PriceRaw
+from nautilus_trader.core.rust.model cimport QuantityRaw
+from nautilus_trader.core.rust.model cimport TradeId_t
+from nautilus_trader.model.data cimport Bar
+from nautilus_trader.model.data cimport BarType
+from nautilus_trader.model.data cimport QuoteTick
+from nautilus_trader.model.data cimport TradeTick
+from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.identifiers cimport TradeId
+
+
+cdef int _INITIAL_SIZE = 64
+
+# Powers of ten up to the maximum fixed-point precision
+cdef int64_t _POW10[17]
+_POW10[0] = 1
+for _i in range(1, 17):
+    _POW10[_i] = _POW10[_i - 1] * 10
+
+
+cdef inline int64_t _price_value(PriceRaw raw, uint8_t precision):
+    # Raw values are exact multiples of the scale for their precision
+    return <int64_t>(raw // _POW10[FIXED_PRECISION - precision])
+
+
+cdef inline uint64_t _quantity_value(QuantityRaw raw, uint8_t precision):
+    # Raw values are exact multiples of the scale for their precision
+    return <uint64_t>(raw // _POW10[FIXED_PRECISION - precision])
+
+
+cdef inline PriceRaw _price_raw(int64_t value, uint8_t precision):
+    return <PriceRaw>value * _POW10[FIXED_PRECISION - precision]
+
+
+cdef inline QuantityRaw _quantity_raw(uint64_t value, uint8_t precision):
+    return <QuantityRaw>value * <QuantityRaw>_POW10[FIXED_PRECISION - precision]
+
+
+cdef class MarketDataRingBuffer:
+    """
+    The base class for all columnar market data ring buffers.
+
+    Rows are held in preallocated NumPy columns (one array per field) which grow
+    by doubling until `capacity` is reached, after which the oldest row is
+    overwritten. Only the columns are held (not the appended objects), object
+    queries rebuild each object from its row, apart from the most recent object
+    which is retained so that the latest value is returned without rebuilding.
+
+    Prices and sizes are held as fixed-point integers at the precision of each
+    row, with the precisions in the `price_precision` and `size_precision`
+    columns (so a value is ``price / 10 ** price_precision``).
+
+    Parameters
+    ----------
+    capacity : int
+        The maximum number of rows to hold.
+    columns : list[tuple[str, object, tuple]]
+        The column definitions as (name, dtype, trailing shape).
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+
+    Warnings
+    --------
+    This class should not be used directly, but through a concrete subclass.
+
+    """
+
+    def __init__(self, int capacity, list columns not None):
+        Condition.positive_int(capacity, "capacity")
+
+        self.capacity = capacity
+        self._size = min(_INITIAL_SIZE, capacity)
+        self._count = 0
+        self._head = 0
+        self._latest = None
+        self._latest_slot = -1
+        self._columns = {
+            name: np.zeros((self._size,) + shape, dtype=dtype)
+            for name, dtype, shape in [
+                *columns,
+                ("price_precision", np.uint8, ()),
+                ("size_precision", np.uint8, ()),
+                ("ts_event", np.uint64, ()),
+                ("ts_init", np.uint64, ()),
+            ]
+        }
+        self._bind()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, int index):
+        return self._object(self._slot(index))
+
+    def __iter__(self):
+        cdef int i
+        for i in range(self._count):
+            yield self._object(self._slot(i))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(len={self._count}, capacity={self.capacity})"
+
+    cdef int _next_slot(self) except -1:
+        if self._count == self._size and self._size < self.capacity:
+            self._grow()
+
+        cdef int slot = self._head
+        self._head += 1
+        if self._head == self._size:
+            self._head = 0
+
+        if self._count < self._size:
+            self._count += 1
+
+        self._latest = None  # Set by the subclass once the row is written
+        self._latest_slot = slot
+        return slot
+
+    cdef int _slot(self, int index) except -1:
+        if index < 0:
+            index += self._count
+
+        if index < 0 or index >= self._count:
+            raise IndexError("index out of range")
+
+        # Reverse indexed (most recent row at index 0)
+        cdef int slot = self._head - 1 - index
+        if slot < 0:
+            slot += self._size
+
+        return slot
+
+    cdef object _object(self, int slot):
+        if slot == self._latest_slot and self._latest is not None:
+            return self._latest
+
+        return self._row(slot)
+
+    cdef object _row(self, int slot):
+        raise NotImplementedError("method `_row` must be implemented in the subclass")  # pragma: no cover
+
+    cdef void _grow(self):
+        # Only called when full and not yet at capacity, so rows are in order
+        cdef int new_size = min(self._size * 2, self.capacity)
+
+        cdef str name
+        for name, column in self._columns.items():
+            grown = np.zeros((new_size,) + column.shape[1:], dtype=column.dtype)
+            grown[:self._size] = column
+            self._columns[name] = grown
+
+        self._head = self._size
+        self._size = new_size
+        self._bind()
+
+    cdef void _bind(self):
+        self._price_precision = self._columns["price_precision"]
+        self._size_precision = self._columns["size_precision"]
+        self._ts_event = self._columns["ts_event"]
+        self._ts_init = self._columns["ts_init"]
+
+    cpdef void extend(self, objects):
+        """
+        Append the given objects to the buffer (in the order given).
+
+        Parameters
+        ----------
+        objects : Iterable
+            The objects to append, oldest first.
+
+        """
+        for obj in objects:
+            self.append(obj)
+
+    cpdef list to_list(self):
+        """
+        Return the buffered objects (rebuilt from the columns).
+
+        Returns
+        -------
+        list
+
+        Notes
+        -----
+        Reverse indexed (most recent object at index 0).
+
+        """
+        cdef list objects = []
+
+        cdef int i
+        for i in range(self._count):
+            objects.append(self._object(self._slot(i)))
+
+        return objects
+
+    cpdef dict to_arrays(self):
+        """
+        Return the buffered rows as read-only NumPy arrays keyed by column name.
+
+        While the rows are contiguous in the underlying columns the arrays are
+        zero-copy views, once the buffer has wrapped each column is copied once
+        into chronological order.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+
+        Notes
+        -----
+        Arrays are in chronological order (oldest row at index 0).
+
+        """
+        cdef int start = self._head - self._count
+        if start < 0:
+            start += self._size
+
+        cdef dict arrays = {}
+
+        cdef str name
+        for name, column in self._columns.items():
+            if start + self._count <= self._size:
+                array = column[start:start + self._count]
+            else:
+                array = np.concatenate((column[start:], column[:self._head]))
+            array.flags.writeable = False
+            arrays[name] = array
+
+        return arrays
+
+    cpdef void clear(self):
+        """
+        Clear all rows from the buffer (the allocated columns are retained).
+        """
+        self._count = 0
+        self._head = 0
+        self._latest = None
+        self._latest_slot = -1
+
+
+cdef class QuoteTickRingBuffer(MarketDataRingBuffer):
+    """
+    Provides a columnar ring buffer of quote ticks for a single instrument.
+
+    Parameters
+    ----------
+    instrument_id : InstrumentId
+        The instrument ID for the buffer.
+    capacity : int
+        The maximum number of ticks to hold.
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+
+    """
+
+    def __init__(self, InstrumentId instrument_id not None, int capacity):
+        self.instrument_id = instrument_id
+        super().__init__(
+            capacity,
+            [
+                ("bid_price", np.int64, ()),
+                ("ask_price", np.int64, ()),
+                ("bid_size", np.uint64, ()),
+                ("ask_size", np.uint64, ()),
+            ],
+        )
+
+    def appendleft(self, QuoteTick tick) -> None:
+        # Compatible with the `deque` interface used by the `Cache`
+        self.append(tick)
+
+    cdef void _bind(self):
+        MarketDataRingBuffer._bind(self)
+        self._bid_price = self._columns["bid_price"]
+        self._ask_price = self._columns["ask_price"]
+        self._bid_size = self._columns["bid_size"]
+        self._ask_size = self._columns["ask_size"]
+
+    cpdef void append(self, QuoteTick tick):
+        """
+        Append the given tick to the buffer.
+
+        Parameters
+        ----------
+        tick : QuoteTick
+            The tick to append.
+
+        """
+        cdef uint8_t price_prec = tick._mem.bid_price.precision
+        cdef uint8_t size_prec = tick._mem.bid_size.precision
+
+        cdef int slot = self._next_slot()
+        self._bid_price[slot] = _price_value(tick._mem.bid_price.raw, price_prec)
+        self._ask_price[slot] = _price_value(tick._mem.ask_price.raw, price_prec)
+        self._bid_size[slot] = _quantity_value(tick._mem.bid_size.raw, size_prec)
+        self._ask_size[slot] = _quantity_value(tick._mem.ask_size.raw, size_prec)
+        self._price_precision[slot] = price_prec
+        self._size_precision[slot] = size_prec
+        self._ts_event[slot] = tick._mem.ts_event
+        self._ts_init[slot] = tick._mem.ts_init
+        self._latest = tick
+
+    cdef object _row(self, int slot):
+        cdef uint8_t price_prec = self._price_precision[slot]
+        cdef uint8_t size_prec = self._size_precision[slot]
+        return QuoteTick.from_raw_c(
+            self.instrument_id,
+            _price_raw(self._bid_price[slot], price_prec),
+            _price_raw(self._ask_price[slot], price_prec),
+            price_prec,
+            price_prec,
+            _quantity_raw(self._bid_size[slot], size_prec),
+            _quantity_raw(self._ask_size[slot], size_prec),
+            size_prec,
+            size_prec,
+            self._ts_event[slot],
+            self._ts_init[slot],
+        )
+
+
+cdef class TradeTickRingBuffer(MarketDataRingBuffer):
+    """
+    Provides a columnar ring buffer of trade ticks for a single instrument.
+
+    Parameters
+    ----------
+    instrument_id : InstrumentId
+        The instrument ID for the buffer.
+    capacity : int
+        The maximum number of ticks to hold.
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+
+    Notes
+    -----
+    Trade IDs are held as fixed-length byte strings.
+
+    """
+
+    def __init__(self, InstrumentId instrument_id not None, int capacity):
+        self.instrument_id = instrument_id
+        super().__init__(
+            capacity,
+            [
+                ("price", np.int64, ()),
+                ("size", np.uint64, ()),
+                ("aggressor_side", np.uint8, ()),
+                ("trade_id", np.uint8, (TRADE_ID_LEN,)),
+            ],
+        )
+
+    def appendleft(self, TradeTick tick) -> None:
+        # Compatible with the `deque` interface used by the `Cache`
+        self.append(tick)
+
+    cdef void _bind(self):
+        MarketDataRingBuffer._bind(self)
+        self._price = self._columns["price"]
+        self._trade_size = self._columns["size"]
+        self._aggressor_side = self._columns["aggressor_side"]
+        self._trade_id = self._columns["trade_id"]
+
+    cpdef void append(self, TradeTick tick):
+        """
+        Append the given tick to the buffer.
+
+        Parameters
+        ----------
+        tick : TradeTick
+            The tick to append.
+
+        """
+        cdef uint8_t price_prec = tick._mem.price.precision
+        cdef uint8_t size_prec = tick._mem.size.precision
+
+        cdef int slot = self._next_slot()
+        self._price[slot] = _price_value(tick._mem.price.raw, price_prec)
+        self._trade_size[slot] = _quantity_value(tick._mem.size.raw, size_prec)
+        self._aggressor_side[slot] = <uint8_t>tick._mem.aggressor_side
+        memcpy(&self._trade_id[slot, 0], tick._mem.trade_id.value, TRADE_ID_LEN)
+        self._price_precision[slot] = price_prec
+        self._size_precision[slot] = size_prec
+        self._ts_event[slot] = tick._mem.ts_event
+        self._ts_init[slot] = tick._mem.ts_init
+        self._latest = tick
+
+    cdef object _row(self, int slot):
+        cdef TradeId_t trade_id
+        memcpy(trade_id.value, &self._trade_id[slot, 0], TRADE_ID_LEN)
+
+        cdef uint8_t price_prec = self._price_precision[slot]
+        cdef uint8_t size_prec = self._size_precision[slot]
+        return TradeTick.from_raw_c(
+            self.instrument_id,
+            _price_raw(self._price[slot], price_prec),
+            price_prec,
+            _quantity_raw(self._trade_size[slot], size_prec),
+            size_prec,
+            <AggressorSide>self._aggressor_side[slot],
+            TradeId.from_mem_c(trade_id),
+            self._ts_event[slot],
+            self._ts_init[slot],
+        )
+
+    cpdef dict to_arrays(self):
+        """
+        Return the buffered rows as read-only NumPy arrays keyed by column name.
+
+        The `trade_id` column is returned as fixed-length byte strings.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+
+        Notes
+        -----
+        Arrays are in chronological order (oldest row at index 0).
+
+        """
+        cdef dict arrays = MarketDataRingBuffer.to_arrays(self)
+        arrays["trade_id"] = arrays["trade_id"].view(f"S{TRADE_ID_LEN}")[:, 0]
+        return arrays
+
+
+cdef class BarRingBuffer(MarketDataRingBuffer):
+    """
+    Provides a columnar ring buffer of bars for a single bar type.
+
+    Parameters
+    ----------
+    bar_type : BarType
+        The bar type for the buffer.
+    capacity : int
+        The maximum number of bars to hold.
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+
+    """
+
+    def __init__(self, BarType bar_type not None, int capacity):
+        self.bar_type = bar_type
+        super().__init__(
+            capacity,
+            [
+                ("open", np.int64, ()),
+                ("high", np.int64, ()),
+                ("low", np.int64, ()),
+                ("close", np.int64, ()),
+                ("volume", np.uint64, ()),
+                ("is_revision", np.uint8, ()),
+            ],
+        )
+
+    def appendleft(self, Bar bar) -> None:
+        # Compatible with the `deque` interface used by the `Cache`
+        self.append(bar)
+
+    cdef void _bind(self):
+        MarketDataRingBuffer._bind(self)
+        self._open = self._columns["open"]
+        self._high = self._columns["high"]
+        self._low = self._columns["low"]
+        self._close = self._columns["close"]
+        self._volume = self._columns["volume"]
+        self._is_revision = self._columns["is_revision"]
+
+    cpdef void append(self, Bar bar):
+        """
+        Append the given bar to the buffer.
+
+        Parameters
+        ----------
+        bar : Bar
+            The bar to append.
+
+        """
+        cdef uint8_t price_prec = bar._mem.open.precision
+        cdef uint8_t size_prec = bar._mem.volume.precision
+
+        cdef int slot = self._next_slot()
+        self._open[slot] = _price_value(bar._mem.open.raw, price_prec)
+        self._high[slot] = _price_value(bar._mem.high.raw, price_prec)
+        self._low[slot] = _price_value(bar._mem.low.raw, price_prec)
+        self._close[slot] = _price_value(bar._mem.close.raw, price_prec)
+        self._volume[slot] = _quantity_value(bar._mem.volume.raw, size_prec)
+        self._is_revision[slot] = bar.is_revision
+        self._price_precision[slot] = price_prec
+        self._size_precision[slot] = size_prec
+        self._ts_event[slot] = bar._mem.ts_event
+        self._ts_init[slot] = bar._mem.ts_init
+        self._latest = bar
+
+    cdef object _row(self, int slot):
+        cdef uint8_t price_prec = self._price_precision[slot]
+        cdef uint8_t size_prec = self._size_precision[slot]
+        cdef Bar bar = Bar.from_raw_c(
+            self.bar_type,
+            _price_raw(self._open[slot], price_prec),
+            _price_raw(self._high[slot], price_prec),
+            _price_raw(self._low[slot], price_prec),
+            _price_raw(self._close[slot], price_prec),
+            price_prec,
+            _quantity_raw(self._volume[slot], size_prec),
+            size_prec,
+            self._ts_event[slot],
+            self._ts_init[slot],
+        )
+        bar.is_revision = self._is_revision[slot]
+        return bar
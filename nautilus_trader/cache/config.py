@@ -49,6 +49,12 @@ class CacheConfig(NautilusConfig, frozen=True):
         The maximum length for internal tick dequeues.
     bar_capacity : PositiveInt, default 10_000
         The maximum length for internal bar dequeues.
+    columnar_market_data : bool, default False
+        If quotes, trades and bars should be held in columnar ring buffers
+        (NumPy arrays per instrument or bar type) instead of deques of objects, so
+        history can be read as NumPy arrays with the `*_arrays` cache queries.
+        Object queries then rebuild each object from its row (apart from the most
+        recent object, which is retained).
 
     """
 
@@ -62,3 +68,4 @@ class CacheConfig(NautilusConfig, frozen=True):
     drop_instruments_on_reset: bool = True
     tick_capacity: PositiveInt = 10_000
     bar_capacity: PositiveInt = 10_000
+    columnar_market_data: bool = False
@@ -424,10 +424,15 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
 
         return orders
 
-    cpdef dict load_positions(self):
+    cpdef dict load_positions(self, int max_events=0):
         """
         Load all positions from the database.
 
+        Parameters
+        ----------
+        max_events : int, default 0
+            The maximum number of events to retain for each position (0 for no limit).
+
         Returns
         -------
         dict[PositionId, Position]
@@ -445,7 +450,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
             Position position
         for key in position_keys:
             position_id = PositionId(key.rsplit(':', maxsplit=1)[1])
-            position = self.load_position(position_id)
+            position = self.load_position(position_id, max_events)
 
             if position is not None:
                 positions[position.id] = position
@@ -656,7 +661,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
 
         return order
 
-    cpdef Position load_position(self, PositionId position_id):
+    cpdef Position load_position(self, PositionId position_id, int max_events=0):
         """
         Load the position associated with the given ID (if found).
 
@@ -664,6 +669,8 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         ----------
         position_id : PositionId
             The position ID to load.
+        max_events : int, default 0
+            The maximum number of events to retain for the position (0 for no limit).
 
         Returns
         -------
@@ -688,7 +695,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
             )
             return
 
-        cdef Position position = Position(instrument, initial_fill)
+        cdef Position position = Position(instrument, initial_fill, max_events=max_events)
 
         cdef:
             bytes event_bytes
@@ -65,7 +65,7 @@ cdef class CacheDatabaseFacade:
     cpdef dict load_synthetics(self)
     cpdef dict load_accounts(self)
     cpdef dict load_orders(self)
-    cpdef dict load_positions(self)
+    cpdef dict load_positions(self, int max_events=*)
     cpdef dict load_index_order_position(self)
     cpdef dict load_index_order_client(self)
     cpdef Currency load_currency(self, str code)
@@ -73,7 +73,7 @@ cdef class CacheDatabaseFacade:
     cpdef SyntheticInstrument load_synthetic(self, InstrumentId instrument_id)
     cpdef Account load_account(self, AccountId account_id)
     cpdef Order load_order(self, ClientOrderId order_id)
-    cpdef Position load_position(self, PositionId position_id)
+    cpdef Position load_position(self, PositionId position_id, int max_events=*)
     cpdef dict load_actor(self, ComponentId component_id)
     cpdef void delete_actor(self, ComponentId component_id)
     cpdef dict load_strategy(self, StrategyId strategy_id)
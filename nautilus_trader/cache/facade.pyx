@@ -107,7 +107,7 @@ cdef class CacheDatabaseFacade:
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method `load_orders` must be implemented in the subclass")  # pragma: no cover
 
-    cpdef dict load_positions(self):
+    cpdef dict load_positions(self, int max_events=0):
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method `load_positions` must be implemented in the subclass")  # pragma: no cover
 
@@ -139,7 +139,7 @@ cdef class CacheDatabaseFacade:
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method `load_order` must be implemented in the subclass")  # pragma: no cover
 
-    cpdef Position load_position(self, PositionId position_id):
+    cpdef Position load_position(self, PositionId position_id, int max_events=0):
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method `load_position` must be implemented in the subclass")  # pragma: no cover
 
@@ -0,0 +1,91 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.model.identifiers cimport AccountId
+from nautilus_trader.model.identifiers cimport ClientOrderId
+from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.identifiers cimport PositionId
+from nautilus_trader.model.identifiers cimport StrategyId
+from nautilus_trader.model.identifiers cimport TraderId
+from nautilus_trader.model.objects cimport Currency
+from nautilus_trader.model.objects cimport Money
+from nautilus_trader.model.objects cimport Quantity
+from nautilus_trader.model.position cimport Position
+
+
+cdef class PositionSnapshotBuffer:
+    cdef int _size
+    cdef int _count
+    cdef dict _columns
+    cdef list _records
+    cdef list _snapshot_ids
+    cdef list _events
+    cdef uint64_t _cycle_ts_opened
+    cdef ClientOrderId _cycle_opening_order_id
+    cdef int64_t _cycle_event_count
+    cdef TraderId _trader_id
+    cdef StrategyId _strategy_id
+    cdef InstrumentId _instrument_id
+    cdef AccountId _account_id
+    cdef uint8_t _price_precision
+    cdef uint8_t _size_precision
+    cdef uint8_t _pnl_precision
+    cdef Quantity _multiplier
+    cdef bint _is_inverse
+    cdef Currency _quote_currency
+    cdef Currency _base_currency
+    cdef int64_t _realized_pnl_total
+    cdef bint _has_realized_pnl
+
+    cdef uint64_t[::1] _ts_init
+    cdef uint64_t[::1] _ts_opened
+    cdef uint64_t[::1] _ts_last
+    cdef uint64_t[::1] _ts_closed
+    cdef uint64_t[::1] _duration_ns
+    cdef int64_t[::1] _rolled_event_count
+    cdef uint8_t[::1] _entry
+    cdef uint8_t[::1] _side
+    cdef uint8_t[::1] _has_pnl
+    cdef double[::1] _signed_qty
+    cdef uint64_t[::1] _quantity
+    cdef uint64_t[::1] _peak_qty
+    cdef uint64_t[::1] _buy_qty
+    cdef uint64_t[::1] _sell_qty
+    cdef double[::1] _avg_px_open
+    cdef double[::1] _avg_px_close
+    cdef double[::1] _realized_return
+    cdef int64_t[::1] _realized_pnl
+    cdef int64_t[::1] _event_start
+    cdef int64_t[::1] _event_end
+
+    cdef readonly PositionId position_id
+    """The position ID for the snapshots.\n\n:returns: `PositionId`"""
+    cdef readonly Currency settlement_currency
+    """The settlement currency for the snapshots realized PnL.\n\n:returns: `Currency`"""
+
+    cdef void _grow(self)
+    cdef void _bind(self)
+    cdef Money _money(self, int64_t value)
+    cdef Position _build(self, int index)
+
+    cpdef void append(self, Position position)
+    cpdef Position get(self, int index)
+    cpdef list to_list(self)
+    cpdef Money realized_pnl(self)
+    cpdef void clear(self)
@@ -0,0 +1,394 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import numpy as np
+
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.rust.model cimport FIXED_PRECISION
+from nautilus_trader.core.rust.model cimport MoneyRaw
+from nautilus_trader.core.rust.model cimport OrderSide
+from nautilus_trader.core.rust.model cimport PositionSide
+from nautilus_trader.core.rust.model cimport QuantityRaw
+from nautilus_trader.core.uuid cimport UUID4
+from nautilus_trader.model.events.order cimport OrderFilled
+from nautilus_trader.model.identifiers cimport PositionId
+from nautilus_trader.model.objects cimport Currency
+from nautilus_trader.model.objects cimport Money
+from nautilus_trader.model.objects cimport Quantity
+from nautilus_trader.model.position cimport Position
+
+
+cdef int _INITIAL_SIZE = 4
+
+# Powers of ten up to the maximum fixed-point precision
+cdef int64_t _POW10[17]
+_POW10[0] = 1
+for _i in range(1, 17):
+    _POW10[_i] = _POW10[_i - 1] * 10
+
+
+cdef inline uint64_t _quantity_value(Quantity quantity, uint8_t precision):
+    # Raw values are exact multiples of the scale for their precision
+    return <uint64_t>(quantity._mem.raw // _POW10[FIXED_PRECISION - precision])
+
+
+cdef inline Quantity _quantity(uint64_t value, uint8_t precision):
+    return Quantity.from_raw_c(<QuantityRaw>value * _POW10[FIXED_PRECISION - precision], precision)
+
+
+cdef class PositionSnapshotBuffer:
+    """
+    Provides a compact columnar store of the snapshots for a single position ID.
+
+    Each snapshot is held as a row of fixed fields in NumPy columns which grow by
+    doubling. Quantities and the realized PnL are stored as exact fixed-point integers
+    (at the size and settlement currency precisions), and the fields a `Position`
+    holds as floats (average prices, signed quantity and realized return) as float64.
+    The fill events are appended once to an event log shared by all snapshots, with
+    each snapshot holding the range of the log retained by the position, so the
+    memory held is proportional to the fills rather than to the snapshots taken.
+    The realized PnL total over all snapshots is maintained incrementally, and
+    `Position` objects (including their identifier sets) are only rebuilt from the
+    event log on access.
+
+    Parameters
+    ----------
+    position : Position
+        The position which will be snapshot.
+
+    """
+
+    def __init__(self, Position position not None):
+        self.position_id = position.id
+        self.settlement_currency = position.settlement_currency
+        self._trader_id = position.trader_id
+        self._strategy_id = position.strategy_id
+        self._instrument_id = position.instrument_id
+        self._account_id = position.account_id
+        self._price_precision = position.price_precision
+        self._size_precision = position.size_precision
+        self._pnl_precision = position.settlement_currency.get_precision()
+        self._multiplier = position.multiplier
+        self._is_inverse = position.is_inverse
+        self._quote_currency = position.quote_currency
+        self._base_currency = position.base_currency
+
+        self._size = _INITIAL_SIZE
+        self._count = 0
+        self._records = []
+        self._snapshot_ids = []
+        self._events = []
+        self._cycle_ts_opened = 0
+        self._cycle_opening_order_id = None
+        self._cycle_event_count = 0
+        self._realized_pnl_total = 0
+        self._has_realized_pnl = False
+        self._columns = {
+            name: np.zeros(self._size, dtype=dtype)
+            for name, dtype in [
+                ("ts_init", np.uint64),
+                ("ts_opened", np.uint64),
+                ("ts_last", np.uint64),
+                ("ts_closed", np.uint64),
+                ("duration_ns", np.uint64),
+                ("rolled_event_count", np.int64),
+                ("entry", np.uint8),
+                ("side", np.uint8),
+                ("has_pnl", np.uint8),
+                ("signed_qty", np.float64),
+                ("quantity", np.uint64),
+                ("peak_qty", np.uint64),
+                ("buy_qty", np.uint64),
+                ("sell_qty", np.uint64),
+                ("avg_px_open", np.float64),
+                ("avg_px_close", np.float64),
+                ("realized_return", np.float64),
+                ("realized_pnl", np.int64),
+                ("event_start", np.int64),
+                ("event_end", np.int64),
+            ]
+        }
+        self._bind()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(position_id={self.position_id}, len={self._count})"
+
+    cdef void _grow(self):
+        cdef int new_size = self._size * 2
+
+        cdef str name
+        for name, column in self._columns.items():
+            grown = np.zeros(new_size, dtype=column.dtype)
+            grown[:self._size] = column
+            self._columns[name] = grown
+
+        self._size = new_size
+        self._bind()
+
+    cdef void _bind(self):
+        self._ts_init = self._columns["ts_init"]
+        self._ts_opened = self._columns["ts_opened"]
+        self._ts_last = self._columns["ts_last"]
+        self._ts_closed = self._columns["ts_closed"]
+        self._duration_ns = self._columns["duration_ns"]
+        self._rolled_event_count = self._columns["rolled_event_count"]
+        self._entry = self._columns["entry"]
+        self._side = self._columns["side"]
+        self._has_pnl = self._columns["has_pnl"]
+        self._signed_qty = self._columns["signed_qty"]
+        self._quantity = self._columns["quantity"]
+        self._peak_qty = self._columns["peak_qty"]
+        self._buy_qty = self._columns["buy_qty"]
+        self._sell_qty = self._columns["sell_qty"]
+        self._avg_px_open = self._columns["avg_px_open"]
+        self._avg_px_close = self._columns["avg_px_close"]
+        self._realized_return = self._columns["realized_return"]
+        self._realized_pnl = self._columns["realized_pnl"]
+        self._event_start = self._columns["event_start"]
+        self._event_end = self._columns["event_end"]
+
+    cpdef void append(self, Position position):
+        """
+        Append a snapshot of the given position in its current state.
+
+        Parameters
+        ----------
+        position : Position
+            The position to snapshot.
+
+        Raises
+        ------
+        ValueError
+            If `position.id` is not equal to the buffers `position_id`.
+
+        """
+        Condition.not_none(position, "position")
+        Condition.equal(position.id, self.position_id, "position.id", "position_id")
+
+        if self._count == self._size:
+            self._grow()
+
+        cdef int i = self._count
+        cdef uint8_t size_precision = self._size_precision
+        self._ts_init[i] = position.ts_init
+        self._ts_opened[i] = position.ts_opened
+        self._ts_last[i] = position.ts_last
+        self._ts_closed[i] = position.ts_closed
+        self._duration_ns[i] = position.duration_ns
+        self._rolled_event_count[i] = position.rolled_event_count
+        self._entry[i] = <uint8_t>position.entry
+        self._side[i] = <uint8_t>position.side
+        self._signed_qty[i] = position.signed_qty
+        self._quantity[i] = _quantity_value(position.quantity, size_precision)
+        self._peak_qty[i] = _quantity_value(position.peak_qty, size_precision)
+        self._buy_qty[i] = _quantity_value(position._buy_qty, size_precision)
+        self._sell_qty[i] = _quantity_value(position._sell_qty, size_precision)
+        self._avg_px_open[i] = position.avg_px_open
+        self._avg_px_close[i] = position.avg_px_close
+        self._realized_return[i] = position.realized_return
+
+        if position.realized_pnl is not None:
+            self._has_pnl[i] = 1
+            self._realized_pnl[i] = <int64_t>(
+                position.realized_pnl._mem.raw // _POW10[FIXED_PRECISION - self._pnl_precision]
+            )
+            self._realized_pnl_total += self._realized_pnl[i]
+            self._has_realized_pnl = True
+        else:
+            self._has_pnl[i] = 0
+            self._realized_pnl[i] = 0
+
+        # Only fills not already logged for the current open/close cycle are appended
+        cdef int retained = len(position._events)
+        cdef int64_t event_count = position.event_count_c()
+        cdef int64_t new_count = event_count
+        if (
+            self._count > 0
+            and position.ts_opened == self._cycle_ts_opened
+            and position.opening_order_id == self._cycle_opening_order_id
+            and event_count >= self._cycle_event_count
+        ):
+            new_count = event_count - self._cycle_event_count
+
+        if new_count > retained:
+            new_count = retained  # Earlier fills were rolled by the position
+
+        if new_count > 0:
+            self._events.extend(position._events[retained - new_count:])
+
+        self._cycle_ts_opened = position.ts_opened
+        self._cycle_opening_order_id = position.opening_order_id
+        self._cycle_event_count = event_count
+        self._event_end[i] = len(self._events)
+        self._event_start[i] = self._event_end[i] - retained
+
+        self._records.append(
+            (
+                position.opening_order_id,
+                position.closing_order_id,
+                tuple(position._commissions.values()),
+                position._max_events,
+            ),
+        )
+        self._snapshot_ids.append(None)  # Assigned when first rebuilt
+        self._count += 1
+
+    cpdef Position get(self, int index):
+        """
+        Return the snapshot position at the given index (in order of snapshot).
+
+        Parameters
+        ----------
+        index : int
+            The snapshot index (negative values index from the end).
+
+        Returns
+        -------
+        Position
+
+        Raises
+        ------
+        IndexError
+            If `index` is out of range.
+
+        """
+        if index < 0:
+            index += self._count
+
+        if index < 0 or index >= self._count:
+            raise IndexError("index out of range")
+
+        return self._build(index)
+
+    cpdef list to_list(self):
+        """
+        Return all snapshot positions (in order of snapshot).
+
+        Returns
+        -------
+        list[Position]
+
+        """
+        cdef int i
+        return [self._build(i) for i in range(self._count)]
+
+    cpdef Money realized_pnl(self):
+        """
+        Return the total realized PnL over all snapshots.
+
+        Returns
+        -------
+        Money or ``None``
+            ``None`` if no snapshot has a realized PnL.
+
+        """
+        if not self._has_realized_pnl:
+            return None
+
+        return self._money(self._realized_pnl_total)
+
+    cpdef void clear(self):
+        """
+        Clear all snapshots from the buffer.
+        """
+        self._count = 0
+        self._records.clear()
+        self._snapshot_ids.clear()
+        self._events.clear()
+        self._cycle_ts_opened = 0
+        self._cycle_opening_order_id = None
+        self._cycle_event_count = 0
+        self._realized_pnl_total = 0
+        self._has_realized_pnl = False
+
+    cdef Money _money(self, int64_t value):
+        return Money.from_raw_c(
+            <MoneyRaw>value * _POW10[FIXED_PRECISION - self._pnl_precision],
+            self.settlement_currency,
+        )
+
+    cdef Position _build(self, int index):
+        cdef str snapshot_id = self._snapshot_ids[index]
+        if snapshot_id is None:
+            snapshot_id = f"{self.position_id.to_str()}-{UUID4().to_str()}"
+            self._snapshot_ids[index] = snapshot_id
+
+        cdef tuple record = self._records[index]
+        cdef uint8_t size_precision = self._size_precision
+        cdef list events = self._events[self._event_start[index]:self._event_end[index]]
+        cdef Position position = Position.__new__(Position)
+        position._events = events
+        position._trade_ids = set()
+        position._fill_keys = set()
+        position._client_order_ids = set()
+        position._venue_order_ids = set()
+
+        cdef OrderFilled fill
+        for fill in events:
+            position._trade_ids.add(fill.trade_id)
+            position._fill_keys.add(
+                (fill.trade_id, fill.order_side, fill.last_px._mem.raw, fill.last_qty._mem.raw),
+            )
+            position._client_order_ids.add(fill.client_order_id)
+            position._venue_order_ids.add(fill.venue_order_id)
+
+        position._client_order_ids_sorted = None
+        position._venue_order_ids_sorted = None
+        position._max_events = record[3]
+        position._buy_qty = _quantity(self._buy_qty[index], size_precision)
+        position._sell_qty = _quantity(self._sell_qty[index], size_precision)
+        position._commissions = {commission.currency: commission for commission in record[2]}
+
+        position.trader_id = self._trader_id
+        position.strategy_id = self._strategy_id
+        position.instrument_id = self._instrument_id
+        position.id = PositionId(snapshot_id)
+        position.account_id = self._account_id
+        position.opening_order_id = record[0]
+        position.closing_order_id = record[1]
+        position.entry = <OrderSide>self._entry[index]
+        position.side = <PositionSide>self._side[index]
+        position.signed_qty = self._signed_qty[index]
+        position.quantity = _quantity(self._quantity[index], size_precision)
+        position.peak_qty = _quantity(self._peak_qty[index], size_precision)
+        position.price_precision = self._price_precision
+        position.size_precision = size_precision
+        position.multiplier = self._multiplier
+        position.is_inverse = self._is_inverse
+        position.quote_currency = self._quote_currency
+        position.base_currency = self._base_currency
+        position.settlement_currency = self.settlement_currency
+        position.ts_init = self._ts_init[index]
+        position.ts_opened = self._ts_opened[index]
+        position.ts_last = self._ts_last[index]
+        position.ts_closed = self._ts_closed[index]
+        position.duration_ns = self._duration_ns[index]
+        position.avg_px_open = self._avg_px_open[index]
+        position.avg_px_close = self._avg_px_close[index]
+        position.realized_return = self._realized_return[index]
+        position.realized_pnl = self._money(self._realized_pnl[index]) if self._has_pnl[index] else None
+        position.rolled_event_count = self._rolled_event_count[index]
+
+        return position
@@ -54,6 +54,7 @@ cdef class Actor(Component):
     cdef object _executor
     cdef bint _log_events
     cdef bint _log_commands
+    cdef bint _bulk_historical_data
     cdef set[type] _warning_events
     cdef dict[UUID4, object] _pending_requests
     cdef set[type] _pyo3_conversion_types
@@ -104,6 +105,7 @@ cdef class Actor(Component):
     cpdef void on_data(self, data)
     cpdef void on_signal(self, signal)
     cpdef void on_historical_data(self, data)
+    cpdef void on_historical_columns(self, type data_cls, object identifier, dict columns)
     cpdef void on_event(self, Event event)
 
 # -- REGISTRATION ---------------------------------------------------------------------------------
@@ -296,6 +298,7 @@ cdef class Actor(Component):
     cpdef void handle_instrument_status(self, InstrumentStatus data)
     cpdef void handle_instrument_close(self, InstrumentClose data)
     cpdef void handle_historical_data(self, data)
+    cpdef void handle_historical_columns(self, type data_cls, object identifier, dict columns)
     cpdef void handle_event(self, Event event)
 
 # -- HANDLERS -------------------------------------------------------------------------------------
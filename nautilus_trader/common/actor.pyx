@@ -159,6 +159,7 @@ cdef class Actor(Component):
         # Configuration
         self._log_events = config.log_events
         self._log_commands = config.log_commands
+        self._bulk_historical_data = config.bulk_historical_data
         self.config = config
 
         self.trader_id = None  # Initialized when registered
@@ -553,6 +554,31 @@ cdef class Actor(Component):
         """
         # Optionally override in subclass
 
+    cpdef void on_historical_columns(self, type data_cls, object identifier, dict columns):
+        """
+        Actions to be performed when receiving historical data in bulk.
+
+        Only called when `bulk_historical_data` is enabled in the config, once per
+        historical quote, trade or bar response (before the per-object
+        `on_historical_data` callbacks). A DataFrame view can be created with
+        ``pd.DataFrame(columns, copy=False)``.
+
+        Parameters
+        ----------
+        data_cls : type
+            The data type of the response (``QuoteTick``, ``TradeTick`` or ``Bar``).
+        identifier : InstrumentId or BarType
+            The instrument ID (for ticks) or bar type (for bars) of the response.
+        columns : dict[str, np.ndarray]
+            The columnar data as returned by `data_cls.to_columns`.
+
+        Warnings
+        --------
+        System method (not intended to be called by user code).
+
+        """
+        # Optionally override in subclass
+
     cpdef void on_event(self, Event event):
         """
         Actions to be performed running and receives an event.
@@ -3299,6 +3325,18 @@ cdef class Actor(Component):
         cdef:
             int i
             QuoteTick tick
+            Indicator indicator
+            dict columns
+        if self._bulk_historical_data:
+            columns = QuoteTick.to_columns(ticks)
+            if indicators:
+                for indicator in indicators:
+                    indicator.handle_quote_ticks(ticks, columns)
+            self.handle_historical_columns(QuoteTick, instrument_id, columns)
+            for i in range(length):
+                self.handle_historical_data(ticks[i])
+            return
+
         for i in range(length):
             tick = ticks[i]
             if indicators:
@@ -3419,6 +3457,18 @@ cdef class Actor(Component):
         cdef:
             int i
             TradeTick tick
+            Indicator indicator
+            dict columns
+        if self._bulk_historical_data:
+            columns = TradeTick.to_columns(ticks)
+            if indicators:
+                for indicator in indicators:
+                    indicator.handle_trade_ticks(ticks, columns)
+            self.handle_historical_columns(TradeTick, instrument_id, columns)
+            for i in range(length):
+                self.handle_historical_data(ticks[i])
+            return
+
         for i in range(length):
             tick = ticks[i]
             if indicators:
@@ -3497,6 +3547,18 @@ cdef class Actor(Component):
         cdef:
             int i
             Bar bar
+            Indicator indicator
+            dict columns
+        if self._bulk_historical_data:
+            columns = Bar.to_columns(bars)
+            if indicators:
+                for indicator in indicators:
+                    indicator.handle_bars(bars, columns)
+            self.handle_historical_columns(Bar, first.bar_type, columns)
+            for i in range(length):
+                self.handle_historical_data(bars[i])
+            return
+
         for i in range(length):
             bar = bars[i]
             if indicators:
@@ -3625,6 +3687,32 @@ cdef class Actor(Component):
             self._log.exception(f"Error on handling {repr(data)}", e)
             raise
 
+    cpdef void handle_historical_columns(self, type data_cls, object identifier, dict columns):
+        """
+        Handle the given historical data in columnar form.
+
+        Parameters
+        ----------
+        data_cls : type
+            The data type of the columns.
+        identifier : InstrumentId or BarType
+            The instrument ID (for ticks) or bar type (for bars) of the columns.
+        columns : dict[str, np.ndarray]
+            The columnar data.
+
+        Warnings
+        --------
+        System method (not intended to be called by user code).
+
+        """
+        Condition.not_none(columns, "columns")
+
+        try:
+            self.on_historical_columns(data_cls, identifier, columns)
+        except Exception as e:
+            self._log.exception(f"Error on handling historical {data_cls.__name__} columns", e)
+            raise
+
     cpdef void handle_event(self, Event event):
         """
         Handle the given event.
@@ -83,8 +83,10 @@ cdef class Clock:
 
 
 cdef dict[UUID4, Clock] _COMPONENT_CLOCKS
+cdef dict[UUID4, list] _COMPONENT_CLOCKS_TIMERS_CHANGED
 
 cdef list[TestClock] get_component_clocks(UUID4 instance_id)
+cdef list[TestClock] pop_component_clocks_timers_changed(UUID4 instance_id)
 cpdef void register_component_clock(UUID4 instance_id, Clock clock)
 cpdef void deregister_component_clock(UUID4 instance_id, Clock clock)
 
@@ -97,7 +99,11 @@ cpdef bint is_backtest_force_stop()
 
 cdef class TestClock(Clock):
     cdef TestClock_API _mem
+    cdef list _timers_changed_queue
+    cdef bint _timers_changed
 
+    cdef void _notify_timers_changed(self)
+    cpdef uint64_t next_event_time_ns(self)
     cpdef void set_time(self, uint64_t to_time_ns)
     cdef CVec advance_time_c(self, uint64_t to_time_ns, bint set_time=*)
     cpdef list advance_time(self, uint64_t to_time_ns, bint set_time=*)
@@ -47,6 +47,10 @@ from libc.stdio cimport printf
 
 from nautilus_trader.common.messages cimport ComponentStateChanged
 from nautilus_trader.common.messages cimport ShutdownSystem
+from nautilus_trader.common.profiler cimport PROFILING
+from nautilus_trader.common.profiler cimport profiler_handle_time_event
+from nautilus_trader.common.profiler cimport profiler_now
+from nautilus_trader.common.profiler cimport profiler_record_handler
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.datetime cimport dt_to_unix_nanos
 from nautilus_trader.core.datetime cimport maybe_dt_to_unix_nanos
@@ -94,6 +98,7 @@ from nautilus_trader.core.rust.common cimport logging_shutdown
 from nautilus_trader.core.rust.common cimport test_clock_advance_time
 from nautilus_trader.core.rust.common cimport test_clock_cancel_timer
 from nautilus_trader.core.rust.common cimport test_clock_cancel_timers
+from nautilus_trader.core.rust.common cimport test_clock_next_event_time
 from nautilus_trader.core.rust.common cimport test_clock_drop
 from nautilus_trader.core.rust.common cimport test_clock_new
 from nautilus_trader.core.rust.common cimport test_clock_next_time
@@ -516,6 +521,7 @@ cdef class Clock:
 
 # Global map of clocks per kernel instance used when running a `BacktestEngine`
 _COMPONENT_CLOCKS = {}
+_COMPONENT_CLOCKS_TIMERS_CHANGED = {}
 
 
 cdef list[TestClock] get_component_clocks(UUID4 instance_id):
@@ -524,6 +530,23 @@ cdef list[TestClock] get_component_clocks(UUID4 instance_id):
     return _COMPONENT_CLOCKS[instance_id].copy()
 
 
+cdef list[TestClock] pop_component_clocks_timers_changed(UUID4 instance_id):
+    # Return the test clocks which have had timers set, cancelled or advanced
+    # since the last call, so a scheduler only needs to re-check those clocks.
+    cdef list[TestClock] changed = _COMPONENT_CLOCKS_TIMERS_CHANGED.get(instance_id)
+    if not changed:
+        return []
+
+    cdef list[TestClock] clocks = changed.copy()
+    changed.clear()
+
+    cdef TestClock clock
+    for clock in clocks:
+        clock._timers_changed = False
+
+    return clocks
+
+
 cpdef void register_component_clock(UUID4 instance_id, Clock clock):
     Condition.not_none(instance_id, "instance_id")
     Condition.not_none(clock, "clock")
@@ -537,6 +560,15 @@ cpdef void register_component_clock(UUID4 instance_id, Clock clock):
     if clock not in clocks:
         clocks.append(clock)
 
+    cdef list[TestClock] changed
+    if isinstance(clock, TestClock):
+        changed = _COMPONENT_CLOCKS_TIMERS_CHANGED.get(instance_id)
+        if changed is None:
+            changed = []
+            _COMPONENT_CLOCKS_TIMERS_CHANGED[instance_id] = changed
+        (<TestClock>clock)._timers_changed_queue = changed
+        (<TestClock>clock)._notify_timers_changed()
+
 
 cpdef void deregister_component_clock(UUID4 instance_id, Clock clock):
     Condition.not_none(instance_id, "instance_id")
@@ -550,11 +582,20 @@ cpdef void deregister_component_clock(UUID4 instance_id, Clock clock):
     if clock in clocks:
         clocks.remove(clock)
 
+    if isinstance(clock, TestClock):
+        (<TestClock>clock)._timers_changed_queue = None
+
 
 cpdef void remove_instance_component_clocks(UUID4 instance_id):
     Condition.not_none(instance_id, "instance_id")
 
-    _COMPONENT_CLOCKS.pop(instance_id, None)
+    cdef list[Clock] clocks = _COMPONENT_CLOCKS.pop(instance_id, None) or []
+    _COMPONENT_CLOCKS_TIMERS_CHANGED.pop(instance_id, None)
+
+    cdef Clock clock
+    for clock in clocks:
+        if isinstance(clock, TestClock):
+            (<TestClock>clock)._timers_changed_queue = None
 
 
 # Global backtest force stop flag
@@ -579,11 +620,20 @@ cdef class TestClock(Clock):
 
     def __init__(self):
         self._mem = test_clock_new()
+        self._timers_changed_queue = None
+        self._timers_changed = False
 
     def __del__(self) -> None:
         if self._mem._0 != NULL:
             test_clock_drop(self._mem)
 
+    cdef void _notify_timers_changed(self):
+        if self._timers_changed or self._timers_changed_queue is None:
+            return  # Already queued or not registered
+
+        self._timers_changed = True
+        self._timers_changed_queue.append(self)
+
     @property
     def timer_names(self) -> list[str]:
         cdef str timer_names = cstr_to_pystr(test_clock_timer_names(&self._mem))
@@ -630,6 +680,7 @@ cdef class TestClock(Clock):
             alert_time_ns,
             <PyObject *>callback,
         )
+        self._notify_timers_changed()
 
     cpdef void set_timer_ns(
         self,
@@ -659,19 +710,34 @@ cdef class TestClock(Clock):
             stop_time_ns,
             <PyObject *>callback,
         )
+        self._notify_timers_changed()
 
     cpdef uint64_t next_time_ns(self, str name):
         Condition.valid_string(name, "name")
         return test_clock_next_time(&self._mem, pystr_to_cstr(name))
 
+    cpdef uint64_t next_event_time_ns(self):
+        """
+        Return the earliest next event time across all active timers.
+
+        Returns
+        -------
+        uint64_t
+            Zero if the clock has no active timers.
+
+        """
+        return test_clock_next_event_time(&self._mem)
+
     cpdef void cancel_timer(self, str name):
         Condition.valid_string(name, "name")
         Condition.is_in(name, self.timer_names, "name", "self.timer_names")
 
         test_clock_cancel_timer(&self._mem, pystr_to_cstr(name))
+        self._notify_timers_changed()
 
     cpdef void cancel_timers(self):
         test_clock_cancel_timers(&self._mem)
+        self._notify_timers_changed()
 
     cpdef void set_time(self, uint64_t to_time_ns):
         """
@@ -688,6 +754,7 @@ cdef class TestClock(Clock):
     cdef CVec advance_time_c(self, uint64_t to_time_ns, bint set_time=True):
         Condition.is_true(to_time_ns >= test_clock_timestamp_ns(&self._mem), "to_time_ns was < time_ns (not monotonic)")
 
+        self._notify_timers_changed()
         return <CVec>test_clock_advance_time(&self._mem, to_time_ns, set_time)
 
     cpdef list advance_time(self, uint64_t to_time_ns, bint set_time=True):
@@ -1001,7 +1068,10 @@ cdef class TimeEventHandler:
 
     cpdef void handle(self):
         """Call the handler with the contained time event."""
-        self._handler(self.event)
+        if PROFILING:
+            profiler_handle_time_event(self._handler, self.event)
+        else:
+            self._handler(self.event)
 
     def __eq__(self, TimeEventHandler other) -> bool:
         return self.event.ts_event == other.event.ts_event
@@ -2579,9 +2649,15 @@ cdef class MessageBus:
         cdef:
             int i
             Subscription sub
+            uint64_t start_ns
         for i in range(len(subs)):
             sub = subs[i]
-            sub.handler(msg)
+            if PROFILING:
+                start_ns = profiler_now()
+                sub.handler(msg)
+                profiler_record_handler(sub.handler, topic, start_ns)
+            else:
+                sub.handler(msg)
 
         # Publish externally (if configured)
         cdef bytes payload_bytes
@@ -425,12 +425,18 @@ class ActorConfig(NautilusConfig, kw_only=True, frozen=True):
         If False, then only warning events and above are logged.
     log_commands : bool, default True
         If commands should be logged by the actor.
+    bulk_historical_data : bool, default False
+        If historical quote, trade and bar responses are handled in bulk. Columns are
+        extracted once per response, registered indicators are updated with the whole
+        batch, and `on_historical_columns` is called before the per-object
+        `on_historical_data` callbacks (which then observe the final indicator state).
 
     """
 
     component_id: ComponentId | None = None
     log_events: bool = True
     log_commands: bool = True
+    bulk_historical_data: bool = False
 
 
 class ImportableActorConfig(NautilusConfig, frozen=True):
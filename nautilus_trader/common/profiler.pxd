@@ -0,0 +1,61 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport uint64_t
+
+
+cdef enum:
+    LATENCY_BUCKETS = 496
+
+
+cdef class LatencyStats:
+    cdef uint64_t _buckets[LATENCY_BUCKETS]
+
+    cdef readonly uint64_t count
+    """The number of recorded calls.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t total_ns
+    """The cumulative latency (nanoseconds) of all recorded calls.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t min_ns
+    """The minimum recorded latency (nanoseconds).\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t max_ns
+    """The maximum recorded latency (nanoseconds).\n\n:returns: `uint64_t`"""
+
+    cdef void add(self, uint64_t elapsed_ns)
+    cpdef uint64_t percentile(self, double q)
+    cpdef dict to_dict(self)
+
+
+cdef class HotPathProfiler:
+    cdef dict _stats
+    cdef dict _name_counts
+    cdef object _handler_components
+
+    cpdef void record(self, str component, str name, uint64_t elapsed_ns)
+    cdef str _handler_component(self, handler)
+    cpdef LatencyStats stats(self, str component, str name)
+    cpdef dict summary(self)
+    cpdef void reset(self)
+
+
+cdef bint PROFILING
+
+cpdef void set_profiling_enabled(bint value)
+cpdef bint is_profiling_enabled()
+cpdef HotPathProfiler get_profiler()
+
+cdef uint64_t profiler_now()
+cdef void profiler_record(str component, str name, uint64_t start_ns)
+cdef void profiler_record_handler(handler, str name, uint64_t start_ns)
+cdef void profiler_handle_time_event(handler, event)
@@ -0,0 +1,317 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from time import perf_counter_ns
+from weakref import WeakKeyDictionary
+
+from libc.math cimport ceil
+from libc.stdint cimport UINT64_MAX
+from libc.stdint cimport uint64_t
+from libc.string cimport memset
+
+from nautilus_trader.core.correctness cimport Condition
+
+
+# Latencies below 8ns are bucketed exactly, above that each power of two is split
+# into 8 linear sub-buckets (a relative error of at most 12.5% for percentiles).
+cdef int _SUB_BUCKET_BITS = 3
+cdef int _SUB_BUCKETS = 8
+
+# Paths beyond this many per component (e.g. dynamically named timers) are
+# aggregated under a single overflow name, so the number of stats is bounded.
+cdef int _MAX_NAMES_PER_COMPONENT = 256
+OVERFLOW_NAME = "<other>"
+
+
+cdef inline int _bucket_index(uint64_t value):
+    if value < _SUB_BUCKETS:
+        return <int>value
+
+    cdef int msb = _SUB_BUCKET_BITS
+    cdef uint64_t rest = value >> (_SUB_BUCKET_BITS + 1)
+    while rest:
+        rest >>= 1
+        msb += 1
+
+    cdef int sub = <int>((value >> (msb - _SUB_BUCKET_BITS)) & (_SUB_BUCKETS - 1))
+    return (msb - _SUB_BUCKET_BITS + 1) * _SUB_BUCKETS + sub
+
+
+cdef inline uint64_t _bucket_upper_bound(int index):
+    if index < _SUB_BUCKETS:
+        return <uint64_t>index
+
+    cdef int msb = index // _SUB_BUCKETS + _SUB_BUCKET_BITS - 1
+    cdef uint64_t sub = <uint64_t>(index % _SUB_BUCKETS)
+    cdef int shift = msb - _SUB_BUCKET_BITS
+    if msb == 63 and sub == _SUB_BUCKETS - 1:
+        return UINT64_MAX
+    return ((_SUB_BUCKETS + sub + 1) << shift) - 1
+
+
+def _total_ns(item: tuple) -> int:
+    return item[1].total_ns
+
+
+cdef class LatencyStats:
+    """
+    Provides call count and latency statistics for a single profiled hot path.
+
+    Latencies are held in a fixed-size log-linear histogram, so recording is
+    constant time and memory regardless of the number of calls.
+    """
+
+    def __init__(self):
+        memset(self._buckets, 0, sizeof(self._buckets))
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"count={self.count}, "
+            f"total_ns={self.total_ns}, "
+            f"p50_ns={self.percentile(0.5)}, "
+            f"p99_ns={self.percentile(0.99)}, "
+            f"max_ns={self.max_ns})"
+        )
+
+    cdef void add(self, uint64_t elapsed_ns):
+        if self.count == 0 or elapsed_ns < self.min_ns:
+            self.min_ns = elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+
+        self.count += 1
+        self.total_ns += elapsed_ns
+        self._buckets[_bucket_index(elapsed_ns)] += 1
+
+    cpdef uint64_t percentile(self, double q):
+        """
+        Return the latency (nanoseconds) at the given quantile.
+
+        The value is the upper bound of the histogram bucket containing the
+        quantile, capped at the maximum recorded latency.
+
+        Parameters
+        ----------
+        q : double
+            The quantile in the range [0, 1].
+
+        Returns
+        -------
+        uint64_t
+
+        Raises
+        ------
+        ValueError
+            If `q` is not in range [0, 1].
+
+        """
+        Condition.in_range(q, 0.0, 1.0, "q")
+
+        if self.count == 0:
+            return 0
+
+        cdef uint64_t target = <uint64_t>ceil(q * self.count)
+        if target == 0:
+            return self.min_ns
+
+        cdef uint64_t cumulative = 0
+        cdef int i
+        for i in range(LATENCY_BUCKETS):
+            cumulative += self._buckets[i]
+            if cumulative >= target:
+                return min(_bucket_upper_bound(i), self.max_ns)
+
+        return self.max_ns  # pragma: no cover (design-time error)
+
+    cpdef dict to_dict(self):
+        """
+        Return a dictionary representation of the statistics.
+
+        Returns
+        -------
+        dict[str, int]
+
+        """
+        return {
+            "count": self.count,
+            "total_ns": self.total_ns,
+            "mean_ns": self.total_ns // self.count if self.count else 0,
+            "min_ns": self.min_ns,
+            "p50_ns": self.percentile(0.5),
+            "p90_ns": self.percentile(0.9),
+            "p99_ns": self.percentile(0.99),
+            "max_ns": self.max_ns,
+        }
+
+
+cdef class HotPathProfiler:
+    """
+    Provides call count and latency statistics per component and hot path.
+
+    Timings are inclusive, the time recorded for a path includes any nested
+    profiled paths it calls into (e.g. a data engine handler includes the
+    strategy handlers receiving the published data).
+
+    At most 256 path names are recorded per component, any further names are
+    aggregated under the `OVERFLOW_NAME` path.
+    """
+
+    def __init__(self):
+        self._stats: dict[tuple[str, str], LatencyStats] = {}
+        self._name_counts: dict[str, int] = {}
+        # Weakly keyed so cached handlers do not keep their owners alive
+        self._handler_components = WeakKeyDictionary()
+
+    cpdef void record(self, str component, str name, uint64_t elapsed_ns):
+        """
+        Record a call for the given component and path name.
+
+        Parameters
+        ----------
+        component : str
+            The component the path belongs to.
+        name : str
+            The path name (e.g. a topic, message type or method name).
+        elapsed_ns : uint64_t
+            The elapsed time of the call (nanoseconds).
+
+        """
+        cdef tuple key = (component, name)
+        cdef LatencyStats stats = self._stats.get(key)
+        cdef int name_count
+        if stats is None:
+            name_count = self._name_counts.get(component, 0)
+            if name_count >= _MAX_NAMES_PER_COMPONENT:
+                key = (component, OVERFLOW_NAME)
+                stats = self._stats.get(key)
+                if stats is None:
+                    stats = LatencyStats()
+                    self._stats[key] = stats
+                stats.add(elapsed_ns)
+                return
+
+            self._name_counts[component] = name_count + 1
+            stats = LatencyStats()
+            self._stats[key] = stats
+
+        stats.add(elapsed_ns)
+
+    cdef str _handler_component(self, handler):
+        cdef str component
+        try:
+            component = self._handler_components.get(handler)
+        except TypeError:  # Handler cannot be weakly referenced
+            component = None
+        if component is not None:
+            return component
+
+        owner = getattr(handler, "__self__", None)
+        if owner is None:
+            component = getattr(handler, "__qualname__", type(handler).__name__)
+        else:
+            owner_id = getattr(owner, "id", None)
+            component = str(owner_id) if owner_id is not None else type(owner).__name__
+
+        try:
+            self._handler_components[handler] = component
+        except TypeError:  # Handler cannot be weakly referenced
+            pass
+        return component
+
+    cpdef LatencyStats stats(self, str component, str name):
+        """
+        Return the statistics for the given component and path name (if recorded).
+
+        Parameters
+        ----------
+        component : str
+            The component the path belongs to.
+        name : str
+            The path name.
+
+        Returns
+        -------
+        LatencyStats or ``None``
+
+        """
+        return self._stats.get((component, name))
+
+    cpdef dict summary(self):
+        """
+        Return the statistics for all recorded paths, grouped by component.
+
+        Returns
+        -------
+        dict[str, dict[str, dict[str, int]]]
+
+        """
+        cdef dict summary = {}
+        cdef tuple key
+        cdef LatencyStats stats
+        for key, stats in sorted(self._stats.items(), key=_total_ns, reverse=True):
+            summary.setdefault(key[0], {})[key[1]] = stats.to_dict()
+
+        return summary
+
+    cpdef void reset(self):
+        """
+        Reset the profiler by clearing all recorded statistics.
+        """
+        self._stats.clear()
+        self._name_counts.clear()
+        self._handler_components.clear()
+
+
+# Global hot-path profiling flag
+PROFILING = False
+
+cdef HotPathProfiler _PROFILER = HotPathProfiler()
+
+
+cpdef void set_profiling_enabled(bint value):
+    global PROFILING
+    PROFILING = value
+
+
+cpdef bint is_profiling_enabled():
+    return PROFILING
+
+
+cpdef HotPathProfiler get_profiler():
+    return _PROFILER
+
+
+cdef uint64_t profiler_now():
+    return perf_counter_ns()
+
+
+cdef void profiler_record(str component, str name, uint64_t start_ns):
+    _PROFILER.record(component, name, perf_counter_ns() - start_ns)
+
+
+cdef void profiler_record_handler(handler, str name, uint64_t start_ns):
+    cdef uint64_t elapsed_ns = perf_counter_ns() - start_ns
+    _PROFILER.record(_PROFILER._handler_component(handler), name, elapsed_ns)
+
+
+cdef void profiler_handle_time_event(handler, event):
+    cdef uint64_t start_ns = perf_counter_ns()
+    handler(event)
+    profiler_record_handler(handler, event.name, start_ns)
@@ -360,6 +360,11 @@ const char *test_clock_timer_names(const struct TestClock_API *clock);
 
 uintptr_t test_clock_timer_count(struct TestClock_API *clock);
 
+/**
+ * Returns the earliest next time across all active timers (0 if there are no timers).
+ */
+uint64_t test_clock_next_event_time(const struct TestClock_API *clock);
+
 /**
  * # Safety
  *
@@ -154,6 +154,16 @@ void cstr_drop(const char *ptr);
 
 struct UUID4_t uuid4_new(void);
 
+/**
+ * Switches [`UUID4`] generation on the calling thread to a deterministic sequence from `seed`.
+ */
+void uuid4_set_seed(uint64_t seed);
+
+/**
+ * Restores random [`UUID4`] generation on the calling thread.
+ */
+void uuid4_clear_seed(void);
+
 /**
  * Returns a [`UUID4`] from C string pointer.
  *
@@ -369,6 +369,7 @@ def margin_account_from_account_events(
 # Data types
 
 def drop_cvec_pycapsule(capsule: object) -> None: ...
+def pyobjects_to_data_pycapsule(data: list[Any]) -> object: ...
 
 class BarSpecification:
     def __init__(
@@ -4904,6 +4905,11 @@ class DatabentoDataLoader:
     def load_status(self, filepath: str, instrument_id: InstrumentId | None = None) -> list[InstrumentStatus]: ...
     def load_imbalance(self, filepath: str, instrument_id: InstrumentId | None = None, price_precision: int | None = None) -> list[DatabentoImbalance]: ...  # noqa: E501
     def load_statistics(self, filepath: str, instrument_id: InstrumentId | None = None, price_precision: int | None = None) -> list[DatabentoStatistics]: ...  # noqa: E501
+    def stream_data(self, filepath: str, chunk_size: int = 100_000, instrument_id: InstrumentId | None = None, price_precision: int | None = None, include_trades: bool | None = None) -> DatabentoDataChunkIterator: ...  # noqa: E501
+
+class DatabentoDataChunkIterator:
+    def __iter__(self) -> DatabentoDataChunkIterator: ...
+    def __next__(self) -> object: ...
 
 class DatabentoHistoricalClient:
     def __init__(
@@ -5000,6 +5006,9 @@ class DatabentoLiveClient:
         self,
         callback: Callable,
         callback_pyo3: Callable,
+        callback_batch: Callable | None = None,
+        max_batch_size: int = 1024,
+        max_batch_latency_us: int = 0,
     ) -> Awaitable[None]: ...
     def close(self) -> None: ...
 
@@ -5013,6 +5022,13 @@ def load_tardis_depth10_from_snapshot5(filepath: str, price_precision: int | Non
 def load_tardis_depth10_from_snapshot25(filepath: str, price_precision: int | None = None, size_precision: int | None = None, instrument_id: InstrumentId | None = None, limit: int | None = None) -> list[OrderBookDepth10]: ...  # noqa
 def load_tardis_quotes(filepath: str, price_precision: int | None = None, size_precision: int | None = None, instrument_id: InstrumentId | None = None, limit: int | None = None) -> list[QuoteTick]: ...  # noqa
 def load_tardis_trades(filepath: str, price_precision: int | None = None, size_precision: int | None = None, instrument_id: InstrumentId | None = None, limit: int | None = None) -> list[TradeTick]: ...  # noqa
+def stream_tardis_deltas(filepath: str, chunk_size: int = 100_000, price_precision: int | None = None, size_precision: int | None = None, instrument_id: InstrumentId | None = None, limit: int | None = None) -> TardisCsvChunkIterator: ...  # noqa
+def stream_tardis_quotes(filepath: str, chunk_size: int = 100_000, price_precision: int | None = None, size_precision: int | None = None, instrument_id: InstrumentId | None = None, limit: int | None = None) -> TardisCsvChunkIterator: ...  # noqa
+def stream_tardis_trades(filepath: str, chunk_size: int = 100_000, price_precision: int | None = None, size_precision: int | None = None, instrument_id: InstrumentId | None = None, limit: int | None = None) -> TardisCsvChunkIterator: ...  # noqa
+
+class TardisCsvChunkIterator:
+    def __iter__(self) -> TardisCsvChunkIterator: ...
+    def __next__(self) -> list[OrderBookDelta] | list[QuoteTick] | list[TradeTick]: ...
 
 class InstrumentMiniInfo:
     def __init__(
@@ -222,6 +222,9 @@ cdef extern from "../includes/common.h":
 
     uintptr_t test_clock_timer_count(TestClock_API *clock);
 
+    # Returns the earliest next time across all active timers (0 if there are no timers).
+    uint64_t test_clock_next_event_time(const TestClock_API *clock);
+
     # # Safety
     #
     # - Assumes `name_ptr` is a valid C string pointer.
@@ -107,6 +107,12 @@ cdef extern from "../includes/core.h":
 
     UUID4_t uuid4_new();
 
+    # Switches [`UUID4`] generation on the calling thread to a deterministic sequence from `seed`.
+    void uuid4_set_seed(uint64_t seed);
+
+    # Restores random [`UUID4`] generation on the calling thread.
+    void uuid4_clear_seed();
+
     # Returns a [`UUID4`] from C string pointer.
     #
     # # Safety
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from libc.stdint cimport uint64_t
+
 from nautilus_trader.core.rust.core cimport UUID4_t
 
 
@@ -26,3 +28,7 @@ cdef class UUID4:
 
     @staticmethod
     cdef UUID4 from_str_c(str value)
+
+
+cpdef void set_uuid4_seed(uint64_t seed)
+cpdef void clear_uuid4_seed()
@@ -15,12 +15,16 @@
 
 import uuid
 
+from libc.stdint cimport uint64_t
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.rust.core cimport UUID4_t
+from nautilus_trader.core.rust.core cimport uuid4_clear_seed
 from nautilus_trader.core.rust.core cimport uuid4_eq
 from nautilus_trader.core.rust.core cimport uuid4_from_cstr
 from nautilus_trader.core.rust.core cimport uuid4_hash
 from nautilus_trader.core.rust.core cimport uuid4_new
+from nautilus_trader.core.rust.core cimport uuid4_set_seed
 from nautilus_trader.core.rust.core cimport uuid4_to_cstr
 from nautilus_trader.core.string cimport cstr_to_pystr
 from nautilus_trader.core.string cimport pystr_to_cstr
@@ -102,3 +106,33 @@ cdef class UUID4:
 
         """
         return UUID4.from_str_c(value)
+
+
+cpdef void set_uuid4_seed(uint64_t seed):
+    """
+    Switch `UUID4` generation on the calling thread to a deterministic sequence
+    derived from the given seed.
+
+    Values are generated from a seeded counter rather than drawn from the random
+    number generator, so the same seed reproduces the same sequence of values.
+    Calling this again restarts the sequence.
+
+    Parameters
+    ----------
+    seed : uint64_t
+        The seed for the sequence.
+
+    Warnings
+    --------
+    Deterministic values are only unique within the sequence for a seed, this mode
+    is intended for backtesting and should not be used for live trading.
+
+    """
+    uuid4_set_seed(seed)
+
+
+cpdef void clear_uuid4_seed():
+    """
+    Restore random `UUID4` generation on the calling thread.
+    """
+    uuid4_clear_seed()
@@ -82,6 +82,7 @@ cdef class DataClient(Component):
 # -- DATA HANDLERS --------------------------------------------------------------------------------
 
     cpdef void _handle_data(self, Data data)
+    cpdef void _handle_data_batch(self, list data)
     cpdef void _handle_data_response(self, DataType data_type, data, UUID4 correlation_id, dict params)
 
 
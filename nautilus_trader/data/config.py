@@ -16,6 +16,7 @@
 from __future__ import annotations
 
 from nautilus_trader.common.config import NautilusConfig
+from nautilus_trader.common.config import PositiveInt
 from nautilus_trader.model.identifiers import ClientId
 
 
@@ -45,6 +46,16 @@ class DataEngineConfig(NautilusConfig, frozen=True):
     external_clients : list[ClientId], optional
         The client IDs declared for external stream processing.
         The data engine will not attempt to send data commands to these client IDs.
+    catalog_max_workers : PositiveInt, optional
+        The maximum number of threads used to query registered catalogs in parallel.
+        If ``None`` then one thread per registered catalog is used (parallel querying
+        only applies when more than one catalog is registered).
+    catalog_read_ahead : bool, default False
+        If catalog queries for quotes, trades and bars will read ahead by one request
+        window, so the next window requested when paging through history is served
+        from memory.
+    catalog_read_ahead_capacity : PositiveInt, default 16
+        The maximum number of read-ahead windows held in memory.
     debug : bool, default False
         If debug mode is active (will provide extra debug logging).
 
@@ -58,4 +69,7 @@ class DataEngineConfig(NautilusConfig, frozen=True):
     validate_data_sequence: bool = False
     buffer_deltas: bool = False
     external_clients: list[ClientId] | None = None
+    catalog_max_workers: PositiveInt | None = None
+    catalog_read_ahead: bool = False
+    catalog_read_ahead_capacity: PositiveInt = 16
     debug: bool = False
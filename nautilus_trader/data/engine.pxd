@@ -69,6 +69,7 @@ from nautilus_trader.model.data cimport InstrumentStatus
 from nautilus_trader.model.data cimport MarkPriceUpdate
 from nautilus_trader.model.data cimport OrderBookDelta
 from nautilus_trader.model.data cimport OrderBookDeltas
+from nautilus_trader.model.data cimport OrderBookDeltasBuffer
 from nautilus_trader.model.data cimport OrderBookDepth10
 from nautilus_trader.model.data cimport QuoteTick
 from nautilus_trader.model.data cimport TradeTick
@@ -93,7 +94,7 @@ cdef class DataEngine(Component):
     cdef readonly dict[InstrumentId, list[SyntheticInstrument]] _synthetic_trade_feeds
     cdef readonly list[InstrumentId] _subscribed_synthetic_quotes
     cdef readonly list[InstrumentId] _subscribed_synthetic_trades
-    cdef readonly dict[InstrumentId, list[OrderBookDelta]] _buffered_deltas_map
+    cdef readonly dict[InstrumentId, OrderBookDeltasBuffer] _buffered_deltas_map
     cdef readonly dict[str, SnapshotInfo] _snapshot_info
     cdef readonly dict[UUID4, int] _query_group_n_components
     cdef readonly dict[UUID4, list] _query_group_components
@@ -105,6 +106,10 @@ cdef class DataEngine(Component):
     cdef readonly dict[BarAggregation, object] _time_bars_origins # pd.Timedelta or pd.DateOffset
     cdef readonly bint _validate_data_sequence
     cdef readonly bint _buffer_deltas
+    cdef int _catalog_max_workers
+    cdef object _catalog_executor
+    cdef object _catalog_executor_lock
+    cdef readonly object _catalog_read_ahead_cache
 
     cdef readonly bint debug
     """If debug mode is active (will provide extra debug logging).\n\n:returns: `bool`"""
@@ -153,6 +158,7 @@ cdef class DataEngine(Component):
     cpdef void stop_clients(self)
     cpdef void execute(self, DataCommand command)
     cpdef void process(self, Data data)
+    cpdef void process_batch(self, list data)
     cpdef void request(self, RequestData request)
     cpdef void response(self, DataResponse response)
 
@@ -204,6 +210,8 @@ cdef class DataEngine(Component):
     cpdef void _handle_request_bars(self, DataClient client, RequestBars request)
     cpdef void _handle_request_data(self, DataClient client, RequestData request)
     cpdef void _query_catalog(self, RequestData request)
+    cpdef void _execute_catalog_query(self, RequestData request, uint64_t ts_start, uint64_t ts_end, uint64_t ts_now)
+    cpdef void _handle_catalog_data(self, RequestData request, list data, uint64_t ts_now)
 
 # -- DATA HANDLERS --------------------------------------------------------------------------------
 
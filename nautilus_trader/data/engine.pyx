@@ -29,6 +29,8 @@ Alternative implementations can be written on top of the generic engine - which
 just need to override the `execute`, `process`, `send` and `receive` methods.
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable
 
 from nautilus_trader.common.enums import LogColor
@@ -38,8 +40,10 @@ from nautilus_trader.core.datetime import max_date
 from nautilus_trader.core.datetime import min_date
 from nautilus_trader.core.datetime import time_object_to_dt
 from nautilus_trader.data.config import DataEngineConfig
-from nautilus_trader.model.enums import RecordFlag
 from nautilus_trader.persistence.catalog import ParquetDataCatalog
+from nautilus_trader.persistence.catalog.query import CatalogReadAheadCache
+from nautilus_trader.persistence.catalog.query import merge_data_streams
+from nautilus_trader.persistence.catalog.query import merge_instruments
 from nautilus_trader.persistence.catalog.types import CatalogWriteMode
 
 from cpython.datetime cimport datetime
@@ -52,6 +56,9 @@ from nautilus_trader.common.component cimport RES
 from nautilus_trader.common.component cimport Clock
 from nautilus_trader.common.component cimport Component
 from nautilus_trader.common.component cimport MessageBus
+from nautilus_trader.common.profiler cimport PROFILING
+from nautilus_trader.common.profiler cimport profiler_now
+from nautilus_trader.common.profiler cimport profiler_record
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.data cimport Data
 from nautilus_trader.core.datetime cimport dt_to_unix_nanos
@@ -113,6 +120,7 @@ from nautilus_trader.model.data cimport InstrumentStatus
 from nautilus_trader.model.data cimport MarkPriceUpdate
 from nautilus_trader.model.data cimport OrderBookDelta
 from nautilus_trader.model.data cimport OrderBookDeltas
+from nautilus_trader.model.data cimport OrderBookDeltasBuffer
 from nautilus_trader.model.data cimport OrderBookDepth10
 from nautilus_trader.model.data cimport QuoteTick
 from nautilus_trader.model.data cimport TradeTick
@@ -172,7 +180,7 @@ cdef class DataEngine(Component):
         self._synthetic_trade_feeds: dict[InstrumentId, list[SyntheticInstrument]] = {}
         self._subscribed_synthetic_quotes: list[InstrumentId] = []
         self._subscribed_synthetic_trades: list[InstrumentId] = []
-        self._buffered_deltas_map: dict[InstrumentId, list[OrderBookDelta]] = {}
+        self._buffered_deltas_map: dict[InstrumentId, OrderBookDeltasBuffer] = {}
         self._snapshot_info: dict[str, SnapshotInfo] = {}
         self._query_group_n_components: dict[UUID4, int] = {}
         self._query_group_components: dict[UUID4, list] = {}
@@ -186,6 +194,14 @@ cdef class DataEngine(Component):
         self._time_bars_origins = config.time_bars_origins or {}
         self._validate_data_sequence = config.validate_data_sequence
         self._buffer_deltas = config.buffer_deltas
+        self._catalog_max_workers = config.catalog_max_workers or 0
+        self._catalog_executor = None  # Created on first multi-catalog query
+        self._catalog_executor_lock = threading.Lock()
+        self._catalog_read_ahead_cache = (
+            CatalogReadAheadCache(config.catalog_read_ahead_capacity)
+            if config.catalog_read_ahead
+            else None
+        )
 
         if config.external_clients:
             self._external_clients = set(config.external_clients)
@@ -199,6 +215,7 @@ cdef class DataEngine(Component):
         # Register endpoints
         self._msgbus.register(endpoint="DataEngine.execute", handler=self.execute)
         self._msgbus.register(endpoint="DataEngine.process", handler=self.process)
+        self._msgbus.register(endpoint="DataEngine.process_batch", handler=self.process_batch)
         self._msgbus.register(endpoint="DataEngine.request", handler=self.request)
         self._msgbus.register(endpoint="DataEngine.response", handler=self.response)
 
@@ -294,6 +311,10 @@ cdef class DataEngine(Component):
 
         self._catalogs[name] = catalog
 
+        if self._catalog_read_ahead_cache is not None:
+            # Cached reads may not include the data of the registered catalog
+            self._catalog_read_ahead_cache.clear()
+
     cpdef void register_client(self, DataClient client):
         """
         Register the given data client with the data engine.
@@ -634,6 +655,9 @@ cdef class DataEngine(Component):
         self._buffered_deltas_map.clear()
         self._snapshot_info.clear()
 
+        if self._catalog_read_ahead_cache is not None:
+            self._catalog_read_ahead_cache.clear()
+
         self._clock.cancel_timers()
         self.command_count = 0
         self.data_count = 0
@@ -645,6 +669,11 @@ cdef class DataEngine(Component):
         for client in self._clients.values():
             client.dispose()
 
+        with self._catalog_executor_lock:
+            if self._catalog_executor is not None:
+                self._catalog_executor.shutdown(wait=False)
+                self._catalog_executor = None
+
         self._clock.cancel_timers()
 
 # -- COMMANDS -------------------------------------------------------------------------------------
@@ -685,6 +714,22 @@ cdef class DataEngine(Component):
 
         self._handle_data(data)
 
+    cpdef void process_batch(self, list data):
+        """
+        Process the given batch of data in order.
+
+        Parameters
+        ----------
+        data : list[Data]
+            The data to process.
+
+        """
+        Condition.not_none(data, "data")
+
+        cdef Data item
+        for item in data:
+            self.process(item)
+
     cpdef void request(self, RequestData request):
         """
         Handle the given request.
@@ -1611,50 +1656,128 @@ cdef class DataEngine(Component):
             )
             ts_end = ts_now
 
-        data = []
+        if isinstance(request, RequestBars) and request.bar_type is None:
+            self._log.error("No bar type provided for bars request")
+            return
+
+        self._execute_catalog_query(request, ts_start, ts_end, ts_now)
+
+    cpdef void _execute_catalog_query(
+        self,
+        RequestData request,
+        uint64_t ts_start,
+        uint64_t ts_end,
+        uint64_t ts_now,
+    ):
+        # Reads synchronously on the calling thread, the live engine overrides
+        # this to read on an executor and handle the data back on the event loop
+        data = self._read_catalogs(request, ts_start, ts_end, ts_now)
+        self._handle_catalog_data(request, data, ts_now)
+
+    def _read_catalogs(
+        self,
+        RequestData request,
+        uint64_t ts_start,
+        uint64_t ts_end,
+        uint64_t ts_now,
+    ) -> list:
+        # Only reads from the registered catalogs and the (thread-safe) read-ahead
+        # cache, so this can safely run off the engine thread
+        if isinstance(request, (RequestInstruments, RequestInstrument)):
+            return merge_instruments(self._query_catalogs(request, ts_start, ts_end))
+
+        key = None
+        if self._catalog_read_ahead_cache is not None and ts_start > 0:
+            key = self._catalog_read_ahead_key(request)
+
+        if key is None:
+            return list(merge_data_streams(self._query_catalogs(request, ts_start, ts_end)))
+
+        cached = self._catalog_read_ahead_cache.get(key, ts_start, ts_end)
+        if cached is not None:
+            return cached
+
+        # Read ahead by one request window (bounded by the current time)
+        cdef uint64_t ts_read_end = min(ts_end + (ts_end - ts_start), ts_now)
+        data = list(merge_data_streams(self._query_catalogs(request, ts_start, ts_read_end)))
+        self._catalog_read_ahead_cache.put(key, ts_start, ts_read_end, data)
+
+        if ts_read_end == ts_end:
+            return data
+
+        return [obj for obj in data if obj.ts_init <= ts_end]
+
+    def _catalog_read_ahead_key(self, RequestData request):
+        if isinstance(request, RequestBars):
+            return (Bar, request.bar_type)
+        elif isinstance(request, RequestQuoteTicks):
+            return (QuoteTick, request.instrument_id)
+        elif isinstance(request, RequestTradeTicks):
+            return (TradeTick, request.instrument_id)
+        else:
+            return None  # Read-ahead only applies to market data paging
+
+    def _query_catalogs(self, RequestData request, uint64_t ts_start, uint64_t ts_end) -> list:
+        catalogs = list(self._catalogs.values())
+
+        if len(catalogs) < 2:
+            return [self._query_single_catalog(catalog, request, ts_start, ts_end) for catalog in catalogs]
+
+        with self._catalog_executor_lock:
+            if self._catalog_executor is None:
+                self._catalog_executor = ThreadPoolExecutor(
+                    max_workers=self._catalog_max_workers or len(catalogs),
+                    thread_name_prefix="catalog-query",
+                )
+            executor = self._catalog_executor
+
+        # Query each catalog in parallel (reads release the GIL in pyarrow/datafusion)
+        return list(
+            executor.map(
+                lambda catalog: self._query_single_catalog(catalog, request, ts_start, ts_end),
+                catalogs,
+            ),
+        )
 
+    def _query_single_catalog(
+        self,
+        catalog: ParquetDataCatalog,
+        RequestData request,
+        uint64_t ts_start,
+        uint64_t ts_end,
+    ) -> list:
         if isinstance(request, RequestInstruments):
-            for catalog in self._catalogs.values():
-                data += catalog.instruments()
+            return catalog.instruments()
         elif isinstance(request, RequestInstrument):
-            for catalog in self._catalogs.values():
-                data += catalog.instruments(instrument_ids=[str(request.instrument_id)])
+            return catalog.instruments(instrument_ids=[str(request.instrument_id)])
         elif isinstance(request, RequestQuoteTicks):
-            for catalog in self._catalogs.values():
-                data += catalog.quote_ticks(
-                    instrument_ids=[str(request.instrument_id)],
-                    start=ts_start,
-                    end=ts_end,
-                )
+            return catalog.quote_ticks(
+                instrument_ids=[str(request.instrument_id)],
+                start=ts_start,
+                end=ts_end,
+            )
         elif isinstance(request, RequestTradeTicks):
-            for catalog in self._catalogs.values():
-                data += catalog.trade_ticks(
-                    instrument_ids=[str(request.instrument_id)],
-                    start=ts_start,
-                    end=ts_end,
-                )
+            return catalog.trade_ticks(
+                instrument_ids=[str(request.instrument_id)],
+                start=ts_start,
+                end=ts_end,
+            )
         elif isinstance(request, RequestBars):
-            bar_type = request.bar_type
-            if bar_type is None:
-                self._log.error("No bar type provided for bars request")
-                return
-
-            for catalog in self._catalogs.values():
-                data += catalog.bars(
-                    instrument_ids=[str(bar_type.instrument_id)],
-                    bar_type=str(bar_type),
-                    start=ts_start,
-                    end=ts_end,
-                )
-        elif isinstance(request, RequestData):
-            for catalog in self._catalogs.values():
-                data += catalog.custom_data(
-                    cls=request.data_type.type,
-                    metadata=request.data_type.metadata,
-                    start=ts_start,
-                    end=ts_end,
-                )
+            return catalog.bars(
+                instrument_ids=[str(request.bar_type.instrument_id)],
+                bar_type=str(request.bar_type),
+                start=ts_start,
+                end=ts_end,
+            )
+        else:
+            return catalog.custom_data(
+                cls=request.data_type.type,
+                metadata=request.data_type.metadata,
+                start=ts_start,
+                end=ts_end,
+            )
 
+    cpdef void _handle_catalog_data(self, RequestData request, list data, uint64_t ts_now):
         # Validate data is not from the future
         if data and data[-1].ts_init > ts_now:
             raise RuntimeError(
@@ -1682,6 +1805,10 @@ cdef class DataEngine(Component):
     cpdef void _handle_data(self, Data data):
         self.data_count += 1
 
+        cdef uint64_t start_ns = 0
+        if PROFILING:
+            start_ns = profiler_now()
+
         if isinstance(data, OrderBookDelta):
             self._handle_order_book_delta(data)
         elif isinstance(data, OrderBookDeltas):
@@ -1709,6 +1836,9 @@ cdef class DataEngine(Component):
         else:
             self._log.error(f"Cannot handle data: unrecognized type {type(data)} {data}")
 
+        if start_ns:
+            profiler_record("DataEngine", type(data).__name__, start_ns)
+
     cpdef void _handle_instrument(self, Instrument instrument, update_catalog_mode: CatalogWriteMode | None = None):
         self._cache.add_instrument(instrument)
 
@@ -1724,71 +1854,47 @@ cdef class DataEngine(Component):
 
     cpdef void _handle_order_book_delta(self, OrderBookDelta delta):
         cdef OrderBookDeltas deltas = None
-        cdef list[OrderBookDelta] buffer_deltas = None
-        cdef bint is_last_delta = False
+        cdef OrderBookDeltasBuffer buffer = None
 
         if self._buffer_deltas:
-            buffer_deltas = self._buffered_deltas_map.get(delta.instrument_id)
+            buffer = self._buffered_deltas_map.get(delta.instrument_id)
 
-            if buffer_deltas is None:
-                buffer_deltas = []
-                self._buffered_deltas_map[delta.instrument_id] = buffer_deltas
+            if buffer is None:
+                buffer = OrderBookDeltasBuffer(delta.instrument_id)
+                self._buffered_deltas_map[delta.instrument_id] = buffer
 
-            buffer_deltas.append(delta)
-            is_last_delta = delta.flags == RecordFlag.F_LAST
+            if not buffer.push(delta):
+                return  # Wait for F_LAST
 
-            if is_last_delta:
-                deltas = OrderBookDeltas(
-                    instrument_id=delta.instrument_id,
-                    deltas=buffer_deltas
-                )
-                self._msgbus.publish_c(
-                    topic=f"data.book.deltas"
-                        f".{deltas.instrument_id.venue}"
-                        f".{deltas.instrument_id.symbol}",
-                    msg=deltas,
-                )
-                buffer_deltas.clear()
+            deltas = buffer.build()
         else:
-            deltas = OrderBookDeltas(
-                instrument_id=delta.instrument_id,
-                deltas=[delta]
-            )
-            self._msgbus.publish_c(
-                 topic=f"data.book.deltas"
-                    f".{deltas.instrument_id.venue}"
-                    f".{deltas.instrument_id.symbol}",
-                msg=deltas,
-            )
+            deltas = OrderBookDeltas.from_delta_c(delta)
+
+        self._msgbus.publish_c(
+            topic=f"data.book.deltas"
+                f".{deltas.instrument_id.venue}"
+                f".{deltas.instrument_id.symbol}",
+            msg=deltas,
+        )
 
     cpdef void _handle_order_book_deltas(self, OrderBookDeltas deltas):
         cdef OrderBookDeltas deltas_to_publish = None
-        cdef list[OrderBookDelta] buffer_deltas = None
-        cdef bint is_last_delta = False
+        cdef OrderBookDeltasBuffer buffer = None
 
         if self._buffer_deltas:
-            buffer_deltas = self._buffered_deltas_map.get(deltas.instrument_id)
+            buffer = self._buffered_deltas_map.get(deltas.instrument_id)
 
-            if buffer_deltas is None:
-                buffer_deltas = []
-                self._buffered_deltas_map[deltas.instrument_id] = buffer_deltas
+            if buffer is None:
+                buffer = OrderBookDeltasBuffer(deltas.instrument_id)
+                self._buffered_deltas_map[deltas.instrument_id] = buffer
 
-            for delta in deltas.deltas:
-                buffer_deltas.append(delta)
-                is_last_delta = delta.flags == RecordFlag.F_LAST
-
-                if is_last_delta:
-                    deltas_to_publish = OrderBookDeltas(
-                        instrument_id=deltas.instrument_id,
-                        deltas=buffer_deltas,
-                    )
-                    self._msgbus.publish_c(
-                        topic=f"data.book.deltas"
-                            f".{deltas.instrument_id.venue}"
-                            f".{deltas.instrument_id.symbol}",
-                        msg=deltas_to_publish,
-                    )
-                    buffer_deltas.clear()
+            for deltas_to_publish in buffer.extend(deltas):
+                self._msgbus.publish_c(
+                    topic=f"data.book.deltas"
+                        f".{deltas.instrument_id.venue}"
+                        f".{deltas.instrument_id.symbol}",
+                    msg=deltas_to_publish,
+                )
         else:
             self._msgbus.publish_c(
                 topic=f"data.book.deltas"
@@ -2015,12 +2121,14 @@ cdef class DataEngine(Component):
             return
 
         if type(ticks[0]) is Bar:
+            read_ahead_key = (Bar, ticks[0].bar_type)
             timestamp_bound_catalog = self._catalogs_timestamp_bound(
                 data_cls=Bar,
                 bar_type=ticks[0].bar_type,
                 is_last=(update_catalog_mode is not CatalogWriteMode.PREPEND),
             )[1]
         else:
+            read_ahead_key = (type(ticks[0]), ticks[0].instrument_id)
             timestamp_bound_catalog = self._catalogs_timestamp_bound(
                 data_cls=type(ticks[0]),
                 instrument_id=ticks[0].instrument_id,
@@ -2037,6 +2145,10 @@ cdef class DataEngine(Component):
 
         if timestamp_bound_catalog is not None:
             timestamp_bound_catalog.write_data(ticks, mode=update_catalog_mode)
+
+            if self._catalog_read_ahead_cache is not None:
+                # Any cached window for the stream may no longer match the catalog
+                self._catalog_read_ahead_cache.discard(read_ahead_key)
         else:
             self._log.warning("No catalog available for appending data.")
 
@@ -21,6 +21,7 @@ import msgspec
 
 from nautilus_trader.common.config import NautilusConfig
 from nautilus_trader.common.config import PositiveFloat
+from nautilus_trader.common.config import PositiveInt
 from nautilus_trader.common.config import msgspec_encoding_hook
 from nautilus_trader.common.config import resolve_config_path
 from nautilus_trader.common.config import resolve_path
@@ -52,6 +53,10 @@ class ExecEngineConfig(NautilusConfig, frozen=True):
         If ``None`` then no additional snapshots will be taken.
         To include unrealized PnL in these snapshots, quotes for the position's instrument must be
         available in the cache.
+    position_max_events : PositiveInt, optional
+        The maximum number of fill events each position retains in its event history.
+        Older fills are rolled into the positions aggregate state, bounding memory and
+        per-fill cost for long-lived positions. If ``None`` then all fills are retained.
     debug : bool, default False
         If debug mode is active (will provide extra debug logging).
 
@@ -62,6 +67,7 @@ class ExecEngineConfig(NautilusConfig, frozen=True):
     snapshot_orders: bool = False
     snapshot_positions: bool = False
     snapshot_positions_interval_secs: PositiveFloat | None = None
+    position_max_events: PositiveInt | None = None
     debug: bool = False
 
 
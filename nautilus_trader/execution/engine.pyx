@@ -52,6 +52,9 @@ from nautilus_trader.common.component cimport Logger
 from nautilus_trader.common.component cimport MessageBus
 from nautilus_trader.common.component cimport TimeEvent
 from nautilus_trader.common.generators cimport PositionIdGenerator
+from nautilus_trader.common.profiler cimport PROFILING
+from nautilus_trader.common.profiler cimport profiler_now
+from nautilus_trader.common.profiler cimport profiler_record
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.fsm cimport InvalidStateTrigger
 from nautilus_trader.core.rust.core cimport secs_to_nanos
@@ -157,6 +160,7 @@ cdef class ExecutionEngine(Component):
         self.snapshot_positions = config.snapshot_positions
         self.snapshot_positions_interval_secs = config.snapshot_positions_interval_secs or 0
         self.snapshot_positions_timer_name = "ExecEngine_SNAPSHOT_POSITIONS"
+        self.position_max_events = config.position_max_events or 0
 
         self._log.info(f"{config.snapshot_orders=}", LogColor.BLUE)
         self._log.info(f"{config.snapshot_positions=}", LogColor.BLUE)
@@ -671,7 +675,7 @@ cdef class ExecutionEngine(Component):
         self._cache.cache_accounts()
         self._cache.cache_orders()
         self._cache.cache_order_lists()
-        self._cache.cache_positions()
+        self._cache.cache_positions(self.position_max_events)
 
         # TODO: Uncomment and replace above individual caching methods once implemented
         # self._cache.cache_all()
@@ -857,6 +861,10 @@ cdef class ExecutionEngine(Component):
                 )
                 return  # No client to handle command
 
+        cdef uint64_t start_ns = 0
+        if PROFILING:
+            start_ns = profiler_now()
+
         if isinstance(command, SubmitOrder):
             self._handle_submit_order(client, command)
         elif isinstance(command, SubmitOrderList):
@@ -876,6 +884,9 @@ cdef class ExecutionEngine(Component):
                 f"Cannot handle command: unrecognized {command}",  # pragma: no cover (design-time error)
             )
 
+        if start_ns:
+            profiler_record("ExecEngine", type(command).__name__, start_ns)
+
     cpdef void _handle_submit_order(self, ExecutionClient client, SubmitOrder command):
         cdef Order order = command.order
         if not self._cache.order_exists(order.client_order_id):
@@ -1018,6 +1029,10 @@ cdef class ExecutionEngine(Component):
                 color=LogColor.GREEN,
             )
 
+        cdef uint64_t start_ns = 0
+        if PROFILING:
+            start_ns = profiler_now()
+
         cdef OmsType oms_type
         if isinstance(event, OrderFilled):
             oms_type = self._determine_oms_type(event)
@@ -1027,6 +1042,9 @@ cdef class ExecutionEngine(Component):
         else:
             self._apply_event_to_order(order, event)
 
+        if start_ns:
+            profiler_record("ExecEngine", type(event).__name__, start_ns)
+
     cpdef OmsType _determine_oms_type(self, OrderFilled fill):
         cdef ExecutionClient client
         # Check for strategy OMS override
@@ -1197,7 +1215,7 @@ cdef class ExecutionEngine(Component):
 
     cpdef Position _open_position(self, Instrument instrument, Position position, OrderFilled fill, OmsType oms_type):
         if position is None:
-            position = Position(instrument, fill)
+            position = Position(instrument, fill, max_events=self.position_max_events)
             self._cache.add_position(position, oms_type)
             if self.snapshot_positions:
                 self._create_position_state_snapshot(position)
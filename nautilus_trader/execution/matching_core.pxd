@@ -78,6 +78,8 @@ cdef class MatchingCore:
     cpdef bint is_limit_matched(self, OrderSide side, Price price)
     cpdef bint is_stop_triggered(self, OrderSide side, Price trigger_price)
     cpdef bint is_touch_triggered(self, OrderSide side, Price trigger_price)
+    cdef bint is_range_matched(self, PriceRaw bid_low, PriceRaw bid_high, PriceRaw ask_low, PriceRaw ask_high)
+    cdef bint _is_order_range_matched(self, Order order, PriceRaw low, PriceRaw high)
     cdef LiquiditySide _determine_order_liquidity(self, bint initial, OrderSide side, Price price, Price trigger_price)
 
 
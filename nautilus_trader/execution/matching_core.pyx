@@ -404,6 +404,73 @@ cdef class MatchingCore:
         else:
             raise ValueError(f"invalid `OrderSide`, was {side}")  # pragma: no cover (design-time error)
 
+    cdef bint is_range_matched(
+        self,
+        PriceRaw bid_low,
+        PriceRaw bid_high,
+        PriceRaw ask_low,
+        PriceRaw ask_high,
+    ):
+        """
+        Return whether any resting order could trigger or fill if the market
+        moved anywhere within the given bid and ask price ranges.
+
+        The check is conservative, orders whose matching depends on the path
+        taken through the range (e.g. trailing stops) always return ``True``.
+
+        Parameters
+        ----------
+        bid_low : PriceRaw
+            The lowest bid price (raw) of the range.
+        bid_high : PriceRaw
+            The highest bid price (raw) of the range.
+        ask_low : PriceRaw
+            The lowest ask price (raw) of the range.
+        ask_high : PriceRaw
+            The highest ask price (raw) of the range.
+
+        Returns
+        -------
+        bool
+
+        """
+        cdef Order order
+        for order in self._orders_bid:
+            if self._is_order_range_matched(order, ask_low, ask_high):
+                return True
+
+        for order in self._orders_ask:
+            if self._is_order_range_matched(order, bid_low, bid_high):
+                return True
+
+        return False
+
+    cdef bint _is_order_range_matched(self, Order order, PriceRaw low, PriceRaw high):
+        if order.is_closed_c():
+            return False
+
+        cdef bint is_buy = order.side == OrderSide.BUY
+        cdef OrderType order_type = order.order_type
+        cdef Price price
+        cdef Price trigger_price
+
+        if (
+            order_type == OrderType.LIMIT
+            or order_type == OrderType.MARKET_TO_LIMIT
+            or (order_type == OrderType.STOP_LIMIT and order.is_triggered)
+            or (order_type == OrderType.LIMIT_IF_TOUCHED and order.is_triggered)
+        ):
+            price = order.price
+            return low <= price._mem.raw if is_buy else high >= price._mem.raw
+        elif order_type == OrderType.STOP_MARKET or order_type == OrderType.STOP_LIMIT:
+            trigger_price = order.trigger_price
+            return high >= trigger_price._mem.raw if is_buy else low <= trigger_price._mem.raw
+        elif order_type == OrderType.MARKET_IF_TOUCHED or order_type == OrderType.LIMIT_IF_TOUCHED:
+            trigger_price = order.trigger_price
+            return low <= trigger_price._mem.raw if is_buy else high >= trigger_price._mem.raw
+        else:
+            return True  # Trailing stops are updated along the path taken
+
     cdef LiquiditySide _determine_order_liquidity(
         self,
         bint initial,
@@ -28,5 +28,6 @@ cdef class MovingAverage(Indicator):
     """The current output value.\n\n:returns: `double`"""
 
     cpdef void update_raw(self, double value)
+    cdef void _update_raw_many(self, double[::1] values)
     cpdef void _increment_count(self)
     cpdef void _reset_ma(self)
@@ -15,10 +15,27 @@
 
 from enum import Enum
 from enum import unique
+from types import FunctionType
+
+import numpy as np
 
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.rust.model cimport PriceType
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.model.data cimport Bar
+from nautilus_trader.model.data cimport QuoteTick
+from nautilus_trader.model.data cimport TradeTick
+
+
+cdef inline bint _overrides_handler(MovingAverage indicator, str name):
+    # Python subclasses may override a per-item handler (for example to extract another
+    # price or track extra state), the compiled handlers extract the batch path values
+    for cls in type(indicator).__mro__:
+        handler = cls.__dict__.get(name)
+        if handler is not None:
+            return isinstance(handler, FunctionType)
+
+    return False
 
 
 @unique
@@ -80,6 +97,102 @@ cdef class MovingAverage(Indicator):
         """
         raise NotImplementedError("method `update_raw` must be implemented in the subclass")  # pragma: no cover
 
+    cpdef void handle_quote_ticks(self, list ticks, dict columns = None):
+        """
+        Update the indicator with the given historical quote ticks in bulk.
+
+        Falls back to handling each tick individually if a subclass overrides
+        `handle_quote_tick`.
+
+        Parameters
+        ----------
+        ticks : list[QuoteTick]
+            The ticks to handle (in chronological order).
+        columns : dict[str, np.ndarray], optional
+            The columns for `ticks` as returned by `QuoteTick.to_columns`.
+            If ``None`` then the columns are extracted from `ticks`.
+
+        """
+        Condition.not_none(ticks, "ticks")
+
+        if (
+            self.price_type not in (PriceType.BID, PriceType.ASK, PriceType.MID)
+            or _overrides_handler(self, "handle_quote_tick")
+        ):
+            Indicator.handle_quote_ticks(self, ticks, columns)
+            return
+
+        if columns is None:
+            columns = QuoteTick.to_columns(ticks)
+
+        if self.price_type == PriceType.BID:
+            values = columns["bid_price"]
+        elif self.price_type == PriceType.ASK:
+            values = columns["ask_price"]
+        else:
+            values = (columns["bid_price"] + columns["ask_price"]) / 2.0
+
+        self._update_raw_many(np.ascontiguousarray(values, dtype=np.float64))
+
+    cpdef void handle_trade_ticks(self, list ticks, dict columns = None):
+        """
+        Update the indicator with the given historical trade ticks in bulk.
+
+        Falls back to handling each tick individually if a subclass overrides
+        `handle_trade_tick`.
+
+        Parameters
+        ----------
+        ticks : list[TradeTick]
+            The ticks to handle (in chronological order).
+        columns : dict[str, np.ndarray], optional
+            The columns for `ticks` as returned by `TradeTick.to_columns`.
+            If ``None`` then the columns are extracted from `ticks`.
+
+        """
+        Condition.not_none(ticks, "ticks")
+
+        if _overrides_handler(self, "handle_trade_tick"):
+            Indicator.handle_trade_ticks(self, ticks, columns)
+            return
+
+        if columns is None:
+            columns = TradeTick.to_columns(ticks)
+
+        self._update_raw_many(np.ascontiguousarray(columns["price"], dtype=np.float64))
+
+    cpdef void handle_bars(self, list bars, dict columns = None):
+        """
+        Update the indicator with the given historical bars in bulk.
+
+        Falls back to handling each bar individually if a subclass overrides
+        `handle_bar`.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The bars to handle (in chronological order).
+        columns : dict[str, np.ndarray], optional
+            The columns for `bars` as returned by `Bar.to_columns`.
+            If ``None`` then the columns are extracted from `bars`.
+
+        """
+        Condition.not_none(bars, "bars")
+
+        if _overrides_handler(self, "handle_bar"):
+            Indicator.handle_bars(self, bars, columns)
+            return
+
+        if columns is None:
+            columns = Bar.to_columns(bars)
+
+        self._update_raw_many(np.ascontiguousarray(columns["close"], dtype=np.float64))
+
+    cdef void _update_raw_many(self, double[::1] values):
+        cdef Py_ssize_t i
+        for i in range(values.shape[0]):
+            self.update_raw(values[i])
+
     cpdef void _increment_count(self):
         self.count += 1
 
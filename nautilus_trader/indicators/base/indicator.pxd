@@ -33,6 +33,9 @@ cdef class Indicator:
     cpdef void handle_quote_tick(self, QuoteTick tick)
     cpdef void handle_trade_tick(self, TradeTick tick)
     cpdef void handle_bar(self, Bar bar)
+    cpdef void handle_quote_ticks(self, list ticks, dict columns=*)
+    cpdef void handle_trade_ticks(self, list ticks, dict columns=*)
+    cpdef void handle_bars(self, list bars, dict columns=*)
     cpdef void reset(self)
 
     cpdef void _set_has_inputs(self, bint setting)
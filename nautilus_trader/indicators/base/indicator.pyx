@@ -57,6 +57,63 @@ cdef class Indicator:
         """Abstract method (implement in subclass)."""
         raise NotImplementedError(f"Cannot handle {repr(bar)}: method `handle_bar` not implemented in subclass")  # pragma: no cover
 
+    cpdef void handle_quote_ticks(self, list ticks, dict columns = None):
+        """
+        Update the indicator with the given historical quote ticks in bulk.
+
+        The default implementation handles each tick individually, subclasses
+        may override to update directly from the extracted `columns`.
+
+        Parameters
+        ----------
+        ticks : list[QuoteTick]
+            The ticks to handle (in chronological order).
+        columns : dict[str, np.ndarray], optional
+            The columns for `ticks` as returned by `QuoteTick.to_columns`.
+
+        """
+        cdef QuoteTick tick
+        for tick in ticks:
+            self.handle_quote_tick(tick)
+
+    cpdef void handle_trade_ticks(self, list ticks, dict columns = None):
+        """
+        Update the indicator with the given historical trade ticks in bulk.
+
+        The default implementation handles each tick individually, subclasses
+        may override to update directly from the extracted `columns`.
+
+        Parameters
+        ----------
+        ticks : list[TradeTick]
+            The ticks to handle (in chronological order).
+        columns : dict[str, np.ndarray], optional
+            The columns for `ticks` as returned by `TradeTick.to_columns`.
+
+        """
+        cdef TradeTick tick
+        for tick in ticks:
+            self.handle_trade_tick(tick)
+
+    cpdef void handle_bars(self, list bars, dict columns = None):
+        """
+        Update the indicator with the given historical bars in bulk.
+
+        The default implementation handles each bar individually, subclasses
+        may override to update directly from the extracted `columns`.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The bars to handle (in chronological order).
+        columns : dict[str, np.ndarray], optional
+            The columns for `bars` as returned by `Bar.to_columns`.
+
+        """
+        cdef Bar bar
+        for bar in bars:
+            self.handle_bar(bar)
+
     cpdef void reset(self):
         """
         Reset the indicator.
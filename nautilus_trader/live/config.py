@@ -43,10 +43,22 @@ class LiveDataEngineConfig(DataEngineConfig, frozen=True):
     ----------
     qsize : PositiveInt, default 100_000
         The queue size for the engines internal queue buffers.
+    drain_budget : PositiveInt, default 1_000
+        The maximum number of messages processed from an internal queue per wakeup,
+        before yielding to the event loop.
+    conflate_prices : bool, default False
+        If quotes, mark prices and index prices are conflated per instrument while the
+        data queue is backed up, so that only the latest update is processed.
+        Trades, order book data and custom data always keep strict ordering.
+    conflation_threshold : PositiveInt, default 10_000
+        The data queue size at or above which price updates start to be conflated.
 
     """
 
     qsize: PositiveInt = 100_000
+    drain_budget: PositiveInt = 1_000
+    conflate_prices: bool = False
+    conflation_threshold: PositiveInt = 10_000
 
 
 class LiveRiskEngineConfig(RiskEngineConfig, frozen=True):
@@ -57,10 +69,14 @@ class LiveRiskEngineConfig(RiskEngineConfig, frozen=True):
     ----------
     qsize : PositiveInt, default 100_000
         The queue size for the engines internal queue buffers.
+    drain_budget : PositiveInt, default 1_000
+        The maximum number of messages processed from an internal queue per wakeup,
+        before yielding to the event loop.
 
     """
 
     qsize: PositiveInt = 100_000
+    drain_budget: PositiveInt = 1_000
 
 
 class LiveExecEngineConfig(ExecEngineConfig, frozen=True):
@@ -84,6 +100,10 @@ class LiveExecEngineConfig(ExecEngineConfig, frozen=True):
         If position status reports are filtered from reconciliation.
         This may be applicable when other nodes are trading the same instrument(s), on the same
         account - which could cause conflicts in position status.
+    reconciliation_watermark : bool, default False
+        If the latest reconciled report timestamp is checkpointed per client in the cache.
+        On restart, order reports at or before the checkpoint for orders already held in the
+        cache are then skipped during reconciliation (requires a persistent cache database).
     generate_missing_orders : bool, default True
         If MARKET order events will be generated during reconciliation to align discrepancies
         between internal and external positions.
@@ -112,8 +132,24 @@ class LiveExecEngineConfig(ExecEngineConfig, frozen=True):
         If True, the **check_open_orders** requests only currently open orders from the venue.
         If False, it requests the entire order history, which can be a heavy API call.
         This parameter only applies if the **check_open_orders** task is running.
+    purge_closed_orders_interval_mins : PositiveInt, optional
+        The interval (minutes) between purging closed orders from the in-memory cache.
+        If no value is specified then closed orders are never purged.
+    purge_closed_orders_buffer_mins : NonNegativeInt, optional
+        The minimum time (minutes) since a closed orders last event before it can be purged.
+    purge_closed_positions_interval_mins : PositiveInt, optional
+        The interval (minutes) between purging closed positions from the in-memory cache.
+        If no value is specified then closed positions are never purged.
+        Purged positions no longer contribute to the portfolio realized PnL.
+    purge_closed_positions_buffer_mins : NonNegativeInt, optional
+        The minimum time (minutes) since a position closed before it can be purged.
+    purge_closed_keep_count : NonNegativeInt, default 0
+        The number of most recent closed orders and closed positions always retained in memory.
     qsize : PositiveInt, default 100_000
         The queue size for the engines internal queue buffers.
+    drain_budget : PositiveInt, default 1_000
+        The maximum number of messages processed from an internal queue per wakeup,
+        before yielding to the event loop.
 
     """
 
@@ -121,6 +157,7 @@ class LiveExecEngineConfig(ExecEngineConfig, frozen=True):
     reconciliation_lookback_mins: NonNegativeInt | None = None
     filter_unclaimed_external_orders: bool = False
     filter_position_reports: bool = False
+    reconciliation_watermark: bool = False
     generate_missing_orders: bool = True
     inflight_check_interval_ms: NonNegativeInt = 2_000
     inflight_check_threshold_ms: NonNegativeInt = 5_000
@@ -128,7 +165,13 @@ class LiveExecEngineConfig(ExecEngineConfig, frozen=True):
     own_books_audit_interval_secs: PositiveFloat | None = None
     open_check_interval_secs: PositiveFloat | None = None
     open_check_open_only: bool = True
+    purge_closed_orders_interval_mins: PositiveInt | None = None
+    purge_closed_orders_buffer_mins: NonNegativeInt | None = None
+    purge_closed_positions_interval_mins: PositiveInt | None = None
+    purge_closed_positions_buffer_mins: NonNegativeInt | None = None
+    purge_closed_keep_count: NonNegativeInt = 0
     qsize: PositiveInt = 100_000
+    drain_budget: PositiveInt = 1_000
 
 
 class RoutingConfig(NautilusConfig, frozen=True):
@@ -29,6 +29,14 @@ from nautilus_trader.data.messages import DataCommand
 from nautilus_trader.data.messages import DataResponse
 from nautilus_trader.data.messages import RequestData
 from nautilus_trader.live.enqueue import ThrottledEnqueuer
+from nautilus_trader.model.data import IndexPriceUpdate
+from nautilus_trader.model.data import MarkPriceUpdate
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.identifiers import InstrumentId
+
+
+# Top-of-book style updates where only the latest value per instrument matters
+_CONFLATABLE_TYPES: Final[frozenset[type]] = frozenset({QuoteTick, MarkPriceUpdate, IndexPriceUpdate})
 
 
 class LiveDataEngine(DataEngine):
@@ -80,6 +88,14 @@ class LiveDataEngine(DataEngine):
         self._req_queue: asyncio.Queue = Queue(maxsize=config.qsize)
         self._res_queue: asyncio.Queue = Queue(maxsize=config.qsize)
         self._data_queue: asyncio.Queue = Queue(maxsize=config.qsize)
+        self._drain_budget: int = config.drain_budget
+
+        # Price conflation (latest update per data type and instrument while backed up,
+        # older updates for the same key are dropped when dequeued)
+        self._conflate_prices: bool = config.conflate_prices
+        self._conflation_threshold: int = config.conflation_threshold
+        self._conflated: dict[tuple[type, InstrumentId], Data] = {}
+        self._conflated_counts: dict[type, int] = {}
 
         self._cmd_enqueuer: ThrottledEnqueuer[DataCommand] = ThrottledEnqueuer(
             qname="cmd_queue",
@@ -231,6 +247,45 @@ class LiveDataEngine(DataEngine):
         """
         return self._data_queue.qsize()
 
+    def conflated_count(self) -> int:
+        """
+        Return the total count of price updates dropped by conflation.
+
+        Returns
+        -------
+        int
+
+        """
+        return sum(self._conflated_counts.values())
+
+    def conflated_counts(self) -> dict[str, int]:
+        """
+        Return the counts of price updates dropped by conflation per data type.
+
+        Returns
+        -------
+        dict[str, int]
+
+        """
+        return {cls.__name__: count for cls, count in self._conflated_counts.items()}
+
+    def queue_metrics(self) -> dict[str, dict[str, int]]:
+        """
+        Return the depth and drain batch metrics for the engines internal queues.
+
+        Returns
+        -------
+        dict[str, dict[str, int]]
+            Keyed by queue name.
+
+        """
+        return {
+            self._cmd_enqueuer.qname: self._cmd_enqueuer.metrics(),
+            self._req_enqueuer.qname: self._req_enqueuer.metrics(),
+            self._res_enqueuer.qname: self._res_enqueuer.metrics(),
+            self._data_enqueuer.qname: self._data_enqueuer.metrics(),
+        }
+
     def kill(self) -> None:
         """
         Kill the engine by abruptly canceling the queue tasks and calling stop.
@@ -238,6 +293,7 @@ class LiveDataEngine(DataEngine):
         self._log.warning("Killing engine")
         self._kill = True
         self.stop()
+        self._clear_conflated()
         if self._cmd_queue_task:
             self._log.debug(f"Canceling task '{self._cmd_queue_task.get_name()}'")
             self._cmd_queue_task.cancel()
@@ -322,10 +378,89 @@ class LiveDataEngine(DataEngine):
         loop is running on. Calling it from a different thread may lead to unexpected behavior.
 
         """
+        if self._conflate_prices and type(data) in _CONFLATABLE_TYPES:
+            key = (type(data), data.instrument_id)
+            if key in self._conflated or self._data_queue.qsize() >= self._conflation_threshold:
+                # Track the latest update for the key, any older updates still
+                # on the queue are then dropped when dequeued
+                self._conflated[key] = data
+
         self._data_enqueuer.enqueue(data)
 
+    def process_batch(self, data: list[Data]) -> None:
+        """
+        Process the given batch of data messages in order.
+
+        The batch is placed on the internal queue in a single handoff, unless
+        price conflation is enabled, in which case each message is processed
+        individually (on the event loop thread) so that pending updates can be
+        conflated.
+
+        Parameters
+        ----------
+        data : list[Data]
+            The data to process.
+
+        Notes
+        -----
+        This method may be called from a thread other than the event loop thread
+        (e.g. a Rust client callback), the batch is then handed off to the loop
+        with a single `call_soon_threadsafe`.
+
+        """
+        if self._conflate_prices:
+            if not self._is_loop_thread():
+                self._loop.call_soon_threadsafe(self.process_batch, data)
+                return
+
+            for item in data:
+                self.process(item)
+            return
+
+        self._data_enqueuer.enqueue_batch(data)
+
     # -- INTERNAL -------------------------------------------------------------------------------------
 
+    def _execute_catalog_query(
+        self,
+        request: RequestData,
+        ts_start: int,
+        ts_end: int,
+        ts_now: int,
+    ) -> None:
+        if not self._loop.is_running():
+            super()._execute_catalog_query(request, ts_start, ts_end, ts_now)
+            return
+
+        # Read the catalogs on an executor so the event loop is not blocked,
+        # the response is then handled back on the event loop thread
+        future = self._loop.run_in_executor(
+            None,
+            self._read_catalogs,
+            request,
+            ts_start,
+            ts_end,
+            ts_now,
+        )
+        future.add_done_callback(
+            lambda f: self._on_catalog_query_done(f, request, ts_now),
+        )
+
+    def _on_catalog_query_done(
+        self,
+        future: asyncio.Future,
+        request: RequestData,
+        ts_now: int,
+    ) -> None:
+        if future.cancelled():
+            self._log.warning(f"Catalog query canceled for {request}")
+            return
+
+        try:
+            self._handle_catalog_data(request, future.result(), ts_now)
+        except Exception as e:
+            self._log.error(f"Error querying catalogs for {request}: {e!r}\n{traceback.format_exc()}")
+
     def _enqueue_sentinels(self) -> None:
         self._loop.call_soon_threadsafe(self._cmd_queue.put_nowait, self._sentinel)
         self._loop.call_soon_threadsafe(self._req_queue.put_nowait, self._sentinel)
@@ -333,6 +468,35 @@ class LiveDataEngine(DataEngine):
         self._loop.call_soon_threadsafe(self._data_queue.put_nowait, self._sentinel)
         self._log.debug("Sentinel messages placed on queues")
 
+    def _reset(self) -> None:
+        super()._reset()
+        self._clear_conflated()
+
+    def _clear_conflated(self) -> None:
+        self._conflated.clear()
+        self._conflated_counts.clear()
+
+    def _is_loop_thread(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:  # No running loop on this thread
+            return False
+
+    def _is_stale(self, data: Data) -> bool:
+        # Return whether a newer update for the same key is pending (and should be
+        # processed in place of `data`), otherwise stop tracking the key
+        key = (type(data), data.instrument_id)
+        latest = self._conflated.get(key)
+        if latest is None:
+            return False
+
+        if latest is data:
+            del self._conflated[key]
+            return False
+
+        self._conflated_counts[key[0]] = self._conflated_counts.get(key[0], 0) + 1
+        return True
+
     def _on_start(self) -> None:
         if not self._loop.is_running():
             self._log.warning("Started when loop is not running")
@@ -359,11 +523,13 @@ class LiveDataEngine(DataEngine):
             f"DataCommand message queue processing starting (qsize={self.cmd_qsize()})",
         )
         try:
-            while True:
-                command: DataCommand | None = await self._cmd_queue.get()
-                if command is self._sentinel:
-                    break
-                self._execute_command(command)
+            running = True
+            while running:
+                for command in await self._cmd_enqueuer.get_batch(self._drain_budget):
+                    if command is self._sentinel:
+                        running = False
+                        break
+                    self._execute_command(command)
         except asyncio.CancelledError:
             self._log.warning("DataCommand message queue canceled")
         except Exception as e:
@@ -380,11 +546,13 @@ class LiveDataEngine(DataEngine):
             f"RequestData message queue processing starting (qsize={self.req_qsize()})",
         )
         try:
-            while True:
-                request: RequestData | None = await self._req_queue.get()
-                if request is self._sentinel:
-                    break
-                self._handle_request(request)
+            running = True
+            while running:
+                for request in await self._req_enqueuer.get_batch(self._drain_budget):
+                    if request is self._sentinel:
+                        running = False
+                        break
+                    self._handle_request(request)
         except asyncio.CancelledError:
             self._log.warning("RequestData message queue canceled")
         except Exception as e:
@@ -401,11 +569,13 @@ class LiveDataEngine(DataEngine):
             f"DataResponse message queue processing starting (qsize={self.res_qsize()})",
         )
         try:
-            while True:
-                response: DataResponse | None = await self._res_queue.get()
-                if response is self._sentinel:
-                    break
-                self._handle_response(response)
+            running = True
+            while running:
+                for response in await self._res_enqueuer.get_batch(self._drain_budget):
+                    if response is self._sentinel:
+                        running = False
+                        break
+                    self._handle_response(response)
         except asyncio.CancelledError:
             self._log.warning("DataResponse message queue canceled")
         except Exception as e:
@@ -420,11 +590,16 @@ class LiveDataEngine(DataEngine):
     async def _run_data_queue(self) -> None:
         self._log.debug(f"Data queue processing starting (qsize={self.data_qsize()})")
         try:
-            while True:
-                data: Data | None = await self._data_queue.get()
-                if data is self._sentinel:
-                    break
-                self._handle_data(data)
+            running = True
+            while running:
+                for data in await self._data_enqueuer.get_batch(self._drain_budget):
+                    if data is self._sentinel:
+                        running = False
+                        break
+                    if self._conflated and type(data) in _CONFLATABLE_TYPES:
+                        if self._is_stale(data):
+                            continue
+                    self._handle_data(data)
         except asyncio.CancelledError:
             self._log.warning("Data message queue canceled")
         except Exception as e:
@@ -14,6 +14,8 @@
 # -------------------------------------------------------------------------------------------------
 
 import asyncio
+import threading
+from collections import deque
 from typing import Generic, TypeVar
 
 from nautilus_trader.common.component import Clock
@@ -28,6 +30,10 @@ class ThrottledEnqueuer(Generic[T]):
     """
     Manages enqueuing messages of type T onto an internal asynchronous queue.
 
+    Messages enqueued from the event loop thread are put onto the queue directly.
+    Messages enqueued from other threads are buffered and handed off to the loop
+    in batches, with a single `call_soon_threadsafe` per batch.
+
     Parameters
     ----------
     qname : str
@@ -58,6 +64,17 @@ class ThrottledEnqueuer(Generic[T]):
         self._log = logger
         self._ts_last_logged: int = 0
 
+        # Foreign thread handoff
+        self._pending: deque[T] = deque()
+        self._pending_lock = threading.Lock()
+        self._flush_scheduled = False
+
+        # Metrics
+        self._batch_count: int = 0
+        self._message_count: int = 0
+        self._last_batch_size: int = 0
+        self._max_batch_size: int = 0
+
     @property
     def qname(self) -> str:
         """
@@ -94,6 +111,37 @@ class ThrottledEnqueuer(Generic[T]):
         """
         return self._queue.maxsize
 
+    @property
+    def pending(self) -> int:
+        """
+        Return the count of messages from other threads awaiting handoff to the queue.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._pending)
+
+    def metrics(self) -> dict[str, int]:
+        """
+        Return the queue depth and drain batch metrics.
+
+        Returns
+        -------
+        dict[str, int]
+
+        """
+        return {
+            "size": self._queue.qsize(),
+            "capacity": self._queue.maxsize,
+            "pending": len(self._pending),
+            "batches": self._batch_count,
+            "messages": self._message_count,
+            "last_batch_size": self._last_batch_size,
+            "max_batch_size": self._max_batch_size,
+        }
+
     def enqueue(self, msg: T) -> None:
         """
         Enqueue a message and logs a throttled warning if the queue is at capacity.
@@ -111,11 +159,95 @@ class ThrottledEnqueuer(Generic[T]):
         assert msg is not None, "message was `None` when a value was expected"
 
         if self._queue.qsize() < self._queue.maxsize:
-            self._loop.call_soon_threadsafe(self._enqueue_nowait_safely, self._queue, msg)
+            if self._is_loop_thread():
+                self._enqueue_nowait_safely(self._queue, msg)
+                return
+
+            with self._pending_lock:
+                self._pending.append(msg)
+                if self._flush_scheduled:
+                    return  # Handoff already scheduled for this batch
+                self._flush_scheduled = True
+
+            self._schedule_flush()
             return
 
         self._loop.create_task(self._queue.put(msg))
+        self._log_at_capacity()
+
+    def enqueue_batch(self, msgs: list[T]) -> None:
+        """
+        Enqueue a batch of messages in order.
+
+        Batches enqueued from other threads are handed off to the loop with a
+        single `call_soon_threadsafe`. Messages which do not fit within the queue
+        capacity are scheduled as asynchronous puts, as with `enqueue`.
+
+        Parameters
+        ----------
+        msgs : list[T]
+            The messages to enqueue (must not contain ``None``).
+
+        """
+        if not msgs:
+            return
+
+        if self._queue.qsize() + len(msgs) > self._queue.maxsize:
+            self._log_at_capacity()
+
+        if self._is_loop_thread():
+            for msg in msgs:
+                self._enqueue_nowait_safely(self._queue, msg)
+            return
+
+        with self._pending_lock:
+            self._pending.extend(msgs)
+            if self._flush_scheduled:
+                return  # Handoff already scheduled for this batch
+            self._flush_scheduled = True
+
+        self._schedule_flush()
+
+    async def get_batch(self, budget: int) -> list[T | None]:
+        """
+        Wait for the next message, then drain all immediately available messages.
+
+        Draining stops after a `None` sentinel message. If the `budget` is exhausted
+        then control is yielded to the event loop before returning.
+
+        Parameters
+        ----------
+        budget : int
+            The maximum number of messages to return.
+
+        Returns
+        -------
+        list[T | None]
+
+        """
+        msg = await self._queue.get()
+        batch = [msg]
+
+        while msg is not None and len(batch) < budget:
+            try:
+                msg = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            batch.append(msg)
+
+        batch_size = len(batch)
+        self._batch_count += 1
+        self._message_count += batch_size
+        self._last_batch_size = batch_size
+        if batch_size > self._max_batch_size:
+            self._max_batch_size = batch_size
+
+        if batch_size >= budget:
+            await asyncio.sleep(0)  # Allow other tasks to run
 
+        return batch
+
+    def _log_at_capacity(self) -> None:
         # Throttle logging to once per second
         now_ns = self._clock.timestamp_ns()
         if now_ns > self._ts_last_logged + NANOSECONDS_IN_SECOND:
@@ -125,6 +257,30 @@ class ThrottledEnqueuer(Generic[T]):
             )
             self._ts_last_logged = now_ns
 
+    def _is_loop_thread(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:  # No running loop on this thread
+            return False
+
+    def _schedule_flush(self) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._flush_pending)
+        except Exception:
+            # Allow a later enqueue to schedule the handoff of the pending messages
+            with self._pending_lock:
+                self._flush_scheduled = False
+            raise
+
+    def _flush_pending(self) -> None:
+        with self._pending_lock:
+            msgs = list(self._pending)
+            self._pending.clear()
+            self._flush_scheduled = False
+
+        for msg in msgs:
+            self._enqueue_nowait_safely(self._queue, msg)
+
     def _enqueue_nowait_safely(self, queue: asyncio.Queue, msg: T) -> None:
         # Attempt put_nowait(msg) and if the queue is full,
         # schedule an async put() as a fallback.
@@ -19,6 +19,9 @@ import traceback
 import uuid
 from asyncio import Queue
 from collections import Counter
+from collections import defaultdict
+from collections.abc import Callable
+from collections.abc import Generator
 from decimal import Decimal
 from typing import Any, Final
 
@@ -125,6 +128,7 @@ class LiveExecutionEngine(ExecutionEngine):
         self._loop: asyncio.AbstractEventLoop = loop
         self._cmd_queue: asyncio.Queue = Queue(maxsize=config.qsize)
         self._evt_queue: asyncio.Queue = Queue(maxsize=config.qsize)
+        self._drain_budget: int = config.drain_budget
         self._inflight_check_retries: Counter[ClientOrderId] = Counter()
 
         self._cmd_enqueuer: ThrottledEnqueuer[TradingCommand] = ThrottledEnqueuer(
@@ -148,6 +152,8 @@ class LiveExecutionEngine(ExecutionEngine):
         self._inflight_check_task: asyncio.Task | None = None
         self._own_books_audit_task: asyncio.Task | None = None
         self._open_check_task: asyncio.Task | None = None
+        self._purge_closed_orders_task: asyncio.Task | None = None
+        self._purge_closed_positions_task: asyncio.Task | None = None
         self._kill: bool = False
 
         # Configuration
@@ -155,6 +161,7 @@ class LiveExecutionEngine(ExecutionEngine):
         self.reconciliation_lookback_mins: int = config.reconciliation_lookback_mins or 0
         self.filter_unclaimed_external_orders: bool = config.filter_unclaimed_external_orders
         self.filter_position_reports: bool = config.filter_position_reports
+        self.reconciliation_watermark: bool = config.reconciliation_watermark
         self.generate_missing_orders: bool = config.generate_missing_orders
         self.inflight_check_interval_ms: int = config.inflight_check_interval_ms
         self.inflight_check_threshold_ms: int = config.inflight_check_threshold_ms
@@ -162,18 +169,29 @@ class LiveExecutionEngine(ExecutionEngine):
         self.own_books_audit_interval_secs: float | None = config.own_books_audit_interval_secs
         self.open_check_interval_secs: float | None = config.open_check_interval_secs
         self.open_check_open_only: float | None = config.open_check_open_only
+        self.purge_closed_orders_interval_mins = config.purge_closed_orders_interval_mins
+        self.purge_closed_orders_buffer_mins = config.purge_closed_orders_buffer_mins or 0
+        self.purge_closed_positions_interval_mins = config.purge_closed_positions_interval_mins
+        self.purge_closed_positions_buffer_mins = config.purge_closed_positions_buffer_mins or 0
+        self.purge_closed_keep_count: int = config.purge_closed_keep_count
         self._inflight_check_threshold_ns: int = millis_to_nanos(self.inflight_check_threshold_ms)
 
         self._log.info(f"{config.reconciliation=}", LogColor.BLUE)
         self._log.info(f"{config.reconciliation_lookback_mins=}", LogColor.BLUE)
         self._log.info(f"{config.filter_unclaimed_external_orders=}", LogColor.BLUE)
         self._log.info(f"{config.filter_position_reports=}", LogColor.BLUE)
+        self._log.info(f"{config.reconciliation_watermark=}", LogColor.BLUE)
         self._log.info(f"{config.inflight_check_interval_ms=}", LogColor.BLUE)
         self._log.info(f"{config.inflight_check_threshold_ms=}", LogColor.BLUE)
         self._log.info(f"{config.inflight_check_retries=}", LogColor.BLUE)
         self._log.info(f"{config.own_books_audit_interval_secs=}", LogColor.BLUE)
         self._log.info(f"{config.open_check_interval_secs=}", LogColor.BLUE)
         self._log.info(f"{config.open_check_open_only=}", LogColor.BLUE)
+        self._log.info(f"{config.purge_closed_orders_interval_mins=}", LogColor.BLUE)
+        self._log.info(f"{config.purge_closed_orders_buffer_mins=}", LogColor.BLUE)
+        self._log.info(f"{config.purge_closed_positions_interval_mins=}", LogColor.BLUE)
+        self._log.info(f"{config.purge_closed_positions_buffer_mins=}", LogColor.BLUE)
+        self._log.info(f"{config.purge_closed_keep_count=}", LogColor.BLUE)
 
         # Register endpoints
         self._msgbus.register(endpoint="ExecEngine.reconcile_report", handler=self.reconcile_report)
@@ -297,6 +315,21 @@ class LiveExecutionEngine(ExecutionEngine):
         """
         return self._evt_queue.qsize()
 
+    def queue_metrics(self) -> dict[str, dict[str, int]]:
+        """
+        Return the depth and drain batch metrics for the engines internal queues.
+
+        Returns
+        -------
+        dict[str, dict[str, int]]
+            Keyed by queue name.
+
+        """
+        return {
+            self._cmd_enqueuer.qname: self._cmd_enqueuer.metrics(),
+            self._evt_enqueuer.qname: self._evt_enqueuer.metrics(),
+        }
+
     # -- COMMANDS -------------------------------------------------------------------------------------
 
     def kill(self) -> None:
@@ -382,6 +415,18 @@ class LiveExecutionEngine(ExecutionEngine):
                 name="open_check",
             )
 
+        if self.purge_closed_orders_interval_mins and not self._purge_closed_orders_task:
+            self._purge_closed_orders_task = self._loop.create_task(
+                self._purge_closed_orders_loop(self.purge_closed_orders_interval_mins),
+                name="purge_closed_orders",
+            )
+
+        if self.purge_closed_positions_interval_mins and not self._purge_closed_positions_task:
+            self._purge_closed_positions_task = self._loop.create_task(
+                self._purge_closed_positions_loop(self.purge_closed_positions_interval_mins),
+                name="purge_closed_positions",
+            )
+
     def _on_stop(self) -> None:
         if self._inflight_check_task:
             self._log.debug(f"Canceling task '{self._inflight_check_task.get_name()}'")
@@ -398,6 +443,16 @@ class LiveExecutionEngine(ExecutionEngine):
             self._open_check_task.cancel()
             self._open_check_task = None
 
+        if self._purge_closed_orders_task:
+            self._log.debug(f"Canceling task '{self._purge_closed_orders_task.get_name()}'")
+            self._purge_closed_orders_task.cancel()
+            self._purge_closed_orders_task = None
+
+        if self._purge_closed_positions_task:
+            self._log.debug(f"Canceling task '{self._purge_closed_positions_task.get_name()}'")
+            self._purge_closed_positions_task.cancel()
+            self._purge_closed_positions_task = None
+
         if self._kill:
             return  # Avoids enqueuing unnecessary sentinel messages when termination already signaled
 
@@ -409,11 +464,13 @@ class LiveExecutionEngine(ExecutionEngine):
             f"Command message queue processing starting (qsize={self.cmd_qsize()})",
         )
         try:
-            while True:
-                command: TradingCommand | None = await self._cmd_queue.get()
-                if command is self._sentinel:
-                    break
-                self._execute_command(command)
+            running = True
+            while running:
+                for command in await self._cmd_enqueuer.get_batch(self._drain_budget):
+                    if command is self._sentinel:
+                        running = False
+                        break
+                    self._execute_command(command)
         except asyncio.CancelledError:
             self._log.warning("Canceled task 'run_cmd_queue'")
         except Exception as e:
@@ -430,11 +487,13 @@ class LiveExecutionEngine(ExecutionEngine):
             f"Event message queue processing starting (qsize={self.evt_qsize()})",
         )
         try:
-            while True:
-                event: OrderEvent | None = await self._evt_queue.get()
-                if event is self._sentinel:
-                    break
-                self._handle_event(event)
+            running = True
+            while running:
+                for event in await self._evt_enqueuer.get_batch(self._drain_budget):
+                    if event is self._sentinel:
+                        running = False
+                        break
+                    self._handle_event(event)
         except asyncio.CancelledError:
             self._log.warning("Canceled task 'run_evt_queue'")
         except Exception as e:
@@ -508,6 +567,38 @@ class LiveExecutionEngine(ExecutionEngine):
         except asyncio.CancelledError:
             self._log.debug("Canceled task 'open_check_loop'")
 
+    async def _purge_closed_orders_loop(self, interval_mins: int) -> None:
+        try:
+            while True:
+                await asyncio.sleep(interval_mins * 60)
+                try:
+                    self._cache.purge_closed_orders(
+                        ts_now=self._clock.timestamp_ns(),
+                        buffer_secs=self.purge_closed_orders_buffer_mins * 60,
+                        keep_count=self.purge_closed_keep_count,
+                    )
+                except Exception as e:
+                    # Keep purging on later intervals
+                    self._log.error(f"Error purging closed orders: {e}")
+        except asyncio.CancelledError:
+            self._log.debug("Canceled task 'purge_closed_orders_loop'")
+
+    async def _purge_closed_positions_loop(self, interval_mins: int) -> None:
+        try:
+            while True:
+                await asyncio.sleep(interval_mins * 60)
+                try:
+                    self._cache.purge_closed_positions(
+                        ts_now=self._clock.timestamp_ns(),
+                        buffer_secs=self.purge_closed_positions_buffer_mins * 60,
+                        keep_count=self.purge_closed_keep_count,
+                    )
+                except Exception as e:
+                    # Keep purging on later intervals
+                    self._log.error(f"Error purging closed positions: {e}")
+        except asyncio.CancelledError:
+            self._log.debug("Canceled task 'purge_closed_positions_loop'")
+
     async def _check_open_orders(self) -> None:
         try:
             self._log.debug("Checking open orders status")
@@ -589,8 +680,6 @@ class LiveExecutionEngine(ExecutionEngine):
             self._log.warning("Reconciliation deactivated")
             return True
 
-        results: list[bool] = []
-
         # Request execution mass status report from clients
         reconciliation_lookback_mins: int | None = (
             self.reconciliation_lookback_mins if self.reconciliation_lookback_mins > 0 else None
@@ -601,6 +690,8 @@ class LiveExecutionEngine(ExecutionEngine):
         mass_status_all = await asyncio.gather(*mass_status_coros)
 
         # Reconcile each mass status with the execution engine
+        client_results: dict[ClientId, bool] = {}
+        report_requests: list[tuple[ClientId, Any]] = []
         for mass_status in mass_status_all:
             if mass_status is None:
                 self._log.warning(
@@ -611,11 +702,10 @@ class LiveExecutionEngine(ExecutionEngine):
 
             client_id = mass_status.client_id
             venue = mass_status.venue
-            result = self._reconcile_mass_status(mass_status)
+            result = await self._reconcile_mass_status_async(mass_status)
+            client_results[client_id] = result
 
             if not result and self.filter_position_reports:
-                self._log_reconciliation_result(client_id, result)
-                results.append(result)
                 self._log.warning(
                     "`filter_position_reports` enabled, skipping further reconciliation",
                 )
@@ -624,7 +714,6 @@ class LiveExecutionEngine(ExecutionEngine):
             client = self._clients[client_id]
 
             # Check internal and external position reconciliation
-            report_tasks: list[asyncio.Task] = []
             for position in self._cache.positions_open(venue):
                 instrument_id = position.instrument_id
                 if instrument_id in mass_status.position_reports:
@@ -638,26 +727,30 @@ class LiveExecutionEngine(ExecutionEngine):
                     command_id=UUID4(),
                     ts_init=self._clock.timestamp_ns(),
                 )
-                report_tasks.append(
-                    client.generate_position_status_reports(position_status_command),
+                report_requests.append(
+                    (client_id, client.generate_position_status_reports(position_status_command)),
                 )
 
-            if report_tasks:
-                # Reconcile specific internal open positions
-                self._log.info(f"Awaiting {len(report_tasks)} position reports for {client_id}")
-                position_results: list[bool] = []
-                for task_result in await asyncio.gather(*report_tasks):
-                    for report in task_result:
-                        position_result = self._reconcile_position_report(report)
-                        self._log_reconciliation_result(report.instrument_id, position_result)
-                        position_results.append(position_result)
-
-                result = all(position_results)
-
+        if report_requests:
+            # Request position reports from all clients concurrently
+            self._log.info(f"Awaiting {len(report_requests)} position reports")
+            position_results: dict[ClientId, list[bool]] = {}
+            reports_all = await asyncio.gather(*[coro for _, coro in report_requests])
+            for (client_id, _), reports in zip(report_requests, reports_all, strict=True):
+                client_position_results = position_results.setdefault(client_id, [])
+                for report in reports:
+                    position_result = self._reconcile_position_report(report)
+                    self._log_reconciliation_result(report.instrument_id, position_result)
+                    client_position_results.append(position_result)
+
+            # Reconcile specific internal open positions
+            for client_id, client_position_results in position_results.items():
+                client_results[client_id] = all(client_position_results)
+
+        for client_id, result in client_results.items():
             self._log_reconciliation_result(client_id, result)
-            results.append(result)
 
-        return all(results)
+        return all(client_results.values())
 
     def reconcile_report(self, report: ExecutionReport) -> bool:
         """
@@ -716,6 +809,32 @@ class LiveExecutionEngine(ExecutionEngine):
         self,
         mass_status: ExecutionMassStatus,
     ) -> bool:
+        instrument_steps, complete = self._prepare_mass_status_reconciliation(mass_status)
+        for steps in instrument_steps:
+            for _ in steps:
+                pass
+
+        return complete()
+
+    async def _reconcile_mass_status_async(
+        self,
+        mass_status: ExecutionMassStatus,
+    ) -> bool:
+        instrument_steps, complete = self._prepare_mass_status_reconciliation(mass_status)
+        for steps in instrument_steps:
+            for _ in steps:
+                await asyncio.sleep(0)  # Yield to the event loop between instrument groups
+
+        return complete()
+
+    def _prepare_mass_status_reconciliation(
+        self,
+        mass_status: ExecutionMassStatus,
+    ) -> tuple[list[Generator[None, None, None]], Callable[[], bool]]:
+        # Return a generator per instrument, which reconciles the instrument's order reports
+        # then yields once (so the async path can yield to the event loop between groups),
+        # and a callable which reconciles positions and completes the mass status once all
+        # groups are done.
         self._log.debug(f"<--[RPT] {mass_status}")
         self.report_count += 1
 
@@ -727,57 +846,157 @@ class LiveExecutionEngine(ExecutionEngine):
         results: list[bool] = []
         reconciled_orders: set[ClientOrderId] = set()
         reconciled_trades: set[TradeId] = set()
+        skipped: list[OrderStatusReport] = []
+
+        # Prefetch cached order state for the venue in bulk
+        cached_orders: dict[VenueOrderId, Order] = {
+            order.venue_order_id: order
+            for order in self._cache.orders(venue=mass_status.venue)
+            if order.venue_order_id is not None
+        }
+        cached_client_order_ids: dict[VenueOrderId, ClientOrderId] = {
+            venue_order_id: order.client_order_id for venue_order_id, order in cached_orders.items()
+        }
+
+        watermark: int | None = None
+        if self.reconciliation_watermark:
+            watermark = self._get_reconciliation_watermark(mass_status.client_id)
+
+        # Group order reports so each instrument is reconciled as an independent unit
+        order_reports_by_instrument: dict[InstrumentId, list[OrderStatusReport]] = defaultdict(
+            list,
+        )
+        for order_report in mass_status.order_reports.values():
+            order_reports_by_instrument[order_report.instrument_id].append(order_report)
+
+        def reconcile_instrument(
+            instrument_id: InstrumentId,
+            order_reports: list[OrderStatusReport],
+        ) -> Generator[None, None, None]:
+            instrument_results: list[bool] = []
+            for order_report in order_reports:
+                venue_order_id = order_report.venue_order_id
+                trades = mass_status.fill_reports.get(venue_order_id, [])
+
+                cached_order = cached_orders.get(venue_order_id)
+                client_order_id = order_report.client_order_id or cached_client_order_ids.get(
+                    venue_order_id,
+                )
 
-        # Reconcile all reported orders
-        for venue_order_id, order_report in mass_status.order_reports.items():
-            trades = mass_status.fill_reports.get(venue_order_id, [])
-
-            # Check and handle duplicate client order IDs
-            client_order_id = order_report.client_order_id
-            if client_order_id is not None and client_order_id in reconciled_orders:
-                self._log.error(f"Duplicate {client_order_id!r} detected: {order_report}")
-                continue  # Determine how to handle this
-
-            # Check for duplicate trade IDs
-            for fill_report in trades:
-                if fill_report.trade_id in reconciled_trades:
-                    self._log.warning(
-                        f"Duplicate {fill_report.trade_id!r} detected: {fill_report}",
+                # Skip orders already reconciled and unchanged since the last checkpoint
+                if (
+                    watermark is not None
+                    and cached_order is not None
+                    and order_report.ts_last <= watermark
+                    and order_report.order_status == cached_order.status
+                    and order_report.filled_qty == cached_order.filled_qty
+                ):
+                    skipped.append(order_report)
+                    continue
+
+                # Check and handle duplicate client order IDs
+                if client_order_id is not None and client_order_id in reconciled_orders:
+                    self._log.error(f"Duplicate {client_order_id!r} detected: {order_report}")
+                    continue  # Determine how to handle this
+
+                # Check for duplicate trade IDs
+                for fill_report in trades:
+                    if fill_report.trade_id in reconciled_trades:
+                        self._log.warning(
+                            f"Duplicate {fill_report.trade_id!r} detected: {fill_report}",
+                        )
+                    reconciled_trades.add(fill_report.trade_id)
+
+                try:
+                    result = self._reconcile_order_report(
+                        order_report,
+                        trades,
+                        cached_client_order_ids,
                     )
-                reconciled_trades.add(fill_report.trade_id)
-
-            try:
-                result = self._reconcile_order_report(order_report, trades)
-            except InvalidStateTrigger as e:
-                self._log.error(str(e))
-                result = False
-            results.append(result)
-            reconciled_orders.add(order_report.client_order_id)
-
-        if not self.filter_position_reports:
-            position_reports: list[PositionStatusReport]
-            # Reconcile all reported positions
-            for position_reports in mass_status.position_reports.values():
-                for report in position_reports:
-                    result = self._reconcile_position_report(report)
-                    results.append(result)
-
-        # Publish mass status
-        self._msgbus.publish(
-            topic=f"reports.execution.{mass_status.venue}",
-            msg=mass_status,
-        )
+                except InvalidStateTrigger as e:
+                    self._log.error(str(e))
+                    result = False
+                instrument_results.append(result)
+                reconciled_orders.add(order_report.client_order_id)
+
+            if not all(instrument_results):
+                self._log_reconciliation_result(instrument_id, False)
+            results.extend(instrument_results)
+            yield
+
+        def complete() -> bool:
+            if skipped:
+                self._log.info(
+                    f"Skipped {len(skipped)} order reports for {mass_status.venue} "
+                    f"at or before watermark {watermark}",
+                    LogColor.BLUE,
+                )
 
-        return all(results)
+            if not self.filter_position_reports:
+                position_reports: list[PositionStatusReport]
+                # Reconcile all reported positions
+                for position_reports in mass_status.position_reports.values():
+                    for report in position_reports:
+                        result = self._reconcile_position_report(report)
+                        results.append(result)
+
+            result = all(results)
+            if result and self.reconciliation_watermark:
+                self._update_reconciliation_watermark(mass_status)
+
+            # Publish mass status
+            self._msgbus.publish(
+                topic=f"reports.execution.{mass_status.venue}",
+                msg=mass_status,
+            )
+
+            return result
+
+        instrument_steps = [
+            reconcile_instrument(instrument_id, order_reports)
+            for instrument_id, order_reports in order_reports_by_instrument.items()
+        ]
+        return instrument_steps, complete
+
+    def _reconciliation_watermark_key(self, client_id: ClientId) -> str:
+        return f"reconciliation_watermark:{client_id}"
+
+    def _get_reconciliation_watermark(self, client_id: ClientId) -> int | None:
+        value: bytes | None = self._cache.get(self._reconciliation_watermark_key(client_id))
+        if value is None:
+            return None
+        return int(value.decode())
+
+    def _update_reconciliation_watermark(self, mass_status: ExecutionMassStatus) -> None:
+        watermark = self._get_reconciliation_watermark(mass_status.client_id) or 0
+        for order_report in mass_status.order_reports.values():
+            watermark = max(watermark, order_report.ts_last)
+        for fill_reports in mass_status.fill_reports.values():
+            for fill_report in fill_reports:
+                watermark = max(watermark, fill_report.ts_event)
+
+        if watermark == 0:
+            return  # Nothing reported
+
+        self._cache.add(
+            self._reconciliation_watermark_key(mass_status.client_id),
+            str(watermark).encode(),
+        )
+        self._log.debug(f"Reconciliation watermark for {mass_status.client_id} at {watermark}")
 
     def _reconcile_order_report(  # noqa: C901 (too complex)
         self,
         report: OrderStatusReport,
         trades: list[FillReport],
+        cached_client_order_ids: dict[VenueOrderId, ClientOrderId] | None = None,
     ) -> bool:
         client_order_id: ClientOrderId = report.client_order_id
         if client_order_id is None:
-            client_order_id = self._cache.client_order_id(report.venue_order_id)
+            if cached_client_order_ids is not None:
+                client_order_id = cached_client_order_ids.get(report.venue_order_id)
+            if client_order_id is None:
+                # Not prefetched (e.g. indexed under a previous venue order ID)
+                client_order_id = self._cache.client_order_id(report.venue_order_id)
             if client_order_id is None:
                 # Generate external client order ID
                 client_order_id = self._generate_client_order_id()
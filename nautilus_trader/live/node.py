@@ -207,6 +207,18 @@ class TradingNode:
         """
         return self.kernel.logger
 
+    def profiling_summary(self) -> dict[str, dict[str, dict[str, int]]] | None:
+        """
+        Return the hot-path profiling statistics recorded so far, grouped by component.
+
+        Returns
+        -------
+        dict[str, dict[str, dict[str, int]]] or ``None``
+            ``None`` if profiling is not enabled (see `TradingNodeConfig.profiling`).
+
+        """
+        return self.kernel.profiling_summary()
+
     def add_data_client_factory(self, name: str, factory: type[LiveDataClientFactory]) -> None:
         """
         Add the given data client factory to the node.
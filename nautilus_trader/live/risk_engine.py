@@ -81,6 +81,7 @@ class LiveRiskEngine(RiskEngine):
         self._loop: asyncio.AbstractEventLoop = loop
         self._cmd_queue: asyncio.Queue = Queue(maxsize=config.qsize)
         self._evt_queue: asyncio.Queue = Queue(maxsize=config.qsize)
+        self._drain_budget: int = config.drain_budget
 
         self._cmd_enqueuer: ThrottledEnqueuer[Command] = ThrottledEnqueuer(
             qname="cmd_queue",
@@ -146,6 +147,21 @@ class LiveRiskEngine(RiskEngine):
         """
         return self._evt_queue.qsize()
 
+    def queue_metrics(self) -> dict[str, dict[str, int]]:
+        """
+        Return the depth and drain batch metrics for the engines internal queues.
+
+        Returns
+        -------
+        dict[str, dict[str, int]]
+            Keyed by queue name.
+
+        """
+        return {
+            self._cmd_enqueuer.qname: self._cmd_enqueuer.metrics(),
+            self._evt_enqueuer.qname: self._evt_enqueuer.metrics(),
+        }
+
     # -- COMMANDS -------------------------------------------------------------------------------------
 
     def kill(self) -> None:
@@ -229,11 +245,13 @@ class LiveRiskEngine(RiskEngine):
             f"Command message queue processing (qsize={self.cmd_qsize()})",
         )
         try:
-            while True:
-                command: Command | None = await self._cmd_queue.get()
-                if command is self._sentinel:
-                    break
-                self._execute_command(command)
+            running = True
+            while running:
+                for command in await self._cmd_enqueuer.get_batch(self._drain_budget):
+                    if command is self._sentinel:
+                        running = False
+                        break
+                    self._execute_command(command)
         except asyncio.CancelledError:
             self._log.warning("Canceled task 'run_cmd_queue'")
         except Exception as e:
@@ -250,11 +268,13 @@ class LiveRiskEngine(RiskEngine):
             f"Event message queue processing starting (qsize={self.evt_qsize()})",
         )
         try:
-            while True:
-                event: Event | None = await self._evt_queue.get()
-                if event is self._sentinel:
-                    break
-                self._handle_event(event)
+            running = True
+            while running:
+                for event in await self._evt_enqueuer.get_batch(self._drain_budget):
+                    if event is self._sentinel:
+                        running = False
+                        break
+                    self._handle_event(event)
         except asyncio.CancelledError:
             self._log.warning("Canceled task 'run_evt_queue'")
         except Exception as e:
@@ -283,6 +283,9 @@ cdef class OrderBookDeltas(Data):
     @staticmethod
     cdef OrderBookDeltas from_dict_c(dict values)
 
+    @staticmethod
+    cdef OrderBookDeltas from_delta_c(OrderBookDelta delta)
+
     @staticmethod
     cdef dict to_dict_c(OrderBookDeltas obj)
 
@@ -290,6 +293,21 @@ cdef class OrderBookDeltas(Data):
     cpdef to_pyo3(self)
 
 
+cdef class OrderBookDeltasBuffer:
+    cdef OrderBookDelta_t *_ptr
+    cdef uint64_t _len
+    cdef uint64_t _cap
+
+    cdef readonly InstrumentId instrument_id
+    """The instrument ID for the buffered deltas.\n\n:returns: `InstrumentId`"""
+
+    cdef void _reserve(self, uint64_t additional) except *
+    cpdef bint push(self, OrderBookDelta delta)
+    cpdef list extend(self, OrderBookDeltas deltas)
+    cpdef OrderBookDeltas build(self)
+    cpdef void clear(self)
+
+
 cdef class OrderBookDepth10(Data):
     cdef OrderBookDepth10_t _mem
 
@@ -23,6 +23,7 @@ from nautilus_trader.core import nautilus_pyo3
 from cpython.datetime cimport timedelta
 from cpython.mem cimport PyMem_Free
 from cpython.mem cimport PyMem_Malloc
+from cpython.mem cimport PyMem_Realloc
 from cpython.pycapsule cimport PyCapsule_Destructor
 from cpython.pycapsule cimport PyCapsule_GetPointer
 from cpython.pycapsule cimport PyCapsule_New
@@ -218,6 +219,13 @@ cpdef list capsule_to_list(capsule):
     return objects
 
 
+cdef inline list pyo3_data_to_list(list pyo3_data):
+    # Hand the Rust objects across in a single contiguous buffer (rather than one
+    # capsule per object), the buffer is dropped when the capsule is collected
+    capsule = nautilus_pyo3.pyobjects_to_data_pycapsule(pyo3_data)
+    return capsule_to_list(capsule)
+
+
 # SAFETY: Do NOT deallocate the capsule here
 cpdef Data capsule_to_data(capsule):
     cdef Data_t* ptr = <Data_t*>PyCapsule_GetPointer(capsule, NULL)
@@ -1358,6 +1366,66 @@ cdef class Bar(Data):
         """
         return Bar.to_dict_c(obj)
 
+    @staticmethod
+    def to_columns(list bars) -> dict[str, np.ndarray]:
+        """
+        Return the given bars as columnar arrays, extracted in a single pass.
+
+        The result can be viewed as a DataFrame with ``pd.DataFrame(columns, copy=False)``.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The bars to extract columns from.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            The ``open``, ``high``, ``low``, ``close`` and ``volume`` columns as
+            `float64`, and the ``ts_event`` and ``ts_init`` columns as `uint64`.
+
+        """
+        Condition.not_none(bars, "bars")
+
+        cdef Py_ssize_t count = len(bars)
+        opens = np.empty(count, dtype=np.float64)
+        highs = np.empty(count, dtype=np.float64)
+        lows = np.empty(count, dtype=np.float64)
+        closes = np.empty(count, dtype=np.float64)
+        volumes = np.empty(count, dtype=np.float64)
+        ts_events = np.empty(count, dtype=np.uint64)
+        ts_inits = np.empty(count, dtype=np.uint64)
+
+        cdef:
+            double[::1] opens_view = opens
+            double[::1] highs_view = highs
+            double[::1] lows_view = lows
+            double[::1] closes_view = closes
+            double[::1] volumes_view = volumes
+            uint64_t[::1] ts_events_view = ts_events
+            uint64_t[::1] ts_inits_view = ts_inits
+            Py_ssize_t i
+            Bar bar
+        for i in range(count):
+            bar = bars[i]
+            opens_view[i] = Price.raw_to_f64_c(bar._mem.open.raw)
+            highs_view[i] = Price.raw_to_f64_c(bar._mem.high.raw)
+            lows_view[i] = Price.raw_to_f64_c(bar._mem.low.raw)
+            closes_view[i] = Price.raw_to_f64_c(bar._mem.close.raw)
+            volumes_view[i] = Quantity.raw_to_f64_c(bar._mem.volume.raw)
+            ts_events_view[i] = bar._mem.ts_event
+            ts_inits_view[i] = bar._mem.ts_init
+
+        return {
+            "open": opens,
+            "high": highs,
+            "low": lows,
+            "close": closes,
+            "volume": volumes,
+            "ts_event": ts_events,
+            "ts_init": ts_inits,
+        }
+
     @staticmethod
     def to_pyo3_list(list bars) -> list[nautilus_pyo3.Bar]:
         """
@@ -1418,12 +1486,7 @@ cdef class Bar(Data):
         list[Bar]
 
         """
-        cdef list[Bar] output = []
-
-        for pyo3_bar in pyo3_bars:
-            output.append(Bar.from_pyo3_c(pyo3_bar))
-
-        return output
+        return pyo3_data_to_list(pyo3_bars)
 
     @staticmethod
     def from_pyo3(pyo3_bar) -> Bar:
@@ -2440,12 +2503,7 @@ cdef class OrderBookDelta(Data):
         list[OrderBookDelta]
 
         """
-        cdef list[OrderBookDelta] output = []
-
-        for pyo3_delta in pyo3_deltas:
-            output.append(OrderBookDelta.from_pyo3_c(pyo3_delta))
-
-        return output
+        return pyo3_data_to_list(pyo3_deltas)
 
 
 cdef class OrderBookDeltas(Data):
@@ -2663,6 +2721,18 @@ cdef class OrderBookDeltas(Data):
         """
         return orderbook_deltas_ts_init(&self._mem)
 
+    @staticmethod
+    cdef OrderBookDeltas from_delta_c(OrderBookDelta delta):
+        # Wraps a single delta without allocating an intermediate list or buffer
+        cdef CVec cvec
+        cvec.ptr = <void *>&delta._mem
+        cvec.len = 1
+        cvec.cap = 1
+
+        cdef OrderBookDeltas deltas = OrderBookDeltas.__new__(OrderBookDeltas)
+        deltas._mem = orderbook_deltas_new(delta._mem.instrument_id, &cvec)
+        return deltas
+
     @staticmethod
     cdef OrderBookDeltas from_dict_c(dict values):
         Condition.not_none(values, "values")
@@ -2785,6 +2855,187 @@ cdef class OrderBookDeltas(Data):
         return deltas
 
 
+cdef class OrderBookDeltasBuffer:
+    """
+    Provides a growable native buffer of `OrderBookDelta` updates for a single instrument.
+
+    Deltas are copied into a contiguous C buffer as they arrive, and handed off as
+    a single `OrderBookDeltas` when a batch completes. The buffer memory is retained
+    between batches, so steady-state accumulation does not allocate.
+
+    Parameters
+    ----------
+    instrument_id : InstrumentId
+        The instrument ID for the buffered deltas.
+    capacity : int, default 64
+        The initial capacity (number of deltas) for the buffer.
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+
+    """
+
+    def __init__(
+        self,
+        InstrumentId instrument_id not None,
+        uint64_t capacity = 64,
+    ) -> None:
+        Condition.positive_int(capacity, "capacity")
+
+        self._ptr = <OrderBookDelta_t *>PyMem_Malloc(capacity * sizeof(OrderBookDelta_t))
+        if not self._ptr:
+            raise MemoryError()
+
+        self._len = 0
+        self._cap = capacity
+        self.instrument_id = instrument_id
+
+    def __dealloc__(self) -> None:
+        if self._ptr != NULL:
+            PyMem_Free(self._ptr)
+            self._ptr = NULL
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"instrument_id={self.instrument_id}, "
+            f"len={self._len}, "
+            f"capacity={self._cap})"
+        )
+
+    @property
+    def capacity(self) -> int:
+        """
+        Return the current capacity (number of deltas) of the buffer.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._cap
+
+    cdef void _reserve(self, uint64_t additional) except *:
+        if self._len + additional <= self._cap:
+            return
+
+        cdef uint64_t new_cap = self._cap * 2
+        while new_cap < self._len + additional:
+            new_cap *= 2
+
+        cdef OrderBookDelta_t *ptr = <OrderBookDelta_t *>PyMem_Realloc(
+            self._ptr,
+            new_cap * sizeof(OrderBookDelta_t),
+        )
+        if not ptr:
+            raise MemoryError()
+
+        self._ptr = ptr
+        self._cap = new_cap
+
+    cpdef bint push(self, OrderBookDelta delta):
+        """
+        Push the given delta onto the buffer.
+
+        Parameters
+        ----------
+        delta : OrderBookDelta
+            The delta to push.
+
+        Returns
+        -------
+        bool
+            True if the delta has the `F_LAST` flag set (the batch is complete).
+
+        """
+        Condition.not_none(delta, "delta")
+
+        self._reserve(1)
+        self._ptr[self._len] = delta._mem
+        self._len += 1
+
+        return delta._mem.flags == RecordFlag.F_LAST
+
+    cpdef list extend(self, OrderBookDeltas deltas):
+        """
+        Push the given deltas onto the buffer.
+
+        A batch is built for every delta with the `F_LAST` flag set, any deltas
+        after the last `F_LAST` flag remain buffered.
+
+        Parameters
+        ----------
+        deltas : OrderBookDeltas
+            The deltas to push.
+
+        Returns
+        -------
+        list[OrderBookDeltas]
+            The completed batches (in order).
+
+        """
+        Condition.not_none(deltas, "deltas")
+
+        cdef CVec raw_deltas_vec = orderbook_deltas_vec_deltas(&deltas._mem)
+        cdef OrderBookDelta_t *raw_deltas = <OrderBookDelta_t *>raw_deltas_vec.ptr
+        cdef list[OrderBookDeltas] batches = []
+
+        cdef:
+            uint64_t i
+        try:
+            self._reserve(raw_deltas_vec.len)
+            for i in range(raw_deltas_vec.len):
+                self._ptr[self._len] = raw_deltas[i]
+                self._len += 1
+                if raw_deltas[i].flags == RecordFlag.F_LAST:
+                    batches.append(self.build())
+        finally:
+            orderbook_deltas_vec_drop(raw_deltas_vec)
+
+        return batches
+
+    cpdef OrderBookDeltas build(self):
+        """
+        Build an `OrderBookDeltas` from the buffered deltas and reset the buffer.
+
+        The buffered deltas are copied into the returned object in one pass,
+        and the buffer capacity is retained for the next batch.
+
+        Returns
+        -------
+        OrderBookDeltas
+
+        Raises
+        ------
+        ValueError
+            If the buffer is empty.
+
+        """
+        Condition.is_true(self._len > 0, "buffer was empty")
+
+        cdef CVec cvec
+        cvec.ptr = <void *>self._ptr
+        cvec.len = self._len
+        cvec.cap = self._cap
+
+        cdef OrderBookDeltas deltas = OrderBookDeltas.__new__(OrderBookDeltas)
+        deltas._mem = orderbook_deltas_new(self.instrument_id._mem, &cvec)
+
+        self._len = 0
+
+        return deltas
+
+    cpdef void clear(self):
+        """
+        Clear all buffered deltas (the buffer capacity is retained).
+        """
+        self._len = 0
+
 
 cdef class OrderBookDepth10(Data):
     """
@@ -4073,12 +4324,63 @@ cdef class QuoteTick(Data):
         list[QuoteTick]
 
         """
-        cdef list[QuoteTick] output = []
+        return pyo3_data_to_list(pyo3_quotes)
 
-        for pyo3_quote in pyo3_quotes:
-            output.append(QuoteTick.from_pyo3_c(pyo3_quote))
+    @staticmethod
+    def to_columns(list quotes) -> dict[str, np.ndarray]:
+        """
+        Return the given quotes as columnar arrays, extracted in a single pass.
 
-        return output
+        The result can be viewed as a DataFrame with ``pd.DataFrame(columns, copy=False)``.
+
+        Parameters
+        ----------
+        quotes : list[QuoteTick]
+            The quotes to extract columns from.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            The ``bid_price``, ``ask_price``, ``bid_size`` and ``ask_size`` columns
+            as `float64`, and the ``ts_event`` and ``ts_init`` columns as `uint64`.
+
+        """
+        Condition.not_none(quotes, "quotes")
+
+        cdef Py_ssize_t count = len(quotes)
+        bid_prices = np.empty(count, dtype=np.float64)
+        ask_prices = np.empty(count, dtype=np.float64)
+        bid_sizes = np.empty(count, dtype=np.float64)
+        ask_sizes = np.empty(count, dtype=np.float64)
+        ts_events = np.empty(count, dtype=np.uint64)
+        ts_inits = np.empty(count, dtype=np.uint64)
+
+        cdef:
+            double[::1] bid_prices_view = bid_prices
+            double[::1] ask_prices_view = ask_prices
+            double[::1] bid_sizes_view = bid_sizes
+            double[::1] ask_sizes_view = ask_sizes
+            uint64_t[::1] ts_events_view = ts_events
+            uint64_t[::1] ts_inits_view = ts_inits
+            Py_ssize_t i
+            QuoteTick quote
+        for i in range(count):
+            quote = quotes[i]
+            bid_prices_view[i] = Price.raw_to_f64_c(quote._mem.bid_price.raw)
+            ask_prices_view[i] = Price.raw_to_f64_c(quote._mem.ask_price.raw)
+            bid_sizes_view[i] = Quantity.raw_to_f64_c(quote._mem.bid_size.raw)
+            ask_sizes_view[i] = Quantity.raw_to_f64_c(quote._mem.ask_size.raw)
+            ts_events_view[i] = quote._mem.ts_event
+            ts_inits_view[i] = quote._mem.ts_init
+
+        return {
+            "bid_price": bid_prices,
+            "ask_price": ask_prices,
+            "bid_size": bid_sizes,
+            "ask_size": ask_sizes,
+            "ts_event": ts_events,
+            "ts_init": ts_inits,
+        }
 
     @staticmethod
     def to_pyo3_list(list[QuoteTick] quotes) -> list[nautilus_pyo3.QuoteTick]:
@@ -4658,6 +4960,58 @@ cdef class TradeTick(Data):
         """
         return TradeTick.to_dict_c(obj)
 
+    @staticmethod
+    def to_columns(list trades) -> dict[str, np.ndarray]:
+        """
+        Return the given trades as columnar arrays, extracted in a single pass.
+
+        The result can be viewed as a DataFrame with ``pd.DataFrame(columns, copy=False)``.
+
+        Parameters
+        ----------
+        trades : list[TradeTick]
+            The trades to extract columns from.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            The ``price`` and ``size`` columns as `float64`, the ``aggressor_side``
+            column as `uint8`, and the ``ts_event`` and ``ts_init`` columns as `uint64`.
+
+        """
+        Condition.not_none(trades, "trades")
+
+        cdef Py_ssize_t count = len(trades)
+        prices = np.empty(count, dtype=np.float64)
+        sizes = np.empty(count, dtype=np.float64)
+        aggressor_sides = np.empty(count, dtype=np.uint8)
+        ts_events = np.empty(count, dtype=np.uint64)
+        ts_inits = np.empty(count, dtype=np.uint64)
+
+        cdef:
+            double[::1] prices_view = prices
+            double[::1] sizes_view = sizes
+            uint8_t[::1] aggressor_sides_view = aggressor_sides
+            uint64_t[::1] ts_events_view = ts_events
+            uint64_t[::1] ts_inits_view = ts_inits
+            Py_ssize_t i
+            TradeTick trade
+        for i in range(count):
+            trade = trades[i]
+            prices_view[i] = Price.raw_to_f64_c(trade._mem.price.raw)
+            sizes_view[i] = Quantity.raw_to_f64_c(trade._mem.size.raw)
+            aggressor_sides_view[i] = <uint8_t>trade._mem.aggressor_side
+            ts_events_view[i] = trade._mem.ts_event
+            ts_inits_view[i] = trade._mem.ts_init
+
+        return {
+            "price": prices,
+            "size": sizes,
+            "aggressor_side": aggressor_sides,
+            "ts_event": ts_events,
+            "ts_init": ts_inits,
+        }
+
     @staticmethod
     def to_pyo3_list(list[TradeTick] trades) -> list[nautilus_pyo3.TradeTick]:
         """
@@ -4715,12 +5069,7 @@ cdef class TradeTick(Data):
         list[TradeTick]
 
         """
-        cdef list[TradeTick] output = []
-
-        for pyo3_trade in pyo3_trades:
-            output.append(TradeTick.from_pyo3_c(pyo3_trade))
-
-        return output
+        return pyo3_data_to_list(pyo3_trades)
 
     @staticmethod
     def from_pyo3(pyo3_trade) -> TradeTick:
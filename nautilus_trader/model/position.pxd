@@ -34,7 +34,13 @@ from nautilus_trader.model.objects cimport Quantity
 
 cdef class Position:
     cdef list _events
-    cdef list _trade_ids
+    cdef set _trade_ids
+    cdef set _fill_keys
+    cdef set _client_order_ids
+    cdef set _venue_order_ids
+    cdef list _client_order_ids_sorted
+    cdef list _venue_order_ids_sorted
+    cdef int _max_events
     cdef Quantity _buy_qty
     cdef Quantity _sell_qty
     cdef dict _commissions
@@ -95,6 +101,8 @@ cdef class Position:
     """The current realized return for the position.\n\n:returns: `double`"""
     cdef readonly Money realized_pnl
     """The current realized PnL for the position (including commissions).\n\n:returns: `Money` or ``None``"""
+    cdef readonly int rolled_event_count
+    """The count of older fill events rolled out of the retained event history.\n\n:returns: `int`"""
 
     cpdef str info(self)
     cpdef dict to_dict(self)
@@ -126,6 +134,7 @@ cdef class Position:
     cpdef list commissions(self)
 
     cdef void _check_duplicate_trade_id(self, OrderFilled fill)
+    cdef void _roll_events(self)
     cdef void _handle_buy_order_fill(self, OrderFilled fill)
     cdef void _handle_sell_order_fill(self, OrderFilled fill)
     cdef double _calculate_avg_px(self, double avg_px, double qty, double last_px, double last_qty)
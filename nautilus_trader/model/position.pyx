@@ -24,7 +24,9 @@ from nautilus_trader.core.rust.model cimport PositionSide
 from nautilus_trader.model.events.order cimport OrderFilled
 from nautilus_trader.model.functions cimport order_side_to_str
 from nautilus_trader.model.functions cimport position_side_to_str
+from nautilus_trader.model.identifiers cimport ClientOrderId
 from nautilus_trader.model.identifiers cimport TradeId
+from nautilus_trader.model.identifiers cimport VenueOrderId
 from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.objects cimport Quantity
@@ -43,6 +45,11 @@ cdef class Position:
         The trading instrument for the position.
     fill : OrderFilled
         The order fill event which opened the position.
+    max_events : int, default 0
+        The maximum number of fill events to retain in the event history (zero for unlimited).
+        Older fills are rolled out in batches, with their effect kept in the aggregate state
+        (quantities, average prices, commissions and realized PnL) and their identifiers kept
+        for duplicate detection.
 
     Raises
     ------
@@ -50,18 +57,28 @@ cdef class Position:
         If `instrument.id` is not equal to `fill.instrument_id`.
     ValueError
         If `fill.position_id` is ``None``.
+    ValueError
+        If `max_events` is negative (< 0).
     """
 
     def __init__(
         self,
         Instrument instrument not None,
         OrderFilled fill not None,
+        int max_events = 0,
     ) -> None:
         Condition.equal(instrument.id, fill.instrument_id, "instrument.id", "fill.instrument_id")
         Condition.not_none(fill.position_id, "fill.position_id")
+        Condition.not_negative_int(max_events, "max_events")
 
         self._events: list[OrderFilled] = []
-        self._trade_ids: list[TradeId] = []
+        self._trade_ids: set[TradeId] = set()
+        self._fill_keys: set[tuple] = set()
+        self._client_order_ids: set[ClientOrderId] = set()
+        self._venue_order_ids: set[VenueOrderId] = set()
+        self._client_order_ids_sorted: list[ClientOrderId] | None = None
+        self._venue_order_ids_sorted: list[VenueOrderId] | None = None
+        self._max_events = max_events
         self._buy_qty = Quantity.zero_c(precision=instrument.size_precision)
         self._sell_qty = Quantity.zero_c(precision=instrument.size_precision)
         self._commissions = {}
@@ -98,6 +115,7 @@ cdef class Position:
 
         self.realized_return = 0.0
         self.realized_pnl = None
+        self.rolled_event_count = 0
 
         self.apply(fill)
 
@@ -160,12 +178,16 @@ cdef class Position:
         }
 
     cdef list client_order_ids_c(self):
-        # Note the inner set {}
-        return sorted(list({fill.client_order_id for fill in self._events}))
+        # Sorted list cached until a new ID is added
+        if self._client_order_ids_sorted is None:
+            self._client_order_ids_sorted = sorted(self._client_order_ids)
+        return self._client_order_ids_sorted.copy()
 
     cdef list venue_order_ids_c(self):
-        # Note the inner set {}
-        return sorted(list({fill.venue_order_id for fill in self._events}))
+        # Sorted list cached until a new ID is added
+        if self._venue_order_ids_sorted is None:
+            self._venue_order_ids_sorted = sorted(self._venue_order_ids)
+        return self._venue_order_ids_sorted.copy()
 
     cdef list trade_ids_c(self):
         # Checked for duplicate before appending to events
@@ -185,7 +207,7 @@ cdef class Position:
         return trade_id in self._trade_ids
 
     cdef int event_count_c(self):
-        return len(self._events)
+        return self.rolled_event_count + len(self._events)
 
     cdef bint is_open_c(self):
         return self.side != PositionSide.FLAT
@@ -264,6 +286,10 @@ cdef class Position:
         -------
         list[TradeId]
 
+        Notes
+        -----
+        Only includes the trade IDs of the retained event history.
+
         """
         return self.trade_ids_c()
 
@@ -276,6 +302,10 @@ cdef class Position:
         -------
         list[Event]
 
+        Notes
+        -----
+        Only includes the retained event history (see `max_events`).
+
         """
         return self.events_c()
 
@@ -312,6 +342,10 @@ cdef class Position:
         -------
         int
 
+        Notes
+        -----
+        Includes any fill events rolled out of the retained event history.
+
         """
         return self.event_count_c()
 
@@ -448,6 +482,12 @@ cdef class Position:
             # Reset position
             self._events.clear()
             self._trade_ids.clear()
+            self._fill_keys.clear()
+            self._client_order_ids.clear()
+            self._venue_order_ids.clear()
+            self._client_order_ids_sorted = None
+            self._venue_order_ids_sorted = None
+            self.rolled_event_count = 0
             self._buy_qty = Quantity.zero_c(precision=self.size_precision)
             self._sell_qty = Quantity.zero_c(precision=self.size_precision)
             self._commissions = {}
@@ -464,7 +504,20 @@ cdef class Position:
             self.realized_pnl = None
 
         self._events.append(fill)
-        self._trade_ids.append(fill.trade_id)
+        self._trade_ids.add(fill.trade_id)
+        self._fill_keys.add(
+            (fill.trade_id, fill.order_side, fill.last_px._mem.raw, fill.last_qty._mem.raw),
+        )
+
+        if fill.client_order_id not in self._client_order_ids:
+            self._client_order_ids.add(fill.client_order_id)
+            self._client_order_ids_sorted = None
+        if fill.venue_order_id not in self._venue_order_ids:
+            self._venue_order_ids.add(fill.venue_order_id)
+            self._venue_order_ids_sorted = None
+
+        if self._max_events > 0 and len(self._events) >= 2 * self._max_events:
+            self._roll_events()
 
         # Calculate cumulative commission
         cdef Currency currency = fill.commission.currency
@@ -632,18 +685,16 @@ cdef class Position:
         return list(self._commissions.values())
 
     cdef void _check_duplicate_trade_id(self, OrderFilled fill):
-        # Check all previous fills for matching trade ID and composite key
-        cdef:
-            OrderFilled p_fill
-        for p_fill in self._events:
-            if fill.trade_id != p_fill.trade_id:
-                continue
-            if (
-                fill.order_side == p_fill.order_side
-                and fill.last_px == p_fill.last_px
-                and fill.last_qty == p_fill.last_qty
-            ):
-                raise KeyError(f"Duplicate {fill.trade_id!r} in events {fill} {p_fill}")
+        # Check all previous fills (including rolled fills) for matching composite key
+        cdef tuple key = (fill.trade_id, fill.order_side, fill.last_px._mem.raw, fill.last_qty._mem.raw)
+        if key in self._fill_keys:
+            raise KeyError(f"Duplicate {fill.trade_id!r} in events {fill}")
+
+    cdef void _roll_events(self):
+        # Trim in batches (back down to `max_events`) so the cost is amortized per fill
+        cdef int count = len(self._events) - self._max_events
+        del self._events[:count]
+        self.rolled_event_count += count
 
     cdef void _handle_buy_order_fill(self, OrderFilled fill):
         # Initialize realized PnL for fill
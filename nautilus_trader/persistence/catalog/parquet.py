@@ -15,12 +15,15 @@
 
 from __future__ import annotations
 
+import heapq
 import itertools
+import json
 import os
 import platform
 from collections import defaultdict
 from collections.abc import Callable
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
 from itertools import groupby
 from os import PathLike
 from pathlib import Path
@@ -30,6 +33,7 @@ import fsspec
 import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.dataset as pds
 import pyarrow.parquet as pq
 from fsspec.implementations.local import make_path_posix
@@ -47,6 +51,7 @@ from nautilus_trader.core.message import Event
 from nautilus_trader.core.nautilus_pyo3 import DataBackendSession
 from nautilus_trader.core.nautilus_pyo3 import NautilusDataType
 from nautilus_trader.model.data import Bar
+from nautilus_trader.model.data import BarType
 from nautilus_trader.model.data import CustomData
 from nautilus_trader.model.data import DataType
 from nautilus_trader.model.data import OrderBookDelta
@@ -61,12 +66,15 @@ from nautilus_trader.persistence.catalog.types import CatalogWriteMode
 from nautilus_trader.persistence.funcs import class_to_filename
 from nautilus_trader.persistence.funcs import combine_filters
 from nautilus_trader.persistence.funcs import urisafe_instrument_id
+from nautilus_trader.persistence.writer import FEATHER_METADATA_SUFFIX
 from nautilus_trader.serialization.arrow.serializer import ArrowSerializer
 from nautilus_trader.serialization.arrow.serializer import list_schemas
 
 
 TimestampLike = int | str | float
 
+DEFAULT_CONSOLIDATION_MEMORY_BUDGET = 256 * 1024 * 1024  # 256 MiB
+
 NautilusRustDataType = Union[  # noqa: UP007 (mypy does not like pipe operators)
     nautilus_pyo3.OrderBookDelta,
     nautilus_pyo3.OrderBookDepth10,
@@ -426,6 +434,7 @@ class ParquetDataCatalog(BaseDataCatalog):
         instrument_id: str | None = None,
         bar_type: str | None = None,
         ts_column: str = "ts_init",
+        memory_budget_bytes: int = DEFAULT_CONSOLIDATION_MEMORY_BUDGET,
     ) -> None:
         """
         Consolidate several parquet files into a single file with data sorted in
@@ -441,19 +450,33 @@ class ParquetDataCatalog(BaseDataCatalog):
             The specific bar type to consolidate.
         ts_column : str, default "ts_init"
             The timestamp column name to use for sorting data.
+        memory_budget_bytes : int, default 256 MiB
+            The approximate maximum memory to hold in record batches while merging.
 
         Notes
         -----
         The consolidation process combines multiple parquet files into a single file,
         with the data sorted chronologically based on the specified timestamp column.
+        Files with overlapping timestamps are merged by streaming their row groups
+        through a k-way merge, so each file is expected to be sorted internally.
 
         """
         parquet_files = self._query_parquet_files(data_cls, instrument_id, bar_type)
 
         if parquet_files is not None:
-            _combine_data_files(parquet_files, ts_column)
+            _combine_data_files(
+                parquet_files,
+                ts_column,
+                memory_budget_bytes=memory_budget_bytes,
+                row_group_size=self.max_rows_per_group,
+            )
 
-    def consolidate_catalog(self, ts_column: str = "ts_init") -> None:
+    def consolidate_catalog(
+        self,
+        ts_column: str = "ts_init",
+        max_workers: int | None = None,
+        memory_budget_bytes: int = DEFAULT_CONSOLIDATION_MEMORY_BUDGET,
+    ) -> None:
         """
         Consolidate all market data directories of the catalog containing several
         parquet files into a single file per directory, with data sorted in ascending
@@ -463,18 +486,48 @@ class ParquetDataCatalog(BaseDataCatalog):
         ----------
         ts_column : str, default "ts_init"
             The timestamp column name to use for sorting data.
+        max_workers : int, optional
+            The maximum number of directories to consolidate concurrently.
+            If ``None`` then uses the number of CPUs.
+        memory_budget_bytes : int, default 256 MiB
+            The approximate maximum memory to hold in record batches while merging,
+            shared between all concurrently consolidated directories.
 
         Notes
         -----
         The consolidation process combines multiple parquet files into a single file per directory,
         with the data sorted chronologically based on the specified timestamp column.
+        Files with overlapping timestamps are merged by streaming their row groups
+        through a k-way merge, so each file is expected to be sorted internally.
 
         """
+        PyCondition.positive_int(memory_budget_bytes, "memory_budget_bytes")
+
         leaf_directories = self._find_leaf_data_directories()
+        if not leaf_directories:
+            return
+
+        n_workers = min(max_workers or os.cpu_count() or 1, len(leaf_directories))
+        directory_budget = max(1, memory_budget_bytes // n_workers)
 
-        for directory in leaf_directories:
+        def consolidate_directory(directory: str) -> None:
             parquet_files = self.fs.glob(os.path.join(directory, "*.parquet"))
-            _combine_data_files(parquet_files, ts_column)
+            _combine_data_files(
+                parquet_files,
+                ts_column,
+                memory_budget_bytes=directory_budget,
+                row_group_size=self.max_rows_per_group,
+            )
+
+        if n_workers == 1:
+            for directory in leaf_directories:
+                consolidate_directory(directory)
+            return
+
+        # Arrow releases the GIL while decoding, sorting and encoding so threads scale
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            for future in [executor.submit(consolidate_directory, d) for d in leaf_directories]:
+                future.result()
 
     def _find_leaf_data_directories(self) -> list[str]:
         all_paths = self.fs.glob(os.path.join(self.path, "data", "**"))
@@ -1000,6 +1053,216 @@ class ParquetDataCatalog(BaseDataCatalog):
 
         return sorted(itertools.chain.from_iterable(data.values()), key=lambda x: x.ts_init)
 
+    def stream_live_run(self, instance_id: str, **kwargs: Any) -> Generator[Any, None, None]:
+        """
+        Lazily iterate the streamed feather data for the given live run.
+
+        See `stream_backtest` for the parameters.
+
+        """
+        return self._stream_feather(kind="live", instance_id=instance_id, **kwargs)
+
+    def stream_backtest(self, instance_id: str, **kwargs: Any) -> Generator[Any, None, None]:
+        """
+        Lazily iterate the streamed feather data for the given backtest run.
+
+        Unlike `read_backtest`, files are memory-mapped (for local file systems) and
+        read one record batch at a time, so memory usage is bounded by `chunk_size`
+        rather than the size of the run.
+
+        Parameters
+        ----------
+        instance_id : str
+            The instance ID of the run.
+        data_cls : type, optional
+            The data type to read. If ``None`` then all types are read.
+        instrument_ids : list[str], optional
+            The instrument IDs to read. Files written per instrument (and bar files)
+            are filtered by their sidecar or schema metadata, other objects are
+            filtered once created.
+        start : TimestampLike, optional
+            The inclusive start of the `ts_init` range to read.
+        end : TimestampLike, optional
+            The inclusive end of the `ts_init` range to read.
+        as_batches : bool, default False
+            If ``(class_name, pa.RecordBatch)`` pairs should be yielded per file
+            rather than objects merged across files in `ts_init` order.
+        chunk_size : int, default 65_536
+            The maximum number of rows deserialized into objects at once.
+
+        Yields
+        ------
+        Data or tuple[str, pa.RecordBatch]
+
+        """
+        return self._stream_feather(kind="backtest", instance_id=instance_id, **kwargs)
+
+    def _stream_feather(
+        self,
+        kind: str,
+        instance_id: str,
+        data_cls: type | None = None,
+        instrument_ids: list[str] | None = None,
+        start: TimestampLike | None = None,
+        end: TimestampLike | None = None,
+        as_batches: bool = False,
+        chunk_size: int = 65_536,
+    ) -> Generator[Any, None, None]:
+        class_mapping: dict[str, type] = {class_to_filename(cls): cls for cls in list_schemas()}
+        table_name = class_to_filename(data_cls) if data_cls is not None else None
+        start_ns = dt_to_unix_nanos(start) if start is not None else None
+        end_ns = dt_to_unix_nanos(end) if end is not None else None
+        instrument_id_set = set(instrument_ids) if instrument_ids is not None else None
+
+        files: list[tuple[FeatherFile, type]] = []
+        for feather_file in self._list_feather_files(kind=kind, instance_id=instance_id):
+            if table_name is not None and not (
+                feather_file.class_name == table_name
+                or feather_file.class_name.startswith(f"{table_name}_")
+            ):
+                continue
+
+            file_data_cls = _feather_data_cls(feather_file.class_name, class_mapping)
+            if file_data_cls is None:
+                continue
+
+            metadata = self._read_feather_metadata(feather_file.path)
+            if metadata is not None:
+                if metadata.get("count", 0) == 0:
+                    continue
+                file_instrument_id = metadata.get("instrument_id")
+                if (
+                    instrument_id_set is not None
+                    and file_instrument_id is not None
+                    and file_instrument_id not in instrument_id_set
+                ):
+                    continue
+                if start_ns is not None and (metadata.get("ts_init_max") or 0) < start_ns:
+                    continue
+                if end_ns is not None and (metadata.get("ts_init_min") or 0) > end_ns:
+                    continue
+
+            files.append((feather_file, file_data_cls))
+
+        if as_batches:
+            for feather_file, _ in files:
+                for batch in self._iter_feather_batches(
+                    feather_file.path,
+                    instrument_id_set,
+                    start_ns,
+                    end_ns,
+                ):
+                    yield feather_file.class_name, batch
+            return
+
+        iterators = [
+            self._iter_feather_objects(
+                feather_file.path,
+                file_data_cls,
+                instrument_id_set,
+                start_ns,
+                end_ns,
+                chunk_size,
+            )
+            for feather_file, file_data_cls in files
+        ]
+        yield from heapq.merge(*iterators, key=lambda x: x.ts_init)
+
+    def _read_feather_metadata(self, path: str) -> dict[str, Any] | None:
+        metadata_path = f"{path}{FEATHER_METADATA_SUFFIX}"
+        if not self.fs.exists(metadata_path):
+            return None  # File still being written, or written without metadata
+
+        with self.fs.open(metadata_path, "r") as f:
+            return json.loads(f.read())
+
+    def _open_feather_stream(self, path: str) -> Any:
+        if self.fs_protocol == "file":
+            return pa.memory_map(path, "r")
+        return self.fs.open(path, "rb")
+
+    def _iter_feather_batches(
+        self,
+        path: str,
+        instrument_ids: set[str] | None,
+        start_ns: int | None,
+        end_ns: int | None,
+    ) -> Generator[pa.RecordBatch, None, None]:
+        try:
+            source = self._open_feather_stream(path)
+        except (FileNotFoundError, OSError):
+            return
+
+        with source:
+            try:
+                reader = pa.ipc.open_stream(source)
+            except (pa.ArrowInvalid, OSError):
+                return  # Empty or truncated stream
+
+            if instrument_ids is not None:
+                instrument_id = _feather_instrument_id(reader.schema.metadata or {})
+                if instrument_id is not None and instrument_id not in instrument_ids:
+                    return
+
+            has_ts_init = "ts_init" in reader.schema.names
+            while True:
+                try:
+                    batch = reader.read_next_batch()
+                except StopIteration:
+                    return
+                except (pa.ArrowInvalid, OSError):
+                    return  # Truncated stream (e.g. file still being written)
+
+                if batch.num_rows == 0:
+                    continue
+
+                if has_ts_init and (start_ns is not None or end_ns is not None):
+                    ts_init = batch.column("ts_init")
+                    mask = None
+                    if start_ns is not None:
+                        mask = pc.greater_equal(ts_init, pa.scalar(start_ns, ts_init.type))
+                    if end_ns is not None:
+                        upper = pc.less_equal(ts_init, pa.scalar(end_ns, ts_init.type))
+                        mask = upper if mask is None else pc.and_(mask, upper)
+                    batch = batch.filter(mask)
+                    if batch.num_rows == 0:
+                        continue
+
+                yield batch
+
+    def _iter_feather_objects(
+        self,
+        path: str,
+        data_cls: type,
+        instrument_ids: set[str] | None,
+        start_ns: int | None,
+        end_ns: int | None,
+        chunk_size: int,
+    ) -> Generator[Data, None, None]:
+        # The writer emits one batch per object, so batches are coalesced into
+        # chunks before deserializing to amortize the per-call overhead
+        chunk: list[pa.RecordBatch] = []
+        rows = 0
+        batches = self._iter_feather_batches(path, instrument_ids, start_ns, end_ns)
+        for batch in itertools.chain(batches, (None,)):
+            if batch is not None:
+                chunk.append(batch)
+                rows += batch.num_rows
+                if rows < chunk_size:
+                    continue
+            if not chunk:
+                continue
+
+            table = pa.Table.from_batches(chunk)
+            chunk = []
+            rows = 0
+            for obj in self._handle_table_nautilus(table=table, data_cls=data_cls):
+                if instrument_ids is not None:
+                    instrument_id = getattr(obj, "instrument_id", None)
+                    if instrument_id is not None and instrument_id.value not in instrument_ids:
+                        continue
+                yield obj
+
     def _list_feather_files(
         self,
         kind: str,
@@ -1040,7 +1303,7 @@ class ParquetDataCatalog(BaseDataCatalog):
         if not self.fs.exists(path):
             return None
         try:
-            with self.fs.open(path) as f:
+            with self._open_feather_stream(path) as f:
                 reader = pa.ipc.open_stream(f)
                 return reader.read_all()
         except (pa.ArrowInvalid, OSError):
@@ -1075,6 +1338,33 @@ class ParquetDataCatalog(BaseDataCatalog):
         used_catalog.write_data(all_data, **kwargs)
 
 
+def _feather_data_cls(class_name: str, class_mapping: dict[str, type]) -> type | None:
+    # Bar files are written as `bar_{bar_type}`, so fall back to the longest matching prefix
+    data_cls = class_mapping.get(class_name)
+    if data_cls is not None:
+        return data_cls
+
+    for name in sorted(class_mapping, key=len, reverse=True):
+        if class_name.startswith(f"{name}_"):
+            return class_mapping[name]
+
+    return None
+
+
+def _feather_instrument_id(schema_metadata: dict[bytes, bytes]) -> str | None:
+    # Bar streams carry the bar type rather than the instrument ID (which may itself
+    # contain hyphens, so the bar type is parsed rather than split)
+    instrument_id = schema_metadata.get(b"instrument_id")
+    if instrument_id is not None:
+        return instrument_id.decode()
+
+    bar_type = schema_metadata.get(b"bar_type")
+    if bar_type is not None:
+        return BarType.from_str(bar_type.decode()).instrument_id.value
+
+    return None
+
+
 def _min_max_from_parquet_metadata(file_path: str, column_name: str) -> tuple[int, int]:
     parquet_file = pq.ParquetFile(file_path)
     metadata = parquet_file.metadata
@@ -1109,19 +1399,149 @@ def _min_max_from_parquet_metadata(file_path: str, column_name: str) -> tuple[in
         return overall_min_value, overall_max_value
 
 
-def _combine_parquet_files(file_list: list[str]) -> None:
+def _average_row_bytes(file_path: str) -> int:
+    metadata = pq.ParquetFile(file_path).metadata
+    if metadata.num_rows == 0:
+        return 1
+
+    total_bytes = sum(metadata.row_group(i).total_byte_size for i in range(metadata.num_row_groups))
+    return max(1, total_bytes // metadata.num_rows)
+
+
+def _overlapping_groups(
+    file_list: list[str],
+    min_max_per_file: list[tuple[int, int]],
+) -> list[list[str]]:
+    # Files sorted by first timestamp, grouped where their timestamp ranges intersect.
+    # A group of one file is already in order relative to its neighbours and is copied as is.
+    groups: list[list[str]] = []
+    group_max = None
+
+    for file, (min_value, max_value) in zip(file_list, min_max_per_file):
+        if group_max is None or min_value > group_max:
+            groups.append([file])
+            group_max = max_value
+        else:
+            groups[-1].append(file)
+            group_max = max(group_max, max_value)
+
+    return groups
+
+
+def _merge_parquet_files(
+    file_list: list[str],
+    writer: pq.ParquetWriter,
+    ts_column: str,
+    batch_size: int,
+    row_group_size: int | None,
+) -> None:
+    # Streaming k-way merge of internally sorted files. Each file holds at most one
+    # buffered batch; rows at or below the smallest buffered tail timestamp (among
+    # files not yet exhausted) can no longer be preceded by unread rows and are written.
+    iterators = [
+        pq.ParquetFile(file, memory_map=True, pre_buffer=False).iter_batches(batch_size=batch_size)
+        for file in file_list
+    ]
+    buffers: list[pa.Table | None] = [None] * len(iterators)
+    exhausted = [False] * len(iterators)
+
+    while True:
+        for i, iterator in enumerate(iterators):
+            while not exhausted[i] and (buffers[i] is None or buffers[i].num_rows == 0):
+                batch = next(iterator, None)
+                if batch is None:
+                    exhausted[i] = True
+                else:
+                    buffers[i] = pa.Table.from_batches([batch]).cast(writer.schema)
+
+        active = [i for i, buffer in enumerate(buffers) if buffer is not None and buffer.num_rows]
+        if not active:
+            return
+
+        tails = [buffers[i][ts_column][-1].as_py() for i in active if not exhausted[i]]
+        watermark = min(tails) if tails else None
+
+        heads = []
+        for i in active:
+            buffer = buffers[i]
+            if watermark is None:
+                count = buffer.num_rows
+            else:
+                values = buffer[ts_column].to_numpy()
+                count = int(np.searchsorted(values, watermark, side="right"))
+            if count:
+                heads.append(buffer.slice(0, count))
+                buffers[i] = buffer.slice(count)
+
+        if len(heads) == 1:
+            writer.write_table(heads[0], row_group_size=row_group_size)
+            continue
+
+        # Sorting is stable so rows with equal timestamps keep their file order
+        merged = pa.concat_tables(heads).sort_by(ts_column)
+        writer.write_table(merged, row_group_size=row_group_size)
+
+
+def _copy_parquet_file(file: str, writer: pq.ParquetWriter) -> None:
+    # The file does not overlap any other, so its row groups are written as they are
+    # (one at a time, keeping their boundaries) without passing through the merge
+    parquet_file = pq.ParquetFile(file, memory_map=True, pre_buffer=False)
+    for i in range(parquet_file.num_row_groups):
+        table = parquet_file.read_row_group(i)
+        if not table.schema.equals(writer.schema):
+            table = table.cast(writer.schema)
+        writer.write_table(table, row_group_size=max(1, table.num_rows))
+
+
+def _combine_parquet_files(
+    file_list: list[str],
+    ts_column: str = "ts_init",
+    min_max_per_file: list[tuple[int, int]] | None = None,
+    memory_budget_bytes: int = DEFAULT_CONSOLIDATION_MEMORY_BUDGET,
+    row_group_size: int | None = None,
+) -> None:
     if len(file_list) <= 1:
         return
 
-    tables = [pq.read_table(file, memory_map=True, pre_buffer=False) for file in file_list]
-    combined_table = pa.concat_tables(tables)
-    pq.write_table(combined_table, where=file_list[0])
+    if min_max_per_file is None:
+        groups = [file_list]
+    else:
+        groups = _overlapping_groups(file_list, min_max_per_file)
+
+    schema = pq.ParquetFile(file_list[0]).schema_arrow
+    tmp_path = f"{file_list[0]}.consolidating"
+
+    try:
+        with pq.ParquetWriter(tmp_path, schema) as writer:
+            for group in groups:
+                if len(group) == 1:
+                    _copy_parquet_file(group[0], writer)
+                    continue
+
+                # Budget shared by the buffered batch of each file in the group, with
+                # headroom for the concatenated and sorted copies made while merging
+                row_bytes = max(_average_row_bytes(file) for file in group)
+                batch_size = max(1, memory_budget_bytes // (3 * len(group) * row_bytes))
+                _merge_parquet_files(group, writer, ts_column, batch_size, row_group_size)
+
+        # Replace the first file before removing the others, so an interruption can
+        # only leave duplicated rows rather than losing the data
+        os.replace(tmp_path, file_list[0])
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
 
     for file_path in file_list[1:]:
         os.remove(file_path)
 
 
-def _combine_data_files(parquet_files, ts_column):
+def _combine_data_files(
+    parquet_files: list[str],
+    ts_column: str,
+    memory_budget_bytes: int = DEFAULT_CONSOLIDATION_MEMORY_BUDGET,
+    row_group_size: int | None = None,
+) -> None:
     n_files = len(parquet_files)
 
     if n_files <= 1:
@@ -1131,11 +1551,17 @@ def _combine_data_files(parquet_files, ts_column):
     min_max_per_file = [_min_max_from_parquet_metadata(file, ts_column) for file in parquet_files]
     ordering = sorted(range(n_files), key=lambda i: min_max_per_file[i][0])
 
-    for i in range(1, n_files):
-        # last timestamp of previous sorted file bigger than first time timestamp of current file
-        if min_max_per_file[ordering[i - 1]][1] >= min_max_per_file[ordering[i]][0]:
-            print("Merging not safe due to intersection of timestamps between files. Aborting.")
-            return
-
     sorted_parquet_files = [parquet_files[i] for i in ordering]
-    _combine_parquet_files(sorted_parquet_files)
+    sorted_min_max = [min_max_per_file[i] for i in ordering]
+
+    if any(min_max == (-1, -1) for min_max in sorted_min_max):
+        # Without statistics every file must be treated as overlapping
+        sorted_min_max = None
+
+    _combine_parquet_files(
+        sorted_parquet_files,
+        ts_column=ts_column,
+        min_max_per_file=sorted_min_max,
+        memory_budget_bytes=memory_budget_bytes,
+        row_group_size=row_group_size,
+    )
@@ -0,0 +1,216 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import heapq
+import threading
+from bisect import bisect_left
+from bisect import bisect_right
+from collections import OrderedDict
+from collections.abc import Hashable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from operator import attrgetter
+from typing import Any
+
+from nautilus_trader.core.correctness import PyCondition
+
+
+_TS_INIT = attrgetter("ts_init")
+
+
+def merge_data_streams(streams: Iterable[Iterable[Any]]) -> Iterator[Any]:
+    """
+    Merge the given data streams into a single stream ordered by `ts_init`.
+
+    Each stream must already be sorted by `ts_init` (as returned by a catalog query).
+    The merge is a streaming k-way merge, so only the head of each stream is held
+    at any one time. Objects which compare equal to an object already yielded
+    for the same `ts_init` are dropped (duplicates across catalogs).
+
+    Parameters
+    ----------
+    streams : Iterable[Iterable[Any]]
+        The sorted data streams to merge.
+
+    Yields
+    ------
+    Any
+
+    """
+    group_ts: int | None = None
+    group: list[Any] = []
+
+    for obj in heapq.merge(*streams, key=_TS_INIT):
+        ts_init = obj.ts_init
+        if ts_init != group_ts:
+            group_ts = ts_init
+            group.clear()
+        elif any(type(obj) is type(seen) and obj == seen for seen in group):
+            continue
+
+        group.append(obj)
+        yield obj
+
+
+def merge_instruments(streams: Iterable[Iterable[Any]]) -> list[Any]:
+    """
+    Merge the given instrument streams, keeping the first definition seen for each ID.
+
+    Parameters
+    ----------
+    streams : Iterable[Iterable[Any]]
+        The instrument streams to merge (in catalog registration order).
+
+    Returns
+    -------
+    list[Any]
+
+    """
+    instruments: dict[Any, Any] = {}
+
+    for stream in streams:
+        for instrument in stream:
+            instruments.setdefault(instrument.id, instrument)
+
+    return list(instruments.values())
+
+
+class CatalogReadAheadCache:
+    """
+    Provides a bounded read-ahead cache of catalog query windows.
+
+    Each entry holds the data for a time window `[ts_start, ts_end]` (inclusive)
+    keyed by the queried stream (e.g. data class and bar type or instrument ID).
+    A query for a window fully contained in a cached window is served by slicing
+    the cached data on `ts_init`. Entries are evicted least recently used first.
+
+    The cache is thread-safe, so it can be shared by catalog queries running on
+    an executor.
+
+    Parameters
+    ----------
+    capacity : int
+        The maximum number of cached windows.
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+
+    """
+
+    def __init__(self, capacity: int) -> None:
+        PyCondition.positive_int(capacity, "capacity")
+
+        self._capacity = capacity
+        self._entries: OrderedDict[Hashable, tuple[int, int, list[Any], list[int]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def capacity(self) -> int:
+        """
+        Return the maximum number of cached windows.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._capacity
+
+    def get(self, key: Hashable, ts_start: int, ts_end: int) -> list[Any] | None:
+        """
+        Return the cached data for the given key and window (if fully cached).
+
+        Parameters
+        ----------
+        key : Hashable
+            The stream key.
+        ts_start : int
+            UNIX timestamp (nanoseconds) for the start of the window (inclusive).
+        ts_end : int
+            UNIX timestamp (nanoseconds) for the end of the window (inclusive).
+
+        Returns
+        -------
+        list[Any] or ``None``
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or ts_start < entry[0] or ts_end > entry[1]:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        _, _, data, timestamps = entry
+        return data[bisect_left(timestamps, ts_start) : bisect_right(timestamps, ts_end)]
+
+    def put(self, key: Hashable, ts_start: int, ts_end: int, data: list[Any]) -> None:
+        """
+        Cache the data for the given key and window.
+
+        Any previously cached window for the key is replaced.
+
+        Parameters
+        ----------
+        key : Hashable
+            The stream key.
+        ts_start : int
+            UNIX timestamp (nanoseconds) for the start of the window (inclusive).
+        ts_end : int
+            UNIX timestamp (nanoseconds) for the end of the window (inclusive).
+        data : list[Any]
+            The data for the window, sorted by `ts_init`.
+
+        """
+        timestamps = [obj.ts_init for obj in data]
+
+        with self._lock:
+            self._entries[key] = (ts_start, ts_end, data, timestamps)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._capacity:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        """
+        Discard the cached window for the given key (if found).
+
+        Parameters
+        ----------
+        key : Hashable
+            The stream key.
+
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Clear all cached windows.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,134 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from collections.abc import Callable
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from os import PathLike
+from typing import Any
+
+from nautilus_trader.core.data import Data
+from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+from nautilus_trader.persistence.catalog.types import CatalogWriteMode
+
+
+def ingest_to_catalog(
+    catalog: ParquetDataCatalog,
+    chunks: Iterable[list[Data]],
+    basename_prefix: str = "part",
+) -> int:
+    """
+    Write the given `chunks` of data to the `catalog`, one chunk at a time.
+
+    Each chunk is written to new files (existing data is never overwritten), so memory
+    use is bounded by the chunk size rather than the total size of the data.
+
+    Parameters
+    ----------
+    catalog : ParquetDataCatalog
+        The catalog to write to.
+    chunks : Iterable[list[Data]]
+        The chunks of data to write, such as from `TardisCSVDataLoader.stream_quotes`
+        or `DatabentoDataLoader.stream_dbn_file`.
+    basename_prefix : str, default 'part'
+        The prefix for the basenames of the written files.
+
+    Returns
+    -------
+    int
+        The total number of data objects written.
+
+    """
+    count = 0
+    for i, chunk in enumerate(chunks):
+        if not chunk:
+            continue
+
+        catalog.write_data(
+            chunk,
+            basename_template=f"{basename_prefix}-{i:06d}-{{i}}",
+            mode=CatalogWriteMode.NEWFILE,
+        )
+        count += len(chunk)
+
+    return count
+
+
+def ingest_files_to_catalog(
+    catalog: ParquetDataCatalog,
+    filepaths: Iterable[PathLike[str] | str],
+    stream_func: Callable[[str], Iterable[list[Data]]],
+    max_workers: int | None = None,
+) -> dict[str, int]:
+    """
+    Ingest the given files into the `catalog` in parallel, with one file per worker process.
+
+    Each worker streams its file in chunks with `stream_func` and writes the chunks
+    with `ingest_to_catalog`, using a distinct basename prefix per file so that
+    concurrent writes never target the same file.
+
+    Parameters
+    ----------
+    catalog : ParquetDataCatalog
+        The catalog to write to (the catalog is re-created in each worker from its path
+        and filesystem options, so an in-memory filesystem is not supported).
+    filepaths : Iterable[PathLike[str] | str]
+        The paths of the files to ingest.
+    stream_func : Callable[[str], Iterable[list[Data]]]
+        The function to stream the chunks of a file from its path.
+        Must be picklable, such as a module level function (or a `functools.partial` of one).
+    max_workers : int, optional
+        The maximum number of worker processes.
+        If ``None`` then defaults to the number of processors on the machine.
+
+    Returns
+    -------
+    dict[str, int]
+        The number of data objects written for each file path.
+
+    """
+    paths = [str(filepath) for filepath in filepaths]
+    ingest_file = partial(
+        _ingest_file,
+        catalog.path,
+        catalog.fs_protocol,
+        catalog.fs_storage_options,
+        stream_func,
+    )
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        counts = executor.map(ingest_file, range(len(paths)), paths)
+        return dict(zip(paths, counts))
+
+
+def _ingest_file(
+    catalog_path: str,
+    fs_protocol: str,
+    fs_storage_options: dict[str, Any],
+    stream_func: Callable[[str], Iterable[list[Data]]],
+    index: int,
+    filepath: str,
+) -> int:
+    catalog = ParquetDataCatalog(
+        catalog_path,
+        fs_protocol=fs_protocol,
+        fs_storage_options=fs_storage_options,
+    )
+    return ingest_to_catalog(
+        catalog,
+        stream_func(filepath),
+        basename_prefix=f"part-{index:04d}",
+    )
@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 import datetime as dt
+import json
 from enum import Enum
 from io import TextIOWrapper
 from typing import Any, BinaryIO
@@ -41,6 +42,9 @@ from nautilus_trader.serialization.arrow.serializer import ArrowSerializer
 from nautilus_trader.serialization.arrow.serializer import list_schemas
 
 
+FEATHER_METADATA_SUFFIX = ".meta.json"
+
+
 class RotationMode(Enum):
     SIZE = 0
     INTERVAL = 1
@@ -137,6 +141,8 @@ class StreamingFeatherWriter:
         self._file_sizes: dict[str | tuple[str, str], int] = {}
         self._file_creation_times: dict[str | tuple[str, str], pd.Timestamp] = {}
         self._next_rotation_times: dict[str | tuple[str, str], pd.Timestamp | None] = {}
+        self._file_paths: dict[str | tuple[str, str], str] = {}
+        self._file_metadata: dict[str | tuple[str, str], dict[str, Any]] = {}
 
         self._create_writers()
 
@@ -216,6 +222,7 @@ class StreamingFeatherWriter:
             self._files[table_name].flush()
             self._writers[table_name].close()
             self._files[table_name].close()
+            self._write_file_metadata(table_name)
             del self._writers[table_name]
             del self._files[table_name]
 
@@ -242,6 +249,7 @@ class StreamingFeatherWriter:
             self._files[key].flush()
             self._instrument_writers[key].close()
             self._files[key].close()
+            self._write_file_metadata(key)
             del self._instrument_writers[key]
             del self._files[key]
 
@@ -276,6 +284,8 @@ class StreamingFeatherWriter:
         self._writers[table_name] = pa.ipc.new_stream(f, schema)
         self._file_sizes[table_name] = 0
         self._file_creation_times[table_name] = self.clock.utc_now()
+        self._file_paths[table_name] = full_path
+        self._file_metadata[table_name] = {"class_name": table_name, "instrument_id": None}
 
         self.logger.info(f"Created writer for table '{table_name}'")
 
@@ -305,6 +315,8 @@ class StreamingFeatherWriter:
         self._instrument_writers[key] = pa.ipc.new_stream(f, schema)
         self._file_sizes[key] = 0
         self._file_creation_times[key] = self.clock.utc_now()
+        self._file_paths[key] = full_path
+        self._file_metadata[key] = {"class_name": table_name, "instrument_id": key[1]}
         self.logger.info(f"Created writer for table '{table_name}'")
 
     def _extract_obj_metadata(
@@ -388,10 +400,11 @@ class StreamingFeatherWriter:
             else:
                 return
 
+        file_key: str | tuple[str, str] = table
         if table in self._per_instrument_writers:
-            key = (table, obj.instrument_id.value)  # type: ignore
-            if key in self._instrument_writers:
-                writer: RecordBatchStreamWriter = self._instrument_writers[key]
+            file_key = (table, obj.instrument_id.value)  # type: ignore
+            if file_key in self._instrument_writers:
+                writer: RecordBatchStreamWriter = self._instrument_writers[file_key]
             else:
                 return
         else:
@@ -403,6 +416,7 @@ class StreamingFeatherWriter:
         try:
             writer.write_table(serialized)
             self._file_sizes[table] = self._file_sizes.get(table, 0) + serialized.nbytes
+            self._update_file_metadata(file_key, obj)
             self.check_flush()
             if self._check_file_rotation(table):
                 if table in self._per_instrument_writers:
@@ -441,6 +455,34 @@ class StreamingFeatherWriter:
             del self._writers[wcls]
         for fcls in self._files:
             self._files[fcls].close()
+        for key in tuple(self._file_metadata):
+            self._write_file_metadata(key)
+
+    def _update_file_metadata(self, key: str | tuple[str, str], obj: Any) -> None:
+        metadata = self._file_metadata.get(key)
+        if metadata is None:
+            return
+
+        ts_init: int | None = getattr(obj, "ts_init", None)
+        metadata["count"] = metadata.get("count", 0) + 1  # Objects, not rows
+        if ts_init is None:
+            return
+
+        if metadata.get("ts_init_min") is None or ts_init < metadata["ts_init_min"]:
+            metadata["ts_init_min"] = ts_init
+        if metadata.get("ts_init_max") is None or ts_init > metadata["ts_init_max"]:
+            metadata["ts_init_max"] = ts_init
+
+    def _write_file_metadata(self, key: str | tuple[str, str]) -> None:
+        # Persist the metadata of a completed file alongside it, so readers can
+        # filter files by type, instrument and time range without opening them.
+        metadata = self._file_metadata.pop(key, None)
+        path = self._file_paths.pop(key, None)
+        if metadata is None or path is None:
+            return
+
+        with self.fs.open(f"{path}{FEATHER_METADATA_SUFFIX}", "w") as f:
+            f.write(json.dumps(metadata))
 
     def get_current_file_info(self) -> dict[str | tuple[str, str], dict[str, Any]]:
         """
@@ -449,15 +491,23 @@ class StreamingFeatherWriter:
         Returns
         -------
         dict[str | tuple[str, str], dict[str, Any]]
-            A dictionary containing file information for each table.
+            A dictionary containing file information for each table (keyed by
+            `(table, instrument_id)` for per-instrument files), including the
+            ``path``, ``count`` and ``ts_init_min``/``ts_init_max`` range. The
+            ``count`` is the number of objects written, not the number of rows
+            (an object such as `OrderBookDeltas` may serialize to many rows).
 
         """
         return {
             table_name: {
                 "size": self._file_sizes.get(table_name, 0),
                 "creation_time": self._file_creation_times.get(table_name),
+                "path": self._file_paths.get(table_name),
+                "count": self._file_metadata.get(table_name, {}).get("count", 0),
+                "ts_init_min": self._file_metadata.get(table_name, {}).get("ts_init_min"),
+                "ts_init_max": self._file_metadata.get(table_name, {}).get("ts_init_max"),
             }
-            for table_name in self._writers
+            for table_name in (*self._writers, *self._instrument_writers)
         }
 
     def get_next_rotation_time(
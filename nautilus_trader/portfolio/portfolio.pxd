@@ -22,6 +22,7 @@ from nautilus_trader.common.component cimport MessageBus
 from nautilus_trader.core.rust.model cimport OrderSide
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport QuoteTick
+from nautilus_trader.model.data cimport TradeTick
 from nautilus_trader.model.events.account cimport AccountState
 from nautilus_trader.model.events.order cimport OrderEvent
 from nautilus_trader.model.events.position cimport PositionEvent
@@ -29,12 +30,25 @@ from nautilus_trader.model.identifiers cimport InstrumentId
 from nautilus_trader.model.identifiers cimport PositionId
 from nautilus_trader.model.identifiers cimport Venue
 from nautilus_trader.model.instruments.base cimport Instrument
+from nautilus_trader.model.objects cimport Currency
 from nautilus_trader.model.objects cimport Money
 from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.position cimport Position
 from nautilus_trader.portfolio.base cimport PortfolioFacade
 
 
+cdef class VenueTotals:
+    cdef dict[InstrumentId, Money] _values
+    cdef dict[Venue, dict[Currency, list]] _totals
+    cdef dict[Venue, set[InstrumentId]] _dirty
+
+    cdef void mark_dirty(self, InstrumentId instrument_id)
+    cdef set pop_dirty(self, Venue venue)
+    cdef void update(self, InstrumentId instrument_id, Money value)
+    cdef dict totals(self, Venue venue)
+    cdef void clear(self)
+
+
 cdef class Portfolio(PortfolioFacade):
     cdef Clock _clock
     cdef Logger _log
@@ -57,6 +71,11 @@ cdef class Portfolio(PortfolioFacade):
     cdef object _index_bet_positions
     cdef set[InstrumentId] _pending_calcs
     cdef dict[InstrumentId, Price] _bar_close_prices
+    cdef set[InstrumentId] _net_open_instruments
+    cdef VenueTotals _unrealized_pnl_totals
+    cdef VenueTotals _net_exposure_totals
+    cdef VenueTotals _net_exposure_short_totals
+    cdef set[InstrumentId] _trade_subscriptions
 
 # -- COMMANDS -------------------------------------------------------------------------------------
 
@@ -67,6 +86,7 @@ cdef class Portfolio(PortfolioFacade):
     cpdef void initialize_positions(self)
     cpdef void update_quote_tick(self, QuoteTick tick)
     cpdef void update_mark_price(self, object mark_price)
+    cpdef void update_trade_tick(self, TradeTick tick)
     cpdef void update_bar(self, Bar bar)
     cpdef void update_account(self, AccountState event)
     cpdef void update_order(self, OrderEvent event)
@@ -76,8 +96,12 @@ cdef class Portfolio(PortfolioFacade):
 
     cdef object _net_position(self, InstrumentId instrument_id)
     cdef void _update_instrument_id(self, InstrumentId instrument_id)
+    cdef void _mark_dirty(self, InstrumentId instrument_id)
     cdef void _update_net_position(self, InstrumentId instrument_id, list positions_open)
     cdef Money _calculate_realized_pnl(self, InstrumentId instrument_id)
     cdef Money _calculate_unrealized_pnl(self, InstrumentId instrument_id, Price price=*)
+    cdef bint _update_net_exposure_total(self, InstrumentId instrument_id)
+    cdef void _update_trade_subscription(self, InstrumentId instrument_id, bint is_open)
     cdef Price _get_price(self, Position position)
     cdef _calculate_xrate_to_base(self, Account account, Instrument instrument, OrderSide side)
+    cdef _calculate_currency_xrate_to_base(self, Account account, Venue venue, Currency currency, OrderSide side)
@@ -47,6 +47,7 @@ from nautilus_trader.core.rust.model cimport PositionSide
 from nautilus_trader.core.rust.model cimport PriceType
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport QuoteTick
+from nautilus_trader.model.data cimport TradeTick
 from nautilus_trader.model.events.account cimport AccountState
 from nautilus_trader.model.events.order cimport OrderAccepted
 from nautilus_trader.model.events.order cimport OrderCanceled
@@ -78,6 +79,74 @@ cdef tuple[OrderEvent] _UPDATE_ORDER_EVENTS = (
 )
 
 
+cdef class VenueTotals:
+    """
+    Provides running per-venue totals of a `Money` value held per instrument.
+
+    Each instrument contributes a single value, which is replaced when the instrument
+    is recalculated. Instruments are marked dirty when their value may have changed,
+    so the totals for a venue are brought up to date in O(instruments changed) rather
+    than recalculated from every open position.
+    """
+
+    def __init__(self) -> None:
+        self._values: dict[InstrumentId, Money] = {}
+        self._totals: dict[Venue, dict[Currency, list]] = {}  # [raw total, count]
+        self._dirty: dict[Venue, set[InstrumentId]] = {}
+
+    cdef void mark_dirty(self, InstrumentId instrument_id):
+        cdef set dirty = self._dirty.get(instrument_id.venue)
+        if dirty is None:
+            dirty = set()
+            self._dirty[instrument_id.venue] = dirty
+
+        dirty.add(instrument_id)
+
+    cdef set pop_dirty(self, Venue venue):
+        return self._dirty.pop(venue, None) or set()
+
+    cdef void update(self, InstrumentId instrument_id, Money value):
+        # Replace the contribution of the instrument (a `None` value removes it)
+        cdef Venue venue = instrument_id.venue
+        cdef dict totals = self._totals.get(venue)
+        cdef Money previous = self._values.pop(instrument_id, None)
+        cdef list entry
+        if previous is not None:
+            entry = totals[previous.currency]
+            entry[0] -= previous._mem.raw
+            entry[1] -= 1
+            if entry[1] == 0:
+                del totals[previous.currency]
+
+        if value is None:
+            return
+
+        if totals is None:
+            totals = {}
+            self._totals[venue] = totals
+
+        entry = totals.get(value.currency)
+        if entry is None:
+            entry = [0, 0]
+            totals[value.currency] = entry
+
+        entry[0] += value._mem.raw
+        entry[1] += 1
+        self._values[instrument_id] = value
+
+    cdef dict totals(self, Venue venue):
+        cdef dict totals = self._totals.get(venue)
+        if not totals:
+            return {}
+
+        return {currency: Money.from_raw_c(entry[0], currency) for currency, entry in totals.items()}
+
+    cdef void clear(self):
+        self._values.clear()
+        self._totals.clear()
+        self._dirty.clear()
+
+
 cdef class Portfolio(PortfolioFacade):
     """
     Provides a trading portfolio.
@@ -140,6 +209,11 @@ cdef class Portfolio(PortfolioFacade):
         self._index_bet_positions: dict[InstrumentId, set[PositionId]] = defaultdict(set)
         self._pending_calcs: set[InstrumentId] = set()
         self._bar_close_prices: dict[InstrumentId, Price] = {}
+        self._net_open_instruments: set[InstrumentId] = set()
+        self._unrealized_pnl_totals = VenueTotals()
+        self._net_exposure_totals = VenueTotals()  # Positions entered long (tracks dirty instruments)
+        self._net_exposure_short_totals = VenueTotals()  # Positions entered short
+        self._trade_subscriptions: set[InstrumentId] = set()
 
         self.analyzer = PortfolioAnalyzer()
 
@@ -194,6 +268,13 @@ cdef class Portfolio(PortfolioFacade):
         """
         self._use_mark_prices = value
 
+        # Cached values were calculated using the previous price type
+        self._unrealized_pnls.clear()
+
+        cdef Position position
+        for position in self._cache.positions_open():
+            self._mark_dirty(position.instrument_id)
+
     cpdef void set_use_mark_xrates(self, bint value):
         """
         Set the `use_mark_xrates` setting with the given `value`.
@@ -289,6 +370,9 @@ cdef class Portfolio(PortfolioFacade):
         # Clean slate
         self._realized_pnls.clear()
         self._unrealized_pnls.clear()
+        self._unrealized_pnl_totals.clear()
+        self._net_exposure_totals.clear()
+        self._net_exposure_short_totals.clear()
 
         cdef list all_positions_open = self._cache.positions_open()
 
@@ -296,6 +380,7 @@ cdef class Portfolio(PortfolioFacade):
         cdef Position position
         for position in all_positions_open:
             instruments.add(position.instrument_id)
+            self._mark_dirty(position.instrument_id)
 
         cdef bint initialized = True
 
@@ -315,6 +400,7 @@ cdef class Portfolio(PortfolioFacade):
                 instrument_id=instrument_id,
                 positions_open=positions_open,
             )
+            self._update_trade_subscription(instrument_id, is_open=bool(positions_open))
 
             self._realized_pnls[instrument_id] = self._calculate_realized_pnl(instrument_id)
             self._unrealized_pnls[instrument_id] = self._calculate_unrealized_pnl(instrument_id)
@@ -380,10 +466,47 @@ cdef class Portfolio(PortfolioFacade):
 
     cpdef void update_mark_price(self, object mark_price):
         """
-        TBD
+        Update the portfolio with the given mark price.
+
+        Clears the cached unrealized PnL for the associated instrument, and
+        performs any initialization calculations which may have been pending
+        an update.
+
+        Parameters
+        ----------
+        mark_price : MarkPriceUpdate
+            The mark price update to update with.
+
+        """
+        Condition.not_none(mark_price, "mark_price")
+
+        self._update_instrument_id(mark_price.instrument_id)
+
+    cpdef void update_trade_tick(self, TradeTick tick):
         """
-        # TODO: Feature is WIP
-        self._log.warning("Mark price updates not yet supported")
+        Update the portfolio with the given trade tick.
+
+        Only applies where the associated instrument is valued at the last traded
+        price, in which case this clears the cached unrealized PnL for the instrument,
+        and performs any initialization calculations which may have been pending
+        an update. Trades are subscribed to only for instruments with open positions.
+
+        Parameters
+        ----------
+        tick : TradeTick
+            The trade tick to update with.
+
+        """
+        Condition.not_none(tick, "tick")
+
+        cdef InstrumentId instrument_id = tick.instrument_id
+        if self._use_mark_prices:
+            if self._cache.has_mark_prices(instrument_id):
+                return  # Valued at the mark price
+        elif self._cache.has_quote_ticks(instrument_id):
+            return  # Valued at the bid or ask
+
+        self._update_instrument_id(instrument_id)
 
     cpdef void update_bar(self, Bar bar):
         """
@@ -511,6 +634,7 @@ cdef class Portfolio(PortfolioFacade):
             self._unrealized_pnls[event.instrument_id] = self._calculate_unrealized_pnl(
                 instrument_id=event.instrument_id,
             )
+            self._mark_dirty(event.instrument_id)
 
         cdef list orders_open = self._cache.orders_open(
             venue=None,  # Faster query filtering
@@ -557,6 +681,7 @@ cdef class Portfolio(PortfolioFacade):
             instrument_id=event.instrument_id,
             positions_open=positions_open,
         )
+        self._update_trade_subscription(event.instrument_id, is_open=bool(positions_open))
 
         self._realized_pnls[event.instrument_id] = self._calculate_realized_pnl(
             instrument_id=event.instrument_id,
@@ -564,6 +689,7 @@ cdef class Portfolio(PortfolioFacade):
         self._unrealized_pnls[event.instrument_id] = self._calculate_unrealized_pnl(
             instrument_id=event.instrument_id,
         )
+        self._mark_dirty(event.instrument_id)
 
         cdef Account account = self._cache.account(event.account_id)
         if account is None:
@@ -592,12 +718,19 @@ cdef class Portfolio(PortfolioFacade):
         )
 
     def _reset(self) -> None:
+        for instrument_id in list(self._trade_subscriptions):
+            self._update_trade_subscription(instrument_id, is_open=False)
+
         self._net_positions.clear()
         self._bet_positions.clear()
         self._index_bet_positions.clear()
         self._realized_pnls.clear()
         self._unrealized_pnls.clear()
         self._pending_calcs.clear()
+        self._net_open_instruments.clear()
+        self._unrealized_pnl_totals.clear()
+        self._net_exposure_totals.clear()
+        self._net_exposure_short_totals.clear()
         self.analyzer.reset()
 
         self.initialized = False
@@ -756,6 +889,11 @@ cdef class Portfolio(PortfolioFacade):
         -------
         dict[Currency, Money]
 
+        Notes
+        -----
+        Only positions held in the cache are included, so positions purged from the
+        cache (see `Cache.purge_closed_positions`) no longer contribute.
+
         """
         Condition.not_none(venue, "venue")
 
@@ -800,30 +938,26 @@ cdef class Portfolio(PortfolioFacade):
         """
         Condition.not_none(venue, "venue")
 
-        cdef list positions_open = self._cache.positions_open(venue)
-        if not positions_open:
-            return {}  # Nothing to calculate
-
-        cdef set[InstrumentId] instrument_ids = {p.instrument_id for p in positions_open}
-
-        cdef dict[Currency, double] unrealized_pnls = {}  # type: dict[Currency, 0.0]
-
+        # Only instruments changed since the last query are recalculated
         cdef:
             InstrumentId instrument_id
             Money pnl
-        for instrument_id in instrument_ids:
+        for instrument_id in self._unrealized_pnl_totals.pop_dirty(venue):
+            if not self._cache.positions_open_count(venue=None, instrument_id=instrument_id):
+                self._unrealized_pnl_totals.update(instrument_id, None)
+                continue  # No open positions
+
             pnl = self._unrealized_pnls.get(instrument_id)
-            if pnl is not None:
-                # PnL already calculated
-                unrealized_pnls[pnl.currency] = unrealized_pnls.get(pnl.currency, 0.0) + pnl.as_f64_c()
-                continue
-            # Calculate PnL
-            pnl = self._calculate_unrealized_pnl(instrument_id)
             if pnl is None:
-                continue  # Error logged in `_calculate_unrealized_pnl`
-            unrealized_pnls[pnl.currency] = unrealized_pnls.get(pnl.currency, 0.0) + pnl.as_f64_c()
+                pnl = self._calculate_unrealized_pnl(instrument_id)
+                self._unrealized_pnls[instrument_id] = pnl
+            if pnl is None:
+                # Error logged in `_calculate_unrealized_pnl`, recalculate on next query
+                self._unrealized_pnl_totals.mark_dirty(instrument_id)
+
+            self._unrealized_pnl_totals.update(instrument_id, pnl)
 
-        return {k: Money(v, k) for k, v in unrealized_pnls.items()}
+        return self._unrealized_pnl_totals.totals(venue)
 
     cpdef dict total_pnls(self, Venue venue):
         """
@@ -883,76 +1017,64 @@ cdef class Portfolio(PortfolioFacade):
             )
             return None  # Cannot calculate
 
-        cdef list positions_open = self._cache.positions_open(venue)
-        if not positions_open:
-            return {}  # Nothing to calculate
-
-        cdef dict net_exposures = {}  # type: dict[Currency, float]
-
+        # Only instruments changed since the last query are recalculated
+        cdef set dirty = self._net_exposure_totals.pop_dirty(venue)
         cdef:
-            Position position
-            Instrument instrument
-            Price price
-            Currency settlement_currency
-            double xrate
-            double net_exposure
-            double total_net_exposure
-        for position in positions_open:
-            instrument = self._cache.instrument(position.instrument_id)
-            if instrument is None:
-                self._log.error(
-                    f"Cannot calculate net exposures: "
-                    f"no instrument for {position.instrument_id}",
-                )
+            InstrumentId instrument_id
+            InstrumentId dirty_id
+        for instrument_id in dirty:
+            if not self._update_net_exposure_total(instrument_id):
+                # Recalculate all instruments pending in this query on the next query
+                for dirty_id in dirty:
+                    self._net_exposure_totals.mark_dirty(dirty_id)
                 return None  # Cannot calculate
 
-            if position.side == PositionSide.FLAT:
-                self._log.error(
-                    f"Cannot calculate net exposures: "
-                    f"position is flat for {position.instrument_id}",
-                )
-                continue  # Nothing to calculate
+        # Totals are held in settlement currencies, so exchange rates are applied
+        # once per currency and entry side at query time
+        cdef dict long_totals = self._net_exposure_totals.totals(venue)
+        cdef dict short_totals = self._net_exposure_short_totals.totals(venue)
 
-            price = self._get_price(position)
-            if price is None:
-                self._log.error(
-                    f"Cannot calculate net exposures: "
-                    f"no {self._log_price} for {position.instrument_id}",
-                )
-                continue  # Cannot calculate
-
-            xrate_result = self._calculate_xrate_to_base(
-                instrument=instrument,
-                account=account,
-                side=position.entry,
-            )
-            if not xrate_result:
-                self._log.error(
-                    f"Cannot calculate net exposures: "
-                    f"no {self._log_xrate} exchange rate for {instrument.get_settlement_currency()}/{account.base_currency}",
+        cdef dict[Currency, Money] net_exposures
+        cdef:
+            Currency currency
+            Money amount
+        if not self._convert_to_account_base_currency or account.base_currency is None:
+            net_exposures = long_totals
+            for currency, amount in short_totals.items():
+                if currency in net_exposures:
+                    amount = Money.from_raw_c(net_exposures[currency]._mem.raw + amount._mem.raw, currency)
+                net_exposures[currency] = amount
+            return net_exposures
+
+        if not long_totals and not short_totals:
+            return {}
+
+        cdef double total_net_exposure = 0.0
+        cdef double xrate
+        cdef OrderSide side
+        cdef dict totals
+        for side, totals in ((OrderSide.BUY, long_totals), (OrderSide.SELL, short_totals)):
+            for currency, amount in totals.items():
+                if amount._mem.raw == 0:
+                    continue  # Nothing to convert
+
+                xrate_result = self._calculate_currency_xrate_to_base(
+                    account=account,
+                    venue=venue,
+                    currency=currency,
+                    side=side,
                 )
-                return None  # Cannot calculate
-
-            xrate = xrate_result  # Cast to double
-
-            if self._convert_to_account_base_currency and account.base_currency is not None:
-                settlement_currency = account.base_currency
-            else:
-                settlement_currency = instrument.get_settlement_currency()
-
-            if isinstance(instrument, BettingInstrument):
-                bet_position = self._bet_positions.get(position.id)
-                net_exposure = float(bet_position.exposure) * xrate
-            else:
-                net_exposure = instrument.notional_value(position.quantity, price).as_f64_c()
-                net_exposure = round(net_exposure * xrate, settlement_currency.get_precision())
-
-            total_net_exposure = net_exposures.get(settlement_currency, 0.0)
-            total_net_exposure += net_exposure
+                if not xrate_result:
+                    self._log.error(
+                        f"Cannot calculate net exposures: "
+                        f"no {self._log_xrate} exchange rate for {currency}/{account.base_currency}",
+                    )
+                    return None  # Cannot calculate
 
-            net_exposures[settlement_currency] = total_net_exposure
+                xrate = xrate_result  # Cast to double
+                total_net_exposure += amount.as_f64_c() * xrate
 
-        return {k: Money(v, k) for k, v in net_exposures.items()}
+        return {account.base_currency: Money(total_net_exposure, account.base_currency)}
 
     cpdef Money realized_pnl(self, InstrumentId instrument_id):
         """
@@ -967,6 +1089,11 @@ cdef class Portfolio(PortfolioFacade):
         -------
         Money or ``None``
 
+        Notes
+        -----
+        Only positions held in the cache are included, so positions purged from the
+        cache (see `Cache.purge_closed_positions`) no longer contribute.
+
         """
         Condition.not_none(instrument_id, "instrument_id")
 
@@ -1241,11 +1368,7 @@ cdef class Portfolio(PortfolioFacade):
             True if net flat across all instruments, else False.
 
         """
-        for net_position in self._net_positions.values():
-            if net_position != Decimal(0):
-                return False
-
-        return True
+        return not self._net_open_instruments
 
 # -- INTERNAL -------------------------------------------------------------------------------------
 
@@ -1264,8 +1387,18 @@ cdef class Portfolio(PortfolioFacade):
             self._net_positions[instrument_id] = net_position
             self._log.info(f"{instrument_id} net_position={net_position}")
 
+        if net_position != 0:
+            self._net_open_instruments.add(instrument_id)
+        else:
+            self._net_open_instruments.discard(instrument_id)
+
+    cdef void _mark_dirty(self, InstrumentId instrument_id):
+        self._unrealized_pnl_totals.mark_dirty(instrument_id)
+        self._net_exposure_totals.mark_dirty(instrument_id)
+
     cdef void _update_instrument_id(self, InstrumentId instrument_id):
         self._unrealized_pnls.pop(instrument_id, None)
+        self._mark_dirty(instrument_id)
 
         if self.initialized:
             return
@@ -1509,6 +1642,86 @@ cdef class Portfolio(PortfolioFacade):
 
         return Money(total_pnl, currency)
 
+    cdef bint _update_net_exposure_total(self, InstrumentId instrument_id):
+        # Recalculate the net exposure of the instrument in its settlement currency
+        # for the venue totals, returning False if the exposure cannot be calculated
+        cdef list positions_open = self._cache.positions_open(
+            venue=None,  # Faster query filtering
+            instrument_id=instrument_id,
+        )
+        if not positions_open:
+            self._net_exposure_totals.update(instrument_id, None)
+            self._net_exposure_short_totals.update(instrument_id, None)
+            return True  # Nothing to calculate
+
+        cdef Instrument instrument = self._cache.instrument(instrument_id)
+        if instrument is None:
+            self._log.error(
+                f"Cannot calculate net exposures: "
+                f"no instrument for {instrument_id}",
+            )
+            return False  # Cannot calculate
+
+        cdef Currency settlement_currency = instrument.get_settlement_currency()
+        cdef double long_net_exposure = 0.0
+        cdef double short_net_exposure = 0.0
+        cdef bint has_short = False
+
+        cdef:
+            Position position
+            Price price
+            double net_exposure
+        for position in positions_open:
+            if position.side == PositionSide.FLAT:
+                self._log.error(
+                    f"Cannot calculate net exposures: "
+                    f"position is flat for {position.instrument_id}",
+                )
+                continue  # Nothing to calculate
+
+            price = self._get_price(position)
+            if price is None:
+                self._log.error(
+                    f"Cannot calculate net exposures: "
+                    f"no {self._log_price} for {position.instrument_id}",
+                )
+                self._net_exposure_totals.mark_dirty(instrument_id)  # Recalculate on next query
+                continue  # Cannot calculate
+
+            if isinstance(instrument, BettingInstrument):
+                bet_position = self._bet_positions.get(position.id)
+                net_exposure = float(bet_position.exposure)
+            else:
+                net_exposure = instrument.notional_value(position.quantity, price).as_f64_c()
+
+            # Exchange rates to the account base currency depend on the entry side
+            if position.entry == OrderSide.BUY:
+                long_net_exposure += net_exposure
+            else:
+                short_net_exposure += net_exposure
+                has_short = True
+
+        self._net_exposure_totals.update(instrument_id, Money(long_net_exposure, settlement_currency))
+        self._net_exposure_short_totals.update(
+            instrument_id,
+            Money(short_net_exposure, settlement_currency) if has_short else None,
+        )
+        return True
+
+    cdef void _update_trade_subscription(self, InstrumentId instrument_id, bint is_open):
+        # Trades only value instruments without quotes or mark prices (last price fallback),
+        # so are handled only for instruments with open positions
+        if is_open == (instrument_id in self._trade_subscriptions):
+            return  # Subscription already matches
+
+        cdef str topic = f"data.trades.{instrument_id.venue}.{instrument_id.symbol}"
+        if is_open:
+            self._msgbus.subscribe(topic=topic, handler=self.update_trade_tick, priority=10)
+            self._trade_subscriptions.add(instrument_id)
+        else:
+            self._msgbus.unsubscribe(topic=topic, handler=self.update_trade_tick)
+            self._trade_subscriptions.discard(instrument_id)
+
     cdef Price _get_price(self, Position position):
         cdef PriceType price_type
         if self._use_mark_prices:
@@ -1534,18 +1747,32 @@ cdef class Portfolio(PortfolioFacade):
         ) or self._bar_close_prices.get(instrument_id)
 
     cdef _calculate_xrate_to_base(self, Account account, Instrument instrument, OrderSide side):
+        return self._calculate_currency_xrate_to_base(
+            account=account,
+            venue=instrument.id.venue,
+            currency=instrument.get_settlement_currency(),
+            side=side,
+        )
+
+    cdef _calculate_currency_xrate_to_base(
+        self,
+        Account account,
+        Venue venue,
+        Currency currency,
+        OrderSide side,
+    ):
         if not self._convert_to_account_base_currency or account.base_currency is None:
             return 1.0  # No conversion needed
 
         if self._use_mark_xrates:
             return self._cache.get_mark_xrate(
-                from_currency=instrument.get_settlement_currency(),
+                from_currency=currency,
                 to_currency=account.base_currency,
             )
 
         return self._cache.get_xrate(
-            venue=self._venue or instrument.id.venue,
-            from_currency=instrument.get_settlement_currency(),
+            venue=self._venue or venue,
+            from_currency=currency,
             to_currency=account.base_currency,
             price_type=PriceType.BID if side == OrderSide.BUY else PriceType.ASK,
         )
@@ -32,6 +32,9 @@ from nautilus_trader.common.component cimport LogColor
 from nautilus_trader.common.component cimport MessageBus
 from nautilus_trader.common.component cimport Throttler
 from nautilus_trader.common.messages cimport TradingStateChanged
+from nautilus_trader.common.profiler cimport PROFILING
+from nautilus_trader.common.profiler cimport profiler_now
+from nautilus_trader.common.profiler cimport profiler_record
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.message cimport Command
 from nautilus_trader.core.message cimport Event
@@ -393,6 +396,10 @@ cdef class RiskEngine(Component):
             self._log.debug(f"{RECV}{CMD} {command}", LogColor.MAGENTA)
         self.command_count += 1
 
+        cdef uint64_t start_ns = 0
+        if PROFILING:
+            start_ns = profiler_now()
+
         if isinstance(command, SubmitOrder):
             self._handle_submit_order(command)
         elif isinstance(command, SubmitOrderList):
@@ -402,6 +409,9 @@ cdef class RiskEngine(Component):
         else:
             self._log.error(f"Cannot handle command: {command}")
 
+        if start_ns:
+            profiler_record("RiskEngine", type(command).__name__, start_ns)
+
     cpdef void _handle_submit_order(self, SubmitOrder command):
         if self.is_bypassed:
             # Perform no further risk checks or throttling
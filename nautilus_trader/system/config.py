@@ -83,6 +83,9 @@ class NautilusKernelConfig(NautilusConfig, frozen=True):
         If the asyncio event loop should be in debug mode.
     logging : LoggingConfig, optional
         The logging configuration for the kernel.
+    profiling : bool, default False
+        If hot-path profiling should be enabled, recording call counts and latencies
+        per component for message bus handlers, engine handlers and matching steps.
     timeout_connection : PositiveFloat, default 60
         The timeout (seconds) for all clients to connect and initialize.
     timeout_reconciliation : PositiveFloat, default 30
@@ -118,6 +121,7 @@ class NautilusKernelConfig(NautilusConfig, frozen=True):
     save_state: bool = False
     loop_debug: bool = False
     logging: LoggingConfig | None = None
+    profiling: bool = False
 
     timeout_connection: PositiveFloat = 60.0
     timeout_reconciliation: PositiveFloat = 30.0
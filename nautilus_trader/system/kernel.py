@@ -51,6 +51,8 @@ from nautilus_trader.common.enums import LogColor
 from nautilus_trader.common.enums import LogLevel
 from nautilus_trader.common.enums import log_level_from_str
 from nautilus_trader.common.messages import ShutdownSystem
+from nautilus_trader.common.profiler import get_profiler
+from nautilus_trader.common.profiler import set_profiling_enabled
 from nautilus_trader.config import ActorFactory
 from nautilus_trader.config import ControllerFactory
 from nautilus_trader.config import DataEngineConfig
@@ -173,6 +175,12 @@ class NautilusKernel:
 
         register_component_clock(self._instance_id, self._clock)
 
+        # Hot-path profiling (process wide)
+        self._profiling: bool = config.profiling
+        if self._profiling:
+            get_profiler().reset()
+            set_profiling_enabled(True)
+
         # Initialize logging system
         self._log_guard: nautilus_pyo3.LogGuard | LogGuard | None = None
         logging: LoggingConfig = config.logging or LoggingConfig()
@@ -936,6 +944,24 @@ class NautilusKernel:
         """
         return self._log_guard
 
+    def profiling_summary(self) -> dict[str, dict[str, dict[str, int]]] | None:
+        """
+        Return the hot-path profiling statistics recorded so far, grouped by component.
+
+        Each path maps to its call count and cumulative, mean, min, p50, p90, p99
+        and max latencies (nanoseconds). Components are ordered by path total time.
+
+        Returns
+        -------
+        dict[str, dict[str, dict[str, int]]] or ``None``
+            ``None`` if profiling is not enabled for the kernel.
+
+        """
+        if not self._profiling:
+            return None
+
+        return get_profiler().summary()
+
     def is_running(self) -> bool:
         """
         Return whether the kernel is running.
@@ -1091,6 +1117,9 @@ class NautilusKernel:
         if self._writer:
             self._writer.close()
 
+        if self._profiling:
+            set_profiling_enabled(False)
+
     def cancel_all_tasks(self) -> None:  # noqa: C901 (too complex)
         """
         Cancel all tasks currently running for the Nautilus kernel.
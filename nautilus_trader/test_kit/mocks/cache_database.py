@@ -86,7 +86,7 @@ class MockCacheDatabase(CacheDatabaseFacade):
     def load_orders(self) -> dict:
         return self.orders.copy()
 
-    def load_positions(self) -> dict:
+    def load_positions(self, max_events: int = 0) -> dict:
         return self.positions.copy()
 
     def load_currency(self, code: str) -> Currency:
@@ -110,7 +110,7 @@ class MockCacheDatabase(CacheDatabaseFacade):
     def load_index_order_client(self) -> dict[ClientOrderId, ClientId]:
         return self._index_order_client
 
-    def load_position(self, position_id: PositionId) -> Position | None:
+    def load_position(self, position_id: PositionId, max_events: int = 0) -> Position | None:
         return self.positions.get(position_id)
 
     def load_strategy(self, strategy_id: StrategyId) -> dict:
@@ -0,0 +1,224 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import json
+import platform
+import sys
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Any
+
+
+def peak_rss_bytes() -> int | None:
+    """
+    Return the peak resident set size (bytes) of the current process.
+
+    Returns
+    -------
+    int or ``None``
+        ``None`` if the platform does not expose the value.
+
+    Notes
+    -----
+    The value is the high-water mark for the lifetime of the process, so run
+    scenarios in separate processes to attribute peak memory to each one.
+
+    """
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+@dataclass
+class MacroBenchmarkResult:
+    """
+    Represents the measurements of a single macro benchmark scenario run.
+    """
+
+    name: str
+    events: int = 0
+    phases: dict[str, float] = field(default_factory=dict)
+    peak_rss_bytes: int | None = None
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def events_per_sec(self) -> float:
+        """
+        Return the number of events processed per second during the ``run`` phase.
+
+        Returns
+        -------
+        float
+
+        """
+        elapsed = self.phases.get("run", 0.0)
+        return self.events / elapsed if elapsed > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Return a dictionary representation of this object.
+
+        Returns
+        -------
+        dict[str, Any]
+
+        """
+        values = asdict(self)
+        values["events_per_sec"] = self.events_per_sec
+        return values
+
+
+class MacroBenchmark:
+    """
+    Provides phase timing and reporting for a single macro benchmark scenario.
+
+    Parameters
+    ----------
+    name : str
+        The unique scenario name (used as the key in baseline files).
+
+    """
+
+    def __init__(self, name: str) -> None:
+        self.result = MacroBenchmarkResult(name=name)
+
+    @contextmanager
+    def phase(self, name: str) -> Generator[None, None, None]:
+        """
+        Time the enclosed block as the phase with the given `name`.
+
+        Timings for a repeated phase are accumulated.
+
+        Parameters
+        ----------
+        name : str
+            The phase name. The ``run`` phase is used to compute events per second.
+
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.result.phases[name] = self.result.phases.get(name, 0.0) + elapsed
+
+    def finish(self, events: int, **extra: Any) -> MacroBenchmarkResult:
+        """
+        Complete the scenario and return its result.
+
+        Parameters
+        ----------
+        events : int
+            The number of events processed during the ``run`` phase.
+        **extra : Any
+            Any additional scenario specific measurements to record.
+
+        Returns
+        -------
+        MacroBenchmarkResult
+
+        """
+        self.result.events = events
+        self.result.peak_rss_bytes = peak_rss_bytes()
+        self.result.extra.update(extra)
+        return self.result
+
+
+class MacroBenchmarkBaseline:
+    """
+    Provides a machine-readable JSON store of macro benchmark results.
+
+    Parameters
+    ----------
+    path : Path | str
+        The path to the JSON file (created on first save).
+
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self.results: dict[str, dict[str, Any]] = {}
+        if self.path.exists():
+            self.results = json.loads(self.path.read_text()).get("results", {})
+
+    def record(self, result: MacroBenchmarkResult) -> None:
+        """
+        Record the given `result`, replacing any previous result of the same name.
+
+        Parameters
+        ----------
+        result : MacroBenchmarkResult
+            The result to record.
+
+        """
+        self.results[result.name] = result.to_dict()
+
+    def save(self) -> None:
+        """
+        Write all recorded results to the file at `path`.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": dict(sorted(self.results.items())),
+        }
+        self.path.write_text(json.dumps(payload, indent=2))
+
+    def check_regression(
+        self,
+        result: MacroBenchmarkResult,
+        tolerance: float = 0.25,
+    ) -> str | None:
+        """
+        Compare the given `result` against the recorded baseline of the same name.
+
+        Parameters
+        ----------
+        result : MacroBenchmarkResult
+            The result to check.
+        tolerance : float, default 0.25
+            The allowed fractional drop in events per second.
+
+        Returns
+        -------
+        str or ``None``
+            A description of the regression, or ``None`` if within tolerance
+            (or no baseline exists for the scenario).
+
+        """
+        baseline = self.results.get(result.name)
+        if baseline is None or not baseline.get("events_per_sec"):
+            return None
+
+        floor = baseline["events_per_sec"] * (1.0 - tolerance)
+        if result.events_per_sec >= floor:
+            return None
+
+        return (
+            f"{result.name}: {result.events_per_sec:,.0f} events/sec is below "
+            f"baseline {baseline['events_per_sec']:,.0f} events/sec "
+            f"(tolerance {tolerance:.0%})"
+        )
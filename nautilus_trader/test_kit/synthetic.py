@@ -0,0 +1,464 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import random
+
+import pandas as pd
+
+from nautilus_trader.core.datetime import dt_to_unix_nanos
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.data import BarSpecification
+from nautilus_trader.model.data import BarType
+from nautilus_trader.model.data import BookOrder
+from nautilus_trader.model.data import OrderBookDelta
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.enums import AggregationSource
+from nautilus_trader.model.enums import AggressorSide
+from nautilus_trader.model.enums import BarAggregation
+from nautilus_trader.model.enums import BookAction
+from nautilus_trader.model.enums import BookType
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import PriceType
+from nautilus_trader.model.enums import RecordFlag
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+
+
+class SyntheticMarketGenerator:
+    """
+    Provides a deterministic generator of synthetic market data across many instruments.
+
+    Every instrument follows its own seeded random walk (in price ticks), so the
+    same `seed` and parameters always produce identical data. Data for all
+    instruments is merged into a single stream sorted by `ts_init`, with
+    instruments interleaved on every step.
+
+    Parameters
+    ----------
+    instruments : list[Instrument]
+        The instruments to generate data for.
+    seed : int, default 42
+        The seed for the random number generator.
+    start_ns : int, optional
+        The UNIX timestamp (nanoseconds) for the first data point.
+        If ``None`` then defaults to 2020-01-01 UTC.
+    interval_ns : int, default 100_000_000
+        The interval (nanoseconds) between consecutive data points for an instrument.
+    initial_price : float, default 100.0
+        The starting mid price for every instrument.
+    spread_ticks : int, default 1
+        The quoted spread in price ticks.
+    max_move_ticks : int, default 2
+        The maximum absolute price move (in ticks) per step of the random walk.
+
+    Raises
+    ------
+    ValueError
+        If `instruments` is empty.
+
+    """
+
+    __test__ = False  # Prevents pytest from collecting this as a test class
+
+    def __init__(
+        self,
+        instruments: list[Instrument],
+        seed: int = 42,
+        start_ns: int | None = None,
+        interval_ns: int = 100_000_000,
+        initial_price: float = 100.0,
+        spread_ticks: int = 1,
+        max_move_ticks: int = 2,
+    ) -> None:
+        if not instruments:
+            raise ValueError("`instruments` was empty")
+
+        if start_ns is None:
+            start_ns = dt_to_unix_nanos(pd.Timestamp("2020-01-01", tz="UTC"))
+
+        self.instruments = list(instruments)
+        self.seed = seed
+        self.start_ns = start_ns
+        self.interval_ns = interval_ns
+        self.initial_price = initial_price
+        self.spread_ticks = spread_ticks
+        self.max_move_ticks = max_move_ticks
+
+    @staticmethod
+    def equities(count: int, venue: str = "SIM") -> list[Instrument]:
+        """
+        Return `count` USD denominated equity instruments for the given `venue`.
+
+        Parameters
+        ----------
+        count : int
+            The number of instruments.
+        venue : str, default 'SIM'
+            The venue for the instruments.
+
+        Returns
+        -------
+        list[Instrument]
+
+        """
+        return [
+            TestInstrumentProvider.equity(symbol=f"SYN{i:04d}", venue=venue) for i in range(count)
+        ]
+
+    def _rng(self, stream: str) -> random.Random:
+        # A separate stream per data type keeps each generator independent of call order
+        return random.Random(f"{self.seed}-{stream}")  # noqa: S311
+
+    def _ts(self, step: int, index: int) -> int:
+        # Offset instruments by 1ns so the merged stream has a stable interleaving
+        return self.start_ns + step * self.interval_ns + index
+
+    def _walks(self, rng: random.Random, count: int) -> list[list[int]]:
+        # Random walk of mid prices in ticks per instrument
+        walks: list[list[int]] = []
+        for instrument in self.instruments:
+            tick = instrument.price_increment.as_double()
+            mid = max(round(self.initial_price / tick), self.max_move_ticks + 1)
+            floor = self.spread_ticks + 1
+            path: list[int] = []
+            for _ in range(count):
+                mid = max(mid + rng.randint(-self.max_move_ticks, self.max_move_ticks), floor)
+                path.append(mid)
+            walks.append(path)
+        return walks
+
+    def quote_ticks(self, count: int, size: float = 100_000.0) -> list[QuoteTick]:
+        """
+        Return `count` quotes per instrument.
+
+        Parameters
+        ----------
+        count : int
+            The number of quotes per instrument.
+        size : float, default 100_000.0
+            The top-of-book size on both sides.
+
+        Returns
+        -------
+        list[QuoteTick]
+
+        """
+        rng = self._rng("quotes")
+        walks = self._walks(rng, count)
+        quotes: list[QuoteTick] = []
+        for step in range(count):
+            for index, instrument in enumerate(self.instruments):
+                tick = instrument.price_increment.as_double()
+                mid = walks[index][step]
+                ts = self._ts(step, index)
+                quotes.append(
+                    TestDataStubs.quote_tick(
+                        instrument=instrument,
+                        bid_price=(mid - self.spread_ticks) * tick,
+                        ask_price=mid * tick,
+                        bid_size=size,
+                        ask_size=size,
+                        ts_event=ts,
+                        ts_init=ts,
+                    ),
+                )
+        return quotes
+
+    def trade_ticks(self, count: int, max_size: int = 10) -> list[TradeTick]:
+        """
+        Return `count` trades per instrument.
+
+        Parameters
+        ----------
+        count : int
+            The number of trades per instrument.
+        max_size : int, default 10
+            The maximum trade size in multiples of the instruments size increment.
+
+        Returns
+        -------
+        list[TradeTick]
+
+        """
+        rng = self._rng("trades")
+        walks = self._walks(rng, count)
+        trades: list[TradeTick] = []
+        for step in range(count):
+            for index, instrument in enumerate(self.instruments):
+                tick = instrument.price_increment.as_double()
+                ts = self._ts(step, index)
+                trades.append(
+                    TestDataStubs.trade_tick(
+                        instrument=instrument,
+                        price=walks[index][step] * tick,
+                        size=rng.randint(1, max_size) * instrument.size_increment.as_double(),
+                        aggressor_side=(
+                            AggressorSide.BUYER if rng.random() < 0.5 else AggressorSide.SELLER
+                        ),
+                        trade_id=f"{index}-{step}",
+                        ts_event=ts,
+                        ts_init=ts,
+                    ),
+                )
+        return trades
+
+    def bar_type(
+        self,
+        instrument: Instrument,
+        step: int = 1,
+        aggregation: BarAggregation = BarAggregation.MINUTE,
+        price_type: PriceType = PriceType.LAST,
+    ) -> BarType:
+        """
+        Return the externally aggregated bar type used for `instrument`.
+
+        Parameters
+        ----------
+        instrument : Instrument
+            The instrument for the bar type.
+        step : int, default 1
+            The bar step.
+        aggregation : BarAggregation, default ``MINUTE``
+            The bar aggregation method.
+        price_type : PriceType, default ``LAST``
+            The bar price type.
+
+        Returns
+        -------
+        BarType
+
+        """
+        return BarType(
+            instrument.id,
+            BarSpecification(step, aggregation, price_type),
+            AggregationSource.EXTERNAL,
+        )
+
+    def bars(self, count: int, volume: float = 1_000_000.0) -> list[Bar]:
+        """
+        Return `count` one-minute bars per instrument.
+
+        Bar timestamps are spaced one minute apart regardless of `interval_ns`.
+
+        Parameters
+        ----------
+        count : int
+            The number of bars per instrument.
+        volume : float, default 1_000_000.0
+            The volume for every bar.
+
+        Returns
+        -------
+        list[Bar]
+
+        """
+        rng = self._rng("bars")
+        walks = self._walks(rng, count + 1)
+        bar_types = [self.bar_type(instrument) for instrument in self.instruments]
+        interval_ns = 60_000_000_000
+        bars: list[Bar] = []
+        for step in range(count):
+            for index, instrument in enumerate(self.instruments):
+                tick = instrument.price_increment.as_double()
+                open_ = walks[index][step]
+                close = walks[index][step + 1]
+                high = max(open_, close) + rng.randint(0, self.max_move_ticks)
+                low = max(min(open_, close) - rng.randint(0, self.max_move_ticks), 1)
+                ts = self.start_ns + (step + 1) * interval_ns + index
+                bars.append(
+                    Bar(
+                        bar_type=bar_types[index],
+                        open=instrument.make_price(open_ * tick),
+                        high=instrument.make_price(high * tick),
+                        low=instrument.make_price(low * tick),
+                        close=instrument.make_price(close * tick),
+                        volume=instrument.make_qty(volume),
+                        ts_event=ts,
+                        ts_init=ts,
+                    ),
+                )
+        return bars
+
+    def order_book_deltas(
+        self,
+        count: int,
+        book_type: BookType = BookType.L2_MBP,
+        depth: int = 10,
+        max_size: int = 100,
+    ) -> list[OrderBookDelta]:
+        """
+        Return an initial snapshot followed by `count` deltas per instrument.
+
+        For ``L2_MBP`` books each price level is a single aggregated order, for
+        ``L3_MBO`` books each level holds individual orders with their own IDs.
+        Prices stay within `depth` ticks either side of the initial price so
+        the book never crosses.
+
+        Parameters
+        ----------
+        count : int
+            The number of deltas per instrument (excluding the snapshot).
+        book_type : BookType {``L2_MBP``, ``L3_MBO``}, default ``L2_MBP``
+            The order book type to generate deltas for.
+        depth : int, default 10
+            The number of price levels per side.
+        max_size : int, default 100
+            The maximum order size in multiples of the instruments size increment.
+
+        Returns
+        -------
+        list[OrderBookDelta]
+
+        Raises
+        ------
+        ValueError
+            If `book_type` is ``L1_MBP``.
+
+        """
+        if book_type == BookType.L1_MBP:
+            raise ValueError("`book_type` must be `L2_MBP` or `L3_MBO`")
+
+        rng = self._rng(f"deltas-{book_type.name}")
+        is_mbo = book_type == BookType.L3_MBO
+        deltas: list[OrderBookDelta] = []
+        books: list[dict[int, tuple[OrderSide, int, float]]] = []
+        next_order_ids: list[int] = []
+
+        def make_delta(
+            instrument: Instrument,
+            action: BookAction,
+            side: OrderSide,
+            price_ticks: int,
+            size: float,
+            order_id: int,
+            flags: int,
+            sequence: int,
+            ts: int,
+        ) -> OrderBookDelta:
+            tick = instrument.price_increment.as_double()
+            return TestDataStubs.order_book_delta(
+                instrument_id=instrument.id,
+                action=action,
+                order=BookOrder(
+                    side,
+                    instrument.make_price(price_ticks * tick),
+                    instrument.make_qty(size),
+                    order_id,
+                ),
+                flags=flags,
+                sequence=sequence,
+                ts_event=ts,
+                ts_init=ts,
+            )
+
+        # Snapshots
+        for index, instrument in enumerate(self.instruments):
+            tick = instrument.price_increment.as_double()
+            center = max(round(self.initial_price / tick), depth + 1)
+            size_inc = instrument.size_increment.as_double()
+            ts = self._ts(0, index)
+            deltas.append(
+                OrderBookDelta.clear(instrument.id, 0, ts, ts),
+            )
+            book: dict[int, tuple[OrderSide, int, float]] = {}
+            order_id = 1
+            for level in range(1, depth + 1):
+                size = rng.randint(1, max_size) * size_inc
+                book[order_id] = (OrderSide.BUY, center - level, size)
+                order_id += 1
+                size = rng.randint(1, max_size) * size_inc
+                book[order_id] = (OrderSide.SELL, center + level, size)
+                order_id += 1
+            last_id = order_id - 1
+            for oid, (side, price_ticks, size) in book.items():
+                flags = RecordFlag.F_SNAPSHOT
+                if oid == last_id:
+                    flags |= RecordFlag.F_LAST
+                deltas.append(
+                    make_delta(
+                        instrument,
+                        BookAction.ADD,
+                        side,
+                        price_ticks,
+                        size,
+                        oid if is_mbo else 0,
+                        flags,
+                        0,
+                        ts,
+                    ),
+                )
+            books.append(book)
+            next_order_ids.append(order_id)
+
+        # Incremental updates
+        for step in range(1, count + 1):
+            for index, instrument in enumerate(self.instruments):
+                tick = instrument.price_increment.as_double()
+                center = max(round(self.initial_price / tick), depth + 1)
+                size_inc = instrument.size_increment.as_double()
+                book = books[index]
+                ts = self._ts(step, index)
+                roll = rng.random()
+                if roll < 0.6 or len(book) <= 2:
+                    # Update size of an existing order/level
+                    oid = rng.choice(list(book))
+                    side, price_ticks, _ = book[oid]
+                    size = rng.randint(1, max_size) * size_inc
+                    action = BookAction.UPDATE
+                    book[oid] = (side, price_ticks, size)
+                elif roll < 0.8:
+                    # Add a new order (MBO) or refresh a level (MBP)
+                    side = OrderSide.BUY if rng.random() < 0.5 else OrderSide.SELL
+                    offset = rng.randint(1, depth)
+                    price_ticks = center - offset if side == OrderSide.BUY else center + offset
+                    size = rng.randint(1, max_size) * size_inc
+                    if is_mbo:
+                        oid = next_order_ids[index]
+                        next_order_ids[index] += 1
+                        action = BookAction.ADD
+                    else:
+                        oid = next(
+                            (k for k, v in book.items() if v[0] == side and v[1] == price_ticks),
+                            next_order_ids[index],
+                        )
+                        if oid == next_order_ids[index]:
+                            next_order_ids[index] += 1
+                            action = BookAction.ADD
+                        else:
+                            action = BookAction.UPDATE
+                    book[oid] = (side, price_ticks, size)
+                else:
+                    # Delete an existing order/level
+                    oid = rng.choice(list(book))
+                    side, price_ticks, size = book.pop(oid)
+                    action = BookAction.DELETE
+                deltas.append(
+                    make_delta(
+                        instrument,
+                        action,
+                        side,
+                        price_ticks,
+                        size,
+                        oid if is_mbo else 0,
+                        RecordFlag.F_LAST,
+                        step,
+                        ts,
+                    ),
+                )
+
+        deltas.sort(key=lambda x: x.ts_init)  # Stable, so snapshot order is preserved
+        return deltas
@@ -58,6 +58,11 @@ class StrategyConfig(NautilusConfig, kw_only=True, frozen=True):
         If False, then only warning events and above are logged.
     log_commands : bool, default True
         If commands should be logged by the strategy.
+    bulk_historical_data : bool, default False
+        If historical quote, trade and bar responses are handled in bulk. Columns are
+        extracted once per response, registered indicators are updated with the whole
+        batch, and `on_historical_columns` is called before the per-object
+        `on_historical_data` callbacks (which then observe the final indicator state).
 
     """
 
@@ -70,6 +75,7 @@ class StrategyConfig(NautilusConfig, kw_only=True, frozen=True):
     manage_gtd_expiry: bool = False
     log_events: bool = True
     log_commands: bool = True
+    bulk_historical_data: bool = False
 
 
 class ImportableStrategyConfig(NautilusConfig, frozen=True):
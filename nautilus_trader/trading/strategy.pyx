@@ -154,6 +154,7 @@ cdef class Strategy(Actor):
         # Configuration
         self._log_events = config.log_events
         self._log_commands = config.log_commands
+        self._bulk_historical_data = config.bulk_historical_data
         self.config = config
         self.oms_type = <OmsType>oms_type
         self.external_order_claims = self._parse_external_order_claims(config.external_order_claims)
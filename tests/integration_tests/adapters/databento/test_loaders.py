@@ -235,6 +235,20 @@ def test_loader_mbo() -> None:
     assert delta.ts_init == 1609160400000704060
 
 
+def test_loader_stream_dbn_file_matches_from_dbn_file() -> None:
+    # Arrange
+    loader = DatabentoDataLoader()
+    path = DATABENTO_TEST_DATA_DIR / "mbo.dbn.zst"
+
+    # Act
+    chunks = list(loader.stream_dbn_file(path, chunk_size=1))
+    data = loader.from_dbn_file(path)
+
+    # Assert
+    assert [len(chunk) for chunk in chunks] == [1, 1]
+    assert [d for chunk in chunks for d in chunk] == data
+
+
 def test_loader_mbo_pyo3() -> None:
     # Arrange
     loader = DatabentoDataLoader()
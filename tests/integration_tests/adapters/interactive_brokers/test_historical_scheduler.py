@@ -0,0 +1,348 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+import time
+
+import pandas as pd
+import pytest
+
+from nautilus_trader.adapters.interactive_brokers.common import IBContract
+from nautilus_trader.adapters.interactive_brokers.historical.scheduler import HistoricalPacingLimiter
+from nautilus_trader.adapters.interactive_brokers.historical.scheduler import HistoricalSegmentCache
+from nautilus_trader.adapters.interactive_brokers.historical.scheduler import HistoricDownloadScheduler
+from nautilus_trader.adapters.interactive_brokers.historical.scheduler import calculate_segments
+from nautilus_trader.adapters.interactive_brokers.parsing.instruments import ib_contract_to_instrument_id
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.data import BarAggregation
+from nautilus_trader.model.data import BarType
+from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.enums import AggressorSide
+from nautilus_trader.model.identifiers import TradeId
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from tests.integration_tests.adapters.interactive_brokers.test_kit import IBTestContractStubs
+
+
+START = pd.Timestamp("2024-01-02 00:00", tz="UTC")
+MINUTE = pd.Timedelta(minutes=1).value
+SECOND = pd.Timedelta(seconds=1).value
+
+
+class StubHistoricalClient:
+    """
+    Provides a stub of the historical data client API, with one bar per minute and
+    one trade per second.
+    """
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.bar_requests: list[tuple[pd.Timestamp, str]] = []
+        self.tick_requests: list[pd.Timestamp] = []
+        self.max_open = 0
+        self._open = 0
+
+    async def _request(self) -> None:
+        self._open += 1
+        self.max_open = max(self.max_open, self._open)
+        await asyncio.sleep(self.delay)
+        self._open -= 1
+
+    async def get_historical_bars(
+        self,
+        bar_type: BarType,
+        contract: IBContract,
+        use_rth: bool,
+        end_date_time: pd.Timestamp,
+        duration: str,
+        timeout: int = 60,
+    ) -> list[Bar]:
+        self.bar_requests.append((end_date_time, duration))
+        await self._request()
+
+        value, unit = duration.split()
+        start_ns = end_date_time.value - int(value) * (SECOND if unit == "S" else 86_400 * SECOND)
+        return [
+            Bar(
+                bar_type,
+                Price.from_str("1.00"),
+                Price.from_str("1.00"),
+                Price.from_str("1.00"),
+                Price.from_str("1.00"),
+                Quantity.from_int(1),
+                ts,
+                ts + MINUTE,
+            )
+            for ts in range(start_ns, end_date_time.value, MINUTE)
+        ]
+
+    async def get_historical_ticks(
+        self,
+        contract: IBContract,
+        tick_type: str,
+        start_date_time: pd.Timestamp | str = "",
+        end_date_time: pd.Timestamp | str = "",
+        use_rth: bool = True,
+        timeout: int = 60,
+    ) -> list[TradeTick] | None:
+        self.tick_requests.append(start_date_time)
+        await self._request()
+
+        instrument_id = ib_contract_to_instrument_id(contract)
+        return [
+            TradeTick(
+                instrument_id,
+                Price.from_str("1.00"),
+                Quantity.from_int(1),
+                AggressorSide.BUYER,
+                TradeId(str(ts)),
+                ts,
+                ts,
+            )
+            for ts in range(start_date_time.value, start_date_time.value + 100 * SECOND, SECOND)
+        ]
+
+
+@pytest.fixture(name="contract")
+def fixture_contract() -> IBContract:
+    return IBTestContractStubs.aapl_equity_ib_contract()
+
+
+@pytest.fixture(name="bar_type")
+def fixture_bar_type(contract: IBContract) -> BarType:
+    return BarType.from_str(f"{ib_contract_to_instrument_id(contract)}-1-MINUTE-LAST-EXTERNAL")
+
+
+def test_calculate_segments_aligns_to_grid():
+    # Arrange
+    length = pd.Timedelta(hours=1)
+
+    # Act
+    segments = calculate_segments(
+        "data",
+        START + pd.Timedelta(minutes=30),
+        START + pd.Timedelta(hours=2, minutes=15),
+        length,
+    )
+
+    # Assert
+    assert [(s.start, s.end) for s in segments] == [
+        (START, START + pd.Timedelta(hours=1)),
+        (START + pd.Timedelta(hours=1), START + pd.Timedelta(hours=2)),
+        (START + pd.Timedelta(hours=2), START + pd.Timedelta(hours=3)),
+    ]
+    assert segments[0].duration == "3600 S"
+
+
+def test_calculate_segments_for_overlapping_ranges_share_segments():
+    # Arrange
+    length = pd.Timedelta(hours=1)
+
+    # Act
+    first = calculate_segments("data", START, START + pd.Timedelta(hours=3), length)
+    second = calculate_segments(
+        "data",
+        START + pd.Timedelta(minutes=90),
+        START + pd.Timedelta(hours=5),
+        length,
+    )
+
+    # Assert
+    shared = {s.key for s in first} & {s.key for s in second}
+    assert shared == {s.key for s in first[1:]}
+
+
+def test_calculate_segments_with_different_trading_hours_do_not_share_keys():
+    # Arrange
+    length = pd.Timedelta(hours=1)
+
+    # Act
+    rth = calculate_segments("data", START, START + pd.Timedelta(hours=3), length, use_rth=True)
+    all_hours = calculate_segments(
+        "data",
+        START,
+        START + pd.Timedelta(hours=3),
+        length,
+        use_rth=False,
+    )
+
+    # Assert
+    assert not {s.key for s in rth} & {s.key for s in all_hours}
+
+
+@pytest.mark.asyncio
+async def test_pacing_limiter_waits_for_rolling_period():
+    # Arrange
+    pacing = HistoricalPacingLimiter(max_requests=2, period_secs=0.2)
+
+    # Act
+    start = time.monotonic()
+    for _ in range(3):
+        await pacing.acquire("AAPL")
+        pacing.release()
+    elapsed = time.monotonic() - start
+
+    # Assert
+    assert elapsed >= 0.2
+
+
+@pytest.mark.asyncio
+async def test_pacing_limiter_limits_concurrent_requests(contract, bar_type):
+    # Arrange
+    client = StubHistoricalClient(delay=0.01)
+    scheduler = HistoricDownloadScheduler(pacing=HistoricalPacingLimiter(max_concurrent=2))
+
+    # Act
+    bars = await scheduler.download_bars(
+        client,
+        contract,
+        bar_type,
+        START,
+        START + pd.Timedelta(days=4),
+    )
+
+    # Assert
+    assert len(bars) == 4 * 1440
+    assert len(client.bar_requests) == 4
+    assert client.max_open == 2
+
+
+@pytest.mark.asyncio
+async def test_download_bars_resumes_from_cache(tmp_path, contract, bar_type):
+    # Arrange
+    cache = HistoricalSegmentCache(tmp_path)
+    first_client = StubHistoricalClient()
+    second_client = StubHistoricalClient()
+
+    # Act
+    first = await HistoricDownloadScheduler(cache=cache).download_bars(
+        first_client,
+        contract,
+        bar_type,
+        START,
+        START + pd.Timedelta(days=2),
+    )
+    second = await HistoricDownloadScheduler(cache=cache).download_bars(
+        second_client,
+        contract,
+        bar_type,
+        START + pd.Timedelta(hours=12),
+        START + pd.Timedelta(days=3),
+    )
+
+    # Assert
+    assert len(first) == 2 * 1440
+    assert len(first_client.bar_requests) == 2
+    assert len(second) == int(2.5 * 1440)
+    assert second[0].ts_event == (START + pd.Timedelta(hours=12)).value
+    assert second_client.bar_requests == [(START + pd.Timedelta(days=3), "1 D")]
+
+
+@pytest.mark.asyncio
+async def test_download_bars_does_not_request_cached_empty_segments(tmp_path, contract, bar_type):
+    # Arrange
+    cache = HistoricalSegmentCache(tmp_path)
+    first_client = StubHistoricalClient()
+    second_client = StubHistoricalClient()
+
+    async def get_no_bars(*args, **kwargs) -> list[Bar]:
+        first_client.bar_requests.append((args[3], args[4]))
+        return []  # For example a market holiday
+
+    first_client.get_historical_bars = get_no_bars
+
+    # Act
+    first = await HistoricDownloadScheduler(cache=cache).download_bars(
+        first_client,
+        contract,
+        bar_type,
+        START,
+        START + pd.Timedelta(days=2),
+    )
+    second = await HistoricDownloadScheduler(cache=cache).download_bars(
+        second_client,
+        contract,
+        bar_type,
+        START,
+        START + pd.Timedelta(days=2),
+    )
+
+    # Assert
+    assert first == []
+    assert second == []
+    assert len(first_client.bar_requests) == 2
+    assert second_client.bar_requests == []
+
+
+@pytest.mark.asyncio
+async def test_download_bars_with_segment_length_override(contract, bar_type):
+    # Arrange
+    client = StubHistoricalClient()
+    scheduler = HistoricDownloadScheduler(
+        bar_segment_lengths={BarAggregation.MINUTE: pd.Timedelta(hours=6)},
+    )
+
+    # Act
+    bars = await scheduler.download_bars(
+        client,
+        contract,
+        bar_type,
+        START,
+        START + pd.Timedelta(days=1),
+    )
+
+    # Assert
+    assert len(bars) == 1440
+    assert [duration for _, duration in client.bar_requests] == ["21600 S"] * 4
+
+
+@pytest.mark.asyncio
+async def test_download_ticks_walks_each_segment(contract):
+    # Arrange
+    client = StubHistoricalClient()
+    scheduler = HistoricDownloadScheduler(tick_segment_length=pd.Timedelta(minutes=1))
+
+    # Act
+    ticks = await scheduler.download_ticks(
+        client,
+        contract,
+        "TRADES",
+        START,
+        START + pd.Timedelta(minutes=3),
+    )
+
+    # Assert
+    assert len(ticks) == 180
+    assert len({tick.ts_event for tick in ticks}) == 180
+    assert sorted(client.tick_requests) == [START + pd.Timedelta(minutes=i) for i in range(3)]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_downloads_share_only_matching_requests(contract, bar_type):
+    # Arrange
+    client = StubHistoricalClient(delay=0.01)
+    scheduler = HistoricDownloadScheduler()
+    end = START + pd.Timedelta(days=1)
+
+    # Act
+    results = await asyncio.gather(
+        scheduler.download_bars(client, contract, bar_type, START, end, use_rth=True),
+        scheduler.download_bars(client, contract, bar_type, START, end, use_rth=True),
+        scheduler.download_bars(client, contract, bar_type, START, end, use_rth=False),
+    )
+
+    # Assert
+    assert [len(bars) for bars in results] == [1440] * 3
+    assert len(client.bar_requests) == 2
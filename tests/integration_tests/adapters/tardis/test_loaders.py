@@ -224,3 +224,46 @@ def test_tardis_load_trades(
     assert trades[0].trade_id == TradeId("ccc3c1fa-212c-e8b0-1706-9b9c4f3d5ecf")
     assert trades[0].ts_event == 1583020803145000000
     assert trades[0].ts_init == 1583020803307160000
+
+
+def test_tardis_stream_deltas_matches_load_deltas():
+    # Arrange
+    filepath = ensure_data_exists_tardis_deribit_book_l2()
+    instrument_id = InstrumentId.from_str("BTC-PERPETUAL.DERIBIT")
+    loader = TardisCSVDataLoader(
+        price_precision=1,
+        size_precision=0,
+        instrument_id=instrument_id,
+    )
+
+    # Act
+    chunks = list(loader.stream_deltas(filepath, chunk_size=3_000, limit=10_000))
+    deltas = loader.load_deltas(filepath, limit=10_000)
+
+    # Assert
+    assert all(len(chunk) <= 3_000 for chunk in chunks)
+    assert [delta for chunk in chunks for delta in chunk] == deltas
+
+
+def test_tardis_stream_quotes_matches_load_quotes():
+    # Arrange
+    filepath = ensure_data_exists_tardis_huobi_quotes()
+    loader = TardisCSVDataLoader(price_precision=1, size_precision=0)
+
+    # Act
+    chunks = list(loader.stream_quotes(filepath, chunk_size=3_000, limit=10_000))
+    quotes = loader.load_quotes(filepath, limit=10_000)
+
+    # Assert
+    assert [len(chunk) for chunk in chunks] == [3_000, 3_000, 3_000, 1_000]
+    assert [quote for chunk in chunks for quote in chunk] == quotes
+
+
+def test_tardis_stream_trades_with_invalid_chunk_size_raises():
+    # Arrange
+    filepath = ensure_data_exists_tardis_bitmex_trades()
+    loader = TardisCSVDataLoader()
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        next(loader.stream_trades(filepath, chunk_size=0))
@@ -0,0 +1,406 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+"""
+End-to-end macro benchmarks over deterministic synthetic market data.
+
+The scenarios are opt-in since each one runs a full backtest, enable them with::
+
+    NAUTILUS_MACRO_BENCHMARKS=1 pytest tests/performance_tests/test_perf_backtest_macro.py
+
+Results (events/sec, peak RSS and per-phase timings) are written to
+``.benchmarks/macro_results.json``. To record the current results as the baseline
+set ``NAUTILUS_MACRO_BENCHMARKS_UPDATE_BASELINE=1``, subsequent runs then fail if
+throughput drops more than ``NAUTILUS_MACRO_BENCHMARKS_TOLERANCE`` (default 0.25)
+below ``.benchmarks/macro_baseline.json``. ``NAUTILUS_MACRO_BENCHMARKS_SCALE``
+scales the data volume of every scenario (default 1.0).
+
+"""
+
+import os
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from nautilus_trader.backtest.engine import BacktestEngine
+from nautilus_trader.backtest.engine import BacktestEngineConfig
+from nautilus_trader.backtest.models import LatencyModel
+from nautilus_trader.config import LoggingConfig
+from nautilus_trader.config import StrategyConfig
+from nautilus_trader.examples.strategies.ema_cross import EMACross
+from nautilus_trader.examples.strategies.ema_cross import EMACrossConfig
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.data import OrderBookDeltas
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.enums import AccountType
+from nautilus_trader.model.enums import BookType
+from nautilus_trader.model.enums import OmsType
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Money
+from nautilus_trader.test_kit.performance import MacroBenchmark
+from nautilus_trader.test_kit.performance import MacroBenchmarkBaseline
+from nautilus_trader.test_kit.performance import MacroBenchmarkResult
+from nautilus_trader.test_kit.synthetic import SyntheticMarketGenerator
+from nautilus_trader.trading.strategy import Strategy
+
+
+BENCHMARKS_DIR = Path(".benchmarks")
+RESULTS_PATH = BENCHMARKS_DIR / "macro_results.json"
+BASELINE_PATH = BENCHMARKS_DIR / "macro_baseline.json"
+
+SCALE = float(os.environ.get("NAUTILUS_MACRO_BENCHMARKS_SCALE", "1.0"))
+TOLERANCE = float(os.environ.get("NAUTILUS_MACRO_BENCHMARKS_TOLERANCE", "0.25"))
+UPDATE_BASELINE = os.environ.get("NAUTILUS_MACRO_BENCHMARKS_UPDATE_BASELINE") == "1"
+
+macro_benchmark = pytest.mark.skipif(
+    os.environ.get("NAUTILUS_MACRO_BENCHMARKS") != "1",
+    reason="macro benchmarks are opt-in (set NAUTILUS_MACRO_BENCHMARKS=1)",
+)
+
+SIM = Venue("SIM")
+
+
+def _scaled(count: int) -> int:
+    return max(int(count * SCALE), 1)
+
+
+def _make_engine(
+    book_type: BookType = BookType.L1_MBP,
+    latency_model: LatencyModel | None = None,
+) -> BacktestEngine:
+    config = BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True))
+    engine = BacktestEngine(config=config)
+    engine.add_venue(
+        venue=SIM,
+        oms_type=OmsType.NETTING,
+        account_type=AccountType.MARGIN,
+        base_currency=USD,
+        starting_balances=[Money(1_000_000_000, USD)],
+        book_type=book_type,
+        latency_model=latency_model,
+    )
+    return engine
+
+
+def _report(result: MacroBenchmarkResult) -> None:
+    results = MacroBenchmarkBaseline(RESULTS_PATH)
+    results.record(result)
+    results.save()
+
+    baseline = MacroBenchmarkBaseline(BASELINE_PATH)
+    if UPDATE_BASELINE:
+        baseline.record(result)
+        baseline.save()
+        return
+
+    regression = baseline.check_regression(result, tolerance=TOLERANCE)
+    assert regression is None, regression
+
+
+class RestingOrdersMakerConfig(StrategyConfig, frozen=True):
+    instrument_ids: list[InstrumentId]
+    levels: int = 500
+    requote_interval: int = 10
+
+
+class RestingOrdersMaker(Strategy):
+    """
+    Maintains a deep ladder of resting limit orders on both sides of each market.
+
+    Every `requote_interval` quotes the order furthest from the market on each side
+    is canceled and replaced closest to the market, to generate steady order churn.
+    """
+
+    def __init__(self, config: RestingOrdersMakerConfig) -> None:
+        super().__init__(config)
+        self._quote_counts: dict[InstrumentId, int] = {}
+
+    def on_start(self) -> None:
+        for instrument_id in self.config.instrument_ids:
+            self._quote_counts[instrument_id] = 0
+            self.subscribe_quote_ticks(instrument_id)
+
+    def on_quote_tick(self, tick: QuoteTick) -> None:
+        instrument_id = tick.instrument_id
+        count = self._quote_counts[instrument_id]
+        self._quote_counts[instrument_id] = count + 1
+
+        if count == 0:
+            for level in range(1, self.config.levels + 1):
+                self._submit(tick, OrderSide.BUY, level)
+                self._submit(tick, OrderSide.SELL, level)
+        elif count % self.config.requote_interval == 0:
+            self._requote(tick, OrderSide.BUY)
+            self._requote(tick, OrderSide.SELL)
+
+    def _requote(self, tick: QuoteTick, side: OrderSide) -> None:
+        orders = [
+            o
+            for o in self.cache.orders_open(instrument_id=tick.instrument_id, strategy_id=self.id)
+            if o.side == side
+        ]
+        if not orders:
+            return
+
+        if side == OrderSide.BUY:
+            furthest = min(orders, key=lambda o: o.price)
+        else:
+            furthest = max(orders, key=lambda o: o.price)
+
+        self.cancel_order(furthest)
+        self._submit(tick, side, self.config.levels // 10 + 1)
+
+    def _submit(self, tick: QuoteTick, side: OrderSide, level: int) -> None:
+        instrument = self.cache.instrument(tick.instrument_id)
+        offset = level * 10 * instrument.price_increment.as_double()
+        if side == OrderSide.BUY:
+            price = tick.bid_price.as_double() - offset
+        else:
+            price = tick.ask_price.as_double() + offset
+
+        if price <= 0:
+            return
+
+        order = self.order_factory.limit(
+            instrument_id=tick.instrument_id,
+            order_side=side,
+            quantity=instrument.make_qty(100),
+            price=instrument.make_price(price),
+            post_only=True,
+        )
+        self.submit_order(order)
+
+
+class BookDeltasCounterConfig(StrategyConfig, frozen=True):
+    instrument_ids: list[InstrumentId]
+    book_type: BookType = BookType.L2_MBP
+
+
+class BookDeltasCounter(Strategy):
+    """
+    Subscribes to order book deltas and reads the top of book on every update.
+    """
+
+    def __init__(self, config: BookDeltasCounterConfig) -> None:
+        super().__init__(config)
+        self.updates = 0
+
+    def on_start(self) -> None:
+        for instrument_id in self.config.instrument_ids:
+            self.subscribe_order_book_deltas(instrument_id, book_type=self.config.book_type)
+
+    def on_order_book_deltas(self, deltas: OrderBookDeltas) -> None:
+        book = self.cache.order_book(deltas.instrument_id)
+        if book is not None:
+            book.best_bid_price()
+            book.best_ask_price()
+        self.updates += 1
+
+
+def _run_market_making(
+    name: str,
+    instrument_count: int,
+    quotes: int,
+    levels: int,
+    latency_model: LatencyModel | None = None,
+) -> MacroBenchmarkResult:
+    bench = MacroBenchmark(name)
+
+    with bench.phase("generate"):
+        instruments = SyntheticMarketGenerator.equities(instrument_count)
+        data = SyntheticMarketGenerator(instruments).quote_ticks(quotes)
+
+    with bench.phase("setup"):
+        engine = _make_engine(latency_model=latency_model)
+        for instrument in instruments:
+            engine.add_instrument(instrument)
+        engine.add_data(data)
+        config = RestingOrdersMakerConfig(
+            instrument_ids=[i.id for i in instruments],
+            levels=levels,
+        )
+        engine.add_strategy(RestingOrdersMaker(config=config))
+
+    with bench.phase("run"):
+        engine.run()
+
+    result = engine.get_result()
+
+    with bench.phase("dispose"):
+        engine.dispose()
+
+    return bench.finish(
+        events=result.iterations,
+        total_events=result.total_events,
+        total_orders=result.total_orders,
+    )
+
+
+def test_synthetic_generator_is_deterministic() -> None:
+    # Arrange
+    instruments = SyntheticMarketGenerator.equities(3)
+
+    # Act
+    first = SyntheticMarketGenerator(instruments, seed=7)
+    second = SyntheticMarketGenerator(instruments, seed=7)
+    other = SyntheticMarketGenerator(instruments, seed=8)
+
+    # Assert
+    assert first.quote_ticks(50) == second.quote_ticks(50)
+    assert first.trade_ticks(50) == second.trade_ticks(50)
+    assert first.bars(50) == second.bars(50)
+    assert first.order_book_deltas(50, BookType.L3_MBO) == second.order_book_deltas(
+        50,
+        BookType.L3_MBO,
+    )
+    assert first.quote_ticks(50) != other.quote_ticks(50)
+
+
+def test_synthetic_generator_interleaves_instruments_in_time_order() -> None:
+    # Arrange
+    instruments = SyntheticMarketGenerator.equities(4)
+    generator = SyntheticMarketGenerator(instruments)
+
+    # Act
+    quotes = generator.quote_ticks(10)
+    deltas = generator.order_book_deltas(10, BookType.L2_MBP, depth=5)
+
+    # Assert
+    assert len(quotes) == 40
+    assert [q.instrument_id for q in quotes[:4]] == [i.id for i in instruments]
+    assert quotes == sorted(quotes, key=lambda x: x.ts_init)
+    assert len(deltas) == 4 * (1 + 10 + 10)  # Clear + snapshot + updates per instrument
+    assert deltas == sorted(deltas, key=lambda x: x.ts_init)
+
+
+@macro_benchmark
+def test_macro_market_making_thousands_of_resting_orders() -> None:
+    result = _run_market_making(
+        name="market_making_resting_orders",
+        instrument_count=2,
+        quotes=_scaled(50_000),
+        levels=1_000,
+    )
+
+    _report(result)
+    assert result.extra["total_orders"] >= 4_000
+
+
+@macro_benchmark
+def test_macro_market_making_with_latency_model() -> None:
+    latency_model = LatencyModel(
+        base_latency_nanos=1_000_000,
+        insert_latency_nanos=200_000,
+        update_latency_nanos=200_000,
+        cancel_latency_nanos=200_000,
+    )
+
+    result = _run_market_making(
+        name="market_making_latency_model",
+        instrument_count=2,
+        quotes=_scaled(50_000),
+        levels=1_000,
+        latency_model=latency_model,
+    )
+
+    _report(result)
+    assert result.extra["total_orders"] >= 4_000
+
+
+@macro_benchmark
+def test_macro_multi_instrument_bar_strategies() -> None:
+    bench = MacroBenchmark("multi_instrument_bars")
+
+    with bench.phase("generate"):
+        instruments = SyntheticMarketGenerator.equities(20)
+        generator = SyntheticMarketGenerator(instruments)
+        data = generator.bars(_scaled(10_000))
+
+    with bench.phase("setup"):
+        engine = _make_engine()
+        for instrument in instruments:
+            engine.add_instrument(instrument)
+        engine.add_data(data)
+        for instrument in instruments:
+            config = EMACrossConfig(
+                instrument_id=instrument.id,
+                bar_type=generator.bar_type(instrument),
+                trade_size=Decimal(100),
+                subscribe_trade_ticks=False,
+                order_id_tag=instrument.id.symbol.value,
+            )
+            engine.add_strategy(EMACross(config=config))
+
+    with bench.phase("run"):
+        engine.run()
+
+    result = engine.get_result()
+
+    with bench.phase("dispose"):
+        engine.dispose()
+
+    _report(
+        bench.finish(
+            events=result.iterations,
+            total_events=result.total_events,
+            total_orders=result.total_orders,
+        ),
+    )
+    assert result.iterations == len(data)
+
+
+@pytest.mark.parametrize(
+    ("book_type", "name"),
+    [
+        (BookType.L2_MBP, "book_replay_l2"),
+        (BookType.L3_MBO, "book_replay_l3"),
+    ],
+)
+@macro_benchmark
+def test_macro_order_book_replay(book_type: BookType, name: str) -> None:
+    bench = MacroBenchmark(name)
+
+    with bench.phase("generate"):
+        instruments = SyntheticMarketGenerator.equities(5)
+        data = SyntheticMarketGenerator(instruments).order_book_deltas(
+            _scaled(100_000),
+            book_type=book_type,
+            depth=20,
+        )
+
+    with bench.phase("setup"):
+        engine = _make_engine(book_type=book_type)
+        for instrument in instruments:
+            engine.add_instrument(instrument)
+        engine.add_data(data)
+        config = BookDeltasCounterConfig(
+            instrument_ids=[i.id for i in instruments],
+            book_type=book_type,
+        )
+        strategy = BookDeltasCounter(config=config)
+        engine.add_strategy(strategy)
+
+    with bench.phase("run"):
+        engine.run()
+
+    result = engine.get_result()
+
+    with bench.phase("dispose"):
+        engine.dispose()
+
+    _report(bench.finish(events=result.iterations, book_updates=strategy.updates))
+    assert result.iterations == len(data)
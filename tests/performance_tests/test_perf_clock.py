@@ -18,9 +18,21 @@ from datetime import timedelta
 import pandas as pd
 import pytest
 
+from nautilus_trader.backtest.engine import BacktestEngine
+from nautilus_trader.backtest.engine import BacktestEngineConfig
+from nautilus_trader.common.actor import Actor
 from nautilus_trader.common.component import LiveClock
 from nautilus_trader.common.component import TestClock
+from nautilus_trader.common.config import ActorConfig
 from nautilus_trader.common.events import TimeEvent
+from nautilus_trader.config import LoggingConfig
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.enums import AccountType
+from nautilus_trader.model.enums import OmsType
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Money
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
 
 
 _LIVE_CLOCK = LiveClock()
@@ -71,3 +83,56 @@ def test_iteratively_advance_time(benchmark) -> None:
         _TEST_CLOCK.advance_time(to_time_ns=test_time)
 
     benchmark(_iteratively_advance_time)
+
+
+class _TimerActor(Actor):
+    def __init__(self, config: ActorConfig, timer_count: int) -> None:
+        super().__init__(config)
+        self.timer_count = timer_count
+        self.event_count = 0
+
+    def on_start(self) -> None:
+        for i in range(self.timer_count):
+            self.clock.set_timer(
+                name=f"timer-{i}",
+                interval=timedelta(minutes=i + 1),
+                callback=self._on_timer,
+            )
+
+    def _on_timer(self, event: TimeEvent) -> None:
+        self.event_count += 1
+
+
+@pytest.mark.benchmark(min_rounds=1)
+def test_backtest_advance_time_with_many_clocks(benchmark) -> None:
+    # 1,000 component clocks with 10 timers each (10,000 timers)
+    usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+    engine = BacktestEngine(
+        config=BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True)),
+    )
+    engine.add_venue(
+        venue=Venue("SIM"),
+        oms_type=OmsType.HEDGING,
+        account_type=AccountType.MARGIN,
+        base_currency=USD,
+        starting_balances=[Money(1_000_000, USD)],
+    )
+    engine.add_instrument(usdjpy)
+
+    # One quote per second for ~2.7 hours, so most timestamps have no timer due
+    engine.add_data(
+        [
+            TestDataStubs.quote_tick(usdjpy, ts_event=i * 1_000_000_000, ts_init=i * 1_000_000_000)
+            for i in range(1, 10_001)
+        ],
+    )
+
+    actors = [
+        _TimerActor(ActorConfig(component_id=f"TIMER-{i}"), timer_count=10) for i in range(1_000)
+    ]
+    engine.add_actors(actors)
+
+    benchmark.pedantic(engine.run, rounds=1, iterations=1)
+
+    # Assert
+    assert sum(actor.event_count for actor in actors) > 0
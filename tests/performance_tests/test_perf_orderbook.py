@@ -17,11 +17,15 @@ import pytest
 
 from nautilus_trader import TEST_DATA_DIR
 from nautilus_trader.adapters.databento.loaders import DatabentoDataLoader
+from nautilus_trader.common.component import MessageBus
 from nautilus_trader.common.component import TestClock
 from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.data.config import DataEngineConfig
+from nautilus_trader.data.engine import DataEngine
 from nautilus_trader.model.data import OrderBookDelta
 from nautilus_trader.model.enums import BookType
 from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import RecordFlag
 from nautilus_trader.model.identifiers import StrategyId
 from nautilus_trader.model.identifiers import TraderId
 from nautilus_trader.model.objects import Price
@@ -84,3 +88,41 @@ def test_own_book_audit(benchmark) -> None:
         cache.update_order(order)
 
     benchmark(cache.audit_own_order_books)
+
+
+@pytest.mark.parametrize("buffer_deltas", [False, True])
+def test_data_engine_order_book_delta_throughput(benchmark, buffer_deltas: bool) -> None:
+    clock = TestClock()
+    msgbus = MessageBus(trader_id=TestIdStubs.trader_id(), clock=clock)
+    engine = DataEngine(
+        msgbus=msgbus,
+        cache=TestComponentStubs.cache(),
+        clock=clock,
+        config=DataEngineConfig(buffer_deltas=buffer_deltas),
+    )
+
+    instrument_id = TestIdStubs.audusd_id()
+    received = []
+    msgbus.subscribe(
+        topic=f"data.book.deltas.{instrument_id.venue}.{instrument_id.symbol}",
+        handler=received.append,
+    )
+
+    # Batches of 100 deltas (last delta in each batch has F_LAST)
+    deltas = [
+        TestDataStubs.order_book_delta(
+            instrument_id=instrument_id,
+            flags=RecordFlag.F_LAST if (i + 1) % 100 == 0 else 0,
+            sequence=i,
+        )
+        for i in range(10_000)
+    ]
+
+    def _process_deltas():
+        for delta in deltas:
+            engine.process(delta)
+
+    benchmark(_process_deltas)
+
+    # Assert
+    assert len(received) % (100 if buffer_deltas else 10_000) == 0
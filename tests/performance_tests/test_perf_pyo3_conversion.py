@@ -30,6 +30,11 @@ def test_pyo3_deltas_to_legacy_cython_list(benchmark):
     benchmark(OrderBookDelta.from_pyo3_list, pyo3_deltas)
 
 
+def test_pyo3_deltas_to_legacy_cython_per_object(benchmark):
+    pyo3_deltas = [TestDataProviderPyo3.order_book_delta()] * 10_000
+    benchmark(lambda: [OrderBookDelta.from_pyo3(pyo3_delta) for pyo3_delta in pyo3_deltas])
+
+
 def test_pyo3_quote_to_legacy_cython(benchmark):
     pyo3_quote = TestDataProviderPyo3.quote_tick()
     benchmark(QuoteTick.from_pyo3, pyo3_quote)
@@ -40,6 +45,11 @@ def test_pyo3_quotes_to_legacy_cython_list(benchmark):
     benchmark(QuoteTick.from_pyo3_list, pyo3_quotes)
 
 
+def test_pyo3_quotes_to_legacy_cython_per_object(benchmark):
+    pyo3_quotes = [TestDataProviderPyo3.quote_tick()] * 10_000
+    benchmark(lambda: [QuoteTick.from_pyo3(pyo3_quote) for pyo3_quote in pyo3_quotes])
+
+
 def test_pyo3_trade_to_legacy_cython(benchmark):
     pyo3_trade = TestDataProviderPyo3.trade_tick()
     benchmark(TradeTick.from_pyo3, pyo3_trade)
@@ -50,6 +60,11 @@ def test_pyo3_trades_to_legacy_cython_list(benchmark):
     benchmark(TradeTick.from_pyo3_list, pyo3_trades)
 
 
+def test_pyo3_trades_to_legacy_cython_per_object(benchmark):
+    pyo3_trades = [TestDataProviderPyo3.trade_tick()] * 10_000
+    benchmark(lambda: [TradeTick.from_pyo3(pyo3_trade) for pyo3_trade in pyo3_trades])
+
+
 def test_pyo3_bar_to_legacy_cython(benchmark):
     pyo3_bar = TestDataProviderPyo3.bar_5decimal()
     benchmark(Bar.from_pyo3, pyo3_bar)
@@ -58,3 +73,8 @@ def test_pyo3_bar_to_legacy_cython(benchmark):
 def test_pyo3_bars_to_legacy_cython_list(benchmark):
     pyo3_bars = [TestDataProviderPyo3.bar_5decimal()] * 10_000
     benchmark(Bar.from_pyo3_list, pyo3_bars)
+
+
+def test_pyo3_bars_to_legacy_cython_per_object(benchmark):
+    pyo3_bars = [TestDataProviderPyo3.bar_5decimal()] * 10_000
+    benchmark(lambda: [Bar.from_pyo3(pyo3_bar) for pyo3_bar in pyo3_bars])
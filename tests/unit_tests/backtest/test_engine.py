@@ -142,6 +142,39 @@ class TestBacktestEngine:
         assert self.engine.backtest_end is None
         assert self.engine.iteration == 0  # No exceptions raised
 
+    def test_run_with_uuid_seed_is_reproducible(self):
+        # Arrange
+        config = BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True), uuid_seed=1)
+        run_ids = []
+
+        # Act
+        for _ in range(2):
+            engine = self.create_engine(config)
+            engine.run()
+            run_ids.append(engine.run_id)
+            engine.dispose()
+
+        # Assert
+        assert run_ids[0] == run_ids[1]
+
+    def test_uuid_seed_is_scoped_to_run(self):
+        # Arrange
+        config = BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True), uuid_seed=1)
+        engine = self.create_engine(config)
+        engine.run()
+        first_run_id = engine.run_id
+        after_first_run = UUID4()
+
+        # Act
+        engine.reset()
+        engine.run()
+        after_second_run = UUID4()
+
+        # Assert
+        assert engine.run_id == first_run_id
+        assert after_first_run != after_second_run  # Random generation outside the runs
+        engine.dispose()
+
     def test_clear_actors_with_no_actors(self):
         # Arrange, Act, Assert
         self.engine.clear_actors()
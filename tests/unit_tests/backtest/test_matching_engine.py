@@ -22,6 +22,8 @@ from nautilus_trader.backtest.models import FillModel
 from nautilus_trader.backtest.models import MakerTakerFeeModel
 from nautilus_trader.common.component import MessageBus
 from nautilus_trader.common.component import TestClock
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.data import BarType
 from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.enums import AccountType
 from nautilus_trader.model.enums import BookType
@@ -32,6 +34,7 @@ from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.enums import TimeInForce
 from nautilus_trader.model.events import OrderFilled
 from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
 from nautilus_trader.model.orders import MarketOrder
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.component import TestComponentStubs
@@ -43,6 +46,19 @@ from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
 _ETHUSDT_PERP_BINANCE = TestInstrumentProvider.ethusdt_perp_binance()
 
 
+def _bar(open_price: str, high_price: str, low_price: str, close_price: str, ts: int) -> Bar:
+    return Bar(
+        bar_type=BarType.from_str("ETHUSDT-PERP.BINANCE-1-MINUTE-LAST-EXTERNAL"),
+        open=Price.from_str(open_price),
+        high=Price.from_str(high_price),
+        low=Price.from_str(low_price),
+        close=Price.from_str(close_price),
+        volume=Quantity.from_str("100.000"),
+        ts_event=ts,
+        ts_init=ts,
+    )
+
+
 class TestOrderMatchingEngine:
     def setup(self):
         # Fixture Setup
@@ -156,3 +172,39 @@ class TestOrderMatchingEngine:
         # Assert
         assert self.matching_engine.msgbus.sent_count == 1
         assert isinstance(messages[0], OrderFilled)
+
+    def test_process_bar_with_no_orders_in_range_processes_close_only(self) -> None:
+        # Arrange
+        bar = _bar("1500.00", "1510.00", "1495.00", "1505.00", ts=1)
+
+        # Act
+        self.matching_engine.process_bar(bar)
+
+        # Assert
+        book = self.matching_engine.get_book()
+        assert book.update_count == 1
+        assert book.best_bid_price() == Price.from_str("1505.00")
+        assert book.best_ask_price() == Price.from_str("1505.00")
+
+    def test_process_bar_with_order_in_range_fills_order(self) -> None:
+        # Arrange
+        self.matching_engine.process_bar(_bar("1500.00", "1510.00", "1495.00", "1505.00", ts=1))
+
+        order = TestExecStubs.limit_order(
+            instrument=self.instrument,
+            order_side=OrderSide.BUY,
+            price=Price.from_str("1490.00"),
+            quantity=Quantity.from_str("1.000"),
+        )
+        self.cache.add_order(order)
+        self.matching_engine.process_order(order, self.account_id)
+
+        messages: list[Any] = []
+        self.msgbus.register("ExecEngine.process", messages.append)
+
+        # Act
+        self.matching_engine.process_bar(_bar("1505.00", "1506.00", "1485.00", "1500.00", ts=2))
+
+        # Assert
+        assert any(isinstance(m, OrderFilled) for m in messages)
+        assert self.matching_engine.get_book().best_bid_price() == Price.from_str("1500.00")
@@ -13,11 +13,14 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import pickle
+
 import msgspec
 import pytest
 
 from nautilus_trader.backtest.engine import BacktestEngineConfig
 from nautilus_trader.backtest.node import BacktestNode
+from nautilus_trader.backtest.shared_data import SharedBacktestData
 from nautilus_trader.common.config import InvalidConfiguration
 from nautilus_trader.config import BacktestDataConfig
 from nautilus_trader.config import BacktestRunConfig
@@ -25,9 +28,13 @@ from nautilus_trader.config import BacktestVenueConfig
 from nautilus_trader.config import ImportableStrategyConfig
 from nautilus_trader.config import LoggingConfig
 from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.data import TradeTick
 from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.persistence.catalog.types import CatalogDataResult
 from nautilus_trader.test_kit.mocks.data import load_catalog_with_stub_quote_ticks_audusd
 from nautilus_trader.test_kit.mocks.data import setup_catalog
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
 
 
 class TestBacktestNode:
@@ -157,6 +164,92 @@ class TestBacktestNode:
         assert isinstance(results, list)
         assert len(results) == 1
 
+    def test_shared_data_matches_catalog_data(self, tmp_path):
+        # Arrange
+        config = BacktestRunConfig(
+            engine=BacktestEngineConfig(strategies=self.strategies),
+            venues=[self.venue_config],
+            data=[self.data_config],
+            chunk_size=None,  # No streaming
+        )
+
+        # Act
+        shared = SharedBacktestData.create([config, config], path=tmp_path)
+        shared = pickle.loads(pickle.dumps(shared))  # As passed to a worker process
+        result = shared.load(self.data_config)
+        expected = BacktestNode.load_data_config(self.data_config)
+
+        # Assert
+        assert len(shared.index) == 1
+        assert result.data == expected.data
+        assert result.instrument == expected.instrument
+
+    def test_shared_data_interleaves_groups_in_recorded_order(self, tmp_path):
+        # Arrange
+        audusd = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+        gbpusd = TestInstrumentProvider.default_fx_ccy("GBP/USD")
+        data = [
+            TestDataStubs.trade_tick(audusd, trade_id="1", ts_init=1),
+            TestDataStubs.trade_tick(gbpusd, trade_id="2", ts_init=1),
+            TestDataStubs.trade_tick(gbpusd, trade_id="3", ts_init=2),
+            TestDataStubs.trade_tick(audusd, trade_id="4", ts_init=3),
+        ]
+        result = CatalogDataResult(data_cls=TradeTick, data=data)
+        key = SharedBacktestData.key(self.data_config)
+
+        # Act
+        entry = SharedBacktestData._write_result(tmp_path / key, result)
+        shared = SharedBacktestData(tmp_path, {key: entry})
+        loaded = shared.load(self.data_config)
+
+        # Assert
+        assert len(entry.paths) == 2
+        assert loaded.data == data
+
+    def test_shared_data_temporary_directory_removed_with_creating_instance(self):
+        # Arrange
+        config = BacktestRunConfig(
+            engine=BacktestEngineConfig(strategies=self.strategies),
+            venues=[self.venue_config],
+            data=[self.data_config],
+            chunk_size=None,  # No streaming
+        )
+        shared = SharedBacktestData.create([config])
+        path = shared.path
+
+        # Act
+        copy = pickle.loads(pickle.dumps(shared))  # As passed to a worker process
+        del copy
+        exists_after_copy_collected = path.exists()
+        del shared
+
+        # Assert
+        assert exists_after_copy_collected
+        assert not path.exists()
+
+    def test_run_with_shared_data(self, tmp_path):
+        # Arrange
+        config = BacktestRunConfig(
+            engine=BacktestEngineConfig(
+                strategies=self.strategies,
+                logging=LoggingConfig(bypass_logging=True),
+            ),
+            venues=[self.venue_config],
+            data=[self.data_config],
+            chunk_size=None,  # No streaming
+        )
+        expected = BacktestNode(configs=[config]).run()
+
+        # Act
+        with SharedBacktestData.create([config], path=tmp_path) as shared:
+            results = BacktestNode(configs=[config], shared_data=shared).run()
+
+        # Assert
+        assert len(results) == 1
+        assert results[0].total_events == expected[0].total_events
+        assert results[0].total_orders == expected[0].total_orders
+        assert not tmp_path.exists()
+
     def test_node_config_from_raw(self):
         # Arrange
         raw = msgspec.json.encode(
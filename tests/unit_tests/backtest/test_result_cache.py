@@ -0,0 +1,166 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.backtest.engine import BacktestEngineConfig
+from nautilus_trader.backtest.node import BacktestNode
+from nautilus_trader.backtest.result_cache import BacktestResultCache
+from nautilus_trader.backtest.result_cache import code_fingerprint
+from nautilus_trader.backtest.result_cache import data_fingerprint
+from nautilus_trader.config import BacktestDataConfig
+from nautilus_trader.config import BacktestRunConfig
+from nautilus_trader.config import BacktestVenueConfig
+from nautilus_trader.config import ImportableStrategyConfig
+from nautilus_trader.config import LoggingConfig
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.persistence.catalog.types import CatalogWriteMode
+from nautilus_trader.test_kit.mocks.data import load_catalog_with_stub_quote_ticks_audusd
+from nautilus_trader.test_kit.mocks.data import setup_catalog
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+
+
+class TestBacktestResultCache:
+    def setup(self):
+        self.catalog = setup_catalog(protocol="file", path="./catalog")
+        self.data_config = BacktestDataConfig(
+            catalog_path=self.catalog.path,
+            catalog_fs_protocol=self.catalog.fs_protocol,
+            data_cls=QuoteTick,
+            instrument_id=InstrumentId.from_str("AUD/USD.SIM"),
+        )
+        self.config = BacktestRunConfig(
+            engine=BacktestEngineConfig(
+                strategies=[
+                    ImportableStrategyConfig(
+                        strategy_path="nautilus_trader.examples.strategies.ema_cross:EMACross",
+                        config_path="nautilus_trader.examples.strategies.ema_cross:EMACrossConfig",
+                        config={
+                            "instrument_id": "AUD/USD.SIM",
+                            "bar_type": "AUD/USD.SIM-100-TICK-MID-INTERNAL",
+                            "fast_ema_period": 10,
+                            "slow_ema_period": 20,
+                            "trade_size": "1_000_000",
+                            "order_id_tag": "001",
+                        },
+                    ),
+                ],
+                logging=LoggingConfig(bypass_logging=True),
+            ),
+            venues=[
+                BacktestVenueConfig(
+                    name="SIM",
+                    oms_type="HEDGING",
+                    account_type="MARGIN",
+                    base_currency="USD",
+                    starting_balances=["1000000 USD"],
+                ),
+            ],
+            data=[self.data_config],
+            chunk_size=None,  # No streaming
+        )
+        load_catalog_with_stub_quote_ticks_audusd(self.catalog)  # Load sample data
+
+    def test_data_fingerprint_changes_when_data_added(self):
+        # Arrange
+        before = data_fingerprint(self.data_config)
+
+        # Act
+        self.catalog.write_data(
+            [TestDataStubs.quote_tick(ts_event=1, ts_init=1)],
+            basename_template="extra-{i}",
+            mode=CatalogWriteMode.NEWFILE,
+        )
+
+        # Assert
+        assert data_fingerprint(self.data_config) != before
+
+    def test_run_returns_cached_result_for_unchanged_run(self, tmp_path):
+        # Arrange
+        cache = BacktestResultCache(tmp_path)
+        first = BacktestNode(configs=[self.config], result_cache=cache).run()
+
+        # Act
+        second = BacktestNode(configs=[self.config], result_cache=cache).run()
+
+        # Assert
+        key = cache.key(self.config)
+        assert cache.contains(key)
+        assert second[0].run_id == first[0].run_id
+        assert set(cache.get_reports(key)) == {
+            "orders",
+            "order_fills",
+            "fills",
+            "positions",
+            "account_SIM",
+        }
+
+    def test_run_executes_again_when_data_changes(self, tmp_path):
+        # Arrange
+        cache = BacktestResultCache(tmp_path)
+        first = BacktestNode(configs=[self.config], result_cache=cache).run()
+
+        # Act
+        self.catalog.write_data(
+            [TestDataStubs.quote_tick(ts_event=1, ts_init=1)],
+            basename_template="extra-{i}",
+            mode=CatalogWriteMode.NEWFILE,
+        )
+        second = BacktestNode(configs=[self.config], result_cache=cache).run()
+
+        # Assert
+        assert second[0].run_id != first[0].run_id
+        assert len(list(tmp_path.glob("*.pkl"))) == 2
+
+    def test_get_when_cached_file_corrupt_returns_none(self, tmp_path):
+        # Arrange
+        cache = BacktestResultCache(tmp_path)
+        key = cache.key(self.config)
+        (tmp_path / f"{key}.pkl").write_bytes(b"not a pickle")
+
+        # Act, Assert
+        assert cache.get(key) is None
+        assert cache.get_reports(key) == {}
+
+    def test_code_fingerprint_with_component_in_main_script(self):
+        # Arrange
+        config = self._config_with_strategy_path("__main__:MyStrategy")
+
+        # Act
+        fingerprint = code_fingerprint(config)
+
+        # Assert
+        assert fingerprint is not None
+        assert fingerprint != code_fingerprint(self.config)
+
+    def test_key_when_component_not_importable_returns_none(self, tmp_path):
+        # Arrange
+        cache = BacktestResultCache(tmp_path)
+        config = self._config_with_strategy_path("missing_package.strategies:MyStrategy")
+
+        # Act, Assert
+        assert code_fingerprint(config) is None
+        assert cache.key(config) is None
+
+    def _config_with_strategy_path(self, strategy_path: str) -> BacktestRunConfig:
+        strategy = ImportableStrategyConfig(
+            strategy_path=strategy_path,
+            config_path="nautilus_trader.examples.strategies.ema_cross:EMACrossConfig",
+            config={},
+        )
+        return BacktestRunConfig(
+            engine=BacktestEngineConfig(strategies=[strategy]),
+            venues=self.config.venues,
+            data=self.config.data,
+        )
@@ -17,6 +17,8 @@ from decimal import Decimal
 
 import pytest
 
+from nautilus_trader.cache.cache import Cache
+from nautilus_trader.cache.config import CacheConfig
 from nautilus_trader.core import nautilus_pyo3
 from nautilus_trader.core.rust.model import AggregationSource
 from nautilus_trader.model.currencies import AUD
@@ -28,8 +30,11 @@ from nautilus_trader.model.data import Bar
 from nautilus_trader.model.data import BarType
 from nautilus_trader.model.data import MarkPriceUpdate
 from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.enums import AggressorSide
 from nautilus_trader.model.enums import PriceType
 from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.identifiers import TradeId
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
@@ -978,3 +983,136 @@ class TestCache:
 
         with pytest.raises(ValueError):
             self.cache.set_mark_xrate(USD, EUR, 0.0)
+
+
+class TestCacheColumnarMarketData:
+    def setup(self):
+        # Fixture Setup
+        self.cache = Cache(config=CacheConfig(tick_capacity=100, bar_capacity=100, columnar_market_data=True))
+
+    def test_quote_ticks_rebuilds_ticks_most_recent_first(self):
+        # Arrange
+        ticks = [
+            TestDataStubs.quote_tick(bid_price=1.0 + i / 100, ask_price=1.1 + i / 100, ts_event=i, ts_init=i)
+            for i in range(5)
+        ]
+
+        # Act
+        for tick in ticks:
+            self.cache.add_quote_tick(tick)
+
+        # Assert
+        assert self.cache.quote_ticks(AUDUSD_SIM.id) == list(reversed(ticks))
+        assert self.cache.quote_tick(AUDUSD_SIM.id) is ticks[-1]  # Most recent retained
+        assert self.cache.quote_tick(AUDUSD_SIM.id, index=2) == ticks[2]
+        assert self.cache.quote_tick(AUDUSD_SIM.id, index=2).bid_price == ticks[2].bid_price
+        assert self.cache.quote_tick(AUDUSD_SIM.id, index=5) is None
+        assert self.cache.quote_tick_count(AUDUSD_SIM.id) == 5
+
+    def test_quote_ticks_when_capacity_exceeded_drops_oldest(self):
+        # Arrange
+        ticks = [TestDataStubs.quote_tick(ts_event=i, ts_init=i) for i in range(250)]
+
+        # Act
+        for tick in ticks:
+            self.cache.add_quote_tick(tick)
+
+        # Assert
+        arrays = self.cache.quote_tick_arrays(AUDUSD_SIM.id)
+        assert self.cache.quote_tick_count(AUDUSD_SIM.id) == 100
+        assert self.cache.quote_tick(AUDUSD_SIM.id, index=99).ts_init == 150
+        assert arrays["ts_init"].tolist() == list(range(150, 250))
+
+    def test_quote_tick_arrays_returns_read_only_views(self):
+        # Arrange
+        self.cache.add_quote_tick(TestDataStubs.quote_tick(bid_price=1.0, ask_price=1.1, ts_init=1))
+        self.cache.add_quote_tick(TestDataStubs.quote_tick(bid_price=1.2, ask_price=1.3, ts_init=2))
+
+        # Act
+        arrays = self.cache.quote_tick_arrays(AUDUSD_SIM.id)
+
+        # Assert
+        assert arrays["bid_price"].tolist() == [100_000, 120_000]
+        assert arrays["ask_price"].tolist() == [110_000, 130_000]
+        assert arrays["price_precision"].tolist() == [5, 5]
+        assert arrays["ts_init"].tolist() == [1, 2]
+        with pytest.raises(ValueError):
+            arrays["bid_price"][0] = 0
+
+    def test_trade_ticks_rebuilds_ticks(self):
+        # Arrange
+        ticks = [
+            TestDataStubs.trade_tick(price=1.0 + i / 100, trade_id=f"T-{i}", ts_event=i, ts_init=i)
+            for i in range(3)
+        ]
+
+        # Act
+        self.cache.add_trade_ticks(ticks)
+
+        # Assert
+        arrays = self.cache.trade_tick_arrays(AUDUSD_SIM.id)
+        assert self.cache.trade_ticks(AUDUSD_SIM.id) == list(reversed(ticks))
+        assert self.cache.trade_tick(AUDUSD_SIM.id, index=2).trade_id == ticks[0].trade_id
+        assert self.cache.trade_tick(AUDUSD_SIM.id, index=2).price == ticks[0].price
+        assert arrays["trade_id"].tolist() == [b"T-0", b"T-1", b"T-2"]
+
+    def test_bars_rebuilds_bars(self):
+        # Arrange
+        bar1 = TestDataStubs.bar_5decimal(ts_event=1, ts_init=1)
+        bar2 = TestDataStubs.bar_5decimal(ts_event=2, ts_init=2)
+
+        # Act
+        self.cache.add_bar(bar1)
+        self.cache.add_bar(bar2)
+
+        # Assert
+        arrays = self.cache.bar_arrays(bar1.bar_type)
+        assert self.cache.bars(bar1.bar_type) == [bar2, bar1]
+        assert self.cache.bar(bar1.bar_type, index=1) == bar1
+        assert self.cache.bar(bar1.bar_type, index=1).close == bar1.close
+        assert arrays["close"].tolist() == [100_003, 100_003]
+
+    def test_arrays_preserve_values_and_precision_per_row(self):
+        # Arrange
+        tick1 = TradeTick(
+            instrument_id=AUDUSD_SIM.id,
+            price=Price.from_str("123456789.12"),
+            size=Quantity.from_str("1.000000"),
+            aggressor_side=AggressorSide.BUYER,
+            trade_id=TradeId("T-1"),
+            ts_event=1,
+            ts_init=1,
+        )
+        tick2 = TradeTick(
+            instrument_id=AUDUSD_SIM.id,
+            price=Price.from_str("0.000000001"),
+            size=Quantity.from_str("0.5"),
+            aggressor_side=AggressorSide.SELLER,
+            trade_id=TradeId("T-2"),
+            ts_event=2,
+            ts_init=2,
+        )
+
+        # Act
+        self.cache.add_trade_ticks([tick1, tick2])
+
+        # Assert
+        arrays = self.cache.trade_tick_arrays(AUDUSD_SIM.id)
+        assert self.cache.trade_ticks(AUDUSD_SIM.id) == [tick2, tick1]
+        assert arrays["price"].tolist() == [12345678912, 1]
+        assert arrays["price_precision"].tolist() == [2, 9]
+        assert arrays["size"].tolist() == [1_000_000, 5]
+        assert arrays["size_precision"].tolist() == [6, 1]
+
+    def test_arrays_when_not_columnar_builds_from_objects(self):
+        # Arrange
+        cache = TestComponentStubs.cache()
+        cache.add_quote_tick(TestDataStubs.quote_tick(bid_price=1.0, ts_init=1))
+        cache.add_quote_tick(TestDataStubs.quote_tick(bid_price=1.2, ts_init=2))
+
+        # Act
+        arrays = cache.quote_tick_arrays(AUDUSD_SIM.id)
+
+        # Assert
+        assert arrays["bid_price"].tolist() == [100_000, 120_000]
+        assert cache.trade_tick_arrays(AUDUSD_SIM.id) is None
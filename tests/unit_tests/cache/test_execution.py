@@ -23,6 +23,7 @@ from nautilus_trader.cache.cache import Cache
 from nautilus_trader.common.component import MessageBus
 from nautilus_trader.common.component import TestClock
 from nautilus_trader.config import LoggingConfig
+from nautilus_trader.core.uuid import UUID4
 from nautilus_trader.data.engine import DataEngine
 from nautilus_trader.examples.strategies.ema_cross import EMACross
 from nautilus_trader.examples.strategies.ema_cross import EMACrossConfig
@@ -47,6 +48,7 @@ from nautilus_trader.model.objects import Currency
 from nautilus_trader.model.objects import Money
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
+from nautilus_trader.model.orders import MarketOrder
 from nautilus_trader.model.position import Position
 from nautilus_trader.persistence.wranglers import QuoteTickDataWrangler
 from nautilus_trader.portfolio.portfolio import Portfolio
@@ -612,6 +614,130 @@ class TestCache:
         assert position2.realized_return == pytest.approx(0.1818181818)
         assert position1.realized_pnl == Money(9995.80, USD)
         assert position2.realized_pnl == Money(19995.20, USD)
+        assert [s.realized_pnl for s in snapshots] == [Money(9995.80, USD), Money(19995.20, USD)]
+        assert [s.to_dict()["ts_closed"] for s in snapshots] == [
+            position1.ts_closed,
+            position2.ts_closed,
+        ]
+        assert self.cache.position_snapshot_count(position_id) == 2
+        assert self.cache.position_snapshot_count() == 2
+        assert self.cache.position_snapshots_realized_pnl(position_id) == Money(29991.00, USD)
+
+    def test_snapshot_position_keeps_events_when_position_reopened(self):
+        # Arrange
+        order1 = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+        order2 = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100_000),
+        )
+        order3 = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(50_000),
+        )
+
+        fill1 = TestEventStubs.order_filled(
+            order1,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-1"),
+            last_px=Price.from_str("1.00000"),
+            trade_id=TradeId("1"),
+        )
+        fill2 = TestEventStubs.order_filled(
+            order2,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-1"),
+            last_px=Price.from_str("1.10000"),
+            trade_id=TradeId("2"),
+        )
+        fill3 = TestEventStubs.order_filled(
+            order3,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-1"),
+            last_px=Price.from_str("1.20000"),
+            trade_id=TradeId("3"),
+        )
+
+        position = Position(instrument=AUDUSD_SIM, fill=fill1)
+        position.apply(fill2)
+        self.cache.snapshot_position(position)
+
+        # Act
+        position.apply(fill3)  # Reopens (resets) the netted position
+        [snapshot] = self.cache.position_snapshots(position.id)
+
+        # Assert
+        assert snapshot.events == [fill1, fill2]
+        assert snapshot.trade_ids == [TradeId("1"), TradeId("2")]
+        assert snapshot.client_order_ids == sorted([order1.client_order_id, order2.client_order_id])
+        assert snapshot.event_count == 2
+        assert snapshot.quantity == Quantity.zero(AUDUSD_SIM.size_precision)
+        assert snapshot.peak_qty == Quantity.from_int(100_000)
+        assert snapshot.realized_pnl == Money(9995.80, USD)
+        assert position.events == [fill3]
+
+    def test_snapshot_position_shares_events_across_snapshots_of_same_cycle(self):
+        # Arrange
+        order1 = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+        order2 = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100_000),
+        )
+        order3 = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(50_000),
+        )
+
+        fill1 = TestEventStubs.order_filled(
+            order1,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-1"),
+            last_px=Price.from_str("1.00000"),
+            trade_id=TradeId("1"),
+        )
+        fill2 = TestEventStubs.order_filled(
+            order2,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-1"),
+            last_px=Price.from_str("1.10000"),
+            trade_id=TradeId("2"),
+        )
+        fill3 = TestEventStubs.order_filled(
+            order3,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-1"),
+            last_px=Price.from_str("1.20000"),
+            trade_id=TradeId("3"),
+        )
+
+        # Act
+        position = Position(instrument=AUDUSD_SIM, fill=fill1)
+        self.cache.snapshot_position(position)
+        position.apply(fill2)
+        self.cache.snapshot_position(position)
+        position.apply(fill3)  # Reopens (resets) the netted position
+        self.cache.snapshot_position(position)
+        snapshots = self.cache.position_snapshots(position.id)
+
+        # Assert
+        assert [s.events for s in snapshots] == [[fill1], [fill1, fill2], [fill3]]
+        assert [s.trade_ids for s in snapshots] == [
+            [TradeId("1")],
+            [TradeId("1"), TradeId("2")],
+            [TradeId("3")],
+        ]
+        assert [s.event_count for s in snapshots] == [1, 2, 1]
 
     def test_load_position(self):
         # Arrange
@@ -819,6 +945,56 @@ class TestCache:
         assert self.cache.orders_total_count(side=OrderSide.BUY) == 1
         assert self.cache.orders_total_count(side=OrderSide.SELL) == 0
 
+    def test_orders_open_queries_with_composite_filters(self):
+        # Arrange
+        buy_order = self.strategy.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+        sell_order = self.strategy.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100_000),
+            Price.from_str("1.10000"),
+        )
+        closed_order = self.strategy.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("0.90000"),
+        )
+
+        for order in (buy_order, sell_order, closed_order):
+            self.cache.add_order(order)
+            order.apply(TestEventStubs.order_submitted(order))
+            self.cache.update_order(order)
+            order.apply(TestEventStubs.order_accepted(order))
+            self.cache.update_order(order)
+
+        # Act
+        closed_order.apply(TestEventStubs.order_canceled(closed_order))
+        self.cache.update_order(closed_order)
+
+        # Assert
+        assert self.cache.orders_open(
+            instrument_id=AUDUSD_SIM.id,
+            strategy_id=self.strategy.id,
+            side=OrderSide.BUY,
+        ) == [buy_order]
+        assert self.cache.orders_open(venue=AUDUSD_SIM.id.venue, side=OrderSide.SELL) == [sell_order]
+        assert self.cache.orders_open(venue=Venue("OTHER"), instrument_id=AUDUSD_SIM.id) == []
+        assert self.cache.orders_open(instrument_id=GBPUSD_SIM.id) == []
+        assert self.cache.client_order_ids_open(instrument_id=AUDUSD_SIM.id) == {
+            buy_order.client_order_id,
+            sell_order.client_order_id,
+        }
+        assert self.cache.orders_open_count(strategy_id=self.strategy.id) == 2
+        assert self.cache.orders_open_count(side=OrderSide.BUY) == 1
+        assert self.cache.orders_open_count(instrument_id=AUDUSD_SIM.id, side=OrderSide.SELL) == 1
+        assert closed_order in self.cache.orders_closed(instrument_id=AUDUSD_SIM.id)
+
     def test_update_position_for_open_position(self):
         # Arrange
         order1 = self.strategy.order_factory.market(
@@ -945,6 +1121,114 @@ class TestCache:
         assert order1 in self.cache.orders_for_position(position.id)
         assert order2 in self.cache.orders_for_position(position.id)
 
+    def _add_closed_position(self) -> Position:
+        position_id = PositionId("P-1")
+        order1 = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+        order2 = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100_000),
+        )
+
+        position = None
+        for i, order in enumerate((order1, order2)):
+            self.cache.add_order(order, position_id)
+            order.apply(TestEventStubs.order_submitted(order))
+            self.cache.update_order(order)
+            order.apply(TestEventStubs.order_accepted(order, venue_order_id=VenueOrderId(str(i))))
+            self.cache.update_order(order)
+            fill = TestEventStubs.order_filled(
+                order,
+                instrument=AUDUSD_SIM,
+                position_id=position_id,
+                last_px=Price.from_str("1.00001"),
+            )
+            order.apply(fill)
+            self.cache.update_order(order)
+            if position is None:
+                position = Position(instrument=AUDUSD_SIM, fill=fill)
+                self.cache.add_position(position, OmsType.HEDGING)
+            else:
+                position.apply(fill)
+                self.cache.update_position(position)
+
+        return position
+
+    def test_purge_closed_orders_and_positions_removes_from_all_indexes(self):
+        # Arrange
+        position = self._add_closed_position()
+        client_order_ids = position.client_order_ids
+
+        # Act
+        self.cache.purge_closed_orders(ts_now=1_000_000_000)  # Retained while position cached
+        self.cache.purge_closed_positions(ts_now=1_000_000_000)
+        self.cache.purge_closed_orders(ts_now=1_000_000_000)
+
+        # Assert
+        assert self.cache.orders() == []
+        assert self.cache.orders_closed() == []
+        assert self.cache.orders(instrument_id=AUDUSD_SIM.id, strategy_id=self.strategy.id) == []
+        assert self.cache.positions() == []
+        assert self.cache.positions_closed(strategy_id=self.strategy.id) == []
+        assert self.cache.order(client_order_ids[0]) is None  # No database to reload from
+        assert self.cache.position(position.id) is None
+        assert self.cache.position_id(client_order_ids[0]) is None
+        assert self.cache.client_order_id(VenueOrderId("0")) is None
+        assert self.cache.check_integrity()
+
+    def test_purge_closed_orders_and_positions_respects_buffer_and_keep_count(self):
+        # Arrange
+        position = self._add_closed_position()
+
+        # Act
+        self.cache.purge_closed_orders(ts_now=1_000_000_000, buffer_secs=10)
+        self.cache.purge_closed_positions(ts_now=1_000_000_000, keep_count=1)
+
+        # Assert
+        assert self.cache.orders_closed_count() == 2
+        assert self.cache.positions_closed() == [position]
+
+    def test_purge_order_for_exec_spawn_primary_keeps_open_spawned_orders(self):
+        # Arrange
+        primary = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            exec_algorithm_id=ExecAlgorithmId("SizeStagger"),
+        )
+        spawned = MarketOrder(
+            trader_id=self.trader_id,
+            strategy_id=self.strategy.id,
+            instrument_id=AUDUSD_SIM.id,
+            client_order_id=ClientOrderId(f"{primary.client_order_id.value}-E1"),
+            order_side=OrderSide.BUY,
+            quantity=Quantity.from_int(50_000),
+            init_id=UUID4(),
+            ts_init=0,
+            exec_algorithm_id=primary.exec_algorithm_id,
+            exec_spawn_id=primary.client_order_id,
+        )
+        for i, order in enumerate((primary, spawned)):
+            self.cache.add_order(order)
+            order.apply(TestEventStubs.order_submitted(order))
+            self.cache.update_order(order)
+            order.apply(TestEventStubs.order_accepted(order, venue_order_id=VenueOrderId(str(i))))
+            self.cache.update_order(order)
+
+        primary.apply(TestEventStubs.order_canceled(primary))
+        self.cache.update_order(primary)
+
+        # Act
+        self.cache.purge_order(primary.client_order_id)
+
+        # Assert
+        assert self.cache.order(primary.client_order_id) is None
+        assert self.cache.orders_for_exec_spawn(primary.client_order_id) == [spawned]
+
     def test_positions_queries_with_multiple_open_returns_expected_positions(self):
         # Arrange
         # -- Position 1 --------------------------------------------------------
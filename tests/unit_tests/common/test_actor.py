@@ -33,6 +33,7 @@ from nautilus_trader.core.uuid import UUID4
 from nautilus_trader.data.engine import DataEngine
 from nautilus_trader.data.messages import DataResponse
 from nautilus_trader.execution.engine import ExecutionEngine
+from nautilus_trader.indicators.average.ema import ExponentialMovingAverage
 from nautilus_trader.model.currencies import EUR
 from nautilus_trader.model.currencies import USD
 from nautilus_trader.model.data import Bar
@@ -1209,6 +1210,42 @@ class TestActor:
         # Assert
         assert result == bars
 
+    def test_handle_bars_with_bulk_historical_data(self) -> None:
+        # Arrange
+        actor = MockActor(config=ActorConfig(bulk_historical_data=True))
+        actor.register_base(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+        indicator = ExponentialMovingAverage(2)
+        bar_type = TestDataStubs.bartype_audusd_1min_bid()
+        actor.register_indicator_for_bars(bar_type, indicator)
+
+        indicator_counts: list[int] = []
+        actor.on_historical_data = lambda bar: indicator_counts.append(indicator.count)
+        columns_received: list[tuple] = []
+        actor.on_historical_columns = lambda cls, identifier, columns: columns_received.append(
+            (cls, identifier, columns),
+        )
+
+        actor.start()
+
+        bars = [TestDataStubs.bar_5decimal(), TestDataStubs.bar_5decimal()]
+
+        # Act
+        actor.handle_bars(bars)
+
+        # Assert
+        assert indicator.initialized
+        assert indicator_counts == [2, 2]  # Indicators updated before per-object callbacks
+        assert len(columns_received) == 1
+        data_cls, identifier, columns = columns_received[0]
+        assert data_cls is Bar
+        assert identifier == bar_type
+        assert columns["close"].tolist() == [bar.close.as_double() for bar in bars]
+
     def test_handle_data_when_not_running_does_not_send_to_on_data(self) -> None:
         # Arrange
         actor = MockActor()
@@ -445,6 +445,28 @@ class TestTestClock:
         # Assert
         assert clock.timer_count == 0
 
+    def test_next_event_time_ns_returns_earliest_timer(self):
+        # Arrange
+        clock = TestClock()
+        handler = []
+
+        # Act
+        clock.set_timer_ns("TIMER1", 3_000, 0, 0, handler.append)
+        clock.set_timer_ns("TIMER2", 1_000, 0, 0, handler.append)
+        clock.set_time_alert_ns("ALERT1", 2_000, handler.append)
+
+        # Assert
+        assert clock.next_event_time_ns() == 1_000
+
+    def test_next_event_time_ns_when_no_timers_returns_zero(self):
+        # Arrange
+        clock = TestClock()
+        clock.set_time_alert_ns("ALERT1", 2_000, [].append)
+        clock.advance_time(2_000)
+
+        # Act, Assert
+        assert clock.next_event_time_ns() == 0
+
     def test_set_timer2(self):
         # Arrange
         clock = TestClock()
@@ -0,0 +1,154 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from datetime import timedelta
+
+import pytest
+
+from nautilus_trader.common.component import MessageBus
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.common.profiler import OVERFLOW_NAME
+from nautilus_trader.common.profiler import HotPathProfiler
+from nautilus_trader.common.profiler import LatencyStats
+from nautilus_trader.common.profiler import get_profiler
+from nautilus_trader.common.profiler import is_profiling_enabled
+from nautilus_trader.common.profiler import set_profiling_enabled
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+
+
+class TestHotPathProfiler:
+    def setup(self):
+        # Fixture Setup
+        self.profiler = HotPathProfiler()
+
+    def teardown(self):
+        set_profiling_enabled(False)
+        get_profiler().reset()
+
+    def test_latency_stats_when_empty(self):
+        # Arrange, Act
+        stats = LatencyStats()
+
+        # Assert
+        assert stats.count == 0
+        assert stats.percentile(0.99) == 0
+        assert stats.to_dict()["mean_ns"] == 0
+
+    def test_record_percentiles_within_bucket_error(self):
+        # Arrange, Act
+        for value in range(1, 1001):
+            self.profiler.record("DataEngine", "QuoteTick", value)
+
+        stats = self.profiler.stats("DataEngine", "QuoteTick")
+
+        # Assert
+        assert stats.count == 1000
+        assert stats.total_ns == 500_500
+        assert stats.min_ns == 1
+        assert stats.max_ns == 1000
+        assert 500 <= stats.percentile(0.5) <= 500 * 1.125
+        assert 990 <= stats.percentile(0.99) <= 1000
+        assert stats.percentile(1.0) == 1000
+
+    def test_latency_stats_percentile_with_invalid_quantile_raises(self):
+        # Arrange
+        stats = LatencyStats()
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            stats.percentile(1.5)
+
+    def test_summary_groups_by_component_ordered_by_total_time(self):
+        # Arrange
+        self.profiler.record("DataEngine", "QuoteTick", 100)
+        self.profiler.record("DataEngine", "QuoteTick", 300)
+        self.profiler.record("ExecEngine", "OrderFilled", 1_000)
+
+        # Act
+        summary = self.profiler.summary()
+
+        # Assert
+        assert list(summary) == ["ExecEngine", "DataEngine"]
+        assert summary["DataEngine"]["QuoteTick"]["count"] == 2
+        assert summary["DataEngine"]["QuoteTick"]["total_ns"] == 400
+        assert summary["DataEngine"]["QuoteTick"]["mean_ns"] == 200
+
+    def test_reset_clears_stats(self):
+        # Arrange
+        self.profiler.record("DataEngine", "QuoteTick", 100)
+
+        # Act
+        self.profiler.reset()
+
+        # Assert
+        assert self.profiler.summary() == {}
+        assert self.profiler.stats("DataEngine", "QuoteTick") is None
+
+    def test_record_when_name_limit_reached_aggregates_further_names(self):
+        # Arrange, Act
+        for i in range(300):
+            self.profiler.record("Clock", f"timer-{i}", 10)
+
+        summary = self.profiler.summary()
+
+        # Assert
+        assert len(summary["Clock"]) == 257
+        assert summary["Clock"][OVERFLOW_NAME]["count"] == 44
+        assert self.profiler.stats("Clock", "timer-299") is None
+
+    def test_time_event_handler_when_profiling_records_timer_name(self):
+        # Arrange
+        clock = TestClock()
+        received = []
+        clock.set_timer("test-timer", timedelta(seconds=1), callback=received.append)
+        set_profiling_enabled(True)
+
+        # Act
+        for handler in clock.advance_time(2_000_000_000):
+            handler.handle()
+
+        # Assert
+        assert len(received) == 2
+        stats = next(iter(get_profiler().summary().values()))["test-timer"]
+        assert stats["count"] == 2
+
+    def test_msgbus_publish_when_profiling_records_handler_latency(self):
+        # Arrange
+        msgbus = MessageBus(trader_id=TestIdStubs.trader_id(), clock=TestClock())
+        received = []
+        msgbus.subscribe(topic="events.test", handler=received.append)
+        set_profiling_enabled(True)
+
+        # Act
+        msgbus.publish("events.test", "MSG1")
+        msgbus.publish("events.test", "MSG2")
+
+        # Assert
+        assert is_profiling_enabled()
+        assert received == ["MSG1", "MSG2"]
+        stats = next(iter(get_profiler().summary().values()))["events.test"]
+        assert stats["count"] == 2
+
+    def test_msgbus_publish_when_not_profiling_records_nothing(self):
+        # Arrange
+        msgbus = MessageBus(trader_id=TestIdStubs.trader_id(), clock=TestClock())
+        msgbus.subscribe(topic="events.test", handler=[].append)
+
+        # Act
+        msgbus.publish("events.test", "MSG1")
+
+        # Assert
+        assert not is_profiling_enabled()
+        assert get_profiler().summary() == {}
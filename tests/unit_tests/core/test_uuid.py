@@ -18,6 +18,8 @@ import pickle
 import pytest
 
 from nautilus_trader.core.uuid import UUID4
+from nautilus_trader.core.uuid import clear_uuid4_seed
+from nautilus_trader.core.uuid import set_uuid4_seed
 
 
 class TestUUID:
@@ -85,3 +87,30 @@ class TestUUID:
         assert isinstance(result, UUID4)
         assert len(str(result)) == 36
         assert len(str(result).replace("-", "")) == 32
+
+    def test_uuid4_when_seeded_produces_reproducible_sequence(self):
+        # Arrange
+        set_uuid4_seed(42)
+        first = [UUID4() for _ in range(3)]
+
+        # Act
+        set_uuid4_seed(42)
+        second = [UUID4() for _ in range(3)]
+        clear_uuid4_seed()
+
+        # Assert
+        assert first == second
+        assert len(set(first)) == 3
+        assert all(UUID4.from_str(uuid.value) == uuid for uuid in first)  # Valid v4
+
+    def test_uuid4_after_clear_seed_is_random(self):
+        # Arrange
+        set_uuid4_seed(42)
+        seeded = UUID4()
+
+        # Act
+        clear_uuid4_seed()
+        result = UUID4()
+
+        # Assert
+        assert result != seeded
@@ -2413,6 +2413,186 @@ class TestDataEngine:
         assert len(handler) == 1
         assert handler[0].data == [bar]
 
+    def test_request_bars_when_multiple_catalogs_registered_merges_on_ts_init(self, tmp_path):
+        # Arrange
+        bar_spec = BarSpecification(1000, BarAggregation.TICK, PriceType.MID)
+        bar_type = BarType(ETHUSDT_BINANCE.id, bar_spec)
+        bars = [
+            Bar(
+                bar_type,
+                Price.from_str("1051.00000"),
+                Price.from_str("1055.00000"),
+                Price.from_str("1050.00000"),
+                Price.from_str("1052.00000"),
+                Quantity.from_int(100),
+                i,
+                i,
+            )
+            for i in range(4)
+        ]
+        catalog1 = setup_catalog(protocol="file", path=tmp_path / "catalog1")
+        catalog1.write_data([bars[0], bars[2]])
+        catalog2 = setup_catalog(protocol="file", path=tmp_path / "catalog2")
+        catalog2.write_data([bars[1], bars[2], bars[3]])  # bars[2] is duplicated
+
+        msgbus = MessageBus(
+            trader_id=self.trader_id,
+            clock=self.clock,
+        )
+        data_engine = DataEngine(
+            msgbus=msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            config=DataEngineConfig(catalog_max_workers=2),
+        )
+        data_engine.register_catalog(catalog1, name="catalog1")
+        data_engine.register_catalog(catalog2, name="catalog2")
+        self.clock.advance_time(10)
+
+        handler = []
+        request = RequestBars(
+            bar_type=bar_type,
+            start=None,
+            end=None,
+            limit=0,
+            client_id=None,
+            venue=bar_type.instrument_id.venue,
+            callback=handler.append,
+            request_id=UUID4(),
+            ts_init=self.clock.timestamp_ns(),
+            params={"update_catalog_mode": None},
+        )
+
+        # Act
+        msgbus.request(endpoint="DataEngine.request", request=request)
+
+        # Assert
+        assert len(handler) == 1
+        assert handler[0].data == bars
+
+    def test_request_bars_with_catalog_read_ahead_serves_next_window_from_cache(self):
+        # Arrange
+        catalog = setup_catalog(protocol="file")
+        bar_spec = BarSpecification(1000, BarAggregation.TICK, PriceType.MID)
+        bar_type = BarType(ETHUSDT_BINANCE.id, bar_spec)
+        bars = [
+            Bar(
+                bar_type,
+                Price.from_str("1051.00000"),
+                Price.from_str("1055.00000"),
+                Price.from_str("1050.00000"),
+                Price.from_str("1052.00000"),
+                Quantity.from_int(100),
+                i * 1_000,
+                i * 1_000,
+            )
+            for i in range(1, 11)
+        ]
+        catalog.write_data(bars)
+
+        msgbus = MessageBus(
+            trader_id=self.trader_id,
+            clock=self.clock,
+        )
+        data_engine = DataEngine(
+            msgbus=msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            config=DataEngineConfig(catalog_read_ahead=True),
+        )
+        data_engine.register_catalog(catalog)
+        self.clock.advance_time(20_000)
+
+        handler = []
+
+        def request_window(start: int, end: int) -> None:
+            msgbus.request(
+                endpoint="DataEngine.request",
+                request=RequestBars(
+                    bar_type=bar_type,
+                    start=pd.Timestamp(start, tz="UTC"),
+                    end=pd.Timestamp(end, tz="UTC"),
+                    limit=0,
+                    client_id=None,
+                    venue=bar_type.instrument_id.venue,
+                    callback=handler.append,
+                    request_id=UUID4(),
+                    ts_init=self.clock.timestamp_ns(),
+                    params={"update_catalog_mode": None},
+                ),
+            )
+
+        # Act
+        request_window(1_000, 5_000)
+        request_window(5_000, 9_000)
+
+        # Assert
+        assert len(handler) == 2
+        assert handler[0].data == bars[:5]
+        assert handler[1].data == bars[4:9]
+        assert data_engine._catalog_read_ahead_cache.hits == 1
+
+    def test_register_catalog_clears_catalog_read_ahead_cache(self):
+        # Arrange
+        catalog = setup_catalog(protocol="file")
+        bar_spec = BarSpecification(1000, BarAggregation.TICK, PriceType.MID)
+        bar_type = BarType(ETHUSDT_BINANCE.id, bar_spec)
+        bars = [
+            Bar(
+                bar_type,
+                Price.from_str("1051.00000"),
+                Price.from_str("1055.00000"),
+                Price.from_str("1050.00000"),
+                Price.from_str("1052.00000"),
+                Quantity.from_int(100),
+                i * 1_000,
+                i * 1_000,
+            )
+            for i in range(1, 11)
+        ]
+        catalog.write_data(bars)
+
+        msgbus = MessageBus(
+            trader_id=self.trader_id,
+            clock=self.clock,
+        )
+        data_engine = DataEngine(
+            msgbus=msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            config=DataEngineConfig(catalog_read_ahead=True),
+        )
+        data_engine.register_catalog(catalog)
+        self.clock.advance_time(20_000)
+
+        handler = []
+
+        def request_window(start: int, end: int) -> None:
+            msgbus.request(
+                endpoint="DataEngine.request",
+                request=RequestBars(
+                    bar_type=bar_type,
+                    start=pd.Timestamp(start, tz="UTC"),
+                    end=pd.Timestamp(end, tz="UTC"),
+                    limit=0,
+                    client_id=None,
+                    venue=bar_type.instrument_id.venue,
+                    callback=handler.append,
+                    request_id=UUID4(),
+                    ts_init=self.clock.timestamp_ns(),
+                    params={"update_catalog_mode": None},
+                ),
+            )
+
+        # Act
+        request_window(1_000, 5_000)
+        data_engine.register_catalog(catalog, name="catalog_1")
+        request_window(5_000, 9_000)
+
+        # Assert
+        assert len(handler) == 2
+        assert data_engine._catalog_read_ahead_cache.hits == 0
+
     def test_request_bars_when_catalog_and_client_registered(self):
         # Arrange
         catalog = setup_catalog(protocol="file")
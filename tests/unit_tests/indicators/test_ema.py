@@ -17,7 +17,9 @@
 import pytest
 
 from nautilus_trader.indicators.average.ema import ExponentialMovingAverage
+from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.enums import PriceType
+from nautilus_trader.test_kit.providers import TestDataGenerator
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.data import TestDataStubs
 
@@ -108,6 +110,66 @@ class TestExponentialMovingAverage:
         assert indicator.has_inputs
         assert indicator.value == 1.00003
 
+    def test_handle_bars_matches_handling_each_bar(self):
+        # Arrange
+        bars = TestDataGenerator.generate_monotonic_bars(
+            instrument=TestInstrumentProvider.default_fx_ccy("AUD/USD"),
+            first_bar=TestDataStubs.bar_5decimal(),
+            bar_count=100,
+        )
+        expected = ExponentialMovingAverage(10)
+        for bar in bars:
+            expected.handle_bar(bar)
+
+        # Act
+        self.ema.handle_bars(bars)
+
+        # Assert
+        assert self.ema.initialized
+        assert self.ema.count == expected.count
+        assert self.ema.value == expected.value
+
+    def test_handle_bars_uses_handle_bar_overridden_by_subclass(self):
+        # Arrange
+        class OpenPriceEMA(ExponentialMovingAverage):
+            def handle_bar(self, bar):
+                self.update_raw(bar.open.as_double())
+
+        bars = TestDataGenerator.generate_monotonic_bars(
+            instrument=TestInstrumentProvider.default_fx_ccy("AUD/USD"),
+            first_bar=TestDataStubs.bar_5decimal(),
+            bar_count=20,
+        )
+        indicator = OpenPriceEMA(10)
+        expected = OpenPriceEMA(10)
+        for bar in bars:
+            expected.handle_bar(bar)
+
+        # Act
+        indicator.handle_bars(bars)
+
+        # Assert
+        assert indicator.count == expected.count
+        assert indicator.value == expected.value
+
+    def test_handle_quote_ticks_with_columns_matches_handling_each_tick(self):
+        # Arrange
+        indicator = ExponentialMovingAverage(10, PriceType.MID)
+        expected = ExponentialMovingAverage(10, PriceType.MID)
+        ticks = [
+            TestDataStubs.quote_tick(bid_price=1.0 + i * 0.0001, ask_price=1.0002 + i * 0.0001)
+            for i in range(20)
+        ]
+        for tick in ticks:
+            expected.handle_quote_tick(tick)
+
+        # Act
+        indicator.handle_quote_ticks(ticks, QuoteTick.to_columns(ticks))
+
+        # Assert
+        assert indicator.count == 20
+        assert indicator.value == pytest.approx(expected.value)
+
     def test_value_with_one_input_returns_expected_value(self):
         # Arrange
         self.ema.update_raw(1.00000)
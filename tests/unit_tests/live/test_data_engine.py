@@ -97,6 +97,7 @@ class TestLiveDataEngine:
         # Arrange
         self.msgbus.deregister(endpoint="DataEngine.execute", handler=self.engine.execute)
         self.msgbus.deregister(endpoint="DataEngine.process", handler=self.engine.process)
+        self.msgbus.deregister(endpoint="DataEngine.process_batch", handler=self.engine.process_batch)
         self.msgbus.deregister(endpoint="DataEngine.request", handler=self.engine.request)
         self.msgbus.deregister(endpoint="DataEngine.response", handler=self.engine.response)
 
@@ -129,6 +130,7 @@ class TestLiveDataEngine:
         # Arrange
         self.msgbus.deregister(endpoint="DataEngine.execute", handler=self.engine.execute)
         self.msgbus.deregister(endpoint="DataEngine.process", handler=self.engine.process)
+        self.msgbus.deregister(endpoint="DataEngine.process_batch", handler=self.engine.process_batch)
         self.msgbus.deregister(endpoint="DataEngine.request", handler=self.engine.request)
         self.msgbus.deregister(endpoint="DataEngine.response", handler=self.engine.response)
 
@@ -167,6 +169,7 @@ class TestLiveDataEngine:
         # Arrange
         self.msgbus.deregister(endpoint="DataEngine.execute", handler=self.engine.execute)
         self.msgbus.deregister(endpoint="DataEngine.process", handler=self.engine.process)
+        self.msgbus.deregister(endpoint="DataEngine.process_batch", handler=self.engine.process_batch)
         self.msgbus.deregister(endpoint="DataEngine.request", handler=self.engine.request)
         self.msgbus.deregister(endpoint="DataEngine.response", handler=self.engine.response)
 
@@ -201,6 +204,7 @@ class TestLiveDataEngine:
         # Arrange
         self.msgbus.deregister(endpoint="DataEngine.execute", handler=self.engine.execute)
         self.msgbus.deregister(endpoint="DataEngine.process", handler=self.engine.process)
+        self.msgbus.deregister(endpoint="DataEngine.process_batch", handler=self.engine.process_batch)
         self.msgbus.deregister(endpoint="DataEngine.request", handler=self.engine.request)
         self.msgbus.deregister(endpoint="DataEngine.response", handler=self.engine.response)
 
@@ -345,3 +349,129 @@ class TestLiveDataEngine:
 
         # Tear Down
         self.engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_process_batch_processes_data(self):
+        # Arrange
+        self.engine.start()
+
+        ticks = [TestDataStubs.trade_tick(), TestDataStubs.trade_tick()]
+
+        # Act
+        self.msgbus.send(endpoint="DataEngine.process_batch", msg=ticks)
+
+        # Assert
+        await eventually(lambda: self.engine.data_qsize() == 0)
+        await eventually(lambda: self.engine.data_count == 2)
+
+        # Tear Down
+        self.engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_process_with_conflation_keeps_latest_quote_when_backed_up(self):
+        # Arrange
+        self.msgbus.deregister(endpoint="DataEngine.execute", handler=self.engine.execute)
+        self.msgbus.deregister(endpoint="DataEngine.process", handler=self.engine.process)
+        self.msgbus.deregister(endpoint="DataEngine.process_batch", handler=self.engine.process_batch)
+        self.msgbus.deregister(endpoint="DataEngine.request", handler=self.engine.request)
+        self.msgbus.deregister(endpoint="DataEngine.response", handler=self.engine.response)
+
+        self.engine = LiveDataEngine(
+            loop=self.loop,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            config=LiveDataEngineConfig(conflate_prices=True, conflation_threshold=1),
+        )
+
+        trade = TestDataStubs.trade_tick()
+        quotes = [TestDataStubs.quote_tick(bid_price=1.0 + i / 10, ts_init=i) for i in range(3)]
+
+        # Act
+        self.engine.process(trade)  # Queue now at the threshold
+        for quote in quotes:
+            self.engine.process(quote)
+
+        self.engine.start()
+
+        # Assert
+        await eventually(lambda: self.engine.data_count == 2)
+        assert self.engine.conflated_count() == 2
+        assert self.engine.conflated_counts() == {"QuoteTick": 2}
+        assert self.cache.quote_tick(quotes[-1].instrument_id) == quotes[-1]
+        assert self.cache.trade_tick(trade.instrument_id) == trade
+
+        # Tear Down
+        self.engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_process_with_conflation_keeps_latest_quote_in_queue_order(self):
+        # Arrange
+        self.msgbus.deregister(endpoint="DataEngine.execute", handler=self.engine.execute)
+        self.msgbus.deregister(endpoint="DataEngine.process", handler=self.engine.process)
+        self.msgbus.deregister(endpoint="DataEngine.process_batch", handler=self.engine.process_batch)
+        self.msgbus.deregister(endpoint="DataEngine.request", handler=self.engine.request)
+        self.msgbus.deregister(endpoint="DataEngine.response", handler=self.engine.response)
+
+        self.engine = LiveDataEngine(
+            loop=self.loop,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            config=LiveDataEngineConfig(conflate_prices=True, conflation_threshold=1),
+        )
+
+        received = []
+        self.msgbus.subscribe(topic="data.*", handler=received.append)
+
+        trade1 = TestDataStubs.trade_tick(trade_id="1", ts_init=0)
+        quote1 = TestDataStubs.quote_tick(bid_price=1.0, ts_init=1)
+        trade2 = TestDataStubs.trade_tick(trade_id="2", ts_init=2)
+        quote2 = TestDataStubs.quote_tick(bid_price=1.1, ts_init=3)
+
+        # Act
+        for data in (trade1, quote1, trade2, quote2):
+            self.engine.process(data)
+
+        self.engine.start()
+
+        # Assert
+        await eventually(lambda: self.engine.data_count == 3)
+        assert received == [trade1, trade2, quote2]
+        assert self.engine.conflated_counts() == {"QuoteTick": 1}
+
+        # Tear Down
+        self.engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_reset_clears_conflation_state(self):
+        # Arrange
+        self.msgbus.deregister(endpoint="DataEngine.execute", handler=self.engine.execute)
+        self.msgbus.deregister(endpoint="DataEngine.process", handler=self.engine.process)
+        self.msgbus.deregister(endpoint="DataEngine.process_batch", handler=self.engine.process_batch)
+        self.msgbus.deregister(endpoint="DataEngine.request", handler=self.engine.request)
+        self.msgbus.deregister(endpoint="DataEngine.response", handler=self.engine.response)
+
+        self.engine = LiveDataEngine(
+            loop=self.loop,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            config=LiveDataEngineConfig(conflate_prices=True, conflation_threshold=1),
+        )
+
+        self.engine.start()
+        self.engine.process(TestDataStubs.trade_tick())
+        for i in range(3):
+            self.engine.process(TestDataStubs.quote_tick(bid_price=1.0 + i / 10, ts_init=i))
+
+        await eventually(lambda: self.engine.data_count == 2)
+        self.engine.stop()
+        await eventually(lambda: self.engine.data_qsize() == 0)
+
+        # Act
+        self.engine.reset()
+
+        # Assert
+        assert self.engine.conflated_count() == 0
+        assert self.engine.conflated_counts() == {}
@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 import asyncio
+import threading
 from unittest.mock import MagicMock
 
 import pytest
@@ -101,3 +102,163 @@ async def test_enqueue_when_queue_is_full(event_loop, clock, logger):
 
     # Assert: check queue is still size=1
     assert queue.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_enqueue_from_other_thread_hands_off_batch(event_loop, clock, logger):
+    # Arrange
+    queue = asyncio.Queue(maxsize=10)
+    enqueuer = ThrottledEnqueuer(
+        qname="test_queue",
+        queue=queue,
+        loop=event_loop,
+        clock=clock,
+        logger=logger,
+    )
+
+    def _produce():
+        for i in range(3):
+            enqueuer.enqueue(f"message{i}")
+
+    # Act
+    thread = threading.Thread(target=_produce)
+    thread.start()
+    thread.join()
+
+    pending = enqueuer.pending
+    await asyncio.sleep(0)  # allow the loop to run the scheduled handoff
+
+    # Assert
+    assert pending == 3
+    assert enqueuer.pending == 0
+    assert [queue.get_nowait() for _ in range(3)] == ["message0", "message1", "message2"]
+
+
+def test_enqueue_from_other_thread_when_handoff_fails_allows_retry(clock, logger):
+    # Arrange
+    loop = asyncio.new_event_loop()
+    queue = asyncio.Queue(maxsize=10)
+    enqueuer = ThrottledEnqueuer(
+        qname="test_queue",
+        queue=queue,
+        loop=loop,
+        clock=clock,
+        logger=logger,
+    )
+    loop.close()
+
+    # Act
+    with pytest.raises(RuntimeError):
+        enqueuer.enqueue("message0")
+    with pytest.raises(RuntimeError):
+        enqueuer.enqueue("message1")  # Handoff scheduled again (not assumed pending)
+
+    # Assert
+    assert enqueuer.pending == 2
+
+
+@pytest.mark.asyncio
+async def test_enqueue_batch_preserves_order(event_loop, clock, logger):
+    # Arrange
+    queue = asyncio.Queue(maxsize=10)
+    enqueuer = ThrottledEnqueuer(
+        qname="test_queue",
+        queue=queue,
+        loop=event_loop,
+        clock=clock,
+        logger=logger,
+    )
+
+    # Act
+    enqueuer.enqueue_batch([])
+    enqueuer.enqueue_batch(["message0", "message1", "message2"])
+
+    # Assert
+    assert [queue.get_nowait() for _ in range(3)] == ["message0", "message1", "message2"]
+    assert queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_enqueue_batch_from_other_thread_hands_off_batch(event_loop, clock, logger):
+    # Arrange
+    queue = asyncio.Queue(maxsize=10)
+    enqueuer = ThrottledEnqueuer(
+        qname="test_queue",
+        queue=queue,
+        loop=event_loop,
+        clock=clock,
+        logger=logger,
+    )
+
+    # Act
+    thread = threading.Thread(
+        target=enqueuer.enqueue_batch,
+        args=(["message0", "message1", "message2"],),
+    )
+    thread.start()
+    thread.join()
+
+    pending = enqueuer.pending
+    await asyncio.sleep(0)  # allow the loop to run the scheduled handoff
+
+    # Assert
+    assert pending == 3
+    assert enqueuer.pending == 0
+    assert [queue.get_nowait() for _ in range(3)] == ["message0", "message1", "message2"]
+
+
+@pytest.mark.asyncio
+async def test_get_batch_drains_available_messages_up_to_budget(event_loop, clock, logger):
+    # Arrange
+    queue = asyncio.Queue(maxsize=10)
+    enqueuer = ThrottledEnqueuer(
+        qname="test_queue",
+        queue=queue,
+        loop=event_loop,
+        clock=clock,
+        logger=logger,
+    )
+
+    for i in range(5):
+        enqueuer.enqueue(f"message{i}")
+
+    # Act
+    batch1 = await enqueuer.get_batch(budget=3)
+    batch2 = await enqueuer.get_batch(budget=3)
+
+    # Assert
+    assert batch1 == ["message0", "message1", "message2"]
+    assert batch2 == ["message3", "message4"]
+    assert enqueuer.metrics() == {
+        "size": 0,
+        "capacity": 10,
+        "pending": 0,
+        "batches": 2,
+        "messages": 5,
+        "last_batch_size": 2,
+        "max_batch_size": 3,
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_batch_stops_at_sentinel(event_loop, clock, logger):
+    # Arrange
+    queue = asyncio.Queue(maxsize=10)
+    enqueuer = ThrottledEnqueuer(
+        qname="test_queue",
+        queue=queue,
+        loop=event_loop,
+        clock=clock,
+        logger=logger,
+    )
+
+    enqueuer.enqueue("message1")
+    queue.put_nowait(None)
+    enqueuer.enqueue("message2")
+
+    # Act
+    batch = await enqueuer.get_batch(budget=10)
+
+    # Assert
+    assert batch == ["message1", None]
+    assert queue.qsize() == 1
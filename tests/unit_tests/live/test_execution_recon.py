@@ -543,3 +543,118 @@ class TestLiveExecutionReconciliation:
         assert order.last_trade_id == TradeId("1")
         assert order.quantity == Quantity.from_int(10_000)
         assert order.filled_qty == Quantity.from_int(5_000)
+
+    @pytest.mark.asyncio()
+    async def test_reconcile_state_with_watermark_skips_only_unchanged_reports_at_checkpoint(self):
+        # Arrange
+        self.exec_engine.reconciliation_watermark = True
+
+        def make_report(order_status: OrderStatus, ts_last: int) -> OrderStatusReport:
+            return OrderStatusReport(
+                account_id=self.account_id,
+                instrument_id=AUDUSD_SIM.id,
+                client_order_id=ClientOrderId("O-123456"),
+                venue_order_id=VenueOrderId("1"),
+                order_side=OrderSide.BUY,
+                order_type=OrderType.LIMIT,
+                time_in_force=TimeInForce.GTC,
+                order_status=order_status,
+                price=Price.from_str("1.00000"),
+                quantity=Quantity.from_int(10_000),
+                filled_qty=Quantity.from_int(0),
+                post_only=True,
+                report_id=UUID4(),
+                ts_accepted=1_000,
+                ts_last=ts_last,
+                ts_init=0,
+            )
+
+        self.client.add_order_status_report(make_report(OrderStatus.ACCEPTED, 1_000))
+        await self.exec_engine.reconcile_state()
+
+        # Act
+        self.client.add_order_status_report(make_report(OrderStatus.ACCEPTED, 1_000))
+        result1 = await self.exec_engine.reconcile_state()
+        status1 = self.cache.orders()[0].status
+
+        # Same timestamp as the checkpoint, but a changed status
+        self.client.add_order_status_report(make_report(OrderStatus.CANCELED, 1_000))
+        result2 = await self.exec_engine.reconcile_state()
+        status2 = self.cache.orders()[0].status
+
+        # Assert
+        assert result1
+        assert result2
+        assert status1 == OrderStatus.ACCEPTED
+        assert status2 == OrderStatus.CANCELED
+        assert self.cache.get(f"reconciliation_watermark:{self.client.id}") == b"1000"
+
+    @pytest.mark.asyncio()
+    async def test_reconcile_state_reconciles_each_instrument(self):
+        # Arrange
+        self.cache.add_instrument(GBPUSD_SIM)
+        for i, instrument in enumerate((AUDUSD_SIM, GBPUSD_SIM, AUDUSD_SIM)):
+            report = OrderStatusReport(
+                account_id=self.account_id,
+                instrument_id=instrument.id,
+                client_order_id=ClientOrderId(f"O-{i}"),
+                venue_order_id=VenueOrderId(str(i)),
+                order_side=OrderSide.BUY,
+                order_type=OrderType.LIMIT,
+                time_in_force=TimeInForce.GTC,
+                order_status=OrderStatus.ACCEPTED,
+                price=Price.from_str("1.00000"),
+                quantity=Quantity.from_int(10_000),
+                filled_qty=Quantity.from_int(0),
+                post_only=True,
+                report_id=UUID4(),
+                ts_accepted=1_000,
+                ts_last=1_000,
+                ts_init=0,
+            )
+            self.client.add_order_status_report(report)
+
+        # Act
+        result = await self.exec_engine.reconcile_state()
+
+        # Assert
+        assert result
+        assert len(self.cache.orders_open(instrument_id=AUDUSD_SIM.id)) == 2
+        assert len(self.cache.orders_open(instrument_id=GBPUSD_SIM.id)) == 1
+
+    @pytest.mark.asyncio()
+    async def test_reconcile_state_with_watermark_does_not_modify_skipped_reports(self):
+        # Arrange
+        self.exec_engine.reconciliation_watermark = True
+
+        def make_report(client_order_id: ClientOrderId | None) -> OrderStatusReport:
+            return OrderStatusReport(
+                account_id=self.account_id,
+                instrument_id=AUDUSD_SIM.id,
+                client_order_id=client_order_id,
+                venue_order_id=VenueOrderId("1"),
+                order_side=OrderSide.BUY,
+                order_type=OrderType.LIMIT,
+                time_in_force=TimeInForce.GTC,
+                order_status=OrderStatus.ACCEPTED,
+                price=Price.from_str("1.00000"),
+                quantity=Quantity.from_int(10_000),
+                filled_qty=Quantity.from_int(0),
+                post_only=True,
+                report_id=UUID4(),
+                ts_accepted=1_000,
+                ts_last=1_000,
+                ts_init=0,
+            )
+
+        self.client.add_order_status_report(make_report(ClientOrderId("O-123456")))
+        await self.exec_engine.reconcile_state()
+
+        # Act
+        report = make_report(None)
+        self.client.add_order_status_report(report)
+        result = await self.exec_engine.reconcile_state()
+
+        # Assert
+        assert result
+        assert report.client_order_id is None
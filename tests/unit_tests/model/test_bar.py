@@ -695,6 +695,31 @@ class TestBar:
         assert pyo3_bar.ts_event == 1
         assert pyo3_bar.ts_init == 2
 
+    def test_to_columns(self):
+        # Arrange
+        bar = Bar(
+            AUDUSD_1_MIN_BID,
+            Price.from_str("1.00001"),
+            Price.from_str("1.00004"),
+            Price.from_str("1.00000"),
+            Price.from_str("1.00002"),
+            Quantity.from_int(100_000),
+            1,
+            2,
+        )
+
+        # Act
+        columns = Bar.to_columns([bar, bar])
+
+        # Assert
+        assert columns["open"].tolist() == [1.00001, 1.00001]
+        assert columns["high"].tolist() == [1.00004, 1.00004]
+        assert columns["low"].tolist() == [1.0, 1.0]
+        assert columns["close"].tolist() == [1.00002, 1.00002]
+        assert columns["volume"].tolist() == [100_000.0, 100_000.0]
+        assert columns["ts_event"].tolist() == [1, 1]
+        assert columns["ts_init"].tolist() == [2, 2]
+
     def test_from_pyo3_list(self):
         # Arrange
         pyo3_bars = [TestDataProviderPyo3.bar_5decimal()] * 1024
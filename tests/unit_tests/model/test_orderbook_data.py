@@ -23,6 +23,7 @@ from nautilus_trader.model.data import NULL_ORDER
 from nautilus_trader.model.data import BookOrder
 from nautilus_trader.model.data import OrderBookDelta
 from nautilus_trader.model.data import OrderBookDeltas
+from nautilus_trader.model.data import OrderBookDeltasBuffer
 from nautilus_trader.model.data import OrderBookDepth10
 from nautilus_trader.model.data import capsule_to_data
 from nautilus_trader.model.enums import BookAction
@@ -544,6 +545,68 @@ def test_deltas_batching_with_remainder() -> None:
     assert isinstance(batches[2], OrderBookDeltas)
 
 
+def test_deltas_buffer_push_returns_true_on_f_last() -> None:
+    # Arrange
+    buffer = OrderBookDeltasBuffer(AUDUSD)
+    delta1 = TestDataStubs.order_book_delta(flags=0)
+    delta2 = TestDataStubs.order_book_delta(flags=RecordFlag.F_LAST)
+
+    # Act
+    result1 = buffer.push(delta1)
+    result2 = buffer.push(delta2)
+
+    # Assert
+    assert not result1
+    assert result2
+    assert len(buffer) == 2
+
+
+def test_deltas_buffer_build_returns_deltas_and_resets() -> None:
+    # Arrange
+    buffer = OrderBookDeltasBuffer(AUDUSD, capacity=1)  # Forces growth
+    deltas = [TestDataStubs.order_book_delta(flags=0) for _ in range(4)]
+    deltas.append(TestDataStubs.order_book_delta(flags=RecordFlag.F_LAST))
+    for delta in deltas:
+        buffer.push(delta)
+
+    # Act
+    result = buffer.build()
+
+    # Assert
+    assert isinstance(result, OrderBookDeltas)
+    assert result.instrument_id == AUDUSD
+    assert result.deltas == deltas
+    assert len(buffer) == 0
+    assert buffer.capacity >= 5
+
+
+def test_deltas_buffer_build_when_empty_raises() -> None:
+    # Arrange
+    buffer = OrderBookDeltasBuffer(AUDUSD)
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        buffer.build()
+
+
+def test_deltas_buffer_extend_builds_batch_per_f_last_and_keeps_remainder() -> None:
+    # Arrange
+    buffer = OrderBookDeltasBuffer(AUDUSD)
+    delta1 = TestDataStubs.order_book_delta(flags=0)
+    delta2 = TestDataStubs.order_book_delta(flags=RecordFlag.F_LAST)
+    delta3 = TestDataStubs.order_book_delta(flags=RecordFlag.F_LAST)
+    delta4 = TestDataStubs.order_book_delta(flags=0)
+
+    # Act
+    batches = buffer.extend(OrderBookDeltas(AUDUSD, [delta1, delta2, delta3, delta4]))
+
+    # Assert
+    assert len(batches) == 2
+    assert batches[0].deltas == [delta1, delta2]
+    assert batches[1].deltas == [delta3]
+    assert len(buffer) == 1
+
+
 def test_deltas_to_dict_from_dict_round_trip() -> None:
     # Arrange
     order1 = BookOrder(
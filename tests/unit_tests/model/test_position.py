@@ -361,6 +361,42 @@ class TestPosition:
         with pytest.raises(KeyError):
             position.apply(fill)
 
+    def test_position_with_max_events_rolls_older_fills(self) -> None:
+        # Arrange
+        fills = []
+        for i in range(10):
+            order = self.order_factory.market(
+                AUDUSD_SIM.id,
+                OrderSide.BUY,
+                Quantity.from_int(1),
+            )
+            fills.append(
+                TestEventStubs.order_filled(
+                    order,
+                    instrument=AUDUSD_SIM,
+                    strategy_id=StrategyId("S-001"),
+                    last_px=Price.from_str("1.00000"),
+                    trade_id=TradeId(str(i)),
+                    position_id=PositionId("1"),
+                ),
+            )
+
+        position = Position(instrument=AUDUSD_SIM, fill=fills[0], max_events=3)
+
+        # Act
+        for fill in fills[1:]:
+            position.apply(fill)
+
+        # Assert
+        assert position.quantity == Quantity.from_int(10)
+        assert position.event_count == 10
+        assert 3 <= len(position.events) < 6
+        assert position.rolled_event_count == 10 - len(position.events)
+        assert position.last_event == fills[-1]
+        assert len(position.client_order_ids) == 10
+        with pytest.raises(KeyError):
+            position.apply(fills[0])  # Rolled fills are still detected as duplicates
+
     def test_position_filled_with_buy_order(self) -> None:
         # Arrange
         order = self.order_factory.market(
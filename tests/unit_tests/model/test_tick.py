@@ -15,6 +15,8 @@
 
 import pickle
 
+import pytest
+
 from nautilus_trader.core import nautilus_pyo3
 from nautilus_trader.model import convert_to_raw_int
 from nautilus_trader.model.data import QuoteTick
@@ -224,6 +226,22 @@ class TestQuoteTick:
         assert len(quotes) == 1024
         assert isinstance(quotes[0], QuoteTick)
 
+    def test_from_pyo3_list_matches_single_conversion(self):
+        # Arrange
+        pyo3_quotes = [TestDataProviderPyo3.quote_tick(), TestDataProviderPyo3.quote_tick()]
+
+        # Act
+        quotes = QuoteTick.from_pyo3_list(pyo3_quotes)
+
+        # Assert
+        assert quotes == [QuoteTick.from_pyo3(pyo3_quote) for pyo3_quote in pyo3_quotes]
+        assert QuoteTick.from_pyo3_list([]) == []
+
+    def test_from_pyo3_list_with_invalid_object_raises_type_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(TypeError):
+            QuoteTick.from_pyo3_list([TestDataProviderPyo3.quote_tick(), "invalid"])
+
     def test_pickling_round_trip_results_in_expected_tick(self):
         # Arrange
         quote = QuoteTick(
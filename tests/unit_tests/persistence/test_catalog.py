@@ -19,6 +19,7 @@ from decimal import Decimal
 
 import pandas as pd
 import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 import pytest
 
 from nautilus_trader import TEST_DATA_DIR
@@ -41,6 +42,7 @@ from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
 from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
 from nautilus_trader.persistence.catalog.types import CatalogWriteMode
+from nautilus_trader.persistence.funcs import urisafe_instrument_id
 from nautilus_trader.persistence.wranglers_v2 import QuoteTickDataWranglerV2
 from nautilus_trader.persistence.wranglers_v2 import TradeTickDataWranglerV2
 from nautilus_trader.test_kit.mocks.data import NewsEventData
@@ -463,3 +465,82 @@ def test_list_live_runs(
 
     # Assert
     assert result == ["abc"]
+
+
+def test_consolidate_catalog_merges_overlapping_files(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    audusd = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+    usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+    for instrument in (audusd, usdjpy):
+        catalog.write_data(
+            [TestDataStubs.quote_tick(instrument, ts_event=i, ts_init=i) for i in range(0, 200, 2)],
+        )
+        catalog.write_data(
+            [TestDataStubs.quote_tick(instrument, ts_event=i, ts_init=i) for i in range(1, 200, 2)],
+            mode=CatalogWriteMode.NEWFILE,
+        )
+
+    # Act
+    catalog.consolidate_catalog(max_workers=2, memory_budget_bytes=4_096)
+
+    # Assert
+    for instrument in (audusd, usdjpy):
+        directory = urisafe_instrument_id(instrument.id.value)
+        files = catalog.fs.glob(f"{catalog.path}/data/quote_tick/{directory}/*")
+        quotes = catalog.quote_ticks(instrument_ids=[instrument.id.value])
+        assert len(files) == 1
+        assert [q.ts_init for q in quotes] == list(range(200))
+
+
+def test_consolidate_data_concatenates_ordered_files(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+    catalog.write_data(
+        [TestDataStubs.quote_tick(instrument, ts_event=i, ts_init=i) for i in range(100, 200)],
+    )
+    catalog.write_data(
+        [TestDataStubs.quote_tick(instrument, ts_event=i, ts_init=i) for i in range(100)],
+        mode=CatalogWriteMode.NEWFILE,
+    )
+
+    # Act
+    catalog.consolidate_data(QuoteTick, instrument_id=instrument.id.value)
+
+    # Assert
+    directory = urisafe_instrument_id(instrument.id.value)
+    files = catalog.fs.glob(f"{catalog.path}/data/quote_tick/{directory}/*")
+    quotes = catalog.quote_ticks(instrument_ids=[instrument.id.value])
+    assert len(files) == 1
+    assert [q.ts_init for q in quotes] == list(range(200))
+    assert pq.ParquetFile(files[0]).num_row_groups == 2  # Row groups copied as they are
+
+
+def test_consolidate_data_when_replace_fails_keeps_source_files(
+    catalog: ParquetDataCatalog,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Arrange
+    instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+    catalog.write_data(
+        [TestDataStubs.quote_tick(instrument, ts_event=i, ts_init=i) for i in range(100)],
+    )
+    catalog.write_data(
+        [TestDataStubs.quote_tick(instrument, ts_event=i, ts_init=i) for i in range(100, 200)],
+        mode=CatalogWriteMode.NEWFILE,
+    )
+
+    def failing_replace(src: str, dst: str) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr("nautilus_trader.persistence.catalog.parquet.os.replace", failing_replace)
+
+    # Act
+    with pytest.raises(OSError):
+        catalog.consolidate_data(QuoteTick, instrument_id=instrument.id.value)
+
+    # Assert
+    directory = urisafe_instrument_id(instrument.id.value)
+    files = catalog.fs.glob(f"{catalog.path}/data/quote_tick/{directory}/*.parquet")
+    quotes = catalog.quote_ticks(instrument_ids=[instrument.id.value])
+    assert len(files) == 2
+    assert [q.ts_init for q in quotes] == list(range(200))
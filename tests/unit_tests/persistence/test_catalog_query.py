@@ -0,0 +1,133 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.persistence.catalog.query import CatalogReadAheadCache
+from nautilus_trader.persistence.catalog.query import merge_data_streams
+from nautilus_trader.persistence.catalog.query import merge_instruments
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+
+
+def _quote(ts_init: int, bid_price: float = 1.0):
+    return TestDataStubs.quote_tick(bid_price=bid_price, ts_event=ts_init, ts_init=ts_init)
+
+
+def test_merge_data_streams_orders_by_ts_init():
+    # Arrange
+    stream1 = [_quote(1), _quote(3), _quote(5)]
+    stream2 = [_quote(2), _quote(4)]
+
+    # Act
+    result = list(merge_data_streams([stream1, stream2]))
+
+    # Assert
+    assert [q.ts_init for q in result] == [1, 2, 3, 4, 5]
+
+
+def test_merge_data_streams_drops_duplicates_across_streams():
+    # Arrange
+    stream1 = [_quote(1), _quote(2)]
+    stream2 = [_quote(2), _quote(2, bid_price=1.1), _quote(3)]
+
+    # Act
+    result = list(merge_data_streams([stream1, stream2]))
+
+    # Assert
+    assert result == [_quote(1), _quote(2), _quote(2, bid_price=1.1), _quote(3)]
+
+
+def test_merge_data_streams_with_no_streams_returns_empty():
+    # Arrange, Act, Assert
+    assert list(merge_data_streams([])) == []
+
+
+def test_merge_instruments_keeps_first_definition_per_id():
+    # Arrange
+    audusd = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+    gbpusd = TestInstrumentProvider.default_fx_ccy("GBP/USD")
+
+    # Act
+    result = merge_instruments([[audusd], [gbpusd, audusd]])
+
+    # Assert
+    assert result == [audusd, gbpusd]
+
+
+def test_read_ahead_cache_with_invalid_capacity_raises():
+    # Arrange, Act, Assert
+    with pytest.raises(ValueError):
+        CatalogReadAheadCache(capacity=0)
+
+
+def test_read_ahead_cache_get_when_window_contained_returns_slice():
+    # Arrange
+    cache = CatalogReadAheadCache(capacity=2)
+    data = [_quote(ts) for ts in range(0, 100, 10)]
+    cache.put("key", 0, 100, data)
+
+    # Act
+    result = cache.get("key", 20, 50)
+
+    # Assert
+    assert result == data[2:6]
+    assert cache.hits == 1
+    assert cache.misses == 0
+
+
+def test_read_ahead_cache_get_when_window_not_contained_returns_none():
+    # Arrange
+    cache = CatalogReadAheadCache(capacity=2)
+    cache.put("key", 0, 100, [_quote(0)])
+
+    # Act
+    result = cache.get("key", 50, 150)
+
+    # Assert
+    assert result is None
+    assert cache.misses == 1
+
+
+def test_read_ahead_cache_discard_removes_only_key():
+    # Arrange
+    cache = CatalogReadAheadCache(capacity=2)
+    cache.put("a", 0, 10, [])
+    cache.put("b", 0, 10, [])
+
+    # Act
+    cache.discard("a")
+    cache.discard("missing")
+
+    # Assert
+    assert len(cache) == 1
+    assert cache.get("a", 0, 10) is None
+    assert cache.get("b", 0, 10) == []
+
+
+def test_read_ahead_cache_evicts_least_recently_used():
+    # Arrange
+    cache = CatalogReadAheadCache(capacity=2)
+    cache.put("a", 0, 10, [])
+    cache.put("b", 0, 10, [])
+    cache.get("a", 0, 10)
+
+    # Act
+    cache.put("c", 0, 10, [])
+
+    # Assert
+    assert len(cache) == 2
+    assert cache.get("a", 0, 10) == []
+    assert cache.get("b", 0, 10) is None
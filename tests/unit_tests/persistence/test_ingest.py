@@ -0,0 +1,75 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2025 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from collections.abc import Generator
+
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+from nautilus_trader.persistence.ingest import ingest_files_to_catalog
+from nautilus_trader.persistence.ingest import ingest_to_catalog
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+
+
+def _quote_chunks(
+    start: int,
+    count: int,
+    chunk_size: int,
+) -> Generator[list[QuoteTick], None, None]:
+    for offset in range(start, start + count, chunk_size):
+        stop = min(offset + chunk_size, start + count)
+        yield [TestDataStubs.quote_tick(ts_event=i, ts_init=i) for i in range(offset, stop)]
+
+
+def _stream_quote_file(filepath: str) -> Generator[list[QuoteTick], None, None]:
+    # The "file" encodes its first timestamp, so each file yields distinct quotes
+    return _quote_chunks(start=int(filepath) * 1_000, count=250, chunk_size=100)
+
+
+def test_ingest_to_catalog_writes_all_chunks(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    chunks = _quote_chunks(start=0, count=250, chunk_size=100)
+
+    # Act
+    count = ingest_to_catalog(catalog, chunks)
+
+    # Assert
+    quotes = catalog.quote_ticks()
+    assert count == 250
+    assert len(quotes) == 250
+    assert [quote.ts_init for quote in quotes] == list(range(250))
+
+
+def test_ingest_to_catalog_skips_empty_chunks(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    chunks = [[], [TestDataStubs.quote_tick()], []]
+
+    # Act
+    count = ingest_to_catalog(catalog, chunks)
+
+    # Assert
+    assert count == 1
+    assert len(catalog.quote_ticks()) == 1
+
+
+def test_ingest_files_to_catalog_in_parallel(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    filepaths = ["0", "1", "2"]
+
+    # Act
+    counts = ingest_files_to_catalog(catalog, filepaths, _stream_quote_file, max_workers=2)
+
+    # Assert
+    assert counts == {"0": 250, "1": 250, "2": 250}
+    assert len(catalog.quote_ticks()) == 750
@@ -32,6 +32,7 @@ from nautilus_trader.model.data import OrderBookDelta
 from nautilus_trader.model.data import TradeTick
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+from nautilus_trader.persistence.catalog.parquet import _feather_instrument_id
 from nautilus_trader.test_kit.mocks.data import NewsEventData
 from nautilus_trader.test_kit.stubs.persistence import TestPersistenceStubs
 from tests.integration_tests.adapters.betfair.test_kit import BetfairTestStubs
@@ -447,3 +448,96 @@ class TestPersistenceStreaming:
             "TradeTick": 179,
         }
         assert counts == expected
+
+    def test_stream_backtest_matches_read_backtest(
+        self,
+        catalog_betfair: ParquetDataCatalog,
+    ) -> None:
+        # Arrange
+        [backtest_result] = self._run_default_backtest(catalog_betfair)
+        expected = catalog_betfair.read_backtest(backtest_result.instance_id)
+
+        # Act
+        data = list(catalog_betfair.stream_backtest(backtest_result.instance_id, chunk_size=100))
+
+        # Assert
+        assert Counter(d.__class__.__name__ for d in data) == Counter(
+            d.__class__.__name__ for d in expected
+        )
+        assert [d.ts_init for d in data] == sorted(d.ts_init for d in data)
+
+    def test_stream_backtest_filters_by_type_and_time_range(
+        self,
+        catalog_betfair: ParquetDataCatalog,
+    ) -> None:
+        # Arrange
+        [backtest_result] = self._run_default_backtest(catalog_betfair)
+        trades = list(
+            catalog_betfair.stream_backtest(backtest_result.instance_id, data_cls=TradeTick),
+        )
+        start = trades[10].ts_init
+        end = trades[-10].ts_init
+
+        # Act
+        data = list(
+            catalog_betfair.stream_backtest(
+                backtest_result.instance_id,
+                data_cls=TradeTick,
+                start=start,
+                end=end,
+            ),
+        )
+
+        # Assert
+        assert len(trades) == 179
+        assert all(isinstance(d, TradeTick) for d in data)
+        assert data == [t for t in trades if start <= t.ts_init <= end]
+
+    def test_stream_backtest_as_batches(
+        self,
+        catalog_betfair: ParquetDataCatalog,
+    ) -> None:
+        # Arrange
+        [backtest_result] = self._run_default_backtest(catalog_betfair)
+
+        # Act
+        batches = list(
+            catalog_betfair.stream_backtest(
+                backtest_result.instance_id,
+                data_cls=OrderBookDelta,
+                as_batches=True,
+            ),
+        )
+
+        # Assert
+        assert {class_name for class_name, _ in batches} == {"order_book_delta"}
+        assert sum(batch.num_rows for _, batch in batches) == 1307
+
+    def test_stream_backtest_filters_by_unknown_instrument(
+        self,
+        catalog_betfair: ParquetDataCatalog,
+    ) -> None:
+        # Arrange
+        [backtest_result] = self._run_default_backtest(catalog_betfair)
+
+        # Act
+        data = list(
+            catalog_betfair.stream_backtest(
+                backtest_result.instance_id,
+                data_cls=TradeTick,
+                instrument_ids=["UNKNOWN.SIM"],
+            ),
+        )
+
+        # Assert
+        assert data == []
+
+    def test_feather_instrument_id_from_bar_type_with_hyphenated_instrument(self) -> None:
+        # Arrange
+        schema_metadata = {b"bar_type": b"BTC-PERP.BINANCE-1-MINUTE-LAST-EXTERNAL"}
+
+        # Act
+        instrument_id = _feather_instrument_id(schema_metadata)
+
+        # Assert
+        assert instrument_id == "BTC-PERP.BINANCE"
@@ -32,13 +32,16 @@ from nautilus_trader.model.data import Bar
 from nautilus_trader.model.data import BarType
 from nautilus_trader.model.data import MarkPriceUpdate
 from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.data import TradeTick
 from nautilus_trader.model.enums import AccountType
+from nautilus_trader.model.enums import AggressorSide
 from nautilus_trader.model.enums import OmsType
 from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.events import AccountState
 from nautilus_trader.model.identifiers import AccountId
 from nautilus_trader.model.identifiers import PositionId
 from nautilus_trader.model.identifiers import StrategyId
+from nautilus_trader.model.identifiers import TradeId
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.identifiers import VenueOrderId
 from nautilus_trader.model.objects import AccountBalance
@@ -1457,6 +1460,400 @@ class TestPortfolio:
         assert self.portfolio.total_pnls(BINANCE) == {}
         assert self.portfolio.net_exposures(BINANCE) is None
 
+    def test_venue_totals_are_marked_to_market_on_quote(self):
+        # Arrange
+        AccountFactory.register_calculated_account("SIM")
+
+        account_id = AccountId("SIM-01234")
+        state = AccountState(
+            account_id=account_id,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            reported=True,
+            balances=[
+                AccountBalance(
+                    Money(1_000_000, USD),
+                    Money(0, USD),
+                    Money(1_000_000, USD),
+                ),
+            ],
+            margins=[],
+            info={},
+            event_id=UUID4(),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.portfolio.update_account(state)
+
+        quote1 = QuoteTick(
+            instrument_id=AUDUSD_SIM.id,
+            bid_price=Price.from_str("0.80501"),
+            ask_price=Price.from_str("0.80505"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.cache.add_quote_tick(quote1)
+        self.portfolio.update_quote_tick(quote1)
+
+        order = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        fill = TestEventStubs.order_filled(
+            order,
+            instrument=AUDUSD_SIM,
+            strategy_id=StrategyId("S-1"),
+            account_id=account_id,
+            position_id=PositionId("P-123456"),
+            last_px=Price.from_str("1.00000"),
+        )
+
+        position = Position(instrument=AUDUSD_SIM, fill=fill)
+        self.cache.add_position(position, OmsType.HEDGING)
+        self.portfolio.update_position(TestEventStubs.position_opened(position))
+
+        assert self.portfolio.unrealized_pnls(SIM) == {USD: Money(-19499.00, USD)}
+        assert self.portfolio.net_exposures(SIM) == {USD: Money(80501.00, USD)}
+
+        quote2 = QuoteTick(
+            instrument_id=AUDUSD_SIM.id,
+            bid_price=Price.from_str("0.90001"),
+            ask_price=Price.from_str("0.90005"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=1,
+            ts_init=1,
+        )
+
+        # Act
+        self.cache.add_quote_tick(quote2)
+        self.portfolio.update_quote_tick(quote2)
+
+        # Assert
+        assert self.portfolio.unrealized_pnls(SIM) == {USD: Money(-9999.00, USD)}
+        assert self.portfolio.net_exposures(SIM) == {USD: Money(90001.00, USD)}
+        assert self.portfolio.unrealized_pnl(AUDUSD_SIM.id) == Money(-9999.00, USD)
+        assert self.portfolio.net_exposure(AUDUSD_SIM.id) == Money(90001.00, USD)
+        assert not self.portfolio.is_completely_flat()
+
+    def test_venue_totals_are_marked_to_market_on_mark_price(self):
+        # Arrange
+        AccountFactory.register_calculated_account("SIM")
+
+        account_id = AccountId("SIM-01234")
+        state = AccountState(
+            account_id=account_id,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            reported=True,
+            balances=[
+                AccountBalance(
+                    Money(1_000_000, USD),
+                    Money(0, USD),
+                    Money(1_000_000, USD),
+                ),
+            ],
+            margins=[],
+            info={},
+            event_id=UUID4(),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.portfolio.update_account(state)
+        self.portfolio.set_use_mark_prices(True)
+
+        mark1 = MarkPriceUpdate(
+            instrument_id=AUDUSD_SIM.id,
+            value=Price.from_str("0.80500"),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.cache.add_mark_price(mark1)
+        self.portfolio.update_mark_price(mark1)
+
+        order = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        fill = TestEventStubs.order_filled(
+            order,
+            instrument=AUDUSD_SIM,
+            strategy_id=StrategyId("S-1"),
+            account_id=account_id,
+            position_id=PositionId("P-123456"),
+            last_px=Price.from_str("1.00000"),
+        )
+
+        position = Position(instrument=AUDUSD_SIM, fill=fill)
+        self.cache.add_position(position, OmsType.HEDGING)
+        self.portfolio.update_position(TestEventStubs.position_opened(position))
+
+        assert self.portfolio.unrealized_pnls(SIM) == {USD: Money(-19500.00, USD)}
+        assert self.portfolio.net_exposures(SIM) == {USD: Money(80500.00, USD)}
+
+        mark2 = MarkPriceUpdate(
+            instrument_id=AUDUSD_SIM.id,
+            value=Price.from_str("0.90000"),
+            ts_event=1,
+            ts_init=1,
+        )
+
+        # Act
+        self.cache.add_mark_price(mark2)
+        self.portfolio.update_mark_price(mark2)
+
+        # Assert
+        assert self.portfolio.unrealized_pnls(SIM) == {USD: Money(-10000.00, USD)}
+        assert self.portfolio.net_exposures(SIM) == {USD: Money(90000.00, USD)}
+        assert self.portfolio.unrealized_pnl(AUDUSD_SIM.id) == Money(-10000.00, USD)
+        assert self.portfolio.net_exposure(AUDUSD_SIM.id) == Money(90000.00, USD)
+
+    def test_venue_totals_are_marked_to_market_on_trade_without_quotes(self):
+        # Arrange
+        AccountFactory.register_calculated_account("SIM")
+
+        account_id = AccountId("SIM-01234")
+        state = AccountState(
+            account_id=account_id,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            reported=True,
+            balances=[
+                AccountBalance(
+                    Money(1_000_000, USD),
+                    Money(0, USD),
+                    Money(1_000_000, USD),
+                ),
+            ],
+            margins=[],
+            info={},
+            event_id=UUID4(),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.portfolio.update_account(state)
+
+        trade1 = TradeTick(
+            instrument_id=AUDUSD_SIM.id,
+            price=Price.from_str("0.80500"),
+            size=Quantity.from_int(1),
+            aggressor_side=AggressorSide.BUYER,
+            trade_id=TradeId("1"),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.cache.add_trade_tick(trade1)
+        self.portfolio.update_trade_tick(trade1)
+
+        order = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        fill = TestEventStubs.order_filled(
+            order,
+            instrument=AUDUSD_SIM,
+            strategy_id=StrategyId("S-1"),
+            account_id=account_id,
+            position_id=PositionId("P-123456"),
+            last_px=Price.from_str("1.00000"),
+        )
+
+        position = Position(instrument=AUDUSD_SIM, fill=fill)
+        self.cache.add_position(position, OmsType.HEDGING)
+        self.portfolio.update_position(TestEventStubs.position_opened(position))
+
+        assert self.portfolio.unrealized_pnls(SIM) == {USD: Money(-19500.00, USD)}
+        assert self.portfolio.net_exposures(SIM) == {USD: Money(80500.00, USD)}
+
+        trade2 = TradeTick(
+            instrument_id=AUDUSD_SIM.id,
+            price=Price.from_str("0.90000"),
+            size=Quantity.from_int(1),
+            aggressor_side=AggressorSide.BUYER,
+            trade_id=TradeId("2"),
+            ts_event=1,
+            ts_init=1,
+        )
+
+        # Act
+        self.cache.add_trade_tick(trade2)
+        self.portfolio.update_trade_tick(trade2)
+
+        # Assert
+        assert self.portfolio.unrealized_pnls(SIM) == {USD: Money(-10000.00, USD)}
+        assert self.portfolio.net_exposures(SIM) == {USD: Money(90000.00, USD)}
+        assert self.portfolio.unrealized_pnl(AUDUSD_SIM.id) == Money(-10000.00, USD)
+        assert self.portfolio.net_exposure(AUDUSD_SIM.id) == Money(90000.00, USD)
+
+    def test_trades_subscribed_only_while_instrument_has_open_positions(self):
+        # Arrange
+        AccountFactory.register_calculated_account("SIM")
+
+        account_id = AccountId("SIM-01234")
+        state = AccountState(
+            account_id=account_id,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            reported=True,
+            balances=[
+                AccountBalance(
+                    Money(1_000_000, USD),
+                    Money(0, USD),
+                    Money(1_000_000, USD),
+                ),
+            ],
+            margins=[],
+            info={},
+            event_id=UUID4(),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.portfolio.update_account(state)
+
+        topic = f"data.trades.{AUDUSD_SIM.id.venue}.{AUDUSD_SIM.id.symbol}"
+        assert not self.msgbus.is_subscribed(topic, self.portfolio.update_trade_tick)
+
+        order1 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        fill1 = TestEventStubs.order_filled(
+            order1,
+            instrument=AUDUSD_SIM,
+            strategy_id=StrategyId("S-1"),
+            account_id=account_id,
+            position_id=PositionId("P-123456"),
+            last_px=Price.from_str("1.00000"),
+        )
+
+        position = Position(instrument=AUDUSD_SIM, fill=fill1)
+        self.cache.add_position(position, OmsType.HEDGING)
+
+        # Act
+        self.portfolio.update_position(TestEventStubs.position_opened(position))
+
+        # Assert
+        assert self.msgbus.is_subscribed(topic, self.portfolio.update_trade_tick)
+
+        # Act
+        order2 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100_000),
+        )
+
+        fill2 = TestEventStubs.order_filled(
+            order2,
+            instrument=AUDUSD_SIM,
+            strategy_id=StrategyId("S-1"),
+            account_id=account_id,
+            position_id=PositionId("P-123456"),
+            last_px=Price.from_str("1.00010"),
+        )
+
+        position.apply(fill2)
+        self.cache.update_position(position)
+        self.portfolio.update_position(TestEventStubs.position_closed(position))
+
+        # Assert
+        assert not self.msgbus.is_subscribed(topic, self.portfolio.update_trade_tick)
+
+    def test_switching_to_mark_prices_revalues_venue_totals(self):
+        # Arrange
+        AccountFactory.register_calculated_account("SIM")
+
+        account_id = AccountId("SIM-01234")
+        state = AccountState(
+            account_id=account_id,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            reported=True,
+            balances=[
+                AccountBalance(
+                    Money(1_000_000, USD),
+                    Money(0, USD),
+                    Money(1_000_000, USD),
+                ),
+            ],
+            margins=[],
+            info={},
+            event_id=UUID4(),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.portfolio.update_account(state)
+
+        trade1 = TradeTick(
+            instrument_id=AUDUSD_SIM.id,
+            price=Price.from_str("0.80500"),
+            size=Quantity.from_int(1),
+            aggressor_side=AggressorSide.BUYER,
+            trade_id=TradeId("1"),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.cache.add_trade_tick(trade1)
+        self.portfolio.update_trade_tick(trade1)
+
+        order = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        fill = TestEventStubs.order_filled(
+            order,
+            instrument=AUDUSD_SIM,
+            strategy_id=StrategyId("S-1"),
+            account_id=account_id,
+            position_id=PositionId("P-123456"),
+            last_px=Price.from_str("1.00000"),
+        )
+
+        position = Position(instrument=AUDUSD_SIM, fill=fill)
+        self.cache.add_position(position, OmsType.HEDGING)
+        self.portfolio.update_position(TestEventStubs.position_opened(position))
+
+        assert self.portfolio.unrealized_pnls(SIM) == {USD: Money(-19500.00, USD)}
+        assert self.portfolio.net_exposures(SIM) == {USD: Money(80500.00, USD)}
+
+        mark1 = MarkPriceUpdate(
+            instrument_id=AUDUSD_SIM.id,
+            value=Price.from_str("0.90000"),
+            ts_event=1,
+            ts_init=1,
+        )
+
+        self.cache.add_mark_price(mark1)
+
+        # Act
+        self.portfolio.set_use_mark_prices(True)
+
+        # Assert
+        assert self.portfolio.unrealized_pnls(SIM) == {USD: Money(-10000.00, USD)}
+        assert self.portfolio.net_exposures(SIM) == {USD: Money(90000.00, USD)}
+        assert self.portfolio.unrealized_pnl(AUDUSD_SIM.id) == Money(-10000.00, USD)
+        assert self.portfolio.net_exposure(AUDUSD_SIM.id) == Money(90000.00, USD)
+
     def test_closing_position_updates_portfolio(self):
         # Arrange
         AccountFactory.register_calculated_account("SIM")